@@ -105,6 +105,16 @@ bool stopSaved = false;
 uint32_t motionStartTime = 0;
 int32_t motionTargetMs = 0;
 
+// Status format (SF1: answer ? with binary status frames)
+bool binaryStatus = false;
+
+// Status stream (SU<hz>: push status unsolicited, 0 = off)
+uint32_t streamIntervalMs = 0;
+uint32_t lastStreamMs = 0;
+
+// Command acknowledgement (AK1: commands tagged <cmd>#<seq> are answered ACK:<seq>)
+bool ackTags = false;
+
 // ============================================================================
 // Command Buffer
 // ============================================================================
@@ -255,6 +265,16 @@ void loop() {
   // Update motion
   updateMotion();
 
+  // Push subscribed status
+  if (streamIntervalMs && now - lastStreamMs >= streamIntervalMs) {
+    lastStreamMs = now;
+    if (binaryStatus) {
+      sendBinaryStatus();
+    } else {
+      sendStatus();
+    }
+  }
+
   // Small delay to prevent watchdog issues
   delay(1);
 }
@@ -270,6 +290,10 @@ void handleClient() {
     if (client) {
       Serial.println("Client connected");
       cmdBufferIndex = 0;
+      // Each client negotiates its own status format and stream
+      binaryStatus = false;
+      streamIntervalMs = 0;
+      ackTags = false;
     }
   }
 
@@ -281,7 +305,7 @@ void handleClient() {
       if (c == '\n' || c == '\r') {
         if (cmdBufferIndex > 0) {
           cmdBuffer[cmdBufferIndex] = '\0';
-          processCommand(cmdBuffer);
+          processTaggedCommand(cmdBuffer);
           cmdBufferIndex = 0;
         }
       } else if (cmdBufferIndex < CMD_BUFFER_SIZE - 1) {
@@ -295,13 +319,57 @@ void handleClient() {
 // Command Processing
 // ============================================================================
 
+void processTaggedCommand(char* cmd) {
+  // Split off a trailing #<seq> tag and acknowledge it once the command ran
+  char* tag = ackTags ? strrchr(cmd, '#') : NULL;
+  if (tag && tag[1] != '\0' && strspn(tag + 1, "0123456789") == strlen(tag + 1)) {
+    *tag = '\0';
+    processCommand(cmd);
+    String ack = "ACK:";
+    ack += (tag + 1);
+    sendResponse(ack.c_str());
+  } else {
+    processCommand(cmd);
+  }
+}
+
 void processCommand(const char* cmd) {
   Serial.print("CMD: ");
   Serial.println(cmd);
 
   // Status query
   if (strcmp(cmd, "?") == 0) {
-    sendStatus();
+    if (binaryStatus) {
+      sendBinaryStatus();
+    } else {
+      sendStatus();
+    }
+    return;
+  }
+
+  // Status format: SF1 binary frames, SF0 ASCII lines
+  if (strcmp(cmd, "SF1") == 0 || strcmp(cmd, "SF0") == 0) {
+    binaryStatus = (cmd[2] == '1');
+    sendResponse(binaryStatus ? "OK:SF1" : "OK:SF0");
+    return;
+  }
+
+  // Command acknowledgement tags
+  if (strcmp(cmd, "AK1") == 0 || strcmp(cmd, "AK0") == 0) {
+    ackTags = (cmd[2] == '1');
+    sendResponse(ackTags ? "OK:AK1" : "OK:AK0");
+    return;
+  }
+
+  // Status stream: SU<hz> pushes status at hz (1-50), SU0 stops
+  if (strncmp(cmd, "SU", 2) == 0) {
+    int hz = atoi(cmd + 2);
+    if (hz >= 0 && hz <= 50) {
+      streamIntervalMs = hz ? 1000 / hz : 0;
+      String ack = "OK:SU";
+      ack += hz;
+      sendResponse(ack.c_str());
+    }
     return;
   }
 
@@ -463,6 +531,47 @@ void sendStatus() {
   client.println(status);
 }
 
+// CRC-16/CCITT, init 0xFFFF (binascii.crc_hqx on the host)
+uint16_t crc16(const uint8_t* data, size_t len) {
+  uint16_t crc = 0xFFFF;
+  for (size_t i = 0; i < len; i++) {
+    crc ^= (uint16_t)data[i] << 8;
+    for (uint8_t b = 0; b < 8; b++) {
+      crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+    }
+  }
+  return crc;
+}
+
+void putU16(uint8_t* p, uint16_t v) { p[0] = v; p[1] = v >> 8; }
+void putI32(uint8_t* p, int32_t v) { putU16(p, (uint32_t)v); putU16(p + 2, (uint32_t)v >> 16); }
+
+void sendBinaryStatus() {
+  if (!client || !client.connected()) return;
+
+  // Binary frame (25 bytes, little-endian; layout in drop_cylinder_protocol.py):
+  // A5 'D' pos:i32 mode:u8 flags:u8 start:i32 stop:i32 trim:i16 ip:4 speed:u8 crc:u16
+  uint8_t frame[25];
+  uint8_t flags = 0;
+  if (startSaved) flags |= 0x01;
+  if (stopSaved) flags |= 0x02;
+  if (stationMode) flags |= 0x04;
+  IPAddress ip = stationMode ? WiFi.localIP() : WiFi.softAPIP();
+
+  frame[0] = 0xA5;
+  frame[1] = 'D';
+  putI32(frame + 2, currentPositionMs);
+  frame[6] = (uint8_t)currentMode;
+  frame[7] = flags;
+  putI32(frame + 8, startPositionMs);
+  putI32(frame + 12, stopPositionMs);
+  putU16(frame + 16, (uint16_t)trimOffsetUs);
+  for (int i = 0; i < 4; i++) frame[18 + i] = ip[i];
+  frame[22] = (uint8_t)(jogSpeed * 100);
+  putU16(frame + 23, crc16(frame, 23));
+  client.write(frame, sizeof(frame));
+}
+
 void sendResponse(const char* msg) {
   if (client && client.connected()) {
     client.println(msg);
@@ -172,6 +172,12 @@ static char serialBuffer[CMD_BUFFER_SIZE];
 
 static int serialBufferIndex = 0;
 
+static bool binaryStatus = false;  // SF1: answer ? with binary status frames
+
+static uint32_t streamIntervalMs = 0;  // SU<hz>: push status unsolicited (0 = off)
+
+static uint32_t lastStreamMs = 0;
+
 
 static inline bool pressed(uint8_t pin) { return digitalRead(pin) == LOW; }
 
@@ -396,7 +402,7 @@ static void commandMoveTo(int64_t newTarget, uint32_t nowUs) {
 
 // ================= SERIAL COMMUNICATION =================
 
-// Send status response to GUI (only called when idle to avoid timing issues)
+// Send status response to GUI (? only while idle; the stream also while moving)
 // Format: POS:<steps> MODE:<IDLE|JOG|MOVE> SPD:<rps> HOME:<Y@steps|N> WELL:<Y@steps|N> ESTOP:<0|1> VJOG:<rps> VMOVE:<rps>
 static void sendStatus() {
   bool eStopActive = (digitalRead(PIN_ESTOP) == HIGH);
@@ -423,12 +429,70 @@ static void sendStatus() {
   Serial.println(maxRpsMove, 2);
 }
 
+// CRC-16/CCITT, init 0xFFFF (binascii.crc_hqx on the host)
+static uint16_t crc16(const uint8_t* data, size_t len) {
+  uint16_t crc = 0xFFFF;
+  for (size_t i = 0; i < len; i++) {
+    crc ^= (uint16_t)data[i] << 8;
+    for (uint8_t b = 0; b < 8; b++) {
+      crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+    }
+  }
+  return crc;
+}
+
+static void putU16(uint8_t* p, uint16_t v) { p[0] = v; p[1] = v >> 8; }
+static void putI32(uint8_t* p, int32_t v) { putU16(p, (uint32_t)v); putU16(p + 2, (uint32_t)v >> 16); }
+
+// Binary status frame (24 bytes, little-endian; layout in command_protocol.py):
+// A5 'W' pos:i32 mode:u8 flags:u8 spd:u16 home:i32 well:i32 vjog:u16 vmove:u16 crc:u16
+// Speeds are in 0.01 RPS
+static void sendBinaryStatus() {
+  uint8_t frame[24];
+  uint8_t flags = 0;
+  if (homeSaved) flags |= 0x01;
+  if (wellSaved) flags |= 0x02;
+  if (digitalRead(PIN_ESTOP) == HIGH) flags |= 0x04;
+
+  frame[0] = 0xA5;
+  frame[1] = 'W';
+  putI32(frame + 2, (int32_t)posSteps);
+  frame[6] = (uint8_t)mode;
+  frame[7] = flags;
+  putU16(frame + 8, (uint16_t)(currentSps / STEPS_PER_REV * 100.0f + 0.5f));
+  putI32(frame + 10, (int32_t)homeSteps);
+  putI32(frame + 14, (int32_t)wellSteps);
+  putU16(frame + 18, (uint16_t)(maxRpsJog * 100.0f + 0.5f));
+  putU16(frame + 20, (uint16_t)(maxRpsMove * 100.0f + 0.5f));
+  putU16(frame + 22, crc16(frame, 22));
+  Serial.write(frame, sizeof(frame));
+}
+
 static void processSerialCommand(const char* cmd, uint32_t nowUs) {
 
   // Status query - only respond when idle to avoid timing issues during motion
   if (strcmp(cmd, "?") == 0) {
     if (mode == MODE_IDLE && currentSps < MIN_STEP_SPS) {
-      sendStatus();
+      if (binaryStatus) sendBinaryStatus();
+      else sendStatus();
+    }
+    return;
+  }
+
+  // Status format: SF1 binary frames, SF0 ASCII lines
+  if (strcmp(cmd, "SF1") == 0 || strcmp(cmd, "SF0") == 0) {
+    binaryStatus = (cmd[2] == '1');
+    Serial.println(binaryStatus ? "OK:SF1" : "OK:SF0");
+    return;
+  }
+
+  // Status stream: SU<hz> pushes status at hz (1-50), SU0 stops
+  if (strncmp(cmd, "SU", 2) == 0) {
+    long hz = atol(cmd + 2);
+    if (hz >= 0 && hz <= 50) {
+      streamIntervalMs = hz ? 1000 / hz : 0;
+      Serial.print("OK:SU");
+      Serial.println(hz);
     }
     return;
   }
@@ -603,6 +667,28 @@ static void processSerialCommand(const char* cmd, uint32_t nowUs) {
 }
 
 
+// Push subscribed status. While moving (when ? is not answered) the
+// stream keeps going so the host does not mistake a long move for a
+// stalled stream, but at most every STREAM_MOTION_INTERVAL_MS and only
+// when the whole status fits in the TX buffer, so a push never blocks
+// step generation.
+static const uint32_t STREAM_MOTION_INTERVAL_MS = 250;
+static const int BINARY_STATUS_LEN = 24;
+static const int ASCII_STATUS_MAX_LEN = 112;
+
+static void processStatusStream() {
+  if (streamIntervalMs == 0) return;
+  const uint32_t nowMs = millis();
+  const bool moving = (mode != MODE_IDLE || currentSps >= MIN_STEP_SPS);
+  uint32_t intervalMs = streamIntervalMs;
+  if (moving && intervalMs < STREAM_MOTION_INTERVAL_MS) intervalMs = STREAM_MOTION_INTERVAL_MS;
+  if (nowMs - lastStreamMs < intervalMs) return;
+  if (moving && Serial.availableForWrite() < (binaryStatus ? BINARY_STATUS_LEN : ASCII_STATUS_MAX_LEN)) return;
+  lastStreamMs = nowMs;
+  if (binaryStatus) sendBinaryStatus();
+  else sendStatus();
+}
+
 static void processSerial(uint32_t nowUs) {
 
   while (Serial.available() > 0) {
@@ -733,6 +819,8 @@ void loop() {
 
   processSerial(nowUs);
 
+  processStatusStream();
+
 
   // Update buttons (edge detection)
 
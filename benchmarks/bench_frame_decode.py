@@ -0,0 +1,72 @@
+"""
+Camera Frame Decode Benchmark
+
+Measures FrameDecoder cost per frame for each camera display size
+preset, decoding at full size and resizing (the previous path) against
+libjpeg scale-on-decode (Image.draft) followed by the final resize. The
+frame is a 640x480 JPEG with camera-like noise, the ESP32-CAM's VGA
+setting.
+
+Scaled decode only applies when the display is at least 2x smaller than
+the frame in both dimensions. Larger presets (640x480, 800x600) take the
+same full-size path with the option on or off, so their two columns
+differ only by run-to-run noise and no speedup is reported for them.
+
+Usage:
+    python -m benchmarks.bench_frame_decode
+"""
+
+import io
+import time
+
+from PIL import Image
+
+from src.config import CAMERA_DISPLAY_SIZES
+from src.frame_decoder import FrameDecoder
+
+
+FRAME_SIZE = (640, 480)
+REPEATS = 200
+
+
+def make_frame() -> bytes:
+    """Encode a noisy VGA frame (solid colors decode unrealistically fast)."""
+    gradient = Image.linear_gradient("L").resize(FRAME_SIZE)
+    noise = Image.effect_noise(FRAME_SIZE, 12)
+    image = Image.merge("RGB", (gradient, noise, Image.blend(gradient, noise, 0.5)))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=80)
+    return buffer.getvalue()
+
+
+def measure(decoder: FrameDecoder, jpeg: bytes) -> float:
+    """Get the mean decode time in milliseconds."""
+    decoder.decode(jpeg)  # Warm up
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        decoder.decode(jpeg)
+    return (time.perf_counter() - start) / REPEATS * 1000.0
+
+
+def main() -> None:
+    jpeg = make_frame()
+    print(f"{FRAME_SIZE[0]}x{FRAME_SIZE[1]} JPEG, {len(jpeg) // 1024} KB, {REPEATS} decodes per case")
+    print(f"{'display':>9} {'decoded at':>11} {'full ms':>8} {'scaled ms':>10} {'speedup':>8}")
+    for name, size in CAMERA_DISPLAY_SIZES.items():
+        full = measure(FrameDecoder(lambda frame: None, size, scaled_decode=False), jpeg)
+        scaled = measure(FrameDecoder(lambda frame: None, size, scaled_decode=True), jpeg)
+
+        reduced = size[0] * 2 <= FRAME_SIZE[0] and size[1] * 2 <= FRAME_SIZE[1]
+        if reduced:
+            image = Image.open(io.BytesIO(jpeg))
+            image.draft("RGB", size)
+            decoded_at = f"{image.size[0]}x{image.size[1]}"
+            speedup = f"{full / scaled:>7.1f}x"
+        else:
+            decoded_at = f"{FRAME_SIZE[0]}x{FRAME_SIZE[1]}"
+            speedup = f"{'same':>8}"
+        print(f"{name:>9} {decoded_at:>11} {full:>8.2f} {scaled:>10.2f} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
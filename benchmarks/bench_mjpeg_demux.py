@@ -0,0 +1,119 @@
+"""
+MJPEG Demux Benchmark
+
+Compares the MJPEG demuxer (Content-Length parts read with recv_into)
+against the previous reader loop (bytes concatenation plus a SOI/EOI
+rescan of the buffer after every 8 KB receive). Both read the same
+ESP32-CAM style stream (chunked multipart, VGA-sized frames) from a
+socket pair and report reader-thread CPU time per frame.
+
+Usage:
+    python -m benchmarks.bench_mjpeg_demux
+"""
+
+import os
+import socket
+import threading
+import time
+
+from src.mjpeg_demux import MJPEGDemuxer
+
+
+FRAMES = 600
+FRAME_SIZE = 40000  # Typical VGA JPEG from the ESP32-CAM
+BOUNDARY = b"123456789000000000000987654321"
+
+
+def make_stream() -> bytes:
+    """Build a chunked multipart stream as the camera firmware sends it."""
+    def chunk(data: bytes) -> bytes:
+        return b"%x\r\n" % len(data) + data + b"\r\n"
+
+    frame = b"\xff\xd8" + os.urandom(FRAME_SIZE - 4).replace(b"\xff", b"\xfe") + b"\xff\xd9"
+    part = (chunk(b"\r\n--" + BOUNDARY + b"\r\n")
+            + chunk(b"Content-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n" % len(frame))
+            + chunk(frame))
+    headers = (b"HTTP/1.1 200 OK\r\nContent-Type: multipart/x-mixed-replace;boundary="
+               + BOUNDARY + b"\r\nTransfer-Encoding: chunked\r\n\r\n")
+    return headers + part * FRAMES + b"0\r\n\r\n"
+
+
+# -----------------------------------------------------------------------------
+# Previous reader loop (reference only)
+# -----------------------------------------------------------------------------
+
+def legacy_extract_frames(buffer: bytes, frames: list) -> bytes:
+    while True:
+        jpg_start = buffer.find(b'\xff\xd8')
+        if jpg_start == -1:
+            if len(buffer) > 2:
+                buffer = buffer[-2:]
+            break
+        jpg_end = buffer.find(b'\xff\xd9', jpg_start)
+        if jpg_end == -1:
+            if len(buffer) > 500000:
+                buffer = buffer[-2:]
+            break
+        jpg_end += 2
+        frame_data = buffer[jpg_start:jpg_end]
+        buffer = buffer[jpg_end:]
+        if len(frame_data) > 100:
+            frames.append(frame_data)
+    return buffer
+
+
+def legacy_read(sock: socket.socket) -> int:
+    frames: list = []
+    buffer = b''
+    headers_done = False
+    while True:
+        chunk = sock.recv(8192)
+        if not chunk:
+            break
+        buffer += chunk
+        if not headers_done:
+            header_end = buffer.find(b'\r\n\r\n')
+            if header_end != -1:
+                buffer = buffer[header_end + 4:]
+                headers_done = True
+            continue
+        buffer = legacy_extract_frames(buffer, frames)
+    return len(frames)
+
+
+def demuxer_read(sock: socket.socket) -> int:
+    return sum(1 for _ in MJPEGDemuxer(sock).frames())
+
+
+def measure(read, stream: bytes):
+    """
+    Read the stream through a socket pair.
+
+    Returns:
+        (frames read, reader CPU seconds)
+    """
+    reader, writer = socket.socketpair()
+
+    def send():
+        writer.sendall(stream)
+        writer.close()
+
+    threading.Thread(target=send, daemon=True).start()
+    start = time.thread_time()
+    count = read(reader)
+    cpu = time.thread_time() - start
+    reader.close()
+    return count, cpu
+
+
+def main() -> None:
+    stream = make_stream()
+    print(f"{FRAMES} frames of {FRAME_SIZE // 1000} KB, chunked multipart")
+    print(f"{'reader':>10} {'frames':>7} {'CPU ms/frame':>13}")
+    for label, read in (("legacy", legacy_read), ("demuxer", demuxer_read)):
+        count, cpu = measure(read, stream)
+        print(f"{label:>10} {count:>7} {cpu / max(count, 1) * 1000:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+SCL Response Parser Benchmark
+
+Micro-benchmark of the bytes-level parser in src/scl_parser.py against
+the previous decode-and-replace string parsing, over the response shapes
+seen from the STAC5 in the field.
+
+Usage:
+    python -m benchmarks.bench_scl_parser
+"""
+
+import timeit
+from typing import Optional
+
+from src.escl_protocol import parse_response
+from src.scl_parser import parse_position, parse_status_code, parse_alarm_code
+
+
+# (label, frame, parser kind, register)
+SHAPES = [
+    ("EP=value", b"EP=123456", "position", b"EP"),
+    ("IE negative", b"IE=-98765", "position", b"IE"),
+    ("EP duplicated", b"EP=123456 EP=123456", "position", b"EP"),
+    ("bare value", b"123456", "position", b"EP"),
+    ("SC=value", b"SC=0019", "status", b"SC"),
+    ("SC duplicated", b"SC=0009 SC=0009", "status", b"SC"),
+    ("AL=value", b"AL=0200", "alarm", b"AL"),
+    ("error", b"?4", "status", b"SC"),
+]
+
+NUMBER = 100000
+
+
+# -----------------------------------------------------------------------------
+# Previous string-based parsers (reference only)
+# -----------------------------------------------------------------------------
+
+def legacy_position(response: Optional[str], prefix: str) -> Optional[int]:
+    if response:
+        try:
+            key = prefix + "="
+            if key in response:
+                idx = response.find(key) + len(key)
+                end = idx
+                while end < len(response) and (response[end].isdigit() or response[end] == '-'):
+                    end += 1
+                return int(response[idx:end])
+            else:
+                clean = response.replace("=", "").replace(prefix, "")
+                clean = clean.replace("%", "").replace("?", "").replace("*", "").strip()
+                parts = clean.split()
+                if parts:
+                    return int(parts[0])
+        except ValueError:
+            pass
+    return None
+
+
+def legacy_code(response: Optional[str], prefix: str) -> Optional[int]:
+    if response:
+        key = prefix + "="
+        if key in response:
+            idx = response.find(key) + len(key)
+            end = idx
+            while end < len(response) and response[end].isalnum():
+                end += 1
+            code = response[idx:end]
+        else:
+            clean = response.replace("=", "").replace(prefix, "")
+            clean = clean.replace("%", "").replace("?", "").replace("*", "").strip()
+            parts = clean.split()
+            code = parts[0] if parts else None
+        if code:
+            try:
+                return int(code, 16)
+            except ValueError:
+                pass
+    return None
+
+
+def legacy(frame: bytes, kind: str, register: bytes):
+    response = parse_response(frame)
+    if kind == "position":
+        return legacy_position(response, register.decode('ascii'))
+    return legacy_code(response, register.decode('ascii'))
+
+
+def current(frame: bytes, kind: str, register: bytes):
+    if kind == "position":
+        return parse_position(frame, register)
+    if kind == "status":
+        return parse_status_code(frame)
+    return parse_alarm_code(frame)
+
+
+def main() -> None:
+    print(f"{'shape':>14} {'legacy ns':>10} {'bytes ns':>9} {'speedup':>8}  result")
+    for label, frame, kind, register in SHAPES:
+        old = min(timeit.repeat(lambda: legacy(frame, kind, register), number=NUMBER, repeat=5))
+        new = min(timeit.repeat(lambda: current(frame, kind, register), number=NUMBER, repeat=5))
+        old_ns = old / NUMBER * 1e9
+        new_ns = new / NUMBER * 1e9
+        print(f"{label:>14} {old_ns:>10.0f} {new_ns:>9.0f} {old_ns / new_ns:>7.1f}x  "
+              f"{legacy(frame, kind, register)!r} -> {current(frame, kind, register)!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Serial Reader Benchmark
+
+Compares the event-driven SerialManager (blocking reader plus queue-driven
+writer) against the previous 10 ms polling loop, over a pty stand-in for
+the Arduino. Reports idle CPU use with status polling switched off, and
+per-command latency to the wire and to the status reply.
+
+POSIX only (the stand-in uses a pseudo-terminal).
+
+Usage:
+    python -m benchmarks.bench_serial_reader
+"""
+
+import os
+import queue
+import threading
+import time
+
+import serial
+
+from src.metrics import LatencyRecorder
+from src.serial_manager import SerialManager
+from benchmarks.pty_stand_in import PtyArduinoStandIn
+
+
+# Commands timed per implementation
+COMMANDS = 200
+
+# Idle measurement window (seconds)
+IDLE_SECONDS = 3.0
+
+
+class LegacySerialManager(SerialManager):
+    """SerialManager with the previous sleep-and-check read loop (reference only)."""
+
+    def _write_loop(self, commands: queue.Queue) -> None:
+        return  # Legacy loop services the queue itself
+
+    def _read_loop(self) -> None:
+        buffer = ""
+        while not self._stop_event.is_set():
+            try:
+                while True:
+                    command = self._command_queue.get_nowait()
+                    if command is not None:
+                        self._send_command_direct(command)
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                if not self._serial or not self._serial.is_open:
+                    break
+                try:
+                    if self._serial.in_waiting > 0:
+                        data = self._serial.read(self._serial.in_waiting)
+                        buffer += data.decode('ascii', errors='ignore')
+                except serial.SerialException:
+                    break
+
+            while '\n' in buffer:
+                line, buffer = buffer.split('\n', 1)
+                line = line.strip()
+                if line:
+                    self._process_response(line)
+
+            time.sleep(0.01)
+
+
+def measure(manager_class):
+    """Return (idle CPU %, to-wire latency, round-trip latency) for one class."""
+    stand_in = PtyArduinoStandIn()
+    stand_in.start()
+    manager = manager_class()
+    manager.POLL_INTERVAL = 3600.0  # Keep the link idle unless we send
+    replied = threading.Event()
+    manager.set_status_callback(lambda status: replied.set())
+
+    wire = LatencyRecorder()
+    round_trip = LatencyRecorder()
+    try:
+        manager.connect(stand_in.port)
+
+        cpu_start = time.process_time()
+        time.sleep(IDLE_SECONDS)
+        idle_cpu = (time.process_time() - cpu_start) / IDLE_SECONDS * 100.0
+
+        for _ in range(COMMANDS):
+            replied.clear()
+            count = len(stand_in.received)
+            start = time.perf_counter()
+            manager.send_command("?")
+            if not replied.wait(1.0):
+                continue
+            round_trip.record(time.perf_counter() - start)
+            if len(stand_in.received) > count:
+                wire.record(stand_in.received[count][0] - start)
+            # Desynchronize from the legacy loop's 10 ms tick
+            time.sleep(0.003 + (len(stand_in.received) % 7) * 0.001)
+    finally:
+        manager.disconnect()
+        stand_in.stop()
+    return idle_cpu, wire.summary(), round_trip.summary()
+
+
+def main() -> None:
+    if not hasattr(os, "openpty"):
+        print("bench_serial_reader needs a POSIX pty; skipping")
+        return
+    print(f"{COMMANDS} commands per reader, idle CPU over {IDLE_SECONDS:.0f}s")
+    for name, manager_class in (("polling", LegacySerialManager), ("event", SerialManager)):
+        idle_cpu, wire, round_trip = measure(manager_class)
+        print(f"{name:>8}  idle CPU: {idle_cpu:.2f}%")
+        print(f"{'':>8}  to wire:  {wire}")
+        print(f"{'':>8}  to reply: {round_trip}")
+
+
+if __name__ == "__main__":
+    main()
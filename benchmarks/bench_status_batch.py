@@ -0,0 +1,75 @@
+"""
+Status Refresh Benchmark
+
+Compares a full STAC5 status refresh done as three sequential queries
+(EP, SC, AL) against poll_status_batch(), which writes all three packets
+in one send and collects the replies in one read window.
+
+Usage:
+    python -m benchmarks.bench_status_batch
+"""
+
+import contextlib
+import io
+import statistics
+import time
+
+from src.stac5_manager import STAC5Manager
+from simulator import ESCLSimulator
+
+
+# Round-trip latencies to simulate (seconds): loopback, LAN, Starlink
+LATENCIES = [0.0, 0.005, 0.025]
+
+ITERATIONS = 40
+
+
+def sequential_refresh(manager: STAC5Manager) -> None:
+    """Refresh status the pre-batch way: one round-trip per query."""
+    manager.get_encoder_position()
+    manager.get_status_code()
+    manager.get_alarm_code()
+
+
+def batch_refresh(manager: STAC5Manager) -> None:
+    """Refresh status in a single transaction."""
+    manager.poll_status_batch()
+
+
+def measure(refresh, manager: STAC5Manager) -> list:
+    """Time ITERATIONS refreshes, returning per-refresh latency in ms."""
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        refresh(manager)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def main() -> None:
+    print(f"{'RTT':>8} {'method':>12} {'mean ms':>9} {'p50 ms':>8} {'max ms':>8}")
+    for latency in LATENCIES:
+        simulator = ESCLSimulator(latency=latency, udp_port=None)
+        simulator.start()
+        manager = STAC5Manager(simulator.host, simulator.tcp_port)
+        try:
+            # Silence per-command TX/RX logging while timing
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager.connect()
+                results = [
+                    ("sequential", measure(sequential_refresh, manager)),
+                    ("batch", measure(batch_refresh, manager)),
+                ]
+                manager.disconnect()
+        finally:
+            simulator.stop()
+
+        for name, samples in results:
+            print(f"{latency * 1000:>6.1f}ms {name:>12} "
+                  f"{statistics.mean(samples):>9.2f} "
+                  f"{statistics.median(samples):>8.2f} "
+                  f"{max(samples):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
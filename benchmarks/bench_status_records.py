@@ -0,0 +1,126 @@
+"""
+Status Record Allocation Benchmark
+
+Measures the heap cost of winch status records: the previous plain
+dataclass (per-instance __dict__, raw line always kept) against the
+slotted frozen WinchStatus with raw_response off. Reports allocations
+per hour of polling, for a moving winch (every line unique, so every
+poll parses) and an idle one (repeated lines served from the parse
+cache), and the memory retained by an hour of status history.
+
+Usage:
+    python -m benchmarks.bench_status_records
+"""
+
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from src.command_protocol import MotionMode, ResponseParser, WinchStatus
+from src.config import DEFAULT_JOG_SPEED_RPS, DEFAULT_MOVE_SPEED_RPS
+
+
+POLL_HZ = 30
+POLLS_PER_HOUR = POLL_HZ * 3600
+SAMPLE = 20000
+
+LINE = "POS:{} MODE:MOVE SPD:1.50 HOME:Y@0 WELL:Y@96000 ESTOP:0 VJOG:2.00 VMOVE:3.00"
+IDLE_LINE = "POS:96000 MODE:IDLE SPD:0.00 HOME:Y@0 WELL:Y@96000 ESTOP:0 VJOG:2.00 VMOVE:3.00"
+
+
+# -----------------------------------------------------------------------------
+# Previous status record (reference only)
+# -----------------------------------------------------------------------------
+
+@dataclass
+class LegacyWinchStatus:
+    position: int = 0
+    mode: MotionMode = MotionMode.IDLE
+    speed_rps: float = 0.0
+    home_saved: bool = False
+    home_position: Optional[int] = None
+    well_saved: bool = False
+    well_position: Optional[int] = None
+    estop_active: bool = False
+    max_jog_rps: float = DEFAULT_JOG_SPEED_RPS
+    max_move_rps: float = DEFAULT_MOVE_SPEED_RPS
+    raw_response: str = ""
+
+
+def legacy_parse(response: str) -> Optional[LegacyWinchStatus]:
+    response = response.strip()
+    match = ResponseParser.STATUS_PATTERN.search(response)
+    if not match:
+        return None
+    return LegacyWinchStatus(
+        position=int(match.group(1)),
+        mode=MotionMode(match.group(2)),
+        speed_rps=float(match.group(3)),
+        home_saved=match.group(4).startswith("Y"),
+        home_position=int(match.group(5)) if match.group(5) else None,
+        well_saved=match.group(6).startswith("Y"),
+        well_position=int(match.group(7)) if match.group(7) else None,
+        estop_active=(match.group(8) == "1"),
+        max_jog_rps=float(match.group(9)),
+        max_move_rps=float(match.group(10)),
+        raw_response=response,
+    )
+
+
+def measure(parse: Callable[[str], object], lines: List[bytes]):
+    """
+    Parse every line while keeping the results, as a history buffer would.
+
+    Returns:
+        (allocated blocks per poll, retained bytes per poll)
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    history = [parse(line.decode('ascii')) for line in lines]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    # The history list itself is not part of the record cost
+    blocks -= 1
+    size -= sys.getsizeof(history)
+    return blocks / len(lines), size / len(lines)
+
+
+def main() -> None:
+    # Lines arrive as bytes and are decoded per poll, as in SerialManager,
+    # so a record that keeps the raw text keeps that string alive
+    moving = [LINE.format(i).encode('ascii') for i in range(SAMPLE)]
+    idle = [IDLE_LINE.encode('ascii')] * SAMPLE
+
+    ResponseParser.cache_clear()
+    cases = [
+        ("moving, legacy", legacy_parse, moving),
+        ("moving, slotted", ResponseParser._parse_status_uncached, moving),
+        ("idle, legacy", legacy_parse, idle),
+        ("idle, slotted+cache", ResponseParser.parse_status, idle),
+    ]
+
+    print(f"record size: legacy {legacy_record_size()} B, "
+          f"slotted {sys.getsizeof(WinchStatus())} B (no __dict__)")
+    print(f"{'case':>20} {'blocks/poll':>12} {'bytes/poll':>11} "
+          f"{'allocs/hour':>12} {'MB/hour kept':>13}")
+    for label, parse, lines in cases:
+        blocks, size = measure(parse, lines)
+        print(f"{label:>20} {blocks:>12.2f} {size:>11.1f} "
+              f"{blocks * POLLS_PER_HOUR:>12,.0f} {size * POLLS_PER_HOUR / 1e6:>13.1f}")
+    print(f"({POLL_HZ} Hz poll, {POLLS_PER_HOUR:,} polls/hour)")
+
+
+def legacy_record_size() -> int:
+    status = LegacyWinchStatus()
+    return sys.getsizeof(status) + sys.getsizeof(status.__dict__)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Stop Command Latency Benchmark
+
+Measures how long a stop command takes to reach the wire and to be
+acknowledged while the status poll loop and a flood of extra status
+queries keep the link busy. Reports mean, p99 and worst case for stops
+on the safety lane and, for comparison, the same command on the poll lane.
+
+The safety lane only skips polls that are queued and not yet written.
+The drive replies in order, so on either lane the acknowledgement waits
+for the replies to the requests already in flight (also reported). With
+the writer thread draining polls as soon as they are queued, both lanes
+measure about the same; the ack figure is bounded by one round trip plus
+the in-flight depth, not by the lane.
+
+Usage:
+    python -m benchmarks.bench_stop_latency
+"""
+
+import contextlib
+import io
+import threading
+import time
+
+from src.escl_transport import PRIORITY_POLL, PRIORITY_SAFETY
+from src.metrics import LatencyRecorder
+from src.stac5_manager import STAC5Manager
+from simulator import ESCLSimulator
+
+
+# Simulated round-trip latency (seconds)
+LATENCY = 0.025
+
+# Stop commands issued per lane
+STOPS = 100
+
+# Extra status batches in flight at any time
+FLOOD_DEPTH = 8
+
+
+def flood_polls(manager: STAC5Manager, running: threading.Event) -> None:
+    """Keep FLOOD_DEPTH status batches queued on the poll lane."""
+    transport = manager._transport
+    while running.is_set():
+        batches = [transport.submit_many(["IE", "SC", "AL"], PRIORITY_POLL)
+                   for _ in range(FLOOD_DEPTH)]
+        for batch in batches:
+            batch[-1].wait(1.0)
+
+
+def measure_lane(manager: STAC5Manager, priority: int):
+    """Send STOPS stop commands on the given lane and record latency."""
+    transport = manager._transport
+    write = LatencyRecorder()
+    ack = LatencyRecorder()
+    ahead = 0
+    for _ in range(STOPS):
+        ahead += transport.in_flight
+        start = time.perf_counter()
+        request = transport.submit("ST", priority)
+        request.wait(2.0)
+        if request.sent_time:
+            write.record(request.sent_time - start)
+        if request.response is not None:
+            ack.record(request.received_time - start)
+        time.sleep(0.01)
+    return write.summary(), ack.summary(), ahead / STOPS
+
+
+def main() -> None:
+    simulator = ESCLSimulator(latency=LATENCY, udp_port=None)
+    simulator.start()
+    manager = STAC5Manager(simulator.host, simulator.tcp_port)
+    running = threading.Event()
+    running.set()
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager.connect()
+            manager.start_polling(0.03)
+            flood = threading.Thread(target=flood_polls, args=(manager, running), daemon=True)
+            flood.start()
+            results = [
+                ("safety lane", measure_lane(manager, PRIORITY_SAFETY)),
+                ("poll lane", measure_lane(manager, PRIORITY_POLL)),
+            ]
+            running.clear()
+            flood.join(2.0)
+            manager.disconnect()
+    finally:
+        simulator.stop()
+
+    print(f"RTT {LATENCY * 1000:.0f} ms, {FLOOD_DEPTH} status batches in flight, "
+          f"{STOPS} stops per lane")
+    for name, (write, ack, ahead) in results:
+        print(f"{name:>12}  to wire: {write}")
+        print(f"{'':>12}  to ack:  {ack}")
+        print(f"{'':>12}  requests in flight ahead of each stop: {ahead:.1f} mean")
+
+
+if __name__ == "__main__":
+    main()
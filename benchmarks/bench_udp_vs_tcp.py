@@ -0,0 +1,72 @@
+"""
+UDP vs TCP Status Query Benchmark
+
+Measures batched status refresh latency (IE, SC, AL) over the TCP and UDP
+eSCL transports while the simulated link drops packets. On TCP a lost
+segment costs a kernel RTO and stalls every reply behind it; on UDP only
+the affected query is retransmitted.
+
+Usage:
+    python -m benchmarks.bench_udp_vs_tcp
+"""
+
+import contextlib
+import io
+import time
+
+from src.metrics import LatencyRecorder
+from src.stac5_manager import STAC5Manager
+from simulator import ESCLSimulator
+
+
+# Simulated round-trip latency (seconds)
+LATENCY = 0.05
+
+# Probability of losing each packet
+LOSS_RATES = [0.0, 0.02, 0.05]
+
+# Status refreshes per configuration
+ITERATIONS = 200
+
+
+def measure(use_udp: bool, loss: float):
+    """Time ITERATIONS batched refreshes over one transport."""
+    simulator = ESCLSimulator(latency=LATENCY, seed=7)
+    simulator.start()
+    if use_udp:
+        manager = STAC5Manager(simulator.host, use_udp=True, udp_port=simulator.udp_port)
+    else:
+        manager = STAC5Manager(simulator.host, simulator.tcp_port)
+
+    recorder = LatencyRecorder()
+    failures = 0
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulator.loss = 0.0  # Connect over a clean link
+            manager.connect()
+            simulator.loss = loss
+            for _ in range(ITERATIONS):
+                start = time.perf_counter()
+                manager.poll_status_batch(immediate=True, timeout=2.0)
+                elapsed = time.perf_counter() - start
+                recorder.record(elapsed)
+                if elapsed >= 2.0:
+                    failures += 1
+            retransmits = getattr(manager._transport, "retransmits", 0)
+            manager.disconnect()
+    finally:
+        simulator.stop()
+    return recorder.summary(), failures, retransmits
+
+
+def main() -> None:
+    print(f"RTT {LATENCY * 1000:.0f} ms, {ITERATIONS} IE+SC+AL refreshes per run")
+    for loss in LOSS_RATES:
+        for name, use_udp in (("TCP", False), ("UDP", True)):
+            summary, failures, retransmits = measure(use_udp, loss)
+            extra = f" retransmits={retransmits}" if use_udp else ""
+            print(f"loss {loss * 100:>4.1f}% {name}: {summary} timeouts={failures}{extra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Pty Winch Controller Stand-in
+
+Pseudo-terminal pair that plays the Arduino winch controller for
+SerialManager benchmarks: the manager opens the slave side as a normal
+serial port, and this stand-in answers every command line on the master
+side with a status line. Arrival times are recorded so write latency can
+be measured without hardware.
+
+POSIX only (uses os.openpty).
+"""
+
+import os
+import threading
+import time
+from typing import List, Tuple
+
+STATUS_LINE = b"POS:12345 MODE:IDLE SPD:0.00 HOME:Y@0 WELL:Y@8000 ESTOP:0\n"
+
+
+class PtyArduinoStandIn:
+    """Answers newline-terminated commands on a pty with status lines."""
+
+    def __init__(self):
+        self._master, self._slave = os.openpty()
+        self.port = os.ttyname(self._slave)
+        self.received: List[Tuple[float, str]] = []
+        self._running = False
+
+    def start(self) -> None:
+        """Start answering commands."""
+        self._running = True
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop the stand-in and close the pty pair."""
+        self._running = False
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _serve(self) -> None:
+        buffer = b""
+        while self._running:
+            try:
+                data = os.read(self._master, 1024)
+            except OSError:
+                return
+            if not data:
+                return
+            now = time.perf_counter()
+            buffer += data
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                line = line.strip()
+                if not line:
+                    continue
+                self.received.append((now, line.decode('ascii', errors='ignore')))
+                try:
+                    os.write(self._master, STATUS_LINE)
+                except OSError:
+                    return
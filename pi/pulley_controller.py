@@ -247,6 +247,62 @@ class STAC5:
         return False
 
 
+# =============================================================================
+# Line Framing
+# =============================================================================
+
+# Longest command line kept before the partial line is treated as garbage
+MAX_LINE_LENGTH = 1024
+
+
+class LineFramer:
+    """
+    Incremental framer for commands terminated by LF, CR or CRLF.
+
+    Standalone copy of src/line_framer.py (this script runs on the Pi
+    without the laptop package). Bytes accumulate in a bytearray and
+    complete lines are copied out once; a partial line longer than
+    MAX_LINE_LENGTH is discarded up to its terminator.
+    """
+
+    def __init__(self, max_line_length=MAX_LINE_LENGTH):
+        self.buffer = bytearray()
+        self.max_line_length = max_line_length
+        self.discarding = False
+
+    def feed(self, data):
+        """Add received bytes and return a list of complete, stripped lines."""
+        buffer = self.buffer
+        buffer += data
+        lines = []
+        start = 0
+
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(b'\n', start)
+                cr = buffer.find(b'\r', start, end if end != -1 else len(buffer))
+                if cr != -1:
+                    end = cr
+                if end == -1:
+                    break
+                if self.discarding:
+                    self.discarding = False
+                elif end - start <= self.max_line_length:
+                    line = bytes(view[start:end]).strip()
+                    if line:
+                        lines.append(line)
+                start = end + 1
+
+        if start:
+            del buffer[:start]
+
+        if len(buffer) > self.max_line_length:
+            buffer.clear()
+            self.discarding = True
+
+        return lines
+
+
 # =============================================================================
 # Client Handler
 # =============================================================================
@@ -264,28 +320,19 @@ class ClientHandler:
         """Main loop to handle client commands."""
         print(f"[CLIENT] Connected: {self.address}")
 
-        buffer = ""
+        framer = LineFramer()
         while self.running:
             try:
-                data = self.socket.recv(1024).decode('utf-8')
+                data = self.socket.recv(1024)
                 if not data:
                     break
 
-                buffer += data
-
-                # Process complete commands (newline terminated)
-                while '\n' in buffer or '\r' in buffer:
-                    # Split on either newline type
-                    for sep in ['\r\n', '\n', '\r']:
-                        if sep in buffer:
-                            cmd, buffer = buffer.split(sep, 1)
-                            break
-
-                    cmd = cmd.strip()
-                    if cmd:
-                        response = self.process_command(cmd)
-                        if response:
-                            self.socket.sendall((response + "\n").encode('utf-8'))
+                # Process complete commands (LF, CR or CRLF terminated)
+                for line in framer.feed(data):
+                    cmd = line.decode('utf-8', errors='ignore')
+                    response = self.process_command(cmd)
+                    if response:
+                        self.socket.sendall((response + "\n").encode('utf-8'))
 
             except socket.timeout:
                 continue
@@ -0,0 +1,16 @@
+"""
+Device Simulator Package
+
+Local eSCL server with a kinematic STAC5 drive model, for exercising the
+host-side transport, polling and move sequencing without hardware, plus
+stand-ins for the winch (serial) and drop cylinder (WiFi) controllers.
+
+Usage:
+    python -m simulator --latency 0.03 --jitter 0.005
+"""
+
+from .stac5_drive import STAC5DriveModel
+from .escl_server import ESCLSimulator
+from .controllers import DropCylinderSimulator, WinchControllerSimulator
+
+__all__ = ["STAC5DriveModel", "ESCLSimulator", "DropCylinderSimulator", "WinchControllerSimulator"]
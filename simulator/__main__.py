@@ -0,0 +1,44 @@
+"""
+Run the STAC5 simulator on the standard eSCL ports.
+
+Point the GUI (or any STAC5Manager) at 127.0.0.1 to drive it.
+"""
+
+import argparse
+import time
+
+from src.config import STAC5_TCP_PORT, STAC5_UDP_PORT
+from .escl_server import ESCLSimulator
+from .stac5_drive import STAC5DriveModel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="STAC5 eSCL drive simulator")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--tcp-port", type=int, default=STAC5_TCP_PORT)
+    parser.add_argument("--udp-port", type=int, default=STAC5_UDP_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="Round-trip latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra delay per direction (s)")
+    parser.add_argument("--loss", type=float, default=0.0, help="Packet loss probability (0-1)")
+    parser.add_argument("--duplicate-echo", action="store_true",
+                        help="Answer queries with a duplicated echo (EP=1 EP=1)")
+    args = parser.parse_args()
+
+    drive = STAC5DriveModel(duplicate_echo=args.duplicate_echo)
+    simulator = ESCLSimulator(drive, args.host, args.tcp_port, args.udp_port,
+                              latency=args.latency, jitter=args.jitter, loss=args.loss)
+    simulator.start()
+    print(f"[SIM] STAC5 simulator on {args.host} TCP {simulator.tcp_port} "
+          f"UDP {simulator.udp_port} (RTT {args.latency * 1000:.0f} ms)")
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+        print("[SIM] Stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+Line Controller Simulators
+
+Stand-ins for the newline-protocol controllers: the Arduino winch
+controller on a pseudo-terminal (SerialManager opens the slave side as a
+normal serial port) and the ESP32 drop cylinder controller on a local TCP
+port (DropCylinderManager.connect_wifi). Both answer `?`, negotiate binary
+status frames (SF1/SF0) and push subscribed status streams (SU<hz>) the
+way the firmware does, so status handling can be exercised without
+hardware. Like the firmware, the winch simulator leaves ? unanswered and
+slows its stream to MOTION_STREAM_INTERVAL_SEC while its status shows
+motion. Other winch commands are recorded but have no effect; the drop
+cylinder simulator also applies motion and setpoint commands to its
+status (modes change at once, position does not advance) and answers
+acknowledgement tags (AK1, <command>#<seq>).
+
+The winch simulator is POSIX only (uses os.openpty).
+"""
+
+import abc
+import os
+import socket
+import threading
+import time
+from dataclasses import replace
+from typing import List, Optional
+
+from src.command_protocol import MotionMode, WinchStatus, encode_binary_status
+from src.drop_cylinder_protocol import (
+    DropCylinderStatus,
+    command_kind,
+    encode_drop_cylinder_binary_status,
+)
+from src.line_framer import LineFramer
+
+# Highest stream rate the firmware accepts
+MAX_STREAM_RATE_HZ = 50
+
+# Shortest winch stream interval while moving (STREAM_MOTION_INTERVAL_MS)
+MOTION_STREAM_INTERVAL_SEC = 0.25
+
+
+def format_winch_status(status: WinchStatus) -> str:
+    """Format a status as the winch firmware's ASCII status line."""
+    home = f"Y@{status.home_position}" if status.home_saved else "N"
+    well = f"Y@{status.well_position}" if status.well_saved else "N"
+    return (f"POS:{status.position} MODE:{status.mode.value} SPD:{status.speed_rps:.2f} "
+            f"HOME:{home} WELL:{well} ESTOP:{int(status.estop_active)} "
+            f"VJOG:{status.max_jog_rps:.2f} VMOVE:{status.max_move_rps:.2f}")
+
+
+def format_drop_cylinder_status(status: DropCylinderStatus) -> str:
+    """Format a status as the drop cylinder firmware's ASCII status line."""
+    start = f"Y@{status.start_position_ms}" if status.start_saved else "N"
+    stop = f"Y@{status.stop_position_ms}" if status.stop_saved else "N"
+    return (f"POS:{status.position_ms} MODE:{status.mode} START:{start} STOP:{stop} "
+            f"TRIM:{status.trim_us} WIFI:{status.wifi_mode} IP:{status.ip_address} "
+            f"SPEED:{status.speed_percent}")
+
+
+class LineControllerSimulator(abc.ABC):
+    """
+    Command interpreter and status stream shared by the simulators.
+
+    Subclasses provide the transport (_serve/_send) and the status
+    encoding (_format_status/_encode_status).
+    """
+
+    def __init__(self, status, legacy: bool = False):
+        """
+        Initialize the simulator.
+
+        Args:
+            status: Status record reported to the host (replace it to
+                    change what the controller reports)
+            legacy: Behave like firmware without SF/SU support (the
+                    commands are silently ignored)
+        """
+        self.status = status
+        self.legacy = legacy
+        self.commands: List[str] = []
+        self.binary_status = False
+        self.stream_rate_hz = 0
+
+        self._running = False
+        self._write_lock = threading.Lock()
+        self._stream_wake = threading.Event()
+
+    def start(self) -> None:
+        """Start serving commands and streaming."""
+        self._running = True
+        threading.Thread(target=self._serve, daemon=True).start()
+        threading.Thread(target=self._stream_loop, daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop the simulator."""
+        self._running = False
+        self._stream_wake.set()
+
+    def reset(self) -> None:
+        """Simulate a controller reboot: status format and stream revert to defaults."""
+        self.binary_status = False
+        self.stream_rate_hz = 0
+        self._stream_wake.set()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def handle(self, command: str) -> Optional[bytes]:
+        """
+        Execute one command line.
+
+        Args:
+            command: Command without terminator
+
+        Returns:
+            Bytes to send back, or None for no reply
+        """
+        self.commands.append(command)
+
+        if command == "?":
+            return None if self._moving() else self._status_bytes()
+
+        if self.legacy:
+            return None
+
+        if command in ("SF1", "SF0"):
+            self.binary_status = command == "SF1"
+            return f"OK:{command}\n".encode('ascii')
+
+        if command.startswith("SU"):
+            try:
+                rate_hz = int(command[2:])
+            except ValueError:
+                return None
+            if 0 <= rate_hz <= MAX_STREAM_RATE_HZ:
+                self.stream_rate_hz = rate_hz
+                self._stream_wake.set()
+                return f"OK:SU{rate_hz}\n".encode('ascii')
+
+        return None
+
+    def _moving(self) -> bool:
+        """Check if the firmware would treat the controller as moving."""
+        return False
+
+    def _stream_interval(self, rate_hz: int) -> float:
+        return 1.0 / rate_hz
+
+    def _status_bytes(self) -> bytes:
+        if self.binary_status:
+            return self._encode_status(self.status)
+        return (self._format_status(self.status) + "\n").encode('ascii')
+
+    def _stream_loop(self) -> None:
+        while self._running:
+            rate_hz = self.stream_rate_hz
+            if rate_hz:
+                self._send(self._status_bytes())
+                self._stream_wake.wait(self._stream_interval(rate_hz))
+            else:
+                self._stream_wake.wait()
+            self._stream_wake.clear()
+
+    def _handle_data(self, framer: LineFramer, data: bytes) -> None:
+        """Feed received bytes and execute every complete command line."""
+        for line in framer.feed(data):
+            reply = self.handle(line.decode('ascii', errors='ignore'))
+            if reply:
+                self._send(reply)
+
+    @abc.abstractmethod
+    def _serve(self) -> None:
+        """Read commands from the host until stopped (serving thread)."""
+
+    @abc.abstractmethod
+    def _send(self, data: bytes) -> None:
+        """Send bytes to the host."""
+
+    @abc.abstractmethod
+    def _format_status(self, status) -> str:
+        """Format a status as the firmware's ASCII status line."""
+
+    @abc.abstractmethod
+    def _encode_status(self, status) -> bytes:
+        """Encode a status as the firmware's binary status frame."""
+
+
+class WinchControllerSimulator(LineControllerSimulator):
+    """Arduino winch controller on a pseudo-terminal (connect to .port)."""
+
+    def __init__(self, status: Optional[WinchStatus] = None, legacy: bool = False):
+        """
+        Initialize the simulator.
+
+        Args:
+            status: Reported status (default WinchStatus())
+            legacy: Ignore SF/SU like older firmware
+        """
+        super().__init__(status if status is not None else WinchStatus(), legacy)
+        self._master, self._slave = os.openpty()
+        self.port = os.ttyname(self._slave)
+
+    def stop(self) -> None:
+        """Stop the simulator and close the pty pair."""
+        super().stop()
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _serve(self) -> None:
+        framer = LineFramer()
+        while self._running:
+            try:
+                data = os.read(self._master, 1024)
+            except OSError:
+                return
+            if not data:
+                return
+            self._handle_data(framer, data)
+
+    def _send(self, data: bytes) -> None:
+        with self._write_lock:
+            try:
+                os.write(self._master, data)
+            except OSError:
+                pass
+
+    def _moving(self) -> bool:
+        return self.status.mode != MotionMode.IDLE
+
+    def _stream_interval(self, rate_hz: int) -> float:
+        if self._moving():
+            return max(1.0 / rate_hz, MOTION_STREAM_INTERVAL_SEC)
+        return 1.0 / rate_hz
+
+    def _format_status(self, status: WinchStatus) -> str:
+        return format_winch_status(status)
+
+    def _encode_status(self, status: WinchStatus) -> bytes:
+        return encode_binary_status(status)
+
+
+class DropCylinderSimulator(LineControllerSimulator):
+    """
+    ESP32 drop cylinder controller on a local TCP port.
+
+    Serves one client at a time; like the firmware, a new client starts
+    with ASCII status, no stream and no acknowledgement tags.
+    """
+
+    def __init__(self, status: Optional[DropCylinderStatus] = None, legacy: bool = False,
+                 host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        """
+        Initialize the simulator.
+
+        Args:
+            status: Reported status (default DropCylinderStatus())
+            legacy: Ignore SF/SU/AK like older firmware
+            host: Interface to listen on
+            port: TCP port (0 = pick a free port)
+            latency: Delay before each command is executed (seconds)
+        """
+        super().__init__(status if status is not None else DropCylinderStatus(), legacy)
+        self.latency = latency
+        self.ack_tags = False
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen(1)
+        self.host, self.port = self._server.getsockname()
+        self._client: Optional[socket.socket] = None
+
+    def stop(self) -> None:
+        """Stop the simulator and close its sockets."""
+        super().stop()
+        for sock in (self._server, self._client):
+            if sock is not None:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+
+    def reset(self) -> None:
+        """Simulate a controller reboot (also turns acknowledgement tags off)."""
+        super().reset()
+        self.ack_tags = False
+
+    def handle(self, command: str) -> Optional[bytes]:
+        """Execute one command line, answering ACK:<seq> for a tagged command."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        seq = None
+        if self.ack_tags:
+            base, sep, tag = command.rpartition("#")
+            if sep and tag.isdigit():
+                command, seq = base, tag
+
+        if command in ("AK1", "AK0") and not self.legacy:
+            self.commands.append(command)
+            self.ack_tags = command == "AK1"
+            reply = f"OK:{command}\n".encode('ascii')
+        else:
+            reply = super().handle(command)
+            self._apply(command)
+
+        if seq is not None:
+            reply = (reply or b"") + f"ACK:{seq}\n".encode('ascii')
+        return reply
+
+    def _apply(self, command: str) -> None:
+        """Apply a motion or setpoint command to the reported status."""
+        status = self.status
+        kind = command_kind(command)
+        if kind in ("JD", "JU"):
+            status = replace(status, mode="JOG_DOWN" if kind == "JD" else "JOG_UP")
+        elif kind in ("JS", "ST"):
+            status = replace(status, mode="IDLE")
+        elif kind == "GS" and status.start_saved:
+            status = replace(status, mode="MOVE_START")
+        elif kind == "GP" and status.stop_saved:
+            status = replace(status, mode="MOVE_STOP")
+        elif kind == "SS":
+            status = replace(status, start_saved=True, start_position_ms=status.position_ms)
+        elif kind == "SP":
+            status = replace(status, stop_saved=True, stop_position_ms=status.position_ms)
+        elif kind == "ZERO":
+            status = replace(status, position_ms=0)
+        elif kind in ("TR", "VS") and command[2:].lstrip("-").isdigit():
+            value = int(command[2:])
+            if kind == "TR":
+                status = replace(status, trim_us=value)
+            elif 10 <= value <= 100:
+                status = replace(status, speed_percent=value)
+        self.status = status
+
+    def drop_connection(self) -> None:
+        """Close the current client connection (simulates a WiFi drop)."""
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+                client.close()
+            except OSError:
+                pass
+
+    def _serve(self) -> None:
+        while self._running:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            self.reset()
+            self._client = client
+            framer = LineFramer()
+            while self._running:
+                try:
+                    data = client.recv(1024)
+                except OSError:
+                    break
+                if not data:
+                    break
+                self._handle_data(framer, data)
+            if self._client is client:
+                self._client = None
+            client.close()
+
+    def _send(self, data: bytes) -> None:
+        client = self._client
+        if client is None:
+            return
+        with self._write_lock:
+            try:
+                client.sendall(data)
+            except OSError:
+                pass
+
+    def _format_status(self, status: DropCylinderStatus) -> str:
+        return format_drop_cylinder_status(status)
+
+    def _encode_status(self, status: DropCylinderStatus) -> bytes:
+        return encode_drop_cylinder_binary_status(status)
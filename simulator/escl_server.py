@@ -0,0 +1,289 @@
+"""
+eSCL Simulator Server
+
+Serves a STAC5DriveModel over eSCL on local TCP and UDP ports, with a
+simulated network between host and drive:
+
+- latency: round-trip time, split evenly between request and reply
+- jitter: extra random delay (0..jitter) added to each direction
+- loss: probability that any one packet is lost
+
+Over UDP a lost request is never executed and a lost reply is never sent,
+so the host sees exactly what it would on a lossy link. Over TCP a lost
+segment is recovered by the kernel after an RTO, and everything queued
+behind it on that connection waits too (head-of-line blocking).
+
+Commands execute when they "arrive" at the drive, so motion and status
+timing reflect the one-way delay rather than the full round trip.
+"""
+
+import heapq
+import random
+import socket
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from src.escl_protocol import ESCLFramer, build_packet
+from .stac5_drive import STAC5DriveModel
+
+
+class _TcpClient:
+    """Per-connection state for in-order TCP delivery."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.last_exec = 0.0
+        self.last_reply = 0.0
+
+
+class ESCLSimulator:
+    """Local eSCL server backed by a simulated STAC5 drive."""
+
+    def __init__(
+        self,
+        drive: Optional[STAC5DriveModel] = None,
+        host: str = "127.0.0.1",
+        tcp_port: int = 0,
+        udp_port: Optional[int] = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        rto: float = 0.2,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the simulator.
+
+        Args:
+            drive: Drive model to serve (a new one if None)
+            host: Interface to listen on
+            tcp_port: TCP port (0 = pick a free port)
+            udp_port: UDP port (0 = pick a free port, None = no UDP)
+            latency: Simulated round-trip latency (seconds)
+            jitter: Maximum extra random delay per direction (seconds)
+            loss: Probability that a packet is lost (0-1)
+            rto: TCP retransmission timeout applied to lost segments (seconds)
+            seed: Random seed for reproducible jitter and loss
+        """
+        self.drive = drive if drive is not None else STAC5DriveModel()
+        self.host = host
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rto = rto
+        self._random = random.Random(seed)
+
+        self._tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._tcp_server.bind((host, tcp_port))
+        self._tcp_server.listen(4)
+        self.tcp_port = self._tcp_server.getsockname()[1]
+
+        self._udp_server: Optional[socket.socket] = None
+        self.udp_port: Optional[int] = None
+        if udp_port is not None:
+            self._udp_server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._udp_server.bind((host, udp_port))
+            self.udp_port = self._udp_server.getsockname()[1]
+
+        self._clients: List[_TcpClient] = []
+        self._clients_lock = threading.Lock()
+        self._events: List[Tuple[float, int, Callable[[], None]]] = []
+        self._events_cv = threading.Condition()
+        self._seq = 0
+        self._running = False
+
+        # Counters
+        self.packets_dropped = 0
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start serving TCP (and UDP) clients."""
+        self._running = True
+        self.drive.advance(time.monotonic())
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        threading.Thread(target=self._event_loop, daemon=True).start()
+        if self._udp_server is not None:
+            threading.Thread(target=self._udp_loop, daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop the simulator and close all sockets."""
+        self._running = False
+        with self._events_cv:
+            self._events_cv.notify_all()
+        self.drop_connections()
+        for sock in (self._tcp_server, self._udp_server):
+            if sock is not None:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+
+    def __enter__(self) -> "ESCLSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def drop_connections(self) -> None:
+        """Close every TCP client connection (simulates a link drop)."""
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            try:
+                client.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            try:
+                client.sock.close()
+            except OSError:
+                pass
+
+    # =========================================================================
+    # Fault Injection
+    # =========================================================================
+
+    def inject_alarm(self, code: int, delay: float = 0.0) -> None:
+        """
+        Raise a drive alarm now or after a delay.
+
+        Args:
+            code: AL bitfield to set (e.g. 0x0002 CCW limit)
+            delay: Seconds from now until the alarm fires
+        """
+        if delay <= 0:
+            self.drive.inject_alarm(code, time.monotonic())
+            return
+        self._schedule(time.monotonic() + delay,
+                       lambda: self.drive.inject_alarm(code, time.monotonic()))
+
+    # =========================================================================
+    # Network Model
+    # =========================================================================
+
+    def _one_way(self) -> float:
+        delay = self.latency / 2
+        if self.jitter > 0:
+            delay += self._random.uniform(0.0, self.jitter)
+        return delay
+
+    def _lost(self) -> bool:
+        if self.loss > 0 and self._random.random() < self.loss:
+            self.packets_dropped += 1
+            return True
+        return False
+
+    def _schedule(self, due: float, action: Callable[[], None]) -> None:
+        with self._events_cv:
+            self._seq += 1
+            heapq.heappush(self._events, (due, self._seq, action))
+            self._events_cv.notify()
+
+    def _event_loop(self) -> None:
+        while self._running:
+            with self._events_cv:
+                while self._running and not self._events:
+                    self._events_cv.wait()
+                if not self._running:
+                    return
+                due, _, action = self._events[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._events_cv.wait(delay)
+                    continue
+                heapq.heappop(self._events)
+            action()
+
+    def _execute(self, command: bytes) -> bytes:
+        response = self.drive.handle(command.decode('ascii', errors='replace'),
+                                     time.monotonic())
+        return build_packet(response)
+
+    # =========================================================================
+    # TCP
+    # =========================================================================
+
+    def _accept_loop(self) -> None:
+        while self._running:
+            try:
+                sock, _ = self._tcp_server.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client = _TcpClient(sock)
+            with self._clients_lock:
+                self._clients.append(client)
+            threading.Thread(target=self._tcp_client_loop, args=(client,), daemon=True).start()
+
+    def _tcp_client_loop(self, client: _TcpClient) -> None:
+        framer = ESCLFramer()
+        while self._running:
+            try:
+                data = client.sock.recv(1024)
+            except OSError:
+                break
+            if not data:
+                break
+            now = time.monotonic()
+            for command in framer.feed(data):
+                # TCP delivers in order: nothing overtakes a retransmission
+                exec_due = now + self._one_way() + (self.rto if self._lost() else 0.0)
+                exec_due = max(exec_due, client.last_exec)
+                client.last_exec = exec_due
+                self._schedule(exec_due, lambda c=command: self._tcp_execute(client, c))
+        with self._clients_lock:
+            if client in self._clients:
+                self._clients.remove(client)
+        try:
+            client.sock.close()
+        except OSError:
+            pass
+
+    def _tcp_execute(self, client: _TcpClient, command: bytes) -> None:
+        packet = self._execute(command)
+        reply_due = time.monotonic() + self._one_way() + (self.rto if self._lost() else 0.0)
+        reply_due = max(reply_due, client.last_reply)
+        client.last_reply = reply_due
+        self._schedule(reply_due, lambda: self._tcp_send(client, packet))
+
+    def _tcp_send(self, client: _TcpClient, packet: bytes) -> None:
+        try:
+            client.sock.sendall(packet)
+        except OSError:
+            pass
+
+    # =========================================================================
+    # UDP
+    # =========================================================================
+
+    def _udp_loop(self) -> None:
+        framer = ESCLFramer()
+        while self._running:
+            try:
+                data, peer = self._udp_server.recvfrom(1024)
+            except OSError:
+                return
+            now = time.monotonic()
+            # One eSCL packet per datagram
+            for command in framer.feed(data):
+                if not self._lost():
+                    self._schedule(now + self._one_way(),
+                                   lambda c=command, p=peer: self._udp_execute(c, p))
+            framer.reset()
+
+    def _udp_execute(self, command: bytes, peer) -> None:
+        packet = self._execute(command)
+        if not self._lost():
+            self._schedule(time.monotonic() + self._one_way(),
+                           lambda: self._udp_send(packet, peer))
+
+    def _udp_send(self, packet: bytes, peer) -> None:
+        try:
+            self._udp_server.sendto(packet, peer)
+        except OSError:
+            pass
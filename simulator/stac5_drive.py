@@ -0,0 +1,338 @@
+"""
+STAC5 Drive Model
+
+Kinematic model of the STAC5-IP-E120 that interprets the SCL subset used
+by this project (see Host-Command/Host-Command.md). Motion follows
+trapezoidal profiles built from AC/DE and VE/JS; positions are tracked
+in motor steps and reported through a simulated encoder using the same
+electronic gearing as the real drive (20000 steps/rev, 8000 counts/rev).
+
+The model has no clock of its own: every call takes the current time, so
+tests can step it deterministically.
+"""
+
+import math
+import threading
+from typing import Optional
+
+from src.escl_protocol import (
+    SC_MOTOR_ENABLED,
+    SC_DRIVE_FAULT,
+    SC_IN_POSITION,
+    SC_MOVING,
+    SC_JOGGING,
+    SC_STOPPING,
+    SC_ALARM_PRESENT,
+)
+
+
+# Motion modes
+IDLE = "idle"
+MOVE = "move"
+JOG = "jog"
+
+# Integration step (seconds)
+TIME_STEP = 0.001
+
+
+class STAC5DriveModel:
+    """Simulated STAC5 drive state and SCL command interpreter."""
+
+    def __init__(self, steps_per_rev: int = 20000, encoder_counts_per_rev: int = 8000,
+                 duplicate_echo: bool = False):
+        """
+        Initialize the drive model.
+
+        Args:
+            steps_per_rev: Motor steps per revolution (EG setting)
+            encoder_counts_per_rev: Encoder counts per revolution (ER setting)
+            duplicate_echo: Reply to queries with a duplicated echo
+                            ("EP=1 EP=1"), as some firmware does
+        """
+        self.steps_per_rev = steps_per_rev
+        self.encoder_counts_per_rev = encoder_counts_per_rev
+        self.duplicate_echo = duplicate_echo
+        self._lock = threading.Lock()
+
+        # Parameters
+        self.accel = 10.0      # rev/sec^2 (AC)
+        self.decel = 10.0      # rev/sec^2 (DE)
+        self.velocity = 1.0    # rev/sec (VE)
+        self.jog_speed = 1.0   # rev/sec (JS)
+        self.distance = 0      # steps (DI)
+
+        # State
+        self.enabled = False
+        self.alarm = 0
+        self.position = 0.0    # motor steps
+        self.speed = 0.0       # signed rev/sec
+        self.mode = IDLE
+        self.stopping = False
+        self.target = 0.0      # motor steps (MOVE mode)
+        self.jog_direction = 1
+        self._encoder_offset = 0
+        self._last_time: Optional[float] = None
+
+        # Counters for tests and benchmarks
+        self.commands_received = 0
+
+    # =========================================================================
+    # Faults
+    # =========================================================================
+
+    def inject_alarm(self, code: int, now: float) -> None:
+        """
+        Raise an alarm: motion stops immediately and the drive faults.
+
+        Args:
+            code: AL bitfield to set (e.g. 0x0080 under voltage)
+            now: Current time in seconds
+        """
+        with self._lock:
+            self._advance(now)
+            self.alarm |= code
+            self._halt()
+
+    # =========================================================================
+    # State
+    # =========================================================================
+
+    @property
+    def encoder_position(self) -> int:
+        """Get the simulated encoder count."""
+        counts = self.position * self.encoder_counts_per_rev / self.steps_per_rev
+        return int(round(counts)) + self._encoder_offset
+
+    @property
+    def status_code(self) -> int:
+        """Get the SC bitfield for the current state."""
+        code = 0
+        if self.enabled:
+            code |= SC_MOTOR_ENABLED
+        if self.alarm:
+            code |= SC_ALARM_PRESENT | SC_DRIVE_FAULT
+        if self.mode != IDLE:
+            code |= SC_MOVING
+            if self.mode == JOG:
+                code |= SC_JOGGING
+            if self.stopping:
+                code |= SC_STOPPING
+        elif self.enabled and not self.alarm:
+            code |= SC_IN_POSITION
+        return code
+
+    def advance(self, now: float) -> None:
+        """Integrate motion up to the given time."""
+        with self._lock:
+            self._advance(now)
+
+    def _advance(self, now: float) -> None:
+        if self._last_time is None or now <= self._last_time:
+            self._last_time = now if self._last_time is None else self._last_time
+            return
+        t = self._last_time
+        while t < now and self.mode != IDLE:
+            dt = min(TIME_STEP, now - t)
+            self._step(dt)
+            t += dt
+        self._last_time = now
+
+    def _step(self, dt: float) -> None:
+        """Advance motion by one integration step."""
+        if self.mode == MOVE and not self.stopping:
+            remaining = (self.target - self.position) / self.steps_per_rev
+            direction = 1.0 if remaining >= 0 else -1.0
+            stop_distance = self.speed ** 2 / (2 * self.decel)
+            if abs(remaining) <= stop_distance or self.speed * direction < 0:
+                desired = 0.0
+            else:
+                desired = direction * self.velocity
+            self._approach(desired, dt)
+            self.position += self.speed * dt * self.steps_per_rev
+            # Arrived (or overshot by less than one step of travel)
+            if (self.target - self.position) * direction <= 0.5 or \
+                    (abs(self.speed) < 1e-6 and abs(self.target - self.position) < 1.0):
+                self.position = self.target
+                self._halt()
+            return
+
+        if self.mode == JOG and not self.stopping:
+            self._approach(self.jog_direction * self.jog_speed, dt)
+        else:
+            self._approach(0.0, dt)
+        self.position += self.speed * dt * self.steps_per_rev
+        if self.stopping and self.speed == 0.0:
+            self._halt()
+
+    def _approach(self, desired: float, dt: float) -> None:
+        """Ramp speed toward a desired value using AC (speeding up) or DE."""
+        delta = desired - self.speed
+        if delta == 0:
+            return
+        speeding_up = abs(desired) > abs(self.speed) and desired * self.speed >= 0
+        rate = (self.accel if speeding_up else self.decel) * dt
+        if abs(delta) <= rate:
+            self.speed = desired
+        else:
+            self.speed += math.copysign(rate, delta)
+
+    def _halt(self) -> None:
+        self.speed = 0.0
+        self.mode = IDLE
+        self.stopping = False
+
+    # =========================================================================
+    # SCL Interpreter
+    # =========================================================================
+
+    def handle(self, command: str, now: float) -> str:
+        """
+        Execute one SCL command.
+
+        Args:
+            command: Command text without header or CR (e.g. "DI-4000")
+            now: Current time in seconds
+
+        Returns:
+            Response text without header or CR (e.g. "%", "EP=1200", "?")
+        """
+        with self._lock:
+            self._advance(now)
+            self.commands_received += 1
+            code = command[:2].upper()
+            arg = command[2:].strip()
+            handler = getattr(self, f"_cmd_{code}", None)
+            if handler is None:
+                return "?"
+            try:
+                return handler(arg)
+            except ValueError:
+                return "?"
+
+    def _query(self, register: str, value) -> str:
+        reply = f"{register}={value}"
+        return f"{reply} {reply}" if self.duplicate_echo else reply
+
+    def _rate(self, register: str, arg: str, attr: str) -> str:
+        if not arg:
+            return self._query(register, f"{getattr(self, attr):.3f}")
+        if "." not in arg:
+            return "?"  # Rates must include a decimal point
+        value = float(arg)
+        if value < 0:
+            return "?5"
+        if value <= 0:
+            return "?"
+        setattr(self, attr, value)
+        return "%"
+
+    def _motion_allowed(self) -> bool:
+        return self.enabled and not self.alarm
+
+    def _cmd_ME(self, arg: str) -> str:
+        if not self.alarm:
+            self.enabled = True
+        return "%"
+
+    def _cmd_MD(self, arg: str) -> str:
+        self.enabled = False
+        self._halt()
+        return "%"
+
+    def _cmd_AC(self, arg: str) -> str:
+        return self._rate("AC", arg, "accel")
+
+    def _cmd_DE(self, arg: str) -> str:
+        return self._rate("DE", arg, "decel")
+
+    def _cmd_VE(self, arg: str) -> str:
+        return self._rate("VE", arg, "velocity")
+
+    def _cmd_JS(self, arg: str) -> str:
+        return self._rate("JS", arg, "jog_speed")
+
+    def _cmd_DI(self, arg: str) -> str:
+        if not arg:
+            return self._query("DI", self.distance)
+        self.distance = int(arg)
+        return "%"
+
+    def _cmd_FL(self, arg: str) -> str:
+        if not self._motion_allowed():
+            return "?"
+        base = self.target if self.mode == MOVE and not self.stopping else self.position
+        self._start_move(round(base) + self.distance)
+        return "%"
+
+    def _cmd_FP(self, arg: str) -> str:
+        if not self._motion_allowed():
+            return "?"
+        self._start_move(int(arg) if arg else self.distance)
+        return "%"
+
+    def _start_move(self, target: float) -> None:
+        self.target = float(target)
+        self.mode = MOVE
+        self.stopping = False
+
+    def _cmd_CJ(self, arg: str) -> str:
+        if not self._motion_allowed():
+            return "?"
+        self.jog_direction = -1 if self.distance < 0 else 1
+        self.mode = JOG
+        self.stopping = False
+        return "%"
+
+    def _cmd_SJ(self, arg: str) -> str:
+        if self.mode == JOG:
+            self.stopping = True
+        return "%"
+
+    def _cmd_ST(self, arg: str) -> str:
+        if self.mode != IDLE:
+            self.stopping = True
+        return "%"
+
+    def _cmd_SK(self, arg: str) -> str:
+        self._halt()
+        return "%"
+
+    def _cmd_AR(self, arg: str) -> str:
+        self.alarm = 0
+        return "%"
+
+    def _cmd_EP(self, arg: str) -> str:
+        if not arg:
+            return self._query("EP", self.encoder_position)
+        self._encoder_offset += int(arg) - self.encoder_position
+        return "%"
+
+    def _cmd_IE(self, arg: str) -> str:
+        return self._query("IE", self.encoder_position)
+
+    def _cmd_SP(self, arg: str) -> str:
+        if not arg:
+            return self._query("SP", int(round(self.position)))
+        encoder = self.encoder_position
+        self.position = float(int(arg))
+        self._encoder_offset += encoder - self.encoder_position
+        return "%"
+
+    def _cmd_IP(self, arg: str) -> str:
+        return self._query("IP", int(round(self.position)))
+
+    def _cmd_IV(self, arg: str) -> str:
+        # Immediate velocity in rpm
+        return self._query("IV", f"{self.speed * 60.0:.2f}")
+
+    def _cmd_SC(self, arg: str) -> str:
+        return self._query("SC", f"{self.status_code:04X}")
+
+    def _cmd_AL(self, arg: str) -> str:
+        return self._query("AL", f"{self.alarm:04X}")
+
+    def _cmd_RV(self, arg: str) -> str:
+        return self._query("RV", "102")
+
+    def _cmd_MV(self, arg: str) -> str:
+        return self._query("MV", "102I083")
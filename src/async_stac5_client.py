@@ -0,0 +1,419 @@
+"""
+Async STAC5 Client
+
+asyncio counterpart to STAC5Manager. Speaks the same eSCL framing over
+asyncio streams so several drives and devices can be driven from one
+event loop, with commands to each drive issued in a deterministic order.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from .escl_protocol import (
+    SC_MOTOR_ENABLED,
+    SC_MOVING,
+    ESCLFramer,
+    build_packet,
+    parse_response,
+)
+from .scl_parser import parse_position, parse_status_code, parse_alarm_code, format_code
+from .stac5_manager import STAC5Status
+
+
+class AsyncSTAC5Client:
+    """
+    Coroutine-based client for the STAC5 motor controller over eSCL.
+
+    Requests are written to the stream in call order and replies are
+    matched first-in first-out by a single reader task, so concurrent
+    coroutines can pipeline commands without a lock. A request that times
+    out stays in the queue and consumes its late reply, keeping later
+    replies aligned with their commands.
+
+    Mirrors the motion semantics of STAC5Manager (DI-based jog direction,
+    SP/EP sync before FP, gear ratio between encoder counts and motor
+    steps), but keeps no polling thread: call poll_status() from your own
+    task at whatever rate suits.
+
+    There is no outbound queue: every command, stops included, is written
+    when it is called, so a stop never waits behind unsent traffic. Its
+    reply still comes after the replies to requests already in flight.
+    """
+
+    def __init__(self, host: str = "192.168.1.40", port: int = 7776):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Deque[asyncio.Future] = deque()
+        self._framer = ESCLFramer()
+        self._connected = False
+
+        # Status
+        self.status = STAC5Status()
+
+        # Motion defaults
+        self.default_acceleration = 10.0   # rev/sec^2
+        self.default_deceleration = 10.0   # rev/sec^2
+
+        # Electronic gearing ratio (motor steps = encoder counts * gear_ratio)
+        self.gear_ratio = 2.5
+
+        # Jog state tracking
+        self._jog_active = False
+        self._jog_stop_time = 0.0
+        self._jog_decel_lockout = 0.5  # Lockout period after jog stop (seconds)
+
+    # =========================================================================
+    # Connection
+    # =========================================================================
+
+    async def connect(self, timeout: float = 3.0) -> bool:
+        """
+        Connect to the STAC5 controller and initialize the drive.
+
+        Args:
+            timeout: Connection timeout in seconds
+
+        Returns:
+            True if connected
+        """
+        if self._connected:
+            await self.close()
+
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            print(f"[STAC5] Connection failed: {e}")
+            return False
+
+        self._framer.reset()
+        self._connected = True
+        self.status.connected = True
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+        print(f"[STAC5] Connected to {self.host}:{self.port} (async)")
+
+        await self._init_drive()
+        return True
+
+    async def close(self) -> None:
+        """Close the connection and fail any outstanding requests."""
+        self._connected = False
+        self.status.connected = False
+        self.status.is_moving = False
+        self.status.motor_enabled = False
+
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+            self._reader = None
+
+        self._fail_pending()
+        print("[STAC5] Disconnected (async)")
+
+    def is_connected(self) -> bool:
+        """Check if connected to STAC5."""
+        return self._connected
+
+    async def _read_loop(self) -> None:
+        """Match incoming frames to pending requests in FIFO order."""
+        try:
+            while True:
+                data = await self._reader.read(1024)
+                if not data:
+                    break
+                for frame in self._framer.feed(data):
+                    if not self._pending:
+                        continue  # Unsolicited frame
+                    future = self._pending.popleft()
+                    if not future.done():  # Timed out requests are cancelled
+                        future.set_result(frame)
+        except OSError as e:
+            print(f"[STAC5] Read error: {e}")
+
+        if self._connected:
+            print("[STAC5] Connection closed by drive")
+        self._connected = False
+        self.status.connected = False
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Complete all outstanding requests with no response."""
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_result(None)
+
+    # =========================================================================
+    # Command Transport
+    # =========================================================================
+
+    def _submit(self, commands: List[str]) -> List[asyncio.Future]:
+        """Queue futures and write all packets in one call."""
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in commands]
+        self._pending.extend(futures)
+        self._writer.write(b"".join(build_packet(cmd) for cmd in commands))
+        return futures
+
+    async def send_command(self, command: str, timeout: float = 1.0) -> Optional[str]:
+        """
+        Send an SCL command and get response.
+
+        Args:
+            command: SCL command string (e.g., "RV", "ME", "EP")
+            timeout: Response timeout in seconds
+
+        Returns:
+            Response string, or None if failed
+        """
+        return (await self.send_commands([command], timeout))[0]
+
+    async def send_commands(self, commands: List[str],
+                            timeout: float = 1.0) -> List[Optional[str]]:
+        """
+        Send several SCL commands pipelined and collect their responses.
+
+        Args:
+            commands: SCL command strings
+            timeout: Response timeout in seconds (for the whole batch)
+
+        Returns:
+            Response string (or None) for each command, in order
+        """
+        return [parse_response(data) if data is not None else None
+                for data in await self._send_frames(commands, timeout)]
+
+    async def _query(self, command: str, timeout: float = 1.0) -> Optional[bytes]:
+        """Send a query and return the raw response frame."""
+        return (await self._send_frames([command], timeout))[0]
+
+    async def _send_frames(self, commands: List[str],
+                           timeout: float = 1.0) -> List[Optional[bytes]]:
+        """Send several SCL commands pipelined and collect the raw frames."""
+        if not self._connected or self._writer is None:
+            return [None] * len(commands)
+
+        futures = self._submit(commands)
+        try:
+            await self._writer.drain()
+        except OSError as e:
+            print(f"[STAC5] Write error: {e}")
+
+        deadline = time.monotonic() + timeout
+        responses = []
+        for command, future in zip(commands, futures):
+            try:
+                data = await asyncio.wait_for(future, max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                # wait_for cancelled the future; it stays queued to absorb the late reply
+                data = None
+            logged = parse_response(data) if data is not None else None
+            print(f"[STAC5] TX: {command} | RX: {logged}")
+            responses.append(data)
+        return responses
+
+    # =========================================================================
+    # Status Commands
+    # =========================================================================
+
+    async def get_encoder_position(self) -> Optional[int]:
+        """Read current encoder position (use when drive is idle)."""
+        return parse_position(await self._query("EP"), b"EP")
+
+    async def get_immediate_encoder(self) -> Optional[int]:
+        """Read encoder position using Immediate Encoder command (works during motion)."""
+        return parse_position(await self._query("IE"), b"IE")
+
+    async def get_alarm_code(self) -> Optional[str]:
+        """Read alarm status (hex string, e.g. "0000")."""
+        code = parse_alarm_code(await self._query("AL"))
+        return format_code(code) if code is not None else None
+
+    async def get_status_code(self) -> Optional[str]:
+        """Read drive status code (hex string, e.g. "0009")."""
+        code = parse_status_code(await self._query("SC"))
+        return format_code(code) if code is not None else None
+
+    async def poll_status(self, immediate: bool = False, timeout: float = 1.0) -> STAC5Status:
+        """
+        Refresh position, status code and alarm code in one round-trip.
+
+        Args:
+            immediate: Use IE (works during motion) instead of EP
+            timeout: Response timeout in seconds for the whole batch
+
+        Returns:
+            The updated status
+        """
+        position_cmd = "IE" if immediate else "EP"
+        pos_resp, sc_resp, al_resp = await self._send_frames(
+            [position_cmd, "SC", "AL"], timeout)
+
+        pos = parse_position(pos_resp, position_cmd.encode('ascii'))
+        if pos is not None:
+            self.status.encoder_position = pos
+
+        sc = parse_status_code(sc_resp)
+        if sc is not None:
+            self.status.status_code = format_code(sc)
+            self.status.is_moving = bool(sc & SC_MOVING)
+            self.status.motor_enabled = bool(sc & SC_MOTOR_ENABLED)
+
+        al = parse_alarm_code(al_resp)
+        if al is not None:
+            self.status.alarm_code = format_code(al)
+
+        return self.status
+
+    # =========================================================================
+    # Motor Control Commands
+    # =========================================================================
+
+    async def _init_drive(self) -> None:
+        """Initialize drive with default settings and sync SP to EP."""
+        await self.send_commands([
+            f"AC{self.default_acceleration:.1f}",
+            f"DE{self.default_deceleration:.1f}",
+            "ME",
+        ])
+        self.status.motor_enabled = True
+        await self._sync_positions()
+
+    def _encoder_to_motor(self, encoder_counts: int) -> int:
+        """Convert encoder counts to motor steps using gear ratio."""
+        return int(encoder_counts * self.gear_ratio)
+
+    async def _sync_positions(self) -> None:
+        """Sync internal step position (SP) to encoder position (EP)."""
+        ep = await self.get_encoder_position()
+        if ep is not None:
+            await self.send_command(f"SP{self._encoder_to_motor(ep)}")
+
+    async def motor_enable(self) -> bool:
+        """Enable the motor."""
+        if await self.send_command("ME") is not None:
+            self.status.motor_enabled = True
+            return True
+        return False
+
+    async def motor_disable(self) -> bool:
+        """Disable the motor."""
+        if await self.send_command("MD") is not None:
+            self.status.motor_enabled = False
+            return True
+        return False
+
+    async def alarm_reset(self) -> bool:
+        """Clear any alarms."""
+        if await self.send_command("AR") is not None:
+            self.status.alarm_code = "0000"
+            return True
+        return False
+
+    async def stop(self) -> bool:
+        """Stop motion (controlled deceleration)."""
+        self._jog_active = False
+        self._jog_stop_time = time.time()
+        self.status.is_moving = False
+        return await self.send_command("ST") is not None
+
+    async def stop_kill(self) -> bool:
+        """Emergency stop (immediate)."""
+        self._jog_active = False
+        self._jog_stop_time = time.time()
+        self.status.is_moving = False
+        return await self.send_command("SK") is not None
+
+    # =========================================================================
+    # Jog Commands (DI-based direction control)
+    # =========================================================================
+
+    async def jog_start(self, direction: int) -> bool:
+        """
+        Start jogging in specified direction.
+
+        Args:
+            direction: 1 = positive (CW), -1 = negative (CCW)
+        """
+        if self._jog_active:
+            return False
+        if time.time() - self._jog_stop_time < self._jog_decel_lockout:
+            return False
+
+        # Mark as active before awaiting so a concurrent call is rejected
+        self._jog_active = True
+        dir_cmd = "DI1" if direction >= 0 else "DI-1"
+        response = (await self.send_commands([
+            dir_cmd,
+            f"JS{self.status.jog_velocity:.1f}",
+            "CJ",
+        ]))[-1]
+        if response is not None:
+            self.status.is_moving = True
+            return True
+        self._jog_active = False
+        return False
+
+    async def jog_stop(self) -> bool:
+        """Stop jogging (decelerate to stop)."""
+        self._jog_active = False
+        self._jog_stop_time = time.time()
+        self.status.is_moving = False
+        await self.send_command("SJ")
+        return True
+
+    # =========================================================================
+    # Move Commands
+    # =========================================================================
+
+    async def move_relative(self, steps: int) -> bool:
+        """Move relative number of steps."""
+        response = (await self.send_commands([
+            f"VE{self.status.move_velocity:.1f}",
+            f"DI{steps}",
+            "FL",
+        ]))[-1]
+        if response is not None:
+            self.status.is_moving = True
+            return True
+        return False
+
+    async def move_to_position(self, target_steps: int) -> bool:
+        """Move to an absolute encoder position using FP command."""
+        if self.status.is_moving:
+            await self.stop()
+            await asyncio.sleep(0.05)  # Brief pause for stop to take effect
+
+        current = await self.get_encoder_position()
+        if current is not None and current == target_steps:
+            return True
+
+        if current is not None:
+            await self.send_command(f"SP{self._encoder_to_motor(current)}")
+
+        response = (await self.send_commands([
+            f"VE{self.status.move_velocity:.1f}",
+            f"FP{self._encoder_to_motor(target_steps)}",
+        ]))[-1]
+        if response is not None:
+            self.status.is_moving = True
+            return True
+        return False
+
@@ -7,8 +7,10 @@ Provides a clean separation between camera communication and GUI display.
 
 import socket
 import threading
+import time
 import urllib.request
-from typing import Optional, Callable, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Callable, Dict, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -18,7 +20,10 @@ from .config import (
     CAMERA_CONNECT_TIMEOUT,
     CAMERA_READ_TIMEOUT,
     CAMERA_SCAN_TIMEOUT,
+    CAMERA_SCAN_MAX_WORKERS,
+    CAMERA_SCAN_CACHE_TTL_SEC,
 )
+from .mjpeg_demux import MJPEGDemuxer
 
 
 class CameraConnectionState(Enum):
@@ -55,10 +60,10 @@ class CameraConfig:
 class MJPEGStreamReader:
     """
     Reads MJPEG stream from ESP32-CAM and provides frames via callback.
-    Runs in a background thread.
+    Runs in a background thread; frames are split by MJPEGDemuxer.
     """
 
-    # Maximum buffer size before forced cleanup (500KB)
+    # Largest frame accepted (500KB)
     MAX_BUFFER_SIZE = 500000
 
     # Minimum valid JPEG frame size
@@ -75,7 +80,8 @@ class MJPEGStreamReader:
 
         Args:
             url: MJPEG stream URL
-            on_frame: Callback for each received frame (JPEG bytes)
+            on_frame: Callback for each received frame (JPEG bytes; a new
+                      bytearray per frame that the callback may keep)
             on_error: Callback for errors
         """
         self._url = url
@@ -123,31 +129,16 @@ class MJPEGStreamReader:
             # Set longer timeout for reading stream
             sock.settimeout(CAMERA_READ_TIMEOUT)
 
-            buffer = b''
-            headers_done = False
-
-            while self._running:
-                try:
-                    chunk = sock.recv(8192)
-                    if not chunk:
-                        break
-
-                    buffer += chunk
-
-                    # Skip HTTP headers on first read
-                    if not headers_done:
-                        header_end = buffer.find(b'\r\n\r\n')
-                        if header_end != -1:
-                            buffer = buffer[header_end + 4:]
-                            headers_done = True
-                        continue
-
-                    # Extract JPEG frames from buffer
-                    buffer = self._extract_frames(buffer)
-
-                except socket.timeout:
-                    # Timeout on recv is OK, just continue
-                    continue
+            demuxer = MJPEGDemuxer(
+                sock,
+                keep_going=lambda: self._running,
+                max_frame_size=self.MAX_BUFFER_SIZE,
+                min_frame_size=self.MIN_FRAME_SIZE,
+            )
+            for frame in demuxer.frames():
+                if not self._running:
+                    break
+                self._on_frame(frame)
 
         except socket.timeout:
             if self._running:
@@ -197,44 +188,6 @@ class MJPEGStreamReader:
 
         return host, port, path
 
-    def _extract_frames(self, buffer: bytes) -> bytes:
-        """
-        Extract complete JPEG frames from buffer and invoke callback.
-
-        Args:
-            buffer: Current data buffer
-
-        Returns:
-            Remaining buffer after extracting frames
-        """
-        while True:
-            # Find start of JPEG (SOI marker)
-            jpg_start = buffer.find(b'\xff\xd8')
-            if jpg_start == -1:
-                # Keep last 2 bytes in case we're mid-marker
-                if len(buffer) > 2:
-                    buffer = buffer[-2:]
-                break
-
-            # Find end of JPEG (EOI marker)
-            jpg_end = buffer.find(b'\xff\xd9', jpg_start)
-            if jpg_end == -1:
-                # Need more data, but don't let buffer grow too large
-                if len(buffer) > self.MAX_BUFFER_SIZE:
-                    buffer = buffer[-2:]
-                break
-
-            # Extract complete JPEG (include the EOI marker)
-            jpg_end += 2
-            frame_data = buffer[jpg_start:jpg_end]
-            buffer = buffer[jpg_end:]
-
-            # Deliver frame if valid
-            if self._running and len(frame_data) > self.MIN_FRAME_SIZE:
-                self._on_frame(frame_data)
-
-        return buffer
-
 
 class RTSPStreamReader:
     """
@@ -348,6 +301,10 @@ class RTSPStreamReader:
 class CameraDiscovery:
     """Auto-discover ESP32-CAM devices on the local network."""
 
+    # Cameras found per subnet ("192.168.1" -> (scan time, IPs))
+    _cache: Dict[str, Tuple[float, List[str]]] = {}
+    _cache_lock = threading.Lock()
+
     @staticmethod
     def get_local_ip() -> Optional[str]:
         """
@@ -371,16 +328,30 @@ class CameraDiscovery:
         base_ip: str,
         on_found: Callable[[str], None],
         on_complete: Callable[[], None],
-        on_progress: Optional[Callable[[int], None]] = None
+        on_progress: Optional[Callable[[int], None]] = None,
+        max_age: float = CAMERA_SCAN_CACHE_TTL_SEC,
+        port: int = CAMERA_CONTROL_PORT,
+        timeout: float = CAMERA_SCAN_TIMEOUT,
     ) -> threading.Thread:
         """
         Scan local subnet for ESP32-CAM devices.
 
+        All hosts are probed at once (CAMERA_SCAN_MAX_WORKERS covers the
+        subnet), so a scan takes about one probe timeout rather than 254
+        of them. Results of a scan
+        younger than max_age are reported again without probing; a scan
+        that found nothing is not cached, so a camera powered up since is
+        found by the next scan.
+
         Args:
             base_ip: IP address to derive subnet from (e.g., "192.168.1.100")
             on_found: Callback when a camera is found (receives IP)
             on_complete: Callback when scan is complete
-            on_progress: Optional callback for progress updates (receives count 1-254)
+            on_progress: Optional callback for progress updates (receives count
+                         of hosts probed, 1-254)
+            max_age: Reuse cached results up to this age in seconds (0 = rescan)
+            port: Control (web server) port to probe
+            timeout: Connect and response timeout per host in seconds
 
         Returns:
             The scanning thread (for cancellation if needed)
@@ -394,14 +365,36 @@ class CameraDiscovery:
 
             subnet = '.'.join(parts[:3])
 
-            for i in range(1, 255):
-                if on_progress:
-                    on_progress(i)
-
-                ip = f"{subnet}.{i}"
-                if CameraDiscovery.check_camera(ip):
+            cached = CameraDiscovery.cached_cameras(base_ip, max_age)
+            if cached is not None:
+                for ip in cached:
                     on_found(ip)
+                if on_progress:
+                    on_progress(254)
+                on_complete()
+                return
 
+            hosts = [f"{subnet}.{i}" for i in range(1, 255)]
+            found = []
+            with ThreadPoolExecutor(max_workers=min(CAMERA_SCAN_MAX_WORKERS, len(hosts))) as pool:
+                probes = {
+                    pool.submit(CameraDiscovery.check_camera, ip, timeout, port): ip
+                    for ip in hosts
+                }
+                # Report hits as they arrive
+                for count, probe in enumerate(as_completed(probes), 1):
+                    if on_progress:
+                        on_progress(count)
+                    if probe.result():
+                        found.append(probes[probe])
+                        on_found(probes[probe])
+
+            found.sort(key=lambda ip: int(ip.rsplit('.', 1)[1]))
+            with CameraDiscovery._cache_lock:
+                if found:
+                    CameraDiscovery._cache[subnet] = (time.monotonic(), found)
+                else:
+                    CameraDiscovery._cache.pop(subnet, None)
             on_complete()
 
         thread = threading.Thread(target=scan, daemon=True)
@@ -409,26 +402,66 @@ class CameraDiscovery:
         return thread
 
     @staticmethod
-    def check_camera(ip: str, timeout: float = CAMERA_SCAN_TIMEOUT) -> bool:
+    def cached_cameras(base_ip: str, max_age: float = CAMERA_SCAN_CACHE_TTL_SEC) -> Optional[List[str]]:
         """
-        Check if an IP address has an ESP32-CAM stream port open.
+        Get the cameras found by a recent scan of base_ip's subnet.
+
+        Args:
+            base_ip: IP address in the subnet
+            max_age: Oldest scan accepted in seconds
+
+        Returns:
+            Camera IPs, or None if the subnet was not scanned recently
+        """
+        subnet = base_ip.rsplit('.', 1)[0]
+        with CameraDiscovery._cache_lock:
+            entry = CameraDiscovery._cache.get(subnet)
+        if entry is None or time.monotonic() - entry[0] > max_age:
+            return None
+        return list(entry[1])
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all scan results."""
+        with CameraDiscovery._cache_lock:
+            CameraDiscovery._cache.clear()
+
+    @staticmethod
+    def check_camera(ip: str, timeout: float = CAMERA_SCAN_TIMEOUT,
+                     port: int = CAMERA_CONTROL_PORT) -> bool:
+        """
+        Check if an IP address is an ESP32-CAM.
+
+        Requests the index page from the control server and looks for the
+        link to the stream server in it. The stream port is left alone: the
+        ESP32-CAM serves one stream client at a time, so a camera already
+        streaming to a panel would not answer there, and probing an idle
+        camera would start a stream on it.
 
         Args:
             ip: IP address to check
-            timeout: Connection timeout in seconds
+            timeout: Connect and response timeout in seconds
+            port: Control (web server) port
 
         Returns:
-            True if the stream port is open, False otherwise
+            True if the camera index page answered, False otherwise
         """
+        marker = f":{CAMERA_STREAM_PORT}/stream".encode()
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((ip, CAMERA_STREAM_PORT))
-            sock.close()
-            return result == 0
-        except Exception:
+            with socket.create_connection((ip, port), timeout=timeout) as sock:
+                sock.sendall(f"GET / HTTP/1.1\r\nHost: {ip}\r\nConnection: close\r\n\r\n".encode())
+                response = b''
+                while marker not in response and len(response) < 8192:
+                    data = sock.recv(2048)
+                    if not data:
+                        break
+                    response += data
+        except OSError:
             return False
 
+        status_line = response.split(b'\r\n', 1)[0]
+        return status_line.startswith(b'HTTP/1.') and b' 200 ' in status_line and marker in response
+
 
 class CameraController:
     """
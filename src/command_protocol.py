@@ -2,18 +2,41 @@
 Command Protocol Module
 
 Defines serial command format and response parsing for the winch controller.
+
+Status arrives either as an ASCII line or, once negotiated with
+Commands.STATUS_BINARY, as a fixed-layout binary frame:
+
+    offset  type  field
+    0       u8    sync (0xA5)
+    1       u8    frame type ('W')
+    2       i32   position (steps)
+    6       u8    mode (0 IDLE, 1 JOG, 2 MOVE)
+    7       u8    flags (bit 0 home saved, 1 well saved, 2 e-stop)
+    8       u16   speed (0.01 RPS)
+    10      i32   home position (steps)
+    14      i32   well position (steps)
+    18      u16   max jog speed (0.01 RPS)
+    20      u16   max move speed (0.01 RPS)
+    22      u16   CRC-16/CCITT (init 0xFFFF) of bytes 0-21
+
+Little-endian, 24 bytes against ~80 for the ASCII line.
 """
 
+import binascii
 import re
-from dataclasses import dataclass
+import struct
+from functools import lru_cache
 from enum import Enum
 from typing import Optional
 
 from .config import (
+    STATUS_PARSE_CACHE_SIZE,
+    STATUS_KEEP_RAW_RESPONSE,
     STEPS_PER_REVOLUTION,
     DEFAULT_JOG_SPEED_RPS,
     DEFAULT_MOVE_SPEED_RPS,
 )
+from .records import record
 
 
 class MotionMode(Enum):
@@ -24,9 +47,32 @@ class MotionMode(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+# Binary status frame (layout in the module docstring)
+BINARY_STATUS_SYNC = 0xA5
+BINARY_STATUS_TYPE = ord('W')
+BINARY_STATUS_FRAME = struct.Struct("<BBiBBHiiHHH")
+BINARY_STATUS_LENGTH = BINARY_STATUS_FRAME.size
+
+# Mode byte values, in firmware enum order
+BINARY_MODES = (MotionMode.IDLE, MotionMode.JOG, MotionMode.MOVE)
+
+# Flag bits
+FLAG_HOME_SAVED = 0x01
+FLAG_WELL_SAVED = 0x02
+FLAG_ESTOP = 0x04
+
+
+@record
 class WinchStatus:
-    """Parsed status response from the Arduino."""
+    """
+    Parsed status response from the Arduino.
+
+    Frozen because the parser hands the same cached instance to every
+    caller that sees an identical status line, and slotted because
+    records are created at poll rate and may be kept as history.
+    raw_response is only filled in when the parser's keep_raw_response
+    is set.
+    """
     position: int = 0
     mode: MotionMode = MotionMode.IDLE
     speed_rps: float = 0.0
@@ -37,7 +83,7 @@ class WinchStatus:
     estop_active: bool = False
     max_jog_rps: float = DEFAULT_JOG_SPEED_RPS
     max_move_rps: float = DEFAULT_MOVE_SPEED_RPS
-    raw_response: str = ""
+    raw_response: Optional[str] = None
 
     @property
     def position_revolutions(self) -> float:
@@ -68,6 +114,24 @@ class Commands:
     # Query command
     STATUS = "?"
 
+    # Setpoint commands where only the latest queued value matters
+    SETPOINT_PREFIXES = ("VJ", "VM")
+
+    # Status format negotiation (acknowledged with STATUS_BINARY_ACK /
+    # STATUS_ASCII_ACK; firmware without binary support ignores them)
+    STATUS_BINARY = "SF1"
+    STATUS_ASCII = "SF0"
+    STATUS_BINARY_ACK = "OK:SF1"
+    STATUS_ASCII_ACK = "OK:SF0"
+
+    # Status stream acknowledgement prefix (followed by the rate in Hz)
+    STATUS_STREAM_ACK = "OK:SU"
+
+    @staticmethod
+    def subscribe_status(rate_hz: int) -> str:
+        """Generate status stream command (push status at rate_hz, 0 stops)."""
+        return f"SU{rate_hz}"
+
     @staticmethod
     def go_to_position(steps: int) -> str:
         """Generate absolute position command."""
@@ -105,20 +169,89 @@ class ResponseParser:
         r"(?:\s+VMOVE:([\d.]+))?"
     )
 
+    # Attach the raw line to parsed records (see set_keep_raw_response)
+    keep_raw_response = STATUS_KEEP_RAW_RESPONSE
+
     @classmethod
     def parse_status(cls, response: str) -> Optional[WinchStatus]:
         """
         Parse a status response string into a WinchStatus object.
 
+        Idle polls return byte-identical lines, so results are cached by
+        line; repeated lines return the same (frozen) WinchStatus.
+
         Args:
             response: Raw response string from Arduino
 
         Returns:
             WinchStatus object if parsing successful, None otherwise
         """
-        if not response:
+        if not response or "POS:" not in response:
             return None
+        return _cached_winch_status(response)
 
+    @classmethod
+    def parse_binary_status(cls, frame: bytes) -> Optional[WinchStatus]:
+        """
+        Decode a binary status frame into a WinchStatus object.
+
+        Args:
+            frame: Frame bytes, starting at the sync byte
+
+        Returns:
+            WinchStatus object if the frame is intact, None otherwise
+            (wrong length, sync or type, or CRC mismatch)
+        """
+        if not check_binary_status(frame):
+            return None
+
+        (sync, frame_type, position, mode_index, flags, speed, home, well,
+         max_jog, max_move, crc) = BINARY_STATUS_FRAME.unpack_from(frame)
+
+        mode = BINARY_MODES[mode_index] if mode_index < len(BINARY_MODES) else MotionMode.UNKNOWN
+        home_saved = bool(flags & FLAG_HOME_SAVED)
+        well_saved = bool(flags & FLAG_WELL_SAVED)
+
+        return WinchStatus(
+            position=position,
+            mode=mode,
+            speed_rps=speed / 100,
+            home_saved=home_saved,
+            home_position=home if home_saved else None,
+            well_saved=well_saved,
+            well_position=well if well_saved else None,
+            estop_active=bool(flags & FLAG_ESTOP),
+            max_jog_rps=max_jog / 100,
+            max_move_rps=max_move / 100,
+            raw_response=bytes(frame[:BINARY_STATUS_LENGTH]).hex() if cls.keep_raw_response else None
+        )
+
+    @staticmethod
+    def cache_info():
+        """Get parse cache statistics (hits, misses, maxsize, currsize)."""
+        return _cached_winch_status.cache_info()
+
+    @staticmethod
+    def cache_hit_rate() -> float:
+        """Get the fraction of status lines answered from the cache."""
+        info = _cached_winch_status.cache_info()
+        total = info.hits + info.misses
+        return info.hits / total if total else 0.0
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Empty the parse cache and reset its counters."""
+        _cached_winch_status.cache_clear()
+
+    @classmethod
+    def set_keep_raw_response(cls, enabled: bool) -> None:
+        """Turn raw line retention on or off (clears the parse cache)."""
+        cls.keep_raw_response = enabled
+        _cached_winch_status.cache_clear()
+
+    @classmethod
+    def _parse_status_uncached(cls, response: str) -> Optional[WinchStatus]:
+        """Parse a status line (no cache)."""
         # Clean up the response
         response = response.strip()
 
@@ -163,10 +296,14 @@ class ResponseParser:
             estop_active=(estop_str == "1"),
             max_jog_rps=max_jog_rps,
             max_move_rps=max_move_rps,
-            raw_response=response
+            raw_response=response if cls.keep_raw_response else None
         )
 
 
+_cached_winch_status = lru_cache(maxsize=STATUS_PARSE_CACHE_SIZE)(
+    ResponseParser._parse_status_uncached)
+
+
 def format_command(command: str) -> bytes:
     """
     Format a command for serial transmission.
@@ -180,6 +317,67 @@ def format_command(command: str) -> bytes:
     return (command.strip() + "\n").encode('ascii')
 
 
+def check_binary_status(frame: bytes) -> bool:
+    """
+    Check that a binary status frame is intact.
+
+    Args:
+        frame: Frame bytes, starting at the sync byte
+
+    Returns:
+        True if the length, sync byte, frame type and CRC all match
+    """
+    if len(frame) < BINARY_STATUS_LENGTH:
+        return False
+    if frame[0] != BINARY_STATUS_SYNC or frame[1] != BINARY_STATUS_TYPE:
+        return False
+    crc = int.from_bytes(frame[BINARY_STATUS_LENGTH - 2:BINARY_STATUS_LENGTH], 'little')
+    return binascii.crc_hqx(frame[:BINARY_STATUS_LENGTH - 2], 0xFFFF) == crc
+
+
+def encode_binary_status(status: WinchStatus) -> bytes:
+    """
+    Encode a status as a binary status frame (as the firmware sends it).
+
+    Args:
+        status: Status to encode
+
+    Returns:
+        Frame bytes including sync byte and CRC
+    """
+    try:
+        mode_index = BINARY_MODES.index(status.mode)
+    except ValueError:
+        mode_index = 0xFF
+
+    flags = 0
+    if status.home_saved:
+        flags |= FLAG_HOME_SAVED
+    if status.well_saved:
+        flags |= FLAG_WELL_SAVED
+    if status.estop_active:
+        flags |= FLAG_ESTOP
+
+    frame = bytearray(BINARY_STATUS_LENGTH)
+    BINARY_STATUS_FRAME.pack_into(
+        frame, 0,
+        BINARY_STATUS_SYNC,
+        BINARY_STATUS_TYPE,
+        status.position,
+        mode_index,
+        flags,
+        round(status.speed_rps * 100),
+        status.home_position or 0,
+        status.well_position or 0,
+        round(status.max_jog_rps * 100),
+        round(status.max_move_rps * 100),
+        0
+    )
+    crc = binascii.crc_hqx(frame[:-2], 0xFFFF)
+    struct.pack_into("<H", frame, BINARY_STATUS_LENGTH - 2, crc)
+    return bytes(frame)
+
+
 def validate_steps(value: str) -> Optional[int]:
     """
     Validate and parse a steps input value.
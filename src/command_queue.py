@@ -0,0 +1,122 @@
+"""
+Command Queue Module
+
+Coalescing outbound command queue for the winch and drop cylinder
+managers. A slider drag produces a burst of setpoint commands (VS, VJ,
+VM, ...) faster than a slow link can carry them; only the latest value
+matters, so a new setpoint replaces a queued one of the same kind and a
+repeated status request is dropped. Every other command (motion, stop,
+save, ...) is a barrier: it is never merged, and nothing is merged
+across it, so commands keep their order relative to it.
+"""
+
+import queue
+import threading
+from collections import deque
+from typing import Iterable, Optional
+
+
+class CoalescingCommandQueue:
+    """
+    FIFO of command strings that merges superseded setpoints.
+
+    A drop-in for the queue.Queue calls the managers use: put(), get()
+    and get_nowait() (raising queue.Empty). None may be queued as a
+    sentinel and is treated as a barrier.
+    """
+
+    def __init__(self, setpoint_prefixes: Iterable[str] = (), status_command: str = "?"):
+        """
+        Initialize the queue.
+
+        Args:
+            setpoint_prefixes: Command prefixes whose latest value supersedes
+                               earlier ones (e.g. "VS" for VS50, VS60)
+            status_command: Status request merged with a queued duplicate
+        """
+        self._setpoint_prefixes = tuple(setpoint_prefixes)
+        self._status_command = status_command
+        self._items: deque = deque()
+        self._not_empty = threading.Condition(threading.Lock())
+
+        # Commands merged into an already queued one
+        self.coalesced = 0
+
+    def coalesce_key(self, command: Optional[str]) -> Optional[str]:
+        """
+        Get the kind of command that a later command of the same kind supersedes.
+
+        Args:
+            command: Queued command
+
+        Returns:
+            Coalescing key, or None for barrier commands
+        """
+        if command is None:
+            return None
+        if command == self._status_command:
+            return command
+        for prefix in self._setpoint_prefixes:
+            if command.startswith(prefix):
+                return prefix
+        return None
+
+    def put(self, command: Optional[str]) -> None:
+        """
+        Queue a command, merging it with a queued one of the same kind.
+
+        Only commands queued after the most recent barrier are candidates,
+        so a setpoint never moves ahead of a motion or stop command.
+
+        Args:
+            command: Command string (or None as a sentinel)
+        """
+        key = self.coalesce_key(command)
+        with self._not_empty:
+            if key is not None:
+                items = self._items
+                for index in range(len(items) - 1, -1, -1):
+                    queued_key = items[index][0]
+                    if queued_key is None:
+                        break
+                    if queued_key == key:
+                        items[index] = (key, command)
+                        self.coalesced += 1
+                        return
+            self._items.append((key, command))
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Remove and return the oldest command.
+
+        Args:
+            block: Wait for a command if the queue is empty
+            timeout: Longest wait in seconds (None = forever)
+
+        Returns:
+            Command string (or None sentinel)
+
+        Raises:
+            queue.Empty: If no command is available
+        """
+        with self._not_empty:
+            if block:
+                if not self._not_empty.wait_for(lambda: self._items, timeout):
+                    raise queue.Empty
+            elif not self._items:
+                raise queue.Empty
+            return self._items.popleft()[1]
+
+    def get_nowait(self) -> Optional[str]:
+        """Remove and return the oldest command without waiting (raises queue.Empty)."""
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        """Get the number of queued commands."""
+        with self._not_empty:
+            return len(self._items)
+
+    def empty(self) -> bool:
+        """Check if no commands are queued."""
+        return self.qsize() == 0
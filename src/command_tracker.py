@@ -0,0 +1,198 @@
+"""
+Command Tracker Module
+
+Correlates commands sent to a controller with their acknowledgement and
+records the round-trip latency per command kind. Two ways to close a
+command are supported:
+
+- Tagged: the command goes out as <command>#<seq> and the controller
+  answers ACK:<seq> once it has run it.
+- Status-confirmed: on firmware without tags, the command is closed by
+  the first status that shows its effect (e.g. MODE:JOG_DOWN after JD).
+  Commands without a visible effect are dropped untimed.
+
+Commands that are never closed are counted as timeouts.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .metrics import HISTOGRAM_EDGES_MS, LatencyRecorder, LatencySummary
+
+
+@dataclass
+class PendingCommand:
+    """A command waiting for its acknowledgement."""
+    seq: int
+    command: str
+    kind: str
+    sent_time: float
+
+
+class CommandTracker:
+    """
+    Thread-safe tracker of outstanding commands and their latency.
+    """
+
+    def __init__(
+        self,
+        confirms: Callable[[str, object], Optional[bool]],
+        kind: Callable[[str], str],
+        timeout: float,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            confirms: Function telling whether a status shows a command's
+                      effect (command, status -> True/False, None if the
+                      command has no visible effect)
+            kind: Function mapping a command to its kind (latency key)
+            timeout: Seconds before an unacknowledged command is given up
+        """
+        self._confirms = confirms
+        self._kind = kind
+        self.timeout = timeout
+        self.tagging = False
+
+        self._pending: Dict[int, PendingCommand] = {}
+        self._latency: Dict[str, LatencyRecorder] = {}
+        self._next_seq = 1
+        self._lock = threading.Lock()
+
+        # Commands closed by tag, by status, and given up
+        self.acked = 0
+        self.confirmed = 0
+        self.timeouts = 0
+
+    @property
+    def pending(self) -> int:
+        """Get the number of commands waiting for acknowledgement."""
+        with self._lock:
+            return len(self._pending)
+
+    def sent(self, command: str, now: Optional[float] = None) -> str:
+        """
+        Start tracking a command.
+
+        Args:
+            command: Command string
+            now: Send time (default time.monotonic())
+
+        Returns:
+            Text to put on the wire (tagged while tagging is on)
+        """
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._pending[seq] = PendingCommand(
+                seq=seq,
+                command=command,
+                kind=self._kind(command),
+                sent_time=time.monotonic() if now is None else now,
+            )
+        return f"{command}#{seq}" if self.tagging else command
+
+    def on_ack(self, seq: int, now: Optional[float] = None) -> bool:
+        """
+        Close a tagged command.
+
+        Args:
+            seq: Sequence number from the acknowledgement
+            now: Receive time (default time.monotonic())
+
+        Returns:
+            True if the command was pending
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            pending = self._pending.pop(seq, None)
+            if pending is None:
+                return False
+            self.acked += 1
+            self._record(pending, now)
+        return True
+
+    def on_status(self, status, now: Optional[float] = None) -> int:
+        """
+        Close the untagged commands whose effect a status shows.
+
+        Args:
+            status: Received status
+            now: Receive time (default time.monotonic())
+
+        Returns:
+            Number of commands confirmed
+        """
+        if self.tagging:
+            return 0
+        now = time.monotonic() if now is None else now
+        confirmed = 0
+        with self._lock:
+            for seq, pending in list(self._pending.items()):
+                result = self._confirms(pending.command, status)
+                if result is False:
+                    continue
+                del self._pending[seq]
+                if result:
+                    confirmed += 1
+                    self._record(pending, now)
+            self.confirmed += confirmed
+        return confirmed
+
+    def expire(self, now: Optional[float] = None) -> List[PendingCommand]:
+        """
+        Give up on commands older than the timeout.
+
+        Args:
+            now: Current time (default time.monotonic())
+
+        Returns:
+            Commands given up
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = [pending for pending in self._pending.values()
+                       if now - pending.sent_time > self.timeout]
+            for pending in expired:
+                del self._pending[pending.seq]
+            self.timeouts += len(expired)
+        return expired
+
+    def clear(self) -> None:
+        """Forget pending commands (e.g. on reconnect); latency is kept."""
+        with self._lock:
+            self._pending.clear()
+
+    def latency(self) -> Dict[str, LatencySummary]:
+        """Get the round-trip latency summary per command kind."""
+        with self._lock:
+            recorders = dict(self._latency)
+        return {kind: recorder.summary() for kind, recorder in recorders.items()}
+
+    def histogram(self, kind: str,
+                  edges_ms: Sequence[float] = HISTOGRAM_EDGES_MS) -> List[int]:
+        """
+        Get round-trip latency bucket counts for one command kind.
+
+        Args:
+            kind: Command kind (e.g. "GS", "TR")
+            edges_ms: Ascending bucket edges in milliseconds
+
+        Returns:
+            len(edges_ms) + 1 counts (all zero if the kind was never timed)
+        """
+        with self._lock:
+            recorder = self._latency.get(kind)
+        if recorder is None:
+            return [0] * (len(edges_ms) + 1)
+        return recorder.histogram(edges_ms)
+
+    def _record(self, pending: PendingCommand, now: float) -> None:
+        """Record a closed command's latency (lock held)."""
+        recorder = self._latency.get(pending.kind)
+        if recorder is None:
+            recorder = self._latency[pending.kind] = LatencyRecorder()
+        recorder.record(now - pending.sent_time)
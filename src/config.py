@@ -21,9 +21,42 @@ STAC5_TCP_PORT: int = 7776
 # STAC5 UDP port (alternative, less reliable)
 STAC5_UDP_PORT: int = 7775
 
+# STAC5 UDP retransmit interval for unanswered requests (seconds)
+STAC5_UDP_RETRY_INTERVAL_SEC: float = 0.1  # 100ms
+
+# STAC5 UDP retransmissions per request (idempotent commands only)
+STAC5_UDP_MAX_RETRIES: int = 3
+
 # STAC5 status poll interval in seconds
 STAC5_POLL_INTERVAL_SEC: float = 0.15  # 150ms
 
+# STAC5 poll interval while the shaft is moving or jogging
+STAC5_POLL_MOTION_INTERVAL_SEC: float = 0.03  # 30ms
+
+# STAC5 poll interval while decelerating onto the target
+STAC5_POLL_APPROACH_INTERVAL_SEC: float = 0.015  # 15ms
+
+# Time before a move's estimated end at which approach polling starts
+STAC5_POLL_APPROACH_WINDOW_SEC: float = 0.5
+
+# Idle cycles without any change before the poll rate backs off
+STAC5_POLL_IDLE_BACKOFF_CYCLES: int = 20
+
+# Longest idle poll interval after backing off
+STAC5_POLL_MAX_IDLE_INTERVAL_SEC: float = 1.0
+
+# Move timeout when the duration cannot be estimated (seconds)
+STAC5_MOVE_TIMEOUT_SEC: float = 60.0
+
+# Encoder counts per motor shaft revolution (ER setting of the drive)
+STAC5_ENCODER_COUNTS_PER_REV: int = 8000
+
+# Distance from target still counted as arrived, in shaft revolutions
+# (1/720 rev = 0.5 degrees), and the same in encoder counts
+STAC5_IN_POSITION_TOLERANCE_REV: float = 1 / 720
+STAC5_IN_POSITION_TOLERANCE_COUNTS: int = max(
+    1, round(STAC5_ENCODER_COUNTS_PER_REV * STAC5_IN_POSITION_TOLERANCE_REV))
+
 # STAC5 connection timeout in seconds
 STAC5_CONNECT_TIMEOUT: float = 5.0
 
@@ -64,6 +97,28 @@ SERIAL_TIMEOUT: float = 0.1
 # Serial write timeout in seconds
 SERIAL_WRITE_TIMEOUT: float = 0.1
 
+# Serial auto-detect: longest wait for a port to answer ? (covers a
+# bootloader reset on open), and the interval between ? retries
+SERIAL_PROBE_TIMEOUT_SEC: float = 2.0
+SERIAL_PROBE_QUERY_INTERVAL_SEC: float = 0.1
+
+# Serial auto-detect: most ports probed at once
+SERIAL_PROBE_MAX_WORKERS: int = 8
+
+# Serial auto-detect: also send ? to USB ports whose IDs are not listed
+# below (e.g. a winch on a clone board with a CH340 bridge)
+SERIAL_PROBE_UNKNOWN_USB: bool = False
+
+# USB (VID, PID) pairs of the controller boards. Winch IDs are probed;
+# drop cylinder IDs are never opened (it does not answer on serial).
+WINCH_USB_IDS: List[Tuple[int, int]] = [
+    (0x2341, 0x0069),  # Arduino Uno R4 Minima
+    (0x2341, 0x1002),  # Arduino Uno R4 WiFi
+]
+DROP_CYLINDER_USB_IDS: List[Tuple[int, int]] = [
+    (0x2341, 0x0070),  # Arduino Nano ESP32
+]
+
 
 # =============================================================================
 # STATUS POLLING
@@ -75,6 +130,41 @@ WINCH_POLL_INTERVAL_SEC: float = 0.15  # 150ms
 # Drop cylinder status poll interval in seconds
 DROP_CYLINDER_POLL_INTERVAL_SEC: float = 0.2  # 200ms
 
+# Distinct status lines remembered by each status parser (idle polls repeat)
+STATUS_PARSE_CACHE_SIZE: int = 64
+
+# Longest gap between status deliveries while nothing changes (liveness)
+STATUS_HEARTBEAT_SEC: float = 2.0
+
+# Keep the raw status line on parsed status records (debugging only)
+STATUS_KEEP_RAW_RESPONSE: bool = False
+
+# Ask the winch and drop cylinder controllers for binary status frames
+# (firmware without support keeps sending ASCII lines)
+STATUS_BINARY_FRAMES: bool = False
+
+# Consecutive corrupt binary frames before reverting to ASCII status
+STATUS_BINARY_MAX_ERRORS: int = 3
+
+# Rate at which the winch and drop cylinder controllers are asked to push
+# status unsolicited (Hz, 1-50; 0 = poll with ? instead)
+STATUS_STREAM_RATE_HZ: int = 0
+
+# Silence on a subscribed stream before falling back to polling (seconds)
+STATUS_STREAM_STALL_SEC: float = 0.5
+
+# Silence allowed while the last winch status shows motion: the winch
+# firmware pushes at most every 250 ms while moving, and skips a push
+# when its serial TX buffer is full (seconds)
+STATUS_STREAM_MOTION_STALL_SEC: float = 1.0
+
+# Ask the drop cylinder controller to acknowledge each command with its
+# sequence tag (firmware without support is confirmed from status instead)
+DROP_CYLINDER_ACK_TAGS: bool = False
+
+# Longest wait for a drop cylinder command acknowledgement (seconds)
+DROP_CYLINDER_ACK_TIMEOUT_SEC: float = 2.0
+
 
 # =============================================================================
 # WINCH MOTOR CONFIGURATION
@@ -147,6 +237,14 @@ CAMERA_READ_TIMEOUT: float = 5.0
 # Camera discovery scan timeout per IP in seconds
 CAMERA_SCAN_TIMEOUT: float = 0.3
 
+# Hosts probed at once by the discovery scan. One per /24 host, so every
+# probe runs in parallel and a scan of silent hosts takes about one
+# timeout; the threads only wait on sockets and exit with the scan.
+CAMERA_SCAN_MAX_WORKERS: int = 254
+
+# How long discovery scan results are reused before rescanning (seconds)
+CAMERA_SCAN_CACHE_TTL_SEC: float = 60.0
+
 # Default display sizes for camera panel
 CAMERA_DISPLAY_SIZES: dict = {
     '240x180': (240, 180),
@@ -158,6 +256,25 @@ CAMERA_DISPLAY_SIZES: dict = {
 # Default camera display size
 CAMERA_DEFAULT_SIZE: str = '240x180'
 
+# Decode JPEG frames at a reduced scale (1/2, 1/4, 1/8) when the display
+# is at least 2x smaller in both dimensions, instead of decoding at full
+# size and resizing (larger displays always decode at full size)
+CAMERA_SCALED_DECODE: bool = True
+
+# Directory for camera stream recordings
+CAMERA_RECORD_DIR: str = "recordings"
+
+# Start a new recording segment after this many megabytes or seconds
+CAMERA_RECORD_SEGMENT_MB: int = 256
+CAMERA_RECORD_SEGMENT_SEC: float = 600.0
+
+# Interval between batched recording writes in seconds
+CAMERA_RECORD_FLUSH_SEC: float = 0.5
+
+# Frame data allowed to wait for the recording writer before frames are
+# dropped (megabytes)
+CAMERA_RECORD_MAX_PENDING_MB: int = 32
+
 
 # =============================================================================
 # TAPO CAMERA CONFIGURATION (RTSP)
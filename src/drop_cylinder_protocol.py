@@ -3,18 +3,42 @@ Drop Cylinder Protocol Module
 
 Defines command format and response parsing for the ESP32 drop cylinder controller.
 Mirrors the structure of command_protocol.py for the main winch.
+
+Status arrives either as an ASCII line or, once negotiated with
+DropCylinderCommands.STATUS_BINARY, as a fixed-layout binary frame:
+
+    offset  type  field
+    0       u8    sync (0xA5)
+    1       u8    frame type ('D')
+    2       i32   position (ms)
+    6       u8    mode (firmware CylinderMode enum order)
+    7       u8    flags (bit 0 start saved, 1 stop saved, 2 station mode)
+    8       i32   start position (ms)
+    12      i32   stop position (ms)
+    16      i16   trim (us)
+    18      4s    IPv4 address
+    22      u8    speed (percent)
+    23      u16   CRC-16/CCITT (init 0xFFFF) of bytes 0-22
+
+Little-endian, 25 bytes against ~90 for the ASCII line.
 """
 
+import binascii
 import re
-from dataclasses import dataclass
+import socket
+import struct
+from functools import lru_cache
 from enum import Enum
 from typing import Optional
 
 from .config import (
+    STATUS_PARSE_CACHE_SIZE,
+    STATUS_KEEP_RAW_RESPONSE,
     DEFAULT_SERVO_SPEED_PERCENT,
     TRIM_MIN_US,
     TRIM_MAX_US,
 )
+from .records import record
 
 
 class DropCylinderMode(Enum):
@@ -34,9 +58,32 @@ class DropCylinderWifiMode(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+# Binary status frame (layout in the module docstring)
+BINARY_STATUS_SYNC = 0xA5
+BINARY_STATUS_TYPE = ord('D')
+BINARY_STATUS_FRAME = struct.Struct("<BBiBBiih4sBH")
+BINARY_STATUS_LENGTH = BINARY_STATUS_FRAME.size
+
+# Mode byte values, in firmware enum order
+BINARY_MODES = ("IDLE", "JOG_DOWN", "JOG_UP", "MOVE_START", "MOVE_STOP")
+
+# Flag bits
+FLAG_START_SAVED = 0x01
+FLAG_STOP_SAVED = 0x02
+FLAG_STATION_MODE = 0x04
+
+
+@record
 class DropCylinderStatus:
-    """Parsed status response from the ESP32 drop cylinder controller."""
+    """
+    Parsed status response from the ESP32 drop cylinder controller.
+
+    Frozen because the parser hands the same cached instance to every
+    caller that sees an identical status line, and slotted because
+    records are created at poll rate and may be kept as history.
+    raw_response is only filled in when the parser's keep_raw_response
+    is set.
+    """
     position_ms: int = 0
     mode: str = "IDLE"
     start_saved: bool = False
@@ -47,7 +94,7 @@ class DropCylinderStatus:
     wifi_mode: str = "AP"
     ip_address: str = ""
     speed_percent: int = DEFAULT_SERVO_SPEED_PERCENT
-    raw_response: str = ""
+    raw_response: Optional[str] = None
 
     @property
     def motion_mode(self) -> DropCylinderMode:
@@ -94,6 +141,41 @@ class DropCylinderCommands:
     # Query command
     STATUS = "?"
 
+    # Setpoint commands where only the latest queued value matters
+    SETPOINT_PREFIXES = ("VS", "TR")
+
+    # Status format negotiation (acknowledged with STATUS_BINARY_ACK /
+    # STATUS_ASCII_ACK; firmware without binary support ignores them)
+    STATUS_BINARY = "SF1"
+    STATUS_ASCII = "SF0"
+    STATUS_BINARY_ACK = "OK:SF1"
+    STATUS_ASCII_ACK = "OK:SF0"
+
+    # Status stream acknowledgement prefix (followed by the rate in Hz)
+    STATUS_STREAM_ACK = "OK:SU"
+
+    # Command acknowledgement: after ACK_TAGS is acked with ACK_TAGS_ACK,
+    # commands sent as <command>#<seq> are answered with ACK:<seq>
+    ACK_TAGS = "AK1"
+    ACK_TAGS_ACK = "OK:AK1"
+    ACK_PREFIX = "ACK:"
+
+    # Commands that restart the controller and are never acknowledged
+    UNTRACKED_PREFIXES = ("WIFI",)
+
+    @staticmethod
+    def subscribe_status(rate_hz: int) -> str:
+        """
+        Generate status stream command.
+
+        Args:
+            rate_hz: Status pushes per second (1-50, 0 stops the stream)
+
+        Returns:
+            Command string
+        """
+        return f"SU{rate_hz}"
+
     @staticmethod
     def set_trim(offset_us: int) -> str:
         """
@@ -160,11 +242,17 @@ class DropCylinderResponseParser:
         r"(?:\s+SPEED:(\d+))?"
     )
 
+    # Attach the raw line to parsed records (see set_keep_raw_response)
+    keep_raw_response = STATUS_KEEP_RAW_RESPONSE
+
     @classmethod
     def parse_status(cls, response: str) -> Optional[DropCylinderStatus]:
         """
         Parse a status response string into a DropCylinderStatus object.
 
+        Idle polls return byte-identical lines, so results are cached by
+        line; repeated lines return the same (frozen) DropCylinderStatus.
+
         Args:
             response: Raw response string from ESP32
 
@@ -173,7 +261,69 @@ class DropCylinderResponseParser:
         """
         if not response or not response.startswith("POS:"):
             return None
+        return _cached_drop_cylinder_status(response)
+
+    @classmethod
+    def parse_binary_status(cls, frame: bytes) -> Optional[DropCylinderStatus]:
+        """
+        Decode a binary status frame into a DropCylinderStatus object.
+
+        Args:
+            frame: Frame bytes, starting at the sync byte
+
+        Returns:
+            DropCylinderStatus object if the frame is intact, None otherwise
+            (wrong length, sync or type, or CRC mismatch)
+        """
+        if not check_drop_cylinder_binary_status(frame):
+            return None
+
+        (sync, frame_type, position_ms, mode_index, flags, start_ms, stop_ms,
+         trim_us, ip, speed, crc) = BINARY_STATUS_FRAME.unpack_from(frame)
+
+        start_saved = bool(flags & FLAG_START_SAVED)
+        stop_saved = bool(flags & FLAG_STOP_SAVED)
+
+        return DropCylinderStatus(
+            position_ms=position_ms,
+            mode=BINARY_MODES[mode_index] if mode_index < len(BINARY_MODES) else "UNKNOWN",
+            start_saved=start_saved,
+            start_position_ms=start_ms if start_saved else None,
+            stop_saved=stop_saved,
+            stop_position_ms=stop_ms if stop_saved else None,
+            trim_us=trim_us,
+            wifi_mode="STA" if flags & FLAG_STATION_MODE else "AP",
+            ip_address=socket.inet_ntoa(ip),
+            speed_percent=speed,
+            raw_response=bytes(frame[:BINARY_STATUS_LENGTH]).hex() if cls.keep_raw_response else None
+        )
+
+    @staticmethod
+    def cache_info():
+        """Get parse cache statistics (hits, misses, maxsize, currsize)."""
+        return _cached_drop_cylinder_status.cache_info()
+
+    @staticmethod
+    def cache_hit_rate() -> float:
+        """Get the fraction of status lines answered from the cache."""
+        info = _cached_drop_cylinder_status.cache_info()
+        total = info.hits + info.misses
+        return info.hits / total if total else 0.0
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Empty the parse cache and reset its counters."""
+        _cached_drop_cylinder_status.cache_clear()
 
+    @classmethod
+    def set_keep_raw_response(cls, enabled: bool) -> None:
+        """Turn raw line retention on or off (clears the parse cache)."""
+        cls.keep_raw_response = enabled
+        _cached_drop_cylinder_status.cache_clear()
+
+    @classmethod
+    def _parse_status_uncached(cls, response: str) -> Optional[DropCylinderStatus]:
+        """Parse a status line (no cache)."""
         response = response.strip()
         match = cls.STATUS_PATTERN.search(response)
         if not match:
@@ -213,10 +363,72 @@ class DropCylinderResponseParser:
             wifi_mode=wifi_str,
             ip_address=ip_str,
             speed_percent=speed_percent,
-            raw_response=response
+            raw_response=response if cls.keep_raw_response else None
         )
 
 
+_cached_drop_cylinder_status = lru_cache(maxsize=STATUS_PARSE_CACHE_SIZE)(
+    DropCylinderResponseParser._parse_status_uncached)
+
+
+# Command letters, up to a numeric argument or ':' parameter
+_COMMAND_KIND_PATTERN = re.compile(r"\?|[A-Z_]+?(?=-?\d|:|$)|[A-Z_]+")
+
+
+def command_kind(command: str) -> str:
+    """
+    Get the command name without its argument (e.g. "TR" for "TR-5").
+
+    Args:
+        command: Command string
+
+    Returns:
+        Leading command letters ("?" for a status request)
+    """
+    match = _COMMAND_KIND_PATTERN.match(command)
+    return match.group(0) if match else command
+
+
+def status_confirms(command: str, status: DropCylinderStatus) -> Optional[bool]:
+    """
+    Check whether a status shows the effect of a command.
+
+    Used to confirm commands on firmware without acknowledgement tags.
+
+    Args:
+        command: Command that was sent
+        status: Status received after it
+
+    Returns:
+        True if the status reflects the command, False if not (yet), or
+        None if the command has no visible effect on the status
+    """
+    kind = command_kind(command)
+    if kind == DropCylinderCommands.JOG_DOWN:
+        return status.mode == DropCylinderMode.JOG_DOWN.value
+    if kind == DropCylinderCommands.JOG_UP:
+        return status.mode == DropCylinderMode.JOG_UP.value
+    if kind in (DropCylinderCommands.JOG_STOP, DropCylinderCommands.STOP):
+        return not status.is_moving
+    if kind == DropCylinderCommands.GO_START:
+        return (status.mode == DropCylinderMode.MOVE_TO_START.value
+                or (status.start_saved and status.position_ms == status.start_position_ms))
+    if kind == DropCylinderCommands.GO_STOP:
+        return (status.mode == DropCylinderMode.MOVE_TO_STOP.value
+                or (status.stop_saved and status.position_ms == status.stop_position_ms))
+    if kind == DropCylinderCommands.SAVE_START:
+        return status.start_saved
+    if kind == DropCylinderCommands.SAVE_STOP:
+        return status.stop_saved
+    if kind == DropCylinderCommands.ZERO:
+        return status.position_ms == 0
+    if kind == "TR":
+        return status.trim_us == int(command[2:])
+    if kind == "VS":
+        return status.speed_percent == int(command[2:])
+    return None
+
+
 def format_drop_cylinder_command(command: str) -> bytes:
     """
     Format a command for transmission to the drop cylinder controller.
@@ -230,6 +442,72 @@ def format_drop_cylinder_command(command: str) -> bytes:
     return (command.strip() + "\n").encode('ascii')
 
 
+def check_drop_cylinder_binary_status(frame: bytes) -> bool:
+    """
+    Check that a binary status frame is intact.
+
+    Args:
+        frame: Frame bytes, starting at the sync byte
+
+    Returns:
+        True if the length, sync byte, frame type and CRC all match
+    """
+    if len(frame) < BINARY_STATUS_LENGTH:
+        return False
+    if frame[0] != BINARY_STATUS_SYNC or frame[1] != BINARY_STATUS_TYPE:
+        return False
+    crc = int.from_bytes(frame[BINARY_STATUS_LENGTH - 2:BINARY_STATUS_LENGTH], 'little')
+    return binascii.crc_hqx(frame[:BINARY_STATUS_LENGTH - 2], 0xFFFF) == crc
+
+
+def encode_drop_cylinder_binary_status(status: DropCylinderStatus) -> bytes:
+    """
+    Encode a status as a binary status frame (as the firmware sends it).
+
+    Args:
+        status: Status to encode
+
+    Returns:
+        Frame bytes including sync byte and CRC
+    """
+    try:
+        mode_index = BINARY_MODES.index(status.mode)
+    except ValueError:
+        mode_index = 0xFF
+
+    flags = 0
+    if status.start_saved:
+        flags |= FLAG_START_SAVED
+    if status.stop_saved:
+        flags |= FLAG_STOP_SAVED
+    if status.wifi_mode == "STA":
+        flags |= FLAG_STATION_MODE
+
+    try:
+        ip = socket.inet_aton(status.ip_address)
+    except OSError:
+        ip = bytes(4)
+
+    frame = bytearray(BINARY_STATUS_LENGTH)
+    BINARY_STATUS_FRAME.pack_into(
+        frame, 0,
+        BINARY_STATUS_SYNC,
+        BINARY_STATUS_TYPE,
+        status.position_ms,
+        mode_index,
+        flags,
+        status.start_position_ms or 0,
+        status.stop_position_ms or 0,
+        status.trim_us,
+        ip,
+        status.speed_percent,
+        0
+    )
+    crc = binascii.crc_hqx(frame[:-2], 0xFFFF)
+    struct.pack_into("<H", frame, BINARY_STATUS_LENGTH - 2, crc)
+    return bytes(frame)
+
+
 def validate_trim(value: str) -> Optional[int]:
     """
     Validate and parse a trim input value.
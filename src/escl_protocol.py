@@ -0,0 +1,113 @@
+"""
+eSCL Protocol Module
+
+Defines packet format and response framing for the STAC5 eSCL (SCL over
+Ethernet) protocol. Mirrors the structure of command_protocol.py for the
+serial controllers.
+"""
+
+from typing import List, Optional
+
+
+# eSCL Protocol Constants
+ESCL_HEADER = bytes([0x00, 0x07])
+CARRIAGE_RETURN = bytes([0x0D])
+
+# Status Code (SC) bit definitions
+SC_MOTOR_ENABLED = 0x0001
+SC_SAMPLING = 0x0002
+SC_DRIVE_FAULT = 0x0004
+SC_IN_POSITION = 0x0008
+SC_MOVING = 0x0010
+SC_JOGGING = 0x0020
+SC_STOPPING = 0x0040
+SC_WAITING = 0x0080
+SC_ALARM_PRESENT = 0x0200
+
+# Any of these bits means the shaft is in motion
+SC_MOTION_MASK = SC_MOVING | SC_JOGGING | SC_STOPPING
+
+# Maximum size of a single response frame before the receive buffer is discarded
+MAX_FRAME_SIZE = 256
+
+
+def build_packet(command: str) -> bytes:
+    """
+    Build an eSCL packet for the given SCL command.
+
+    Args:
+        command: SCL command string (e.g., "ME", "DI4000")
+
+    Returns:
+        Bytes with eSCL header and carriage return terminator
+    """
+    return ESCL_HEADER + command.encode('ascii') + CARRIAGE_RETURN
+
+
+class ESCLFramer:
+    """
+    Incremental framer for eSCL response streams.
+
+    Responses arrive as [0x00, 0x07] + ASCII + CR. The header is optional
+    (some firmware omits it), so frames are delimited on CR alone and the
+    header is stripped if present. Data is accumulated in a bytearray and
+    only complete frames are copied out.
+    """
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE):
+        self._buffer = bytearray()
+        self._max_frame_size = max_frame_size
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Add received bytes and return any complete response payloads.
+
+        Args:
+            data: Raw bytes read from the socket
+
+        Returns:
+            List of response payloads (header and CR removed)
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        start = 0
+
+        while True:
+            end = buffer.find(b'\r', start)
+            if end == -1:
+                break
+            frame_start = start
+            if buffer[frame_start:frame_start + 2] == ESCL_HEADER:
+                frame_start += 2
+            frames.append(bytes(buffer[frame_start:end]))
+            start = end + 1
+
+        if start:
+            del buffer[:start]
+
+        # A frame that never terminates means we lost sync - drop it
+        if len(buffer) > self._max_frame_size:
+            buffer.clear()
+
+        return frames
+
+    def reset(self) -> None:
+        """Discard any partially received frame."""
+        self._buffer.clear()
+
+
+def parse_response(data: bytes) -> Optional[str]:
+    """
+    Decode an eSCL response payload to a string.
+
+    Args:
+        data: Response bytes, with or without header/terminator
+
+    Returns:
+        Stripped response string, or None if empty
+    """
+    if data[:2] == ESCL_HEADER:
+        data = data[2:]
+    response = data.decode('ascii', errors='replace').strip()
+    return response if response else None
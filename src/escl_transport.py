@@ -0,0 +1,748 @@
+"""
+eSCL Transport Module
+
+Pipelined TCP transport for the STAC5 eSCL protocol. A dedicated reader
+thread frames responses and matches them FIFO to outstanding requests, so
+several commands can be in flight on the link at once. Outbound packets
+pass through a priority queue so safety commands skip status polls that
+are queued but not yet sent. Polls already on the wire are not overtaken:
+the drive replies in order, so a stop's acknowledgement still waits for
+their replies. A stop never overtakes a motion command submitted before
+it, which would leave the drive moving after the stop.
+
+ESCLUdpTransport offers the same interface over UDP, with per-request
+retransmission instead of TCP's in-order delivery.
+"""
+
+import heapq
+import socket
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Optional, Tuple
+
+from .config import STAC5_UDP_RETRY_INTERVAL_SEC, STAC5_UDP_MAX_RETRIES
+from .escl_protocol import ESCLFramer, build_packet
+
+
+# Outbound priorities (lower is sent first)
+PRIORITY_SAFETY = 0   # ST, SK, SJ - written immediately on the caller's thread
+PRIORITY_COMMAND = 1  # Motion and configuration commands
+PRIORITY_POLL = 2     # Status queries - unsent ones are overtaken by safety and command traffic
+
+
+class PendingRequest:
+    """A command that has been written to the drive and awaits its response."""
+
+    def __init__(self, command: str):
+        self.command = command
+        self.response: Optional[bytes] = None
+        self.submit_time: float = time.perf_counter()
+        self.sent_time: float = 0.0
+        self.received_time: float = 0.0
+        self.abandoned = False
+        self._event = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Check if a response has arrived (or the request failed)."""
+        return self._event.is_set()
+
+    @property
+    def queue_delay(self) -> Optional[float]:
+        """Get the time spent queued before being written, in seconds."""
+        if not self.sent_time:
+            return None
+        return self.sent_time - self.submit_time
+
+    @property
+    def round_trip(self) -> Optional[float]:
+        """Get the measured round-trip time in seconds, if completed."""
+        if self.response is None:
+            return None
+        return self.received_time - self.sent_time
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Wait for the response.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Response payload, or None on timeout/failure
+        """
+        self._event.wait(timeout)
+        return self.response
+
+    def _complete(self, response: Optional[bytes]) -> None:
+        self.response = response
+        self.received_time = time.perf_counter()
+        self._event.set()
+
+
+class ESCLTransport:
+    """
+    Pipelined eSCL transport over an already-connected TCP socket.
+
+    The drive answers every packet with exactly one CR-terminated response,
+    in order, so responses are matched FIFO to the requests that were
+    written. Requests that time out stay in the queue (abandoned) so their
+    late reply is consumed instead of being handed to the next request.
+
+    Outbound traffic goes through a priority queue. Whoever holds the
+    write lock drains everything queued in one send: safety and command
+    batches in submission order, then polls. Normal and poll traffic is
+    drained by a writer thread; safety traffic is drained directly by the
+    caller, so a stop only ever waits for a send already in progress and
+    the command batches queued before it (never queued polls). Priority
+    only orders unsent traffic: the stop's reply still comes after the
+    replies to everything written before it, polls included.
+    """
+
+    # Read timeout for the reader thread (seconds)
+    READ_TIMEOUT = 0.5
+
+    # How long abandoned requests may wait for a late reply before the
+    # queue is assumed out of sync and cleared (seconds)
+    LATE_REPLY_GRACE = 2.0
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        on_closed: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            sock: Connected TCP socket
+            on_closed: Callback when the connection drops unexpectedly
+        """
+        self._socket = sock
+        self._on_closed = on_closed
+        self._framer = ESCLFramer()
+
+        # Outstanding requests in wire order
+        self._pending: Deque[PendingRequest] = deque()
+        self._pending_lock = threading.Lock()
+
+        # Held across enqueue + send so queue order matches wire order
+        self._write_lock = threading.Lock()
+
+        # Outbound priority queue: (priority, sequence, requests)
+        self._outbox: List[Tuple[int, int, List[PendingRequest]]] = []
+        self._outbox_cv = threading.Condition()
+        self._outbox_seq = 0
+
+        self._reader_thread: Optional[threading.Thread] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._running = False
+        self._last_abandon_time = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the transport is running."""
+        return self._running
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests awaiting a response."""
+        with self._pending_lock:
+            return len(self._pending)
+
+    def start(self) -> None:
+        """Start the reader thread."""
+        try:
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, AttributeError):
+            pass
+        self._socket.settimeout(self.READ_TIMEOUT)
+        self._running = True
+        self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader_thread.start()
+        self._writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer_thread.start()
+
+    def close(self) -> None:
+        """Stop the reader/writer threads and fail all outstanding requests."""
+        self._running = False
+        with self._outbox_cv:
+            self._outbox_cv.notify_all()
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        for thread in (self._reader_thread, self._writer_thread):
+            if thread and thread is not threading.current_thread():
+                thread.join(timeout=2.0)
+        self._reader_thread = None
+        self._writer_thread = None
+        self._fail_pending()
+
+    def submit(self, command: str, priority: int = PRIORITY_COMMAND) -> PendingRequest:
+        """
+        Write a command without waiting for its response.
+
+        Args:
+            command: SCL command string
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            PendingRequest that completes when the response arrives
+        """
+        return self.submit_many([command], priority)[0]
+
+    def submit_many(self, commands: Iterable[str],
+                    priority: int = PRIORITY_COMMAND) -> List[PendingRequest]:
+        """
+        Write several commands back-to-back in a single send.
+
+        Args:
+            commands: SCL command strings
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            PendingRequest for each command, in order
+        """
+        requests = [PendingRequest(command) for command in commands]
+        if not self._running:
+            for request in requests:
+                request._complete(None)
+            return requests
+
+        # Safety shares the command lane: jumping a queued jog start would
+        # let the jog begin after the stop
+        lane = max(priority, PRIORITY_COMMAND)
+        with self._outbox_cv:
+            self._outbox_seq += 1
+            heapq.heappush(self._outbox, (lane, self._outbox_seq, requests))
+            if priority > PRIORITY_SAFETY:
+                self._outbox_cv.notify()
+
+        if priority <= PRIORITY_SAFETY:
+            # Don't wait for the writer thread to be scheduled
+            self._drain()
+        return requests
+
+    def request(self, command: str, timeout: float = 1.0,
+                priority: int = PRIORITY_COMMAND) -> Optional[bytes]:
+        """
+        Send a command and wait for its response.
+
+        Args:
+            command: SCL command string
+            timeout: Response timeout in seconds
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            Response payload, or None on timeout/failure
+        """
+        pending = self.submit(command, priority)
+        response = pending.wait(timeout)
+        if response is None:
+            self.abandon(pending)
+            response = pending.response
+        return response
+
+    def abandon(self, request: PendingRequest) -> None:
+        """
+        Give up waiting on a request.
+
+        The request keeps its place in the queue so its late reply is
+        discarded rather than matched to a newer request.
+        """
+        with self._pending_lock:
+            if not request.done:
+                request.abandoned = True
+                self._last_abandon_time = time.perf_counter()
+
+    def _discard_stale_locked(self, now: float) -> None:
+        """Clear the queue if only long-abandoned requests remain."""
+        if not self._pending:
+            return
+        if now - self._last_abandon_time < self.LATE_REPLY_GRACE:
+            return
+        if all(request.abandoned for request in self._pending):
+            print(f"[eSCL] Resync: dropping {len(self._pending)} unanswered request(s)")
+            self._pending.clear()
+
+    def _drain(self) -> None:
+        """Write everything queued, polls last, in one send."""
+        with self._write_lock:
+            with self._outbox_cv:
+                batches = [heapq.heappop(self._outbox) for _ in range(len(self._outbox))]
+            if not batches:
+                return
+
+            requests = [request for _, _, queued in batches for request in queued]
+            if not self._running:
+                for request in requests:
+                    request._complete(None)
+                return
+
+            packet = b''.join(build_packet(request.command) for request in requests)
+            now = time.perf_counter()
+            with self._pending_lock:
+                self._discard_stale_locked(now)
+                for request in requests:
+                    request.sent_time = now
+                    self._pending.append(request)
+            try:
+                self._socket.sendall(packet)
+            except OSError as e:
+                self._handle_closed(f"Send failed: {e}")
+
+    def _write_loop(self) -> None:
+        """Background thread that drains the outbound queue."""
+        while True:
+            with self._outbox_cv:
+                while self._running and not self._outbox:
+                    self._outbox_cv.wait()
+                if not self._running:
+                    return
+            self._drain()
+
+    def _read_loop(self) -> None:
+        """Background thread that frames responses and completes requests."""
+        while self._running:
+            try:
+                data = self._socket.recv(1024)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                self._handle_closed(f"Receive failed: {e}")
+                break
+
+            if not data:
+                self._handle_closed("Connection closed by drive")
+                break
+
+            for frame in self._framer.feed(data):
+                self._dispatch(frame)
+
+    def _dispatch(self, frame: bytes) -> None:
+        """Match a response frame to the oldest outstanding request."""
+        with self._pending_lock:
+            request = self._pending.popleft() if self._pending else None
+            if request is not None:
+                request._complete(frame)
+
+        if request is None:
+            print(f"[eSCL] Unsolicited response: {frame!r}")
+            return
+
+        if request.abandoned:
+            print(f"[eSCL] Late response to {request.command} discarded")
+
+    def _handle_closed(self, reason: str) -> None:
+        """Handle an unexpected connection drop."""
+        if not self._running:
+            return
+        self._running = False
+        # Notify the owner before waking waiters so a failed request
+        # already sees the link as down
+        if self._on_closed:
+            self._on_closed(reason)
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Complete all outstanding and queued requests with no response."""
+        with self._pending_lock:
+            pending = list(self._pending)
+            self._pending.clear()
+        with self._outbox_cv:
+            for _, _, requests in self._outbox:
+                pending.extend(requests)
+            self._outbox.clear()
+        for request in pending:
+            request._complete(None)
+
+
+# Register queries: the reply names the register ("EP=1200"), so it can be
+# matched to its request even if earlier replies were lost
+QUERY_COMMANDS = frozenset({"EP", "IE", "SC", "AL", "IV", "IP", "RV", "SP"})
+
+# Commands that start motion - a duplicate would repeat the move, so they
+# are never retransmitted
+NON_IDEMPOTENT_PREFIXES = ("FL", "FP", "FS", "FM", "FO", "FY", "CJ", "SH", "QX")
+
+
+class _UdpSlot:
+    """Retransmit bookkeeping for one request on the UDP transport."""
+
+    def __init__(self, request: PendingRequest, priority: int, max_sends: int):
+        self.request = request
+        self.priority = priority
+        self.packet = build_packet(request.command)
+        self.is_query = request.command in QUERY_COMMANDS
+        self.max_sends = max_sends
+        self.sends = 0
+        self.next_send = 0.0
+        self.seq = 0  # Order of first send, for matching error replies
+
+
+class ESCLUdpTransport:
+    """
+    eSCL transport over a connected UDP socket.
+
+    Each request travels in its own datagram, so a lost packet delays only
+    that request instead of everything queued behind it as on TCP. Lost
+    requests are handled with per-request timeouts and bounded
+    retransmission:
+
+    - Register queries (QUERY_COMMANDS) are pipelined and matched by the
+      register name in the reply. A retransmitted query whose original
+      reply turns up late simply has the duplicate dropped.
+    - Error replies ("?<code>") name no register, so they go to the
+      oldest outstanding request of either kind, in send order.
+    - Other commands are answered with a bare ack ("%", "*" or "?<code>")
+      that cannot be told apart, so they are sent one at a time and the
+      ack goes to the command in flight. After a command needed
+      retransmission, stray duplicate acks are dropped for one retry
+      interval before the next command goes out.
+    - Motion starts (NON_IDEMPOTENT_PREFIXES) are never retransmitted.
+    - Safety traffic (PRIORITY_SAFETY) is sent immediately even while a
+      command is in flight. A stop is idempotent, so if its ack is taken
+      by the command ahead of it, it is simply retransmitted. Motion
+      starts still queued behind the command in flight are cancelled
+      (completed with None) so they cannot start after the stop.
+
+    Queries are not ordered against queued commands. Send commands and
+    wait for their acks when the order matters.
+    """
+
+    # Read timeout for the reader thread (seconds) - shutdown() does not
+    # wake a blocked UDP recv, so this bounds how long close() takes
+    READ_TIMEOUT = 0.1
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        on_closed: Optional[Callable[[str], None]] = None,
+        retry_interval: float = STAC5_UDP_RETRY_INTERVAL_SEC,
+        max_retries: int = STAC5_UDP_MAX_RETRIES,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            sock: UDP socket connected to the drive
+            on_closed: Callback when the socket fails unexpectedly
+            retry_interval: Time to wait for a reply before retransmitting (seconds)
+            max_retries: Retransmissions per idempotent request
+        """
+        self._socket = sock
+        self._on_closed = on_closed
+        self.retry_interval = retry_interval
+        self.max_retries = max_retries
+        self._framer = ESCLFramer()
+
+        self._lock = threading.Lock()
+        self._timer_cv = threading.Condition(self._lock)  # Wakes the retransmit thread
+        self._queries: List[_UdpSlot] = []
+        self._acks: Deque[_UdpSlot] = deque()  # Commands in flight, in wire order
+        self._backlog: List[Tuple[int, int, _UdpSlot]] = []  # Commands waiting to be sent
+        self._backlog_seq = 0
+        self._send_seq = 0
+        self._dup_acks = 0
+        self._dup_until = 0.0
+        self._send_error: Optional[str] = None
+
+        self._reader_thread: Optional[threading.Thread] = None
+        self._timer_thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Link statistics
+        self.retransmits = 0
+        self.duplicates = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the transport is running."""
+        return self._running
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests awaiting a response."""
+        with self._lock:
+            return len(self._queries) + len(self._acks)
+
+    def start(self) -> None:
+        """Start the reader and retransmit threads."""
+        self._socket.settimeout(self.READ_TIMEOUT)
+        self._running = True
+        self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader_thread.start()
+        self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True)
+        self._timer_thread.start()
+
+    def close(self) -> None:
+        """Stop the reader/retransmit threads and fail all outstanding requests."""
+        with self._timer_cv:
+            self._running = False
+            self._timer_cv.notify_all()
+        for thread in (self._reader_thread, self._timer_thread):
+            if thread and thread is not threading.current_thread():
+                thread.join(timeout=2.0)
+        self._reader_thread = None
+        self._timer_thread = None
+        self._fail_pending()
+
+    def submit(self, command: str, priority: int = PRIORITY_COMMAND) -> PendingRequest:
+        """
+        Send a command without waiting for its response.
+
+        Args:
+            command: SCL command string
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            PendingRequest that completes when the response arrives
+        """
+        return self.submit_many([command], priority)[0]
+
+    def submit_many(self, commands: Iterable[str],
+                    priority: int = PRIORITY_COMMAND) -> List[PendingRequest]:
+        """
+        Send several commands without waiting for their responses.
+
+        Args:
+            commands: SCL command strings
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            PendingRequest for each command, in order
+        """
+        requests = [PendingRequest(command) for command in commands]
+        if not self._running:
+            for request in requests:
+                request._complete(None)
+            return requests
+
+        now = time.perf_counter()
+        with self._lock:
+            for request in requests:
+                slot = _UdpSlot(request, priority, self._max_sends(request.command))
+                if slot.is_query:
+                    self._queries.append(slot)
+                    self._send_locked(slot, now)
+                elif priority <= PRIORITY_SAFETY:
+                    self._cancel_queued_motion_locked()
+                    self._acks.append(slot)
+                    self._send_locked(slot, now)
+                else:
+                    self._backlog_seq += 1
+                    heapq.heappush(self._backlog, (priority, self._backlog_seq, slot))
+            self._release_backlog_locked(now)
+        return requests
+
+    def request(self, command: str, timeout: float = 1.0,
+                priority: int = PRIORITY_COMMAND) -> Optional[bytes]:
+        """
+        Send a command and wait for its response.
+
+        Args:
+            command: SCL command string
+            timeout: Response timeout in seconds
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            Response payload, or None on timeout/failure
+        """
+        pending = self.submit(command, priority)
+        response = pending.wait(timeout)
+        if response is None:
+            self.abandon(pending)
+            response = pending.response
+        return response
+
+    def abandon(self, request: PendingRequest) -> None:
+        """
+        Give up waiting on a request.
+
+        Queries and unsent commands are dropped. A command already in
+        flight keeps its place until its retransmit budget runs out, so a
+        late ack is not handed to the next command.
+        """
+        with self._lock:
+            if request.done:
+                return
+            request.abandoned = True
+            for slot in self._queries:
+                if slot.request is request:
+                    self._queries.remove(slot)
+                    request._complete(None)
+                    return
+            for i, (_, _, slot) in enumerate(self._backlog):
+                if slot.request is request:
+                    self._backlog.pop(i)
+                    heapq.heapify(self._backlog)
+                    request._complete(None)
+                    return
+
+    def _cancel_queued_motion_locked(self) -> None:
+        """Fail unsent motion starts so they cannot follow a stop."""
+        motion = [entry for entry in self._backlog
+                  if entry[2].request.command[:2] in NON_IDEMPOTENT_PREFIXES]
+        if not motion:
+            return
+        for entry in motion:
+            self._backlog.remove(entry)
+            entry[2].request._complete(None)
+        heapq.heapify(self._backlog)
+        print(f"[eSCL] Stop cancelled {len(motion)} queued motion command(s)")
+
+    def _max_sends(self, command: str) -> int:
+        """Get the number of times a command may be sent."""
+        if command[:2] in NON_IDEMPOTENT_PREFIXES:
+            return 1
+        return 1 + self.max_retries
+
+    def _send_locked(self, slot: _UdpSlot, now: float) -> None:
+        """Send (or resend) a request's datagram."""
+        if slot.sends:
+            self.retransmits += 1
+        else:
+            slot.request.sent_time = now
+            self._send_seq += 1
+            slot.seq = self._send_seq
+        slot.sends += 1
+        slot.next_send = now + self.retry_interval
+        self._timer_cv.notify()
+        try:
+            self._socket.send(slot.packet)
+        except ConnectionRefusedError:
+            pass  # ICMP port unreachable from an earlier datagram - retry covers it
+        except OSError as e:
+            self._send_error = f"Send failed: {e}"
+
+    def _release_backlog_locked(self, now: float) -> None:
+        """Send the next queued command once the ack lane is clear."""
+        if self._acks or not self._backlog:
+            return
+        if self._dup_acks and now < self._dup_until:
+            return
+        self._dup_acks = 0
+        _, _, slot = heapq.heappop(self._backlog)
+        self._acks.append(slot)
+        self._send_locked(slot, now)
+
+    def _timer_loop(self) -> None:
+        """Background thread that retransmits and expires requests."""
+        with self._timer_cv:
+            while self._running and not self._send_error:
+                now = time.perf_counter()
+                self._service_timers_locked(now)
+                self._timer_cv.wait(self._next_deadline_locked(now))
+            send_error = self._send_error
+        if send_error:
+            self._handle_closed(send_error)
+
+    def _read_loop(self) -> None:
+        """Background thread that receives replies."""
+        while self._running:
+            try:
+                data = self._socket.recv(1024)
+            except socket.timeout:
+                continue
+            except ConnectionRefusedError:
+                continue  # Drive not listening yet; requests will retry or expire
+            except OSError as e:
+                self._handle_closed(f"Receive failed: {e}")
+                break
+
+            # One reply per datagram; never carry a partial frame across datagrams
+            frames = self._framer.feed(data)
+            self._framer.reset()
+            for frame in frames:
+                self._dispatch(frame)
+
+    def _next_deadline_locked(self, now: float) -> Optional[float]:
+        """Get the time until the next retransmit or expiry is due (None if idle)."""
+        deadlines = [slot.next_send for slot in self._queries]
+        deadlines.extend(slot.next_send for slot in self._acks)
+        if self._backlog and self._dup_acks:
+            deadlines.append(self._dup_until)
+        if not deadlines:
+            return None
+        return max(0.001, min(deadlines) - now)
+
+    def _service_timers_locked(self, now: float) -> None:
+        """Retransmit or expire requests whose retry interval has passed."""
+        for slot in [s for s in self._queries if now >= s.next_send]:
+            if slot.sends < slot.max_sends:
+                self._send_locked(slot, now)
+            else:
+                self._queries.remove(slot)
+                slot.request._complete(None)
+
+        for slot in [s for s in self._acks if now >= s.next_send]:
+            if slot.sends < slot.max_sends:
+                self._send_locked(slot, now)
+            else:
+                self._acks.remove(slot)
+                slot.request._complete(None)
+                # Its ack may still be on the way
+                self._dup_acks += slot.sends
+                self._dup_until = now + self.retry_interval
+
+        self._release_backlog_locked(now)
+
+    def _dispatch(self, frame: bytes) -> None:
+        """Match a reply datagram to its request."""
+        now = time.perf_counter()
+        with self._lock:
+            if len(frame) >= 3 and frame[2:3] == b"=":
+                register = frame[:2].decode('ascii', 'replace')
+                for slot in self._queries:
+                    if slot.request.command == register:
+                        self._queries.remove(slot)
+                        slot.request._complete(frame)
+                        return
+                self.duplicates += 1
+                return
+
+            if self._dup_acks and now < self._dup_until:
+                self._dup_acks -= 1
+                self.duplicates += 1
+                self._release_backlog_locked(now)
+                return
+
+            if frame[:1] == b"?" and self._queries:
+                # An error reply answers whichever request went out first
+                query = min(self._queries, key=lambda s: s.seq)
+                if not self._acks or query.seq < self._acks[0].seq:
+                    self._queries.remove(query)
+                    query.request._complete(frame)
+                    return
+
+            if not self._acks:
+                self.duplicates += 1
+                return
+
+            slot = self._acks.popleft()
+            slot.request._complete(frame)
+            if slot.sends > 1:
+                self._dup_acks = slot.sends - 1
+                self._dup_until = now + self.retry_interval
+            self._release_backlog_locked(now)
+
+    def _handle_closed(self, reason: str) -> None:
+        """Handle an unrecoverable socket error."""
+        if not self._running:
+            return
+        self._running = False
+        if self._on_closed:
+            self._on_closed(reason)
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Complete all outstanding and queued requests with no response."""
+        with self._lock:
+            slots = self._queries + list(self._acks) + [slot for _, _, slot in self._backlog]
+            self._queries.clear()
+            self._acks.clear()
+            self._backlog.clear()
+        for slot in slots:
+            slot.request._complete(None)
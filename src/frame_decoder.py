@@ -0,0 +1,204 @@
+"""
+Frame Decoder Module
+
+Background JPEG decode and resize for the camera panels. Decoding and
+scaling a 640x480 frame takes several milliseconds, which on the Tk
+thread delays button handling (and jog HoldButton releases) for every
+camera. Each panel instead gives its frames to a FrameDecoder: a worker
+thread keeps only the newest undecoded frame, decodes and scales it to
+an RGB image of the display size, and hands that to the panel, which
+only has to paste it into its PhotoImage.
+
+When the display is half the frame size or smaller, the JPEG is decoded
+at 1/2, 1/4 or 1/8 scale by libjpeg (Image.draft), using the largest
+reduction that still covers the display size, so the final resize only
+has a small step left.
+
+Requires Pillow.
+"""
+
+import io
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from PIL import Image
+
+from .config import CAMERA_SCALED_DECODE
+from .metrics import LatencyRecorder
+
+
+@dataclass
+class DecodedFrame:
+    """A frame ready to paste into a Tk PhotoImage."""
+    image: Image.Image  # RGB, already at display size
+    source_size: Tuple[int, int]  # Size of the received JPEG
+    decode_time: float  # Seconds spent decoding and scaling
+
+
+class FrameDecoder:
+    """
+    Decodes the newest frame of a camera stream on a worker thread.
+
+    Frames submitted while the worker is busy (or waiting out the
+    minimum interval) replace the pending one and count as dropped.
+    """
+
+    def __init__(
+        self,
+        on_ready: Callable[[DecodedFrame], None],
+        size: Optional[Tuple[int, int]] = None,
+        min_interval: float = 0.0,
+        scaled_decode: bool = CAMERA_SCALED_DECODE,
+    ):
+        """
+        Initialize the decoder.
+
+        Args:
+            on_ready: Called from the worker thread with each decoded frame
+            size: Display size (None = keep the frame size)
+            min_interval: Shortest time between decodes in seconds (frames
+                          arriving faster than the display rate are skipped)
+            scaled_decode: Let libjpeg decode at a reduced scale when the
+                           display size allows it
+        """
+        self._on_ready = on_ready
+        self._size = size
+        self._fit = False
+        self.min_interval = min_interval
+        self.scaled_decode = scaled_decode
+
+        self._pending: Optional[bytes] = None
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Frames decoded, superseded before decoding, and undecodable
+        self.decoded = 0
+        self.dropped = 0
+        self.errors = 0
+        self.decode_latency = LatencyRecorder(max_samples=1000)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the worker is running."""
+        return self._running
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker thread and discard the pending frame."""
+        with self._condition:
+            self._running = False
+            self._pending = None
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def set_size(self, size: Optional[Tuple[int, int]], fit: bool = False) -> None:
+        """
+        Set the display size for the following frames.
+
+        Args:
+            size: Display size (None = keep the frame size)
+            fit: Scale to fit inside size keeping the aspect ratio
+                 (default stretches to exactly size)
+        """
+        self._size = size
+        self._fit = fit
+
+    def submit(self, jpeg: bytes) -> None:
+        """
+        Queue a frame for decoding (called from the stream thread).
+
+        Args:
+            jpeg: JPEG data
+        """
+        with self._condition:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = jpeg
+            self._condition.notify()
+
+    def decode(self, jpeg: bytes) -> DecodedFrame:
+        """
+        Decode and scale one frame.
+
+        Args:
+            jpeg: JPEG data
+
+        Returns:
+            Decoded frame
+
+        Raises:
+            OSError: If the data is not a decodable image
+        """
+        start = time.perf_counter()
+        image = Image.open(io.BytesIO(jpeg))
+        source_size = image.size
+        target = self._target_size(source_size)
+        if target and self._scales_on_decode(image, target):
+            # Picks the largest 1/2, 1/4, 1/8 scale still covering target
+            image.draft("RGB", target)
+        if target and target != image.size:
+            # Use BILINEAR for speed (LANCZOS is slow)
+            image = image.resize(target, Image.Resampling.BILINEAR)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.load()
+        return DecodedFrame(image, source_size, time.perf_counter() - start)
+
+    def _scales_on_decode(self, image: Image.Image, target: Tuple[int, int]) -> bool:
+        """
+        Check if the frame should be decoded at a reduced scale.
+
+        Only when the target is at least 2x smaller in both dimensions:
+        otherwise libjpeg cannot reduce at all, and draft would only
+        change the decode mode.
+        """
+        return (self.scaled_decode and image.format == "JPEG"
+                and target[0] * 2 <= image.size[0] and target[1] * 2 <= image.size[1])
+
+    def _target_size(self, source_size: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Get the output size for a frame of source_size."""
+        size = self._size
+        if not size or not self._fit:
+            return size
+        scale = min(size[0] / source_size[0], size[1] / source_size[1])
+        return (max(1, int(source_size[0] * scale)), max(1, int(source_size[1] * scale)))
+
+    def _run(self) -> None:
+        last_decode = 0.0
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or not self._running)
+                if not self._running:
+                    return
+
+            # Let newer frames replace this one until the interval is up
+            wait = last_decode + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+            with self._condition:
+                jpeg, self._pending = self._pending, None
+                if jpeg is None or not self._running:
+                    continue
+
+            last_decode = time.monotonic()
+            try:
+                frame = self.decode(jpeg)
+            except Exception:
+                self.errors += 1
+                continue
+            self.decoded += 1
+            self.decode_latency.record(frame.decode_time)
+            self._on_ready(frame)
@@ -5,6 +5,8 @@ Displays MJPEG stream from ESP32-CAM and RTSP stream from TAPO cameras.
 Settings accessible via gear icon in the panel header.
 """
 
+from __future__ import annotations
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import io
@@ -15,6 +17,7 @@ from typing import Optional, List
 
 try:
     from PIL import Image, ImageTk
+    from ..frame_decoder import DecodedFrame, FrameDecoder
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -25,9 +28,12 @@ from ..camera_manager import (
     RTSPStreamReader,
     CameraDiscovery,
 )
+from ..mjpeg_recorder import MJPEGRecorder
+from ..metrics import LatencyRecorder
 from ..config import (
     CAMERA_DISPLAY_SIZES,
     CAMERA_DEFAULT_SIZE,
+    CAMERA_RECORD_DIR,
     TAPO_RTSP_PORT,
 )
 from .theme import COLORS, FONTS
@@ -65,11 +71,15 @@ class CameraPanel(tk.Frame):
         self._discovered_ips: List[str] = []
         self._scan_thread: Optional[threading.Thread] = None
         self._settings_popup = None
+        self._recorder: Optional[MJPEGRecorder] = None
 
-        # Frame throttling
-        self._last_display_time = 0
-        self._pending_frame: Optional[bytes] = None
+        # Background decode; the Tk thread only pastes decoded frames
+        self._decoder: Optional[FrameDecoder] = None
+        self._ready_frame: Optional[DecodedFrame] = None
+        self._ready_lock = threading.Lock()
         self._display_scheduled = False
+        self.display_latency = LatencyRecorder(max_samples=1000)
+        self.display_dropped = 0
 
         # StringVars persist across popup open/close
         self._ip_var = tk.StringVar(value=default_ip)
@@ -174,9 +184,16 @@ class CameraPanel(tk.Frame):
             controls_frame, text="Save", command=self._save_snapshot,
             width=80, height=32, bg_color=COLORS['btn_secondary'], font=FONTS['button']
         )
-        self._save_btn.pack(side='left')
+        self._save_btn.pack(side='left', padx=(0, 8))
         self._save_btn.set_enabled(False)
 
+        self._record_btn = ModernButton(
+            controls_frame, text="Rec", command=self._toggle_recording,
+            width=60, height=32, bg_color=COLORS['btn_secondary'], font=FONTS['button']
+        )
+        self._record_btn.pack(side='left')
+        self._record_btn.set_enabled(False)
+
     def _create_status_section(self, parent):
         status_frame = tk.Frame(parent, bg=COLORS['bg_panel'])
         status_frame.pack(fill='x')
@@ -220,6 +237,13 @@ class CameraPanel(tk.Frame):
         ip_row = tk.Frame(frame, bg=COLORS['bg_panel'])
         ip_row.pack(fill='x', pady=(2, 8))
 
+        # Offer the cameras of a recent scan (by either panel) without rescanning
+        if not self._discovered_ips:
+            local_ip = CameraDiscovery.get_local_ip()
+            cached = CameraDiscovery.cached_cameras(local_ip) if local_ip else None
+            if cached:
+                self._discovered_ips = cached
+
         values = [self._default_ip] + self._discovered_ips if self._default_ip else self._discovered_ips
         self._ip_combo = ttk.Combobox(
             ip_row, textvariable=self._ip_var, width=15, values=values
@@ -286,10 +310,21 @@ class CameraPanel(tk.Frame):
         def on_complete():
             self.after(0, self._scan_complete)
 
+        def on_progress(count: int):
+            # Hosts finish in bursts; a status update every 16 is plenty
+            if count % 16 == 0:
+                self.after(0, self._update_scan_progress, count)
+
+        # An explicit scan always probes; the cache only seeds the popup
         self._scan_thread = CameraDiscovery.scan_subnet(
-            local_ip, on_found, on_complete
+            local_ip, on_found, on_complete, on_progress, max_age=0
         )
 
+    def _update_scan_progress(self, count: int):
+        if self._scan_thread and self._scan_thread.is_alive():
+            self._status_var.set(
+                f"Scanning network... {count}/254, found {len(self._discovered_ips)}")
+
     def _update_discovered_ips(self):
         try:
             if hasattr(self, '_ip_combo') and self._ip_combo.winfo_exists():
@@ -333,6 +368,7 @@ class CameraPanel(tk.Frame):
         self._status_var.set(f"Connecting to {ip}...")
         self._conn_led.set_state('connecting')
 
+        self._start_decoder()
         self._stream_reader = MJPEGStreamReader(
             stream_url,
             on_frame=self._on_frame_received,
@@ -345,11 +381,18 @@ class CameraPanel(tk.Frame):
         self._connect_btn.configure_colors(bg_color=COLORS['btn_danger'])
         self._flash_btn.set_enabled(True)
         self._capture_btn.set_enabled(True)
+        self._record_btn.set_enabled(True)
 
     def _disconnect(self):
+        self._stop_recording()
         if self._stream_reader:
             self._stream_reader.stop()
             self._stream_reader = None
+        if self._decoder:
+            self._decoder.stop()
+            self._decoder = None
+        with self._ready_lock:
+            self._ready_frame = None
 
         self._connected = False
         self._config = None
@@ -363,6 +406,7 @@ class CameraPanel(tk.Frame):
         self._flash_btn.set_enabled(False)
         self._capture_btn.set_enabled(False)
         self._save_btn.set_enabled(False)
+        self._record_btn.set_enabled(False)
         self._status_var.set("Disconnected")
 
         self._video_label.configure(image='', text="No Camera Connected")
@@ -370,60 +414,70 @@ class CameraPanel(tk.Frame):
 
     # === Frame Display ===
 
+    @property
+    def decoder(self) -> Optional[FrameDecoder]:
+        """Get the frame decoder of the current stream (decode time and drop counters)."""
+        return self._decoder
+
+    def _decoder_size(self):
+        """Get the decoder output size and fit flag for the display size."""
+        if self._display_size:
+            return self._display_size, False
+        # Fit inside the default display area
+        return (320, 240), True
+
+    def _start_decoder(self):
+        self._decoder = FrameDecoder(
+            self._on_frame_decoded,
+            min_interval=self.DISPLAY_INTERVAL_MS / 1000.0,
+        )
+        self._decoder.set_size(*self._decoder_size())
+        self._decoder.start()
+
     def _on_frame_received(self, frame_data: bytes):
-        """Called from stream thread - store frame and schedule throttled display."""
+        """Called from stream thread - keep the frame for snapshots and queue it for decoding."""
         self._current_frame = frame_data
-        self._pending_frame = frame_data
-
-        # Only schedule one display update at a time
-        if not self._display_scheduled:
+        recorder = self._recorder
+        if recorder:
+            recorder.write(frame_data)
+        decoder = self._decoder
+        if decoder:
+            decoder.submit(frame_data)
+
+    def _on_frame_decoded(self, frame: DecodedFrame):
+        """Called from the decoder thread - hand the newest frame to the Tk thread."""
+        with self._ready_lock:
+            if self._ready_frame is not None:
+                self.display_dropped += 1
+            self._ready_frame = frame
+            if self._display_scheduled:
+                return
             self._display_scheduled = True
-            self.after(0, self._maybe_display_frame)
-
-    def _maybe_display_frame(self):
-        """Check if enough time has passed and display the latest frame."""
-        self._display_scheduled = False
-
-        if not self._pending_frame:
+        self.after(0, self._show_ready_frame)
+
+    def _show_ready_frame(self):
+        """Paste the newest decoded frame into the video label."""
+        with self._ready_lock:
+            frame, self._ready_frame = self._ready_frame, None
+            self._display_scheduled = False
+        if frame is None or not self._connected:
             return
 
-        now = time.time() * 1000
-        elapsed = now - self._last_display_time
-
-        if elapsed >= self.DISPLAY_INTERVAL_MS:
-            # Enough time passed - display the frame
-            self._display_frame_data(self._pending_frame)
-            self._last_display_time = now
-            self._pending_frame = None
+        start = time.perf_counter()
+        image = frame.image
+        photo = self._photo_image
+        if photo is not None and (photo.width(), photo.height()) == image.size:
+            photo.paste(image)
         else:
-            # Too soon - schedule for later
-            wait_ms = int(self.DISPLAY_INTERVAL_MS - elapsed) + 1
-            self._display_scheduled = True
-            self.after(wait_ms, self._maybe_display_frame)
-
-    def _display_frame_data(self, frame_data: bytes):
-        try:
-            image = Image.open(io.BytesIO(frame_data))
-            if self._display_size:
-                # Use BILINEAR for speed (LANCZOS is slow)
-                image = image.resize(self._display_size, Image.Resampling.BILINEAR)
-            else:
-                container_w = self._display_frame.winfo_width()
-                container_h = self._display_frame.winfo_height()
-                if container_w > 1 and container_h > 1:
-                    img_w, img_h = image.size
-                    scale = min(container_w / img_w, container_h / img_h)
-                    new_size = (int(img_w * scale), int(img_h * scale))
-                    image = image.resize(new_size, Image.Resampling.BILINEAR)
-
             self._photo_image = ImageTk.PhotoImage(image)
             self._video_label.configure(image=self._photo_image, text='')
+        self.display_latency.record(time.perf_counter() - start)
 
-            if self._connected:
-                self._conn_led.set_state('connected')
-                self._status_var.set(f"Connected - {image.size[0]}x{image.size[1]}")
-        except Exception:
-            pass
+        self._conn_led.set_state('connected')
+        status = f"Connected - {image.size[0]}x{image.size[1]}"
+        if self._recorder:
+            status += " - REC failed" if self._recorder.error else f" - REC {self._recorder.frames_written}"
+        self._status_var.set(status)
 
     def _on_stream_error(self, error: str):
         self.after(0, self._handle_stream_error, error)
@@ -439,6 +493,8 @@ class CameraPanel(tk.Frame):
         size_name = self._size_var.get()
         self._display_size = self.SIZES.get(size_name)
         self._update_display_size()
+        if self._decoder:
+            self._decoder.set_size(*self._decoder_size())
 
     def _update_display_size(self):
         if self._display_size:
@@ -498,6 +554,40 @@ class CameraPanel(tk.Frame):
             except Exception as e:
                 messagebox.showerror("Save Error", f"Failed to save image: {e}")
 
+    # === Recording ===
+
+    @property
+    def recorder(self) -> Optional[MJPEGRecorder]:
+        """Get the active stream recorder (segment paths and frame counters)."""
+        return self._recorder
+
+    def _toggle_recording(self):
+        if self._recorder:
+            self._stop_recording()
+        elif self._connected:
+            prefix = "camera_" + self._ip_var.get().strip().replace('.', '_')
+            recorder = MJPEGRecorder(CAMERA_RECORD_DIR, prefix=prefix)
+            try:
+                recorder.start()
+            except OSError as e:
+                messagebox.showerror("Record Error", f"Failed to start recording: {e}")
+                return
+            self._recorder = recorder
+            self._record_btn.set_text("Stop")
+            self._record_btn.configure_colors(bg_color=COLORS['btn_danger'])
+
+    def _stop_recording(self):
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return
+        recorder.stop()
+        self._record_btn.set_text("Rec")
+        self._record_btn.configure_colors(bg_color=COLORS['btn_secondary'])
+        if recorder.error:
+            messagebox.showerror("Record Error", f"Recording failed: {recorder.error}")
+        elif recorder.segments:
+            self._status_var.set(f"Recorded {recorder.frames_written} frames to {CAMERA_RECORD_DIR}")
+
     def destroy(self):
         self._close_settings()
         self._disconnect()
@@ -536,10 +626,13 @@ class TapoCameraPanel(tk.Frame):
         self._photo_image: Optional[ImageTk.PhotoImage] = None
         self._display_size = self.SIZES[self.DEFAULT_SIZE]
 
-        # Frame throttling
-        self._last_display_time = 0
-        self._pending_frame: Optional[bytes] = None
+        # Background decode; the Tk thread only pastes decoded frames
+        self._decoder: Optional[FrameDecoder] = None
+        self._ready_frame: Optional[DecodedFrame] = None
+        self._ready_lock = threading.Lock()
         self._display_scheduled = False
+        self.display_latency = LatencyRecorder(max_samples=1000)
+        self.display_dropped = 0
         self._settings_popup = None
 
         # StringVars persist across popup open/close
@@ -755,6 +848,7 @@ class TapoCameraPanel(tk.Frame):
         self._status_var.set(f"Connecting to {ip}...")
         self._conn_led.set_state('connecting')
 
+        self._start_decoder()
         self._stream_reader = RTSPStreamReader(
             rtsp_url,
             on_frame=self._on_frame_received,
@@ -771,6 +865,11 @@ class TapoCameraPanel(tk.Frame):
         if self._stream_reader:
             self._stream_reader.stop()
             self._stream_reader = None
+        if self._decoder:
+            self._decoder.stop()
+            self._decoder = None
+        with self._ready_lock:
+            self._ready_frame = None
 
         self._connected = False
         self._current_frame = None
@@ -787,52 +886,61 @@ class TapoCameraPanel(tk.Frame):
 
     # === Frame Display ===
 
-    def _on_frame_received(self, frame_data: bytes):
-        """Called from stream thread - store frame and schedule throttled display."""
-        self._current_frame = frame_data
-        self._pending_frame = frame_data
+    @property
+    def decoder(self) -> Optional[FrameDecoder]:
+        """Get the frame decoder of the current stream (decode time and drop counters)."""
+        return self._decoder
 
-        # Only schedule one display update at a time
-        if not self._display_scheduled:
-            self._display_scheduled = True
-            self.after(0, self._maybe_display_frame)
+    def _decoder_size(self):
+        """Get the decoder output size and fit flag for the display size."""
+        return self._display_size, False
 
-    def _maybe_display_frame(self):
-        """Check if enough time has passed and display the latest frame."""
-        self._display_scheduled = False
+    def _start_decoder(self):
+        self._decoder = FrameDecoder(
+            self._on_frame_decoded,
+            min_interval=self.DISPLAY_INTERVAL_MS / 1000.0,
+        )
+        self._decoder.set_size(*self._decoder_size())
+        self._decoder.start()
 
-        if not self._pending_frame:
+    def _on_frame_received(self, frame_data: bytes):
+        """Called from stream thread - keep the frame for snapshots and queue it for decoding."""
+        self._current_frame = frame_data
+        decoder = self._decoder
+        if decoder:
+            decoder.submit(frame_data)
+
+    def _on_frame_decoded(self, frame: DecodedFrame):
+        """Called from the decoder thread - hand the newest frame to the Tk thread."""
+        with self._ready_lock:
+            if self._ready_frame is not None:
+                self.display_dropped += 1
+            self._ready_frame = frame
+            if self._display_scheduled:
+                return
+            self._display_scheduled = True
+        self.after(0, self._show_ready_frame)
+
+    def _show_ready_frame(self):
+        """Paste the newest decoded frame into the video label."""
+        with self._ready_lock:
+            frame, self._ready_frame = self._ready_frame, None
+            self._display_scheduled = False
+        if frame is None or not self._connected:
             return
 
-        now = time.time() * 1000
-        elapsed = now - self._last_display_time
-
-        if elapsed >= self.DISPLAY_INTERVAL_MS:
-            # Enough time passed - display the frame
-            self._display_frame_data(self._pending_frame)
-            self._last_display_time = now
-            self._pending_frame = None
+        start = time.perf_counter()
+        image = frame.image
+        photo = self._photo_image
+        if photo is not None and (photo.width(), photo.height()) == image.size:
+            photo.paste(image)
         else:
-            # Too soon - schedule for later
-            wait_ms = int(self.DISPLAY_INTERVAL_MS - elapsed) + 1
-            self._display_scheduled = True
-            self.after(wait_ms, self._maybe_display_frame)
-
-    def _display_frame_data(self, frame_data: bytes):
-        try:
-            image = Image.open(io.BytesIO(frame_data))
-            if self._display_size:
-                # Use BILINEAR for speed (LANCZOS is slow)
-                image = image.resize(self._display_size, Image.Resampling.BILINEAR)
-
             self._photo_image = ImageTk.PhotoImage(image)
             self._video_label.configure(image=self._photo_image, text='')
+        self.display_latency.record(time.perf_counter() - start)
 
-            if self._connected:
-                self._conn_led.set_state('connected')
-                self._status_var.set(f"Connected - {image.size[0]}x{image.size[1]}")
-        except Exception:
-            pass
+        self._conn_led.set_state('connected')
+        self._status_var.set(f"Connected - {image.size[0]}x{image.size[1]}")
 
     def _on_stream_error(self, error: str):
         self.after(0, self._handle_stream_error, error)
@@ -848,6 +956,8 @@ class TapoCameraPanel(tk.Frame):
         size_name = self._size_var.get()
         self._display_size = self.SIZES.get(size_name)
         self._update_display_size()
+        if self._decoder:
+            self._decoder.set_size(*self._decoder_size())
 
     def _update_display_size(self):
         if self._display_size:
@@ -31,9 +31,9 @@ from ..config import (
 )
 from ..serial_manager import SerialManager, ConnectionState
 from ..wifi_manager import DropCylinderManager, DropCylinderConnectionState, ConnectionMode
-from ..drop_cylinder_protocol import DropCylinderStatus
 from ..command_protocol import WinchStatus, MotionMode
-from ..stac5_manager import STAC5Manager, STAC5Status
+from ..stac5_manager import STAC5Manager, STAC5StatusSnapshot
+from ..status_delta import StatusDelta
 from .position_display import PositionDisplay, PositionSlider
 from .control_panel import ControlPanel
 from .settings_panel import SettingsPanel
@@ -339,18 +339,18 @@ class MainWindow:
     def _setup_callbacks(self) -> None:
         """Setup serial, WiFi, and STAC5 manager callbacks."""
         # Serial (legacy winch - kept for reference)
-        self._serial_manager.set_status_callback(self._on_status_update)
+        self._serial_manager.set_delta_callback(self._on_status_delta)
         self._serial_manager.set_connection_callback(self._on_connection_change)
         self._serial_manager.set_command_sent_callback(self._on_command_sent)
         self._serial_manager.set_response_callback(self._on_response_received)
         self._serial_manager.set_error_callback(self._on_error)
 
         # STAC5 Motor Controller (primary)
-        self._stac5_manager.set_status_callback(self._on_stac5_status_update)
+        self._stac5_manager.set_delta_callback(self._on_stac5_status_delta)
         self._stac5_manager.set_error_callback(self._on_stac5_error)
 
         # Drop cylinder (WiFi or Serial)
-        self._drop_cylinder_manager.set_status_callback(self._on_drop_status_update)
+        self._drop_cylinder_manager.set_delta_callback(self._on_drop_status_delta)
         self._drop_cylinder_manager.set_connection_callback(self._on_drop_connection_change)
         self._drop_cylinder_manager.set_error_callback(self._on_drop_error)
 
@@ -388,6 +388,24 @@ class MainWindow:
         else:
             self._port_var.set("")
 
+        if ports and not self._serial_manager.is_connected:
+            # Probing takes up to a couple of seconds, so look for the
+            # winch in the background and select its port when found
+            import threading
+            def detect_thread():
+                port = SerialManager.auto_detect_port()
+                if port:
+                    self._root.after(0, self._on_winch_port_detected, port)
+
+            threading.Thread(target=detect_thread, daemon=True).start()
+
+    def _on_winch_port_detected(self, port: str) -> None:
+        """Select the auto-detected winch port (called on main thread)."""
+        if self._serial_manager.is_connected:
+            return
+        if port in self._port_combo["values"]:
+            self._port_var.set(port)
+
     def _toggle_connection(self) -> None:
         """Connect or disconnect from serial port."""
         if self._serial_manager.is_connected:
@@ -519,16 +537,16 @@ class MainWindow:
                 )
         self._update_controls_state()
 
-    def _on_stac5_status_update(self, status: STAC5Status) -> None:
-        """Handle STAC5 status update (called from background thread)."""
-        self._root.after(0, self._update_stac5_status_display, status)
+    def _on_stac5_status_delta(self, delta: StatusDelta) -> None:
+        """Handle STAC5 status change or heartbeat (called from background thread)."""
+        self._root.after(0, self._update_stac5_status_display, delta.status)
 
-    def _update_stac5_status_display(self, status: STAC5Status) -> None:
+    def _update_stac5_status_display(self, status: STAC5StatusSnapshot) -> None:
         """Update displays with STAC5 status (called on main thread)."""
         # Create a WinchStatus-compatible object for the position display
         # This allows reusing the existing position display widget
         class STAC5WinchStatus:
-            def __init__(self, s: STAC5Status):
+            def __init__(self, s: STAC5StatusSnapshot):
                 self.position = s.encoder_position
                 self.is_moving = s.is_moving
                 self.motor_enabled = s.motor_enabled
@@ -576,10 +594,10 @@ class MainWindow:
 
     # Serial callbacks (called from background thread)
 
-    def _on_status_update(self, status: WinchStatus) -> None:
-        """Handle status update from serial manager."""
-        # Schedule GUI update on main thread
-        self._root.after(0, self._update_status_display, status)
+    def _on_status_delta(self, delta: StatusDelta) -> None:
+        """Handle status change or heartbeat from serial manager."""
+        # Schedule GUI update on main thread (unchanged polls never get here)
+        self._root.after(0, self._update_status_display, delta.status)
 
     def _on_connection_change(self, state: ConnectionState, message: str) -> None:
         """Handle connection state change."""
@@ -773,9 +791,9 @@ class MainWindow:
         """Refresh and return available serial ports for drop cylinder."""
         return DropCylinderManager.list_serial_ports()
 
-    def _on_drop_status_update(self, status: DropCylinderStatus) -> None:
-        """Handle drop cylinder status update."""
-        self._root.after(0, self._drop_cylinder_panel.update_status, status)
+    def _on_drop_status_delta(self, delta: StatusDelta) -> None:
+        """Handle drop cylinder status change or heartbeat."""
+        self._root.after(0, self._drop_cylinder_panel.update_status, delta.status)
 
     def _on_drop_connection_change(self, state: DropCylinderConnectionState, message: str) -> None:
         """Handle drop cylinder connection state change."""
@@ -0,0 +1,155 @@
+"""
+Line Framer Module
+
+Incremental framing for the newline-terminated text links (winch
+controller serial, drop cylinder serial/WiFi). Counterpart to
+ESCLFramer in escl_protocol.py for the STAC5. Optionally also passes
+through fixed-length binary status frames interleaved with the lines.
+"""
+
+from typing import Callable, List, Optional, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Longest line kept before the partial line is treated as garbage
+MAX_LINE_LENGTH = 1024
+
+
+class LineFramer:
+    """
+    Incremental framer for newline-terminated byte streams.
+
+    Received bytes are appended to a bytearray and complete lines are
+    copied out once, through a memoryview; the unterminated tail stays in
+    place until the next feed. Lines are stripped of surrounding
+    whitespace and empty lines are skipped, so CRLF endings need no
+    special handling.
+
+    A partial line longer than max_line_length is discarded, along with
+    the rest of that line up to its terminator, so a stream of garbage
+    bytes cannot grow the buffer without bound.
+
+    With frame_sync set, a sync byte outside a frame starts a binary
+    frame of exactly frame_length bytes (which may contain newline bytes);
+    it is returned whole and unstripped. Frames carry no terminator, so
+    the sync byte must be one that never appears in a text line: any
+    partial line before a sync byte is dropped as a fragment.
+
+    With frame_check also set, a candidate frame that fails the check (a
+    dropped byte shifted it, or it was corrupted) is still returned, so
+    the caller counts it as a bad frame, but framing resumes one byte
+    after its sync byte, skipping to the next sync byte or terminator.
+    One lost byte then costs one frame rather than every frame up to the
+    next newline.
+    """
+
+    def __init__(self, max_line_length: int = MAX_LINE_LENGTH, accept_cr: bool = False,
+                 frame_sync: Optional[int] = None, frame_length: int = 0,
+                 frame_check: Optional[Callable[[bytes], bool]] = None):
+        """
+        Initialize the framer.
+
+        Args:
+            max_line_length: Maximum line length in bytes
+            accept_cr: Also end lines on a bare CR (for clients that send
+                       CR-terminated commands)
+            frame_sync: First byte of a binary frame (None: text only)
+            frame_length: Length of a binary frame, including the sync byte
+            frame_check: Returns True for an intact frame (None: every
+                         candidate is taken as a frame)
+        """
+        self._buffer = bytearray()
+        self._max_line_length = max_line_length
+        self._accept_cr = accept_cr
+        self._frame_sync = frame_sync
+        self._frame_length = frame_length
+        self._frame_check = frame_check
+        self._discarding = False
+
+        # Lines dropped for exceeding max_line_length, and candidate
+        # frames that failed frame_check
+        self.overflows = 0
+        self.frame_errors = 0
+
+    def feed(self, data: BytesLike) -> List[bytes]:
+        """
+        Add received bytes and return any complete lines.
+
+        Args:
+            data: Raw bytes read from the port or socket
+
+        Returns:
+            List of non-empty lines, stripped, without terminators (and
+            binary frames, whole)
+        """
+        buffer = self._buffer
+        buffer += data
+        lines = []
+        start = 0
+        sync = self._frame_sync
+
+        with memoryview(buffer) as view:
+            while True:
+                if sync is not None:
+                    if not self._discarding:
+                        # Skip the line terminators left before a frame
+                        while start < len(buffer) and buffer[start] in b'\r\n':
+                            start += 1
+                    if start < len(buffer) and buffer[start] == sync:
+                        end = start + self._frame_length
+                        if end > len(buffer):
+                            break
+                        frame = bytes(view[start:end])
+                        lines.append(frame)
+                        if self._frame_check is None or self._frame_check(frame):
+                            self._discarding = False
+                            start = end
+                        else:
+                            # Resync: drop up to the next sync byte or terminator
+                            self.frame_errors += 1
+                            self._discarding = True
+                            start += 1
+                        continue
+
+                end = self._find_terminator(buffer, start)
+                if sync is not None:
+                    next_sync = buffer.find(sync, start, end if end != -1 else len(buffer))
+                    if next_sync != -1:
+                        # A sync byte is never text: drop the fragment before it
+                        start = next_sync
+                        continue
+                if end == -1:
+                    break
+                if self._discarding:
+                    self._discarding = False
+                elif end - start > self._max_line_length:
+                    self.overflows += 1
+                else:
+                    line = bytes(view[start:end]).strip()
+                    if line:
+                        lines.append(line)
+                start = end + 1
+
+        if start:
+            del buffer[:start]
+
+        if len(buffer) > self._max_line_length:
+            buffer.clear()
+            if not self._discarding:
+                self.overflows += 1
+            self._discarding = True
+
+        return lines
+
+    def reset(self) -> None:
+        """Discard any partially received line."""
+        self._buffer.clear()
+        self._discarding = False
+
+    def _find_terminator(self, buffer: bytearray, start: int) -> int:
+        end = buffer.find(b'\n', start)
+        if self._accept_cr:
+            cr = buffer.find(b'\r', start, end if end != -1 else len(buffer))
+            if cr != -1:
+                return cr
+        return end
@@ -0,0 +1,131 @@
+"""
+Metrics Module
+
+Lightweight latency recording for command round-trips. Used to report
+worst-case and percentile latencies without pulling in a metrics library.
+"""
+
+import bisect
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Sequence
+
+# Default histogram bucket edges (milliseconds)
+HISTOGRAM_EDGES_MS = (5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+@dataclass
+class LatencySummary:
+    """Summary of recorded latencies (milliseconds)."""
+    count: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    worst_ms: float = 0.0
+
+    def __str__(self) -> str:
+        return (f"n={self.count} mean={self.mean_ms:.1f}ms p50={self.p50_ms:.1f}ms "
+                f"p99={self.p99_ms:.1f}ms worst={self.worst_ms:.1f}ms")
+
+
+class LatencyRecorder:
+    """
+    Thread-safe rolling record of latency samples.
+
+    Percentiles are computed over the most recent max_samples samples;
+    the count and worst case cover everything recorded since the last reset.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+        self._count = 0
+        self._worst = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a latency sample.
+
+        Args:
+            seconds: Measured latency in seconds
+        """
+        with self._lock:
+            self._samples.append(seconds)
+            self._count += 1
+            if seconds > self._worst:
+                self._worst = seconds
+
+    @property
+    def count(self) -> int:
+        """Get the total number of samples recorded."""
+        return self._count
+
+    @property
+    def worst(self) -> float:
+        """Get the worst latency recorded, in seconds."""
+        return self._worst
+
+    def percentile(self, p: float) -> float:
+        """
+        Get a latency percentile over the recent samples.
+
+        Args:
+            p: Percentile (0-100)
+
+        Returns:
+            Latency in seconds (0.0 if no samples)
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        return self._percentile(samples, p)
+
+    def histogram(self, edges_ms: Sequence[float] = HISTOGRAM_EDGES_MS) -> List[int]:
+        """
+        Get sample counts per latency bucket over the recent samples.
+
+        Args:
+            edges_ms: Ascending bucket edges in milliseconds
+
+        Returns:
+            len(edges_ms) + 1 counts: below the first edge, between each
+            pair of edges, and at or above the last edge
+        """
+        with self._lock:
+            samples = list(self._samples)
+        counts = [0] * (len(edges_ms) + 1)
+        for seconds in samples:
+            counts[bisect.bisect_right(edges_ms, seconds * 1000.0)] += 1
+        return counts
+
+    def summary(self) -> LatencySummary:
+        """Get a summary of the recorded latencies."""
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self._count
+            worst = self._worst
+        if not samples:
+            return LatencySummary()
+        return LatencySummary(
+            count=count,
+            mean_ms=sum(samples) / len(samples) * 1000.0,
+            p50_ms=self._percentile(samples, 50) * 1000.0,
+            p99_ms=self._percentile(samples, 99) * 1000.0,
+            worst_ms=worst * 1000.0,
+        )
+
+    def reset(self) -> None:
+        """Discard all samples."""
+        with self._lock:
+            self._samples.clear()
+            self._count = 0
+            self._worst = 0.0
+
+    @staticmethod
+    def _percentile(samples: List[float], p: float) -> float:
+        """Nearest-rank percentile of sorted samples."""
+        if not samples:
+            return 0.0
+        rank = max(1, min(len(samples), math.ceil(p / 100.0 * len(samples))))
+        return samples[rank - 1]
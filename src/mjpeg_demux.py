@@ -0,0 +1,282 @@
+"""
+MJPEG Demux Module
+
+Splits an ESP32-CAM MJPEG HTTP stream into JPEG frames. The camera sends
+multipart/x-mixed-replace (over chunked transfer encoding) with a
+Content-Length header on every part, so each frame is read with
+recv_into straight into a bytearray of exactly its size: no buffer
+concatenation and no marker search over the image data, which also
+keeps an FF D9 inside the image (e.g. in an EXIF thumbnail) from ending
+the frame early. Streams without a boundary, and parts without a
+Content-Length, fall back to scanning for the JPEG SOI/EOI markers.
+"""
+
+import socket
+from typing import Callable, Iterator, Optional
+
+# JPEG start/end of image markers
+SOI = b"\xff\xd8"
+EOI = b"\xff\xd9"
+
+# Longest header or boundary line accepted before giving up on multipart
+MAX_LINE_LENGTH = 1024
+
+
+class StreamEnded(Exception):
+    """The stream closed, ended, or the reader was asked to stop."""
+
+
+class MJPEGDemuxer:
+    """
+    Reads JPEG frames from a connected MJPEG HTTP socket.
+
+    The HTTP request must already have been sent; frames() reads the
+    response headers and then yields frames until the stream ends.
+    """
+
+    RECV_SIZE = 8192
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        keep_going: Callable[[], bool] = lambda: True,
+        max_frame_size: int = 500000,
+        min_frame_size: int = 100,
+    ):
+        """
+        Initialize the demuxer.
+
+        Args:
+            sock: Connected socket (a timeout lets keep_going be checked)
+            keep_going: Checked on every receive; returning False ends frames()
+            max_frame_size: Largest frame accepted (bytes)
+            min_frame_size: Frames this size or smaller are dropped
+        """
+        self._sock = sock
+        self._keep_going = keep_going
+        self.max_frame_size = max_frame_size
+        self.min_frame_size = min_frame_size
+
+        self._buffer = bytearray()  # Received bytes not yet consumed
+        self._scratch = bytearray(self.RECV_SIZE)
+        self._chunk_left = -1       # Bytes left in the current chunk (-1 = not chunked)
+        self.boundary: Optional[bytes] = None
+
+        # Frames read by Content-Length and by marker scan
+        self.frames_sized = 0
+        self.frames_scanned = 0
+
+    def frames(self) -> Iterator[bytearray]:
+        """
+        Yield JPEG frames until the stream ends.
+
+        Each frame is a new bytearray that the caller may keep.
+        """
+        try:
+            self._read_response_headers()
+            if self.boundary:
+                yield from self._multipart_frames()
+            yield from self._scanned_frames()
+        except StreamEnded:
+            return
+
+    # -------------------------------------------------------------------------
+    # Frame extraction
+    # -------------------------------------------------------------------------
+
+    def _multipart_frames(self) -> Iterator[bytearray]:
+        """Yield sized parts; return when the stream needs the marker scan."""
+        delimiter = b"--" + self.boundary
+        while True:
+            line = self._readline()
+            if line is None:
+                return
+            line = line.strip()
+            if not line.startswith(delimiter):
+                continue  # CRLF after the previous part, or preamble
+            if line.startswith(delimiter + b"--"):
+                raise StreamEnded
+
+            length = None
+            while True:
+                header = self._readline()
+                if header is None:
+                    return
+                header = header.strip()
+                if not header:
+                    break
+                name, _, value = header.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    try:
+                        length = int(value)
+                    except ValueError:
+                        length = None
+
+            if length is None or not 0 < length <= self.max_frame_size:
+                print("[CAMERA] Part without usable Content-Length, scanning for JPEG markers")
+                return
+
+            frame = bytearray(length)
+            self._readinto(memoryview(frame))
+            self.frames_sized += 1
+            if length > self.min_frame_size:
+                yield frame
+
+    def _scanned_frames(self) -> Iterator[bytearray]:
+        """Yield frames delimited by the SOI/EOI markers."""
+        data = bytearray()
+        started = False  # data starts with SOI
+        search_from = 0  # Where the EOI search resumes
+        while True:
+            available = self._body_available()
+            data += self._buffer[:available]
+            self._consume(available)
+
+            while True:
+                if not started:
+                    start = data.find(SOI)
+                    if start == -1:
+                        # Keep the last byte in case it is half a marker
+                        del data[:-1]
+                        break
+                    del data[:start]
+                    started = True
+                    search_from = 2
+
+                end = data.find(EOI, search_from)
+                if end == -1:
+                    if len(data) > self.max_frame_size:
+                        # No EOI in sight: resynchronize on the next SOI
+                        del data[:2]
+                        started = False
+                        continue
+                    search_from = max(2, len(data) - 1)
+                    break
+
+                end += 2
+                frame = data[:end]
+                del data[:end]
+                started = False
+                self.frames_scanned += 1
+                if len(frame) > self.min_frame_size:
+                    yield frame
+
+    # -------------------------------------------------------------------------
+    # HTTP response and body (chunked transfer decoding)
+    # -------------------------------------------------------------------------
+
+    def _read_response_headers(self) -> None:
+        """Read the HTTP response headers; note the boundary and chunking."""
+        while True:
+            line = self._raw_readline().strip()
+            if not line:
+                break
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            value = value.strip()
+            if name == b"content-type":
+                for param in value.split(b";")[1:]:
+                    key, _, boundary = param.strip().partition(b"=")
+                    if key.lower() == b"boundary" and boundary:
+                        self.boundary = boundary.strip(b'"')
+            elif name == b"transfer-encoding" and b"chunked" in value.lower():
+                self._chunk_left = 0
+
+    def _body_available(self) -> int:
+        """Make body bytes available in the buffer and get how many belong to the body."""
+        if self._chunk_left == 0:
+            self._next_chunk()
+        if not self._buffer:
+            self._fill()
+        if self._chunk_left < 0:
+            return len(self._buffer)
+        return min(len(self._buffer), self._chunk_left)
+
+    def _consume(self, count: int) -> None:
+        """Drop body bytes from the front of the buffer."""
+        del self._buffer[:count]
+        if self._chunk_left > 0:
+            self._chunk_left -= count
+
+    def _next_chunk(self) -> None:
+        """Read the next chunk size line (skipping the previous chunk's CRLF)."""
+        while True:
+            line = self._raw_readline().strip()
+            if line:
+                break
+        try:
+            size = int(line.split(b";")[0], 16)
+        except ValueError:
+            raise StreamEnded
+        if size == 0:
+            raise StreamEnded
+        self._chunk_left = size
+
+    def _readline(self) -> Optional[bytes]:
+        """Read a body line (None if it is implausibly long)."""
+        line = bytearray()
+        while True:
+            available = self._body_available()
+            end = self._buffer.find(b"\n", 0, available)
+            if end != -1:
+                line += self._buffer[:end + 1]
+                self._consume(end + 1)
+                return bytes(line)
+            line += self._buffer[:available]
+            self._consume(available)
+            if len(line) > MAX_LINE_LENGTH:
+                return None
+
+    def _readinto(self, view: memoryview) -> None:
+        """Fill view with body bytes, receiving directly into it where possible."""
+        filled = 0
+        total = len(view)
+        while filled < total:
+            if self._chunk_left == 0:
+                self._next_chunk()
+            want = total - filled
+            if self._chunk_left > 0:
+                want = min(want, self._chunk_left)
+            if self._buffer:
+                count = min(want, len(self._buffer))
+                view[filled:filled + count] = self._buffer[:count]
+                self._consume(count)
+            else:
+                count = self._recv_into(view[filled:filled + want])
+                if self._chunk_left > 0:
+                    self._chunk_left -= count
+            filled += count
+
+    # -------------------------------------------------------------------------
+    # Socket
+    # -------------------------------------------------------------------------
+
+    def _raw_readline(self) -> bytes:
+        """Read a line from the connection (HTTP headers and chunk sizes)."""
+        while True:
+            end = self._buffer.find(b"\n")
+            if end != -1:
+                line = bytes(self._buffer[:end + 1])
+                del self._buffer[:end + 1]
+                return line
+            if len(self._buffer) > MAX_LINE_LENGTH:
+                raise StreamEnded
+            self._fill()
+
+    def _fill(self) -> None:
+        """Receive more bytes into the buffer."""
+        count = self._recv_into(memoryview(self._scratch))
+        self._buffer += memoryview(self._scratch)[:count]
+
+    def _recv_into(self, view: memoryview) -> int:
+        """Receive into view, retrying on timeouts while keep_going() holds."""
+        while True:
+            if not self._keep_going():
+                raise StreamEnded
+            try:
+                count = self._sock.recv_into(view)
+            except socket.timeout:
+                continue
+            if count == 0:
+                raise StreamEnded
+            return count
@@ -0,0 +1,401 @@
+"""
+MJPEG Recorder Module
+
+Records a camera stream by appending the received JPEG frames, exactly
+as the camera sent them (no decode or re-encode), to segment files.
+Each segment is a plain concatenation of JPEGs (playable as raw MJPEG,
+e.g. ffplay -f mjpeg) with a binary index beside it holding one
+INDEX_RECORD (monotonic timestamp, offset, length) per frame, so the
+frame shown at any moment is found by bisecting the timestamps.
+
+Monotonic time is only meaningful within the process that recorded it,
+so each index starts with an INDEX_HEADER pairing time.time() with
+time.monotonic() when the segment was opened. Readers convert the frame
+stamps to wall-clock time with it and seek on wall-clock time, which
+lines recordings up with each other and with logged events. All the
+segments of one recorder run share a session name, and a reader loads
+one session at a time.
+
+The stream thread only timestamps the frame and appends it to a pending
+list; a writer thread takes the whole list every flush interval and
+writes it in one batch. The index of a batch is written after its frame
+data, so an index never points past the end of its segment, even after
+a crash.
+"""
+
+import os
+import struct
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from .config import (
+    CAMERA_RECORD_FLUSH_SEC,
+    CAMERA_RECORD_MAX_PENDING_MB,
+    CAMERA_RECORD_SEGMENT_MB,
+    CAMERA_RECORD_SEGMENT_SEC,
+)
+
+# Index header: magic, wall-clock time (time.time()) and monotonic time
+# taken together when the segment was opened
+INDEX_HEADER = struct.Struct("<4sdd")
+INDEX_MAGIC = b"MJX1"
+
+# Index record: monotonic timestamp (s), byte offset in segment, length
+INDEX_RECORD = struct.Struct("<dQI")
+
+SEGMENT_EXTENSION = ".mjpg"
+INDEX_EXTENSION = ".idx"
+
+
+@dataclass
+class RecordedFrame:
+    """A frame found in a recording."""
+    timestamp: float  # Wall-clock (time.time()) receive time
+    monotonic: float  # time.monotonic() receive time, as recorded
+    jpeg: bytes
+    segment: str  # Path of the segment file
+    index: int  # Frame number within the segment
+
+
+class MJPEGRecorder:
+    """
+    Writes stream frames to segmented MJPEG files on a background thread.
+
+    Pass write() as (or call it from) the stream reader's frame callback.
+    Frames arriving while more than max_pending_bytes wait for the disk
+    are dropped and counted rather than blocking the stream.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "camera",
+        segment_bytes: int = CAMERA_RECORD_SEGMENT_MB * 1024 * 1024,
+        segment_seconds: float = CAMERA_RECORD_SEGMENT_SEC,
+        flush_interval: float = CAMERA_RECORD_FLUSH_SEC,
+        max_pending_bytes: int = CAMERA_RECORD_MAX_PENDING_MB * 1024 * 1024,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            directory: Directory for the segment files (created if missing)
+            prefix: Segment file name prefix
+            segment_bytes: Start a new segment once this size is reached
+            segment_seconds: Start a new segment after this long
+            flush_interval: Time between batched writes in seconds
+            max_pending_bytes: Frame data allowed to wait for the writer
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.flush_interval = flush_interval
+        self.max_pending_bytes = max_pending_bytes
+
+        self._pending: List[Tuple[float, bytes]] = []
+        self._pending_bytes = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Writer thread state
+        self._data_file = None
+        self._index_file = None
+        self._segment_offset = 0
+        self._segment_start = 0.0
+        self.session = ""  # Segment name stem shared by this run
+        self.segments: List[str] = []  # Segment paths, oldest first
+
+        # Frames written, dropped for backpressure, and write errors
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.bytes_written = 0
+        self.error: Optional[str] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the recorder is accepting frames."""
+        return self._running
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._running:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = f"{self.prefix}_{time.strftime('%Y%m%d_%H%M%S')}"
+        self.session, run = stamp, 1
+        while os.path.exists(os.path.join(self.directory, f"{self.session}_000{SEGMENT_EXTENSION}")):
+            run += 1  # Restarted within the same second
+            self.session = f"{stamp}-{run}"
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        print(f"[RECORD] Recording to {self.directory}")
+
+    def stop(self) -> None:
+        """Write the pending frames, close the segment and stop the writer."""
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=10.0)
+            self._thread = None
+        print(f"[RECORD] Stopped: {self.frames_written} frames in {len(self.segments)} segment(s), "
+              f"{self.frames_dropped} dropped")
+
+    def write(self, jpeg: bytes, timestamp: Optional[float] = None) -> bool:
+        """
+        Queue a frame for writing (called from the stream thread).
+
+        Args:
+            jpeg: JPEG data as received from the camera
+            timestamp: Receive time (default time.monotonic())
+
+        Returns:
+            True if queued, False if dropped (not running or writer behind)
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self._condition:
+            if not self._running or self._pending_bytes + len(jpeg) > self.max_pending_bytes:
+                self.frames_dropped += 1
+                return False
+            self._pending.append((timestamp, jpeg))
+            self._pending_bytes += len(jpeg)
+        return True
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    if self._running:
+                        self._condition.wait(self.flush_interval)
+                    batch, self._pending = self._pending, []
+                    self._pending_bytes = 0
+                    running = self._running
+                if batch:
+                    self._write_batch(batch)
+                if not running:
+                    return
+        except OSError as e:
+            self.error = str(e)
+            self._running = False
+            print(f"[RECORD] Write failed: {e}")
+        finally:
+            self._close_segment()
+
+    def _write_batch(self, batch: List[Tuple[float, bytes]]) -> None:
+        index = bytearray()
+        for timestamp, jpeg in batch:
+            if self._data_file is None or self._segment_full(timestamp):
+                self._flush_index(index)
+                self._open_segment(timestamp)
+            self._data_file.write(jpeg)
+            index += INDEX_RECORD.pack(timestamp, self._segment_offset, len(jpeg))
+            self._segment_offset += len(jpeg)
+            self.bytes_written += len(jpeg)
+        self._flush_index(index)
+        self.frames_written += len(batch)
+
+    def _flush_index(self, index: bytearray) -> None:
+        """Write index records once the frames they point to are on disk."""
+        if not index or self._data_file is None:
+            return
+        self._data_file.flush()
+        self._index_file.write(index)
+        self._index_file.flush()
+        index.clear()
+
+    def _segment_full(self, timestamp: float) -> bool:
+        return (self._segment_offset >= self.segment_bytes
+                or timestamp - self._segment_start >= self.segment_seconds)
+
+    def _open_segment(self, timestamp: float) -> None:
+        self._close_segment()
+        name = f"{self.session}_{len(self.segments):03d}"
+        path = os.path.join(self.directory, name + SEGMENT_EXTENSION)
+        self._data_file = open(path, "wb")
+        self._index_file = open(index_path(path), "wb")
+        self._index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, time.time(), time.monotonic()))
+        self._segment_offset = 0
+        self._segment_start = timestamp
+        self.segments.append(path)
+
+    def _close_segment(self) -> None:
+        for f in (self._data_file, self._index_file):
+            if f is not None:
+                try:
+                    f.close()
+                except OSError:
+                    pass
+        self._data_file = None
+        self._index_file = None
+
+
+def index_path(segment_path: str) -> str:
+    """Get the index file path of a segment file."""
+    return os.path.splitext(segment_path)[0] + INDEX_EXTENSION
+
+
+def session_of(segment_path: str) -> str:
+    """Get the session name of a segment file (its name without _NNN)."""
+    name = os.path.splitext(os.path.basename(segment_path))[0]
+    return name.rsplit("_", 1)[0]
+
+
+class SegmentIndex:
+    """The frame index of one recorded segment."""
+
+    def __init__(self, segment_path: str):
+        """
+        Load the index of a segment.
+
+        A partial record at the end (interrupted write) is ignored.
+
+        Args:
+            segment_path: Path of the segment (.mjpg) file
+
+        Raises:
+            ValueError: If the index has no valid header
+        """
+        self.path = segment_path
+        with open(index_path(segment_path), "rb") as f:
+            data = f.read()
+        if len(data) < INDEX_HEADER.size:
+            raise ValueError(f"Index of {segment_path} has no header")
+        magic, wall, monotonic = INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"Index of {segment_path} has an unknown format")
+        body = memoryview(data)[INDEX_HEADER.size:]
+        usable = len(body) - len(body) % INDEX_RECORD.size
+        records = list(INDEX_RECORD.iter_unpack(body[:usable]))
+        self.timestamps = [r[0] for r in records]  # Monotonic, as recorded
+        self.wall_times = [wall + (t - monotonic) for t in self.timestamps]
+        self._offsets = [r[1] for r in records]
+        self._lengths = [r[2] for r in records]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def find(self, timestamp: float) -> int:
+        """
+        Get the frame showing at a time (last frame received at or before it).
+
+        Args:
+            timestamp: Wall-clock time (time.time())
+
+        Returns:
+            Frame number, or -1 if the segment starts after timestamp
+        """
+        return bisect_right(self.wall_times, timestamp) - 1
+
+    def read(self, index: int) -> bytes:
+        """
+        Read one frame.
+
+        Args:
+            index: Frame number
+
+        Returns:
+            JPEG data
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self._offsets[index])
+            return f.read(self._lengths[index])
+
+
+class RecordingReader:
+    """Seeks by wall-clock time across the segments of a recording."""
+
+    def __init__(self, segment_paths: List[str]):
+        """
+        Load the segment indexes.
+
+        Args:
+            segment_paths: Segment files (e.g. MJPEGRecorder.segments)
+        """
+        indexes = [SegmentIndex(path) for path in segment_paths]
+        self.segments = sorted((i for i in indexes if len(i)), key=lambda i: i.wall_times[0])
+        self._starts = [i.wall_times[0] for i in self.segments]
+
+    @staticmethod
+    def sessions(directory: str, prefix: str = "") -> List[str]:
+        """
+        List the recording sessions in a directory.
+
+        Args:
+            directory: Recording directory
+            prefix: Only sessions whose names start with prefix
+
+        Returns:
+            Session names, oldest first (by the wall-clock anchor of
+            their first segment)
+        """
+        first = {}
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if (name.startswith(prefix) and name.endswith(SEGMENT_EXTENSION)
+                    and os.path.exists(index_path(path))):
+                first.setdefault(session_of(name), path)
+
+        def started(session: str) -> float:
+            with open(index_path(first[session]), "rb") as f:
+                header = f.read(INDEX_HEADER.size)
+            if len(header) < INDEX_HEADER.size:
+                return 0.0
+            return INDEX_HEADER.unpack(header)[1]
+
+        return sorted(first, key=started)
+
+    @classmethod
+    def from_directory(cls, directory: str, prefix: str = "",
+                       session: Optional[str] = None) -> "RecordingReader":
+        """
+        Load the indexed segments of one session in a directory.
+
+        Args:
+            directory: Recording directory
+            prefix: Recorder prefix, used to pick the latest session
+            session: Session name (see sessions()), default the latest
+                one starting with prefix
+
+        Returns:
+            Reader for the session (empty if there is none)
+        """
+        if session is None:
+            sessions = cls.sessions(directory, prefix)
+            if not sessions:
+                return cls([])
+            session = sessions[-1]
+        paths = [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                 if name.endswith(SEGMENT_EXTENSION) and session_of(name) == session
+                 and os.path.exists(index_path(os.path.join(directory, name)))]
+        return cls(paths)
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self.segments)
+
+    def frame_at(self, timestamp: float) -> Optional[RecordedFrame]:
+        """
+        Get the frame showing at a time.
+
+        Args:
+            timestamp: Wall-clock time (time.time())
+
+        Returns:
+            Last frame received at or before timestamp, or None if the
+            recording starts after it
+        """
+        position = bisect_right(self._starts, timestamp) - 1
+        if position < 0:
+            return None
+        segment = self.segments[position]
+        index = segment.find(timestamp)
+        return RecordedFrame(segment.wall_times[index], segment.timestamps[index],
+                             segment.read(index), segment.path, index)
@@ -0,0 +1,230 @@
+"""
+Move Handle Module
+
+Completion tracking for STAC5 moves. A MoveHandle is returned when a move
+command is sent and resolves once polled status shows the drive In
+Position at the target, or fails on an alarm, a stop or a timeout.
+"""
+
+import threading
+import time
+from enum import Enum
+from typing import Callable, List, Optional
+
+from .config import STAC5_IN_POSITION_TOLERANCE_COUNTS
+from .escl_protocol import SC_IN_POSITION, SC_MOTION_MASK
+
+
+class MoveState(Enum):
+    """Move handle states."""
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class MoveHandle:
+    """
+    Future-like handle for a single STAC5 move.
+
+    Truthy if the drive accepted the move command, so existing
+    `if manager.move_to_position(...)` checks keep working. Status updates
+    come from the manager's poll loop; wait() also enforces the move
+    timeout if polling has stopped.
+
+    Timing (from polled status, so resolution is one poll interval):
+    - duration: move accepted -> In Position at target
+    - settle_time: motion bits cleared -> In Position at target
+    """
+
+    # How long SC may show no motion before an off-target stop is a failure
+    MOTION_START_GRACE = 1.0
+
+    def __init__(
+        self,
+        target: Optional[int],
+        timeout: float,
+        tolerance: int = STAC5_IN_POSITION_TOLERANCE_COUNTS,
+        accepted: bool = True,
+        now: Optional[float] = None,
+    ):
+        """
+        Initialize the handle.
+
+        Args:
+            target: Target encoder count (None for relative moves)
+            timeout: Seconds after acceptance before the move fails
+            tolerance: Allowed distance from target in encoder counts (a
+                       small overshoot may settle a few counts away)
+            accepted: False if the drive never took the move command
+            now: Current monotonic time (defaults to time.monotonic())
+        """
+        if now is None:
+            now = time.monotonic()
+        self.target = target
+        self.tolerance = tolerance
+        self.accepted = accepted
+        self.state = MoveState.PENDING
+        self.error: Optional[str] = None
+        self.final_position: Optional[int] = None
+
+        self.start_time = now
+        self.deadline = now + timeout
+        self.motion_end_time: Optional[float] = None
+        self.complete_time: Optional[float] = None
+        self._motion_seen = False
+
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._callbacks: List[Callable[["MoveHandle"], None]] = []
+
+    @classmethod
+    def rejected(cls, reason: str, target: Optional[int] = None) -> "MoveHandle":
+        """Create an already-failed handle for a move that was not sent."""
+        handle = cls(target, timeout=0.0, accepted=False)
+        handle._finish(MoveState.FAILED, reason)
+        return handle
+
+    @classmethod
+    def completed(cls, target: int) -> "MoveHandle":
+        """Create an already-completed handle (e.g. already at target)."""
+        handle = cls(target, timeout=0.0)
+        handle.final_position = target
+        handle._finish(MoveState.COMPLETED)
+        return handle
+
+    def __bool__(self) -> bool:
+        return self.accepted
+
+    def __repr__(self) -> str:
+        return (f"MoveHandle(target={self.target}, state={self.state.value}, "
+                f"error={self.error!r})")
+
+    @property
+    def done(self) -> bool:
+        """Check if the move has finished (either way)."""
+        return self._event.is_set()
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the move reached its target."""
+        return self.state == MoveState.COMPLETED
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Get the time from acceptance to In Position, in seconds."""
+        if self.complete_time is None or not self.succeeded:
+            return None
+        return self.complete_time - self.start_time
+
+    @property
+    def settle_time(self) -> Optional[float]:
+        """Get the time from motion stopping to In Position, in seconds."""
+        if self.complete_time is None or self.motion_end_time is None:
+            return None
+        return self.complete_time - self.motion_end_time
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the move to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = until the move
+                     completes or its own timeout expires)
+
+        Returns:
+            True if the move reached its target
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        while not self._event.is_set():
+            now = time.monotonic()
+            limit = self.deadline if end is None else min(end, self.deadline)
+            if now >= limit:
+                self.check_timeout(now)
+                break
+            self._event.wait(limit - now)
+        return self.succeeded
+
+    def add_done_callback(self, callback: Callable[["MoveHandle"], None]) -> None:
+        """
+        Call a function when the move finishes.
+
+        Runs immediately if already finished, otherwise on the thread that
+        resolves the move (usually the poll thread).
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def update(self, position: Optional[int], status_code: Optional[int],
+               alarm_code: Optional[int], now: Optional[float] = None) -> None:
+        """
+        Feed one polled status sample.
+
+        Args:
+            position: Encoder position
+            status_code: SC bitfield
+            alarm_code: AL bitfield
+            now: Current monotonic time (defaults to time.monotonic())
+        """
+        if self.done:
+            return
+        if now is None:
+            now = time.monotonic()
+
+        if alarm_code:
+            self.final_position = position
+            self.fail(f"Alarm {alarm_code:04X}", now)
+            return
+
+        if status_code is not None:
+            moving = bool(status_code & SC_MOTION_MASK)
+            if moving:
+                self._motion_seen = True
+                self.motion_end_time = None
+            elif self._motion_seen and self.motion_end_time is None:
+                self.motion_end_time = now
+
+            if status_code & SC_IN_POSITION and not moving:
+                started = self._motion_seen or now - self.start_time >= self.MOTION_START_GRACE
+                if self._at_target(position, started):
+                    self.final_position = position
+                    self._finish(MoveState.COMPLETED, now=now)
+                    return
+                if started:
+                    self.final_position = position
+                    self.fail(f"Stopped at {position}, target {self.target}", now)
+                    return
+
+        self.check_timeout(now)
+
+    def check_timeout(self, now: Optional[float] = None) -> None:
+        """Fail the move if its deadline has passed."""
+        if now is None:
+            now = time.monotonic()
+        if not self.done and now >= self.deadline:
+            self.fail("Timed out waiting for In Position", now)
+
+    def fail(self, reason: str, now: Optional[float] = None) -> None:
+        """Fail the move (no effect if already finished)."""
+        self._finish(MoveState.FAILED, reason, now)
+
+    def _at_target(self, position: Optional[int], started: bool) -> bool:
+        if self.target is None:
+            # Relative move: any settled stop after the move began counts
+            return started
+        return position is not None and abs(position - self.target) <= self.tolerance
+
+    def _finish(self, state: MoveState, error: Optional[str] = None,
+                now: Optional[float] = None) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.state = state
+            self.error = error
+            self.complete_time = now if now is not None else time.monotonic()
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
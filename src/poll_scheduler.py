@@ -0,0 +1,179 @@
+"""
+Poll Scheduler Module
+
+Decides how often the STAC5 status is polled. The manager reports each
+decoded SC status code and whether anything changed; the scheduler returns
+the delay until the next poll.
+"""
+
+import abc
+import time
+from typing import Optional
+
+from .config import (
+    STAC5_POLL_INTERVAL_SEC,
+    STAC5_POLL_MOTION_INTERVAL_SEC,
+    STAC5_POLL_APPROACH_INTERVAL_SEC,
+    STAC5_POLL_APPROACH_WINDOW_SEC,
+    STAC5_POLL_IDLE_BACKOFF_CYCLES,
+    STAC5_POLL_MAX_IDLE_INTERVAL_SEC,
+)
+from .escl_protocol import SC_MOTION_MASK, SC_MOVING, SC_STOPPING
+
+
+class PollScheduler(abc.ABC):
+    """
+    Base class for STAC5 poll schedulers.
+
+    Subclasses implement update() to pick the next poll interval.
+    """
+
+    # How long a move command counts as motion before SC confirms it (seconds)
+    MOTION_HOLD = 3.0
+
+    def __init__(self, idle_interval: float = STAC5_POLL_INTERVAL_SEC):
+        """
+        Initialize the scheduler.
+
+        Args:
+            idle_interval: Poll interval when the drive is idle (seconds)
+        """
+        self.idle_interval = idle_interval
+        self._move_time: Optional[float] = None
+        self._move_end: Optional[float] = None
+        self._in_motion = False
+
+    @property
+    def in_motion(self) -> bool:
+        """Check if the last update (or a recent move command) indicated motion."""
+        return self._in_motion
+
+    def notify_move(self, eta: Optional[float] = None, now: Optional[float] = None) -> None:
+        """
+        Record that a motion command was just accepted.
+
+        Args:
+            eta: Estimated move duration in seconds (None if open-ended, e.g. jog)
+            now: Current monotonic time (defaults to time.monotonic())
+        """
+        if now is None:
+            now = time.monotonic()
+        self._move_time = now
+        self._move_end = now + eta if eta is not None else None
+        self._in_motion = True
+
+    @abc.abstractmethod
+    def update(self, status_code: Optional[int], changed: bool,
+               now: Optional[float] = None) -> float:
+        """
+        Report the latest poll result and get the next poll interval.
+
+        Args:
+            status_code: Decoded SC bitfield, or None if the poll failed
+            changed: True if position/status/alarm differ from the last poll
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            Seconds to wait before the next poll
+        """
+
+    def _move_recent(self, now: float) -> bool:
+        """Check if a move command is still inside its hold window."""
+        if self._move_time is None:
+            return False
+        hold_until = self._move_time + self.MOTION_HOLD
+        if self._move_end is not None:
+            hold_until = max(hold_until, self._move_end)
+        return now < hold_until
+
+
+class FixedPollScheduler(PollScheduler):
+    """
+    Two-rate scheduler: fast while moving (or within a few seconds of a
+    move command), otherwise the idle interval.
+    """
+
+    def __init__(self, idle_interval: float = STAC5_POLL_INTERVAL_SEC,
+                 motion_interval: float = STAC5_POLL_MOTION_INTERVAL_SEC):
+        super().__init__(idle_interval)
+        self.motion_interval = motion_interval
+
+    def update(self, status_code: Optional[int], changed: bool,
+               now: Optional[float] = None) -> float:
+        if now is None:
+            now = time.monotonic()
+        moving = status_code is not None and bool(status_code & SC_MOVING)
+        self._in_motion = moving or self._move_recent(now)
+        return self.motion_interval if self._in_motion else self.idle_interval
+
+
+class AdaptivePollScheduler(PollScheduler):
+    """
+    Status-bit-driven scheduler.
+
+    - Moving/Jogging: motion interval
+    - Stopping, or inside the approach window before a move's ETA:
+      approach interval (densest sampling while settling on the target)
+    - Idle/In Position: idle interval, doubling after every
+      backoff_cycles unchanged polls up to max_idle_interval
+    """
+
+    def __init__(
+        self,
+        idle_interval: float = STAC5_POLL_INTERVAL_SEC,
+        motion_interval: float = STAC5_POLL_MOTION_INTERVAL_SEC,
+        approach_interval: float = STAC5_POLL_APPROACH_INTERVAL_SEC,
+        approach_window: float = STAC5_POLL_APPROACH_WINDOW_SEC,
+        backoff_cycles: int = STAC5_POLL_IDLE_BACKOFF_CYCLES,
+        max_idle_interval: float = STAC5_POLL_MAX_IDLE_INTERVAL_SEC,
+    ):
+        super().__init__(idle_interval)
+        self.motion_interval = motion_interval
+        self.approach_interval = approach_interval
+        self.approach_window = approach_window
+        self.backoff_cycles = backoff_cycles
+        self.max_idle_interval = max_idle_interval
+        self._unchanged_cycles = 0
+        self._motion_seen = False
+
+    def notify_move(self, eta: Optional[float] = None, now: Optional[float] = None) -> None:
+        super().notify_move(eta, now)
+        self._unchanged_cycles = 0
+        self._motion_seen = False
+
+    def update(self, status_code: Optional[int], changed: bool,
+               now: Optional[float] = None) -> float:
+        if now is None:
+            now = time.monotonic()
+
+        if changed:
+            self._unchanged_cycles = 0
+        else:
+            self._unchanged_cycles += 1
+
+        bits = status_code if status_code is not None else 0
+        moving = bool(bits & SC_MOTION_MASK)
+        if moving:
+            self._motion_seen = True
+
+        # Until SC confirms motion, trust the move command for a while
+        pending = self._move_time is not None and not self._motion_seen and self._move_recent(now)
+
+        self._in_motion = moving or pending
+        if not self._in_motion:
+            self._move_time = None
+            self._move_end = None
+            return self._idle_interval()
+
+        if bits & SC_STOPPING:
+            return self.approach_interval
+        if self._move_end is not None and now >= self._move_end - self.approach_window:
+            return self.approach_interval
+        return self.motion_interval
+
+    def _idle_interval(self) -> float:
+        """Idle interval with exponential back-off while nothing changes."""
+        if self._unchanged_cycles < self.backoff_cycles:
+            return self.idle_interval
+        doublings = min(self._unchanged_cycles // self.backoff_cycles, 16)
+        return min(self.max_idle_interval, self.idle_interval * (2 ** doublings))
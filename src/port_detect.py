@@ -0,0 +1,230 @@
+"""
+Port Detection Module
+
+Serial auto-detection of the winch controller. Candidate USB ports are
+probed at once on a thread pool: ports are first narrowed by USB
+VID/PID, then each is opened and sent `?` until it answers with a line
+that the winch status parser accepts. Identified ports are remembered by
+USB serial number, so after a cable bump (which may change the device
+name) the port is found again without probing.
+
+Only the winch can be detected. The drop cylinder firmware takes
+commands over WiFi only and prints nothing but debug text on its USB
+port, so it never answers the probe; its USB IDs are skipped instead.
+Ports whose USB IDs are not known are left alone unless
+SERIAL_PROBE_UNKNOWN_USB is set, so `?` is not written to unrelated
+devices.
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Set
+
+import serial
+import serial.tools.list_ports
+
+from .config import (
+    SERIAL_BAUD_DEFAULT,
+    SERIAL_PROBE_TIMEOUT_SEC,
+    SERIAL_PROBE_QUERY_INTERVAL_SEC,
+    SERIAL_PROBE_MAX_WORKERS,
+    SERIAL_PROBE_UNKNOWN_USB,
+    WINCH_USB_IDS,
+    DROP_CYLINDER_USB_IDS,
+)
+from .command_protocol import Commands, ResponseParser, format_command
+from .line_framer import LineFramer
+
+
+@dataclass
+class DetectedPort:
+    """A serial port identified as the winch controller."""
+    device: str
+    serial_number: Optional[str] = None
+    vid: Optional[int] = None
+    pid: Optional[int] = None
+    description: str = ""
+    cached: bool = False  # Identified by serial number, without probing
+
+
+def is_winch_status_line(line: str) -> bool:
+    """Check if a received line is a winch status line."""
+    return ResponseParser.parse_status(line) is not None
+
+
+def probe_port(device: str, baudrate: int = SERIAL_BAUD_DEFAULT,
+               timeout: float = SERIAL_PROBE_TIMEOUT_SEC) -> bool:
+    """
+    Open a port and check if the winch answers `?` on it.
+
+    `?` is repeated every SERIAL_PROBE_QUERY_INTERVAL_SEC, so a board
+    that resets on open is identified as soon as its firmware is up.
+
+    Args:
+        device: Port name
+        baudrate: Baud rate
+        timeout: Longest wait for a status line (seconds)
+
+    Returns:
+        True if a winch status line arrived, False if the port could not
+        be opened or never sent one
+    """
+    try:
+        port = serial.Serial(device, baudrate=baudrate,
+                             timeout=SERIAL_PROBE_QUERY_INTERVAL_SEC, write_timeout=0.1)
+    except (serial.SerialException, OSError):
+        return False
+
+    framer = LineFramer()
+    query = format_command(Commands.STATUS)
+    try:
+        deadline = time.monotonic() + timeout
+        next_query = 0.0
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return False
+            if now >= next_query:
+                port.write(query)
+                next_query = now + SERIAL_PROBE_QUERY_INTERVAL_SEC
+            data = port.read(max(1, port.in_waiting))
+            for line in framer.feed(data):
+                if is_winch_status_line(line.decode('ascii', errors='ignore')):
+                    return True
+    except (serial.SerialException, OSError):
+        return False
+    finally:
+        port.close()
+
+
+class PortDetector:
+    """
+    Finds the winch controller on the serial ports, remembering it by USB serial number.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[str], bool] = probe_port,
+        list_ports: Callable[[], list] = serial.tools.list_ports.comports,
+        max_workers: int = SERIAL_PROBE_MAX_WORKERS,
+        probe_unknown: bool = SERIAL_PROBE_UNKNOWN_USB,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            probe: Function checking a port for the winch (port name -> found)
+            list_ports: Function listing the ports (pyserial ListPortInfo-like)
+            max_workers: Most ports probed at once
+            probe_unknown: Also probe USB ports whose VID/PID is not in
+                           WINCH_USB_IDS (e.g. clone boards)
+        """
+        self._probe = probe
+        self._list_ports = list_ports
+        self._max_workers = max_workers
+        self._probe_unknown = probe_unknown
+        self._cache: Set[str] = set()
+        self._lock = threading.Lock()
+
+        # Ports opened for probing, over the detector's lifetime
+        self.probes = 0
+
+    def detect(self, exclude: Iterable[str] = ()) -> List[DetectedPort]:
+        """
+        Find winch controllers on the serial ports.
+
+        Ports whose serial number is cached are reported without being
+        opened. Ports with a winch VID/PID are probed concurrently, and
+        with probe_unknown set, so are other USB ports. Drop cylinder
+        boards and ports without USB IDs (on-board UARTs) are never
+        opened.
+
+        Args:
+            exclude: Port names to leave alone (e.g. already connected)
+
+        Returns:
+            Detected ports, sorted by device name
+        """
+        excluded = set(exclude)
+        found: List[DetectedPort] = []
+        candidates = []
+
+        for info in self._list_ports():
+            if info.device in excluded or info.vid is None:
+                continue
+
+            with self._lock:
+                cached = bool(info.serial_number) and info.serial_number in self._cache
+            if cached:
+                found.append(self._detected(info, cached=True))
+                continue
+
+            ids = (info.vid, info.pid)
+            if ids in DROP_CYLINDER_USB_IDS:
+                continue
+            known = ids in WINCH_USB_IDS
+            if known or self._probe_unknown:
+                candidates.append((not known, info))
+
+        # Ports with a winch VID/PID go to the pool first
+        candidates.sort(key=lambda candidate: candidate[0])
+        ports = [info for _, info in candidates]
+
+        if ports:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(ports))) as pool:
+                answers = list(pool.map(self._probe, [info.device for info in ports]))
+            self.probes += len(ports)
+
+            for info, answered in zip(ports, answers):
+                if not answered:
+                    continue
+                if info.serial_number:
+                    with self._lock:
+                        self._cache.add(info.serial_number)
+                found.append(self._detected(info))
+
+        found.sort(key=lambda port: port.device)
+        return found
+
+    def find(self, exclude: Iterable[str] = ()) -> Optional[DetectedPort]:
+        """
+        Find the first port with the winch controller.
+
+        Args:
+            exclude: Port names to leave alone
+
+        Returns:
+            DetectedPort, or None if not found
+        """
+        found = self.detect(exclude)
+        return found[0] if found else None
+
+    def forget(self, serial_number: Optional[str] = None) -> None:
+        """
+        Drop cached identifications.
+
+        Args:
+            serial_number: USB serial number to forget (None = all)
+        """
+        with self._lock:
+            if serial_number is None:
+                self._cache.clear()
+            else:
+                self._cache.discard(serial_number)
+
+    @staticmethod
+    def _detected(info, cached: bool = False) -> DetectedPort:
+        return DetectedPort(
+            device=info.device,
+            serial_number=info.serial_number,
+            vid=info.vid,
+            pid=info.pid,
+            description=info.description or "",
+            cached=cached,
+        )
+
+
+# Shared detector, so the serial number cache survives reconnects
+default_detector = PortDetector()
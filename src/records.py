@@ -0,0 +1,72 @@
+"""
+Status Record Module
+
+Decorator for compact status records: dataclasses with __slots__ (no
+per-instance __dict__), frozen by default. Equivalent to
+@dataclass(frozen=True, slots=True), which needs Python 3.10+; this
+works on the 3.8 interpreters the project still supports.
+"""
+
+from dataclasses import FrozenInstanceError, dataclass, fields
+
+
+def record(cls=None, *, frozen: bool = True):
+    """
+    Turn a class into a slotted dataclass.
+
+    Usage:
+        @record
+        class Status:
+            position: int = 0
+
+    Args:
+        cls: Class to convert (when used without arguments)
+        frozen: Make instances immutable (default True)
+
+    Returns:
+        The new slotted dataclass (or a decorator when called with arguments)
+    """
+    def wrap(klass):
+        klass = dataclass(frozen=frozen)(klass)
+        names = tuple(f.name for f in fields(klass))
+
+        # Rebuild the class with __slots__; field defaults live on in the
+        # generated __init__, so the class attributes can be dropped
+        namespace = dict(klass.__dict__)
+        for name in names:
+            namespace.pop(name, None)
+        namespace.pop('__dict__', None)
+        namespace.pop('__weakref__', None)
+        namespace['__slots__'] = names
+        namespace['__getstate__'] = _getstate
+        namespace['__setstate__'] = _setstate
+        if frozen:
+            # The generated versions refer to the pre-slots class
+            namespace['__setattr__'] = _frozen_setattr
+            namespace['__delattr__'] = _frozen_delattr
+
+        slotted = type(klass)(klass.__name__, klass.__bases__, namespace)
+        slotted.__qualname__ = klass.__qualname__
+        return slotted
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+def _frozen_setattr(self, name, value):
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self, name):
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _getstate(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _setstate(self, state):
+    # object.__setattr__ so pickling works for frozen records too
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
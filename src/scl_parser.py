@@ -0,0 +1,95 @@
+"""
+SCL Response Parser Module
+
+Parses STAC5 SCL query responses straight from the received frame bytes
+(bytes, bytearray or memoryview) using precompiled patterns, returning
+typed values instead of strings.
+
+Handles the response shapes seen from the drive:
+- "EP=12345", "IE=-42"                register=value
+- "EP=12345 EP=12345"                 duplicated echo (first value wins)
+- "EP12345", "12345"                  prefix without '=' / bare value
+- "%", "*", "?4"                      ack, buffered ack, error (no value)
+"""
+
+import re
+from typing import Optional, Pattern, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Registers with signed decimal values
+_DECIMAL_REGISTERS = (b"EP", b"IE", b"SP", b"IP")
+
+# Registers with hex bitfield values
+_HEX_REGISTERS = (b"SC", b"AL")
+
+_DECIMAL_PATTERNS = {
+    register: re.compile(rb"%s=?(-?\d+)" % register) for register in _DECIMAL_REGISTERS
+}
+_HEX_PATTERNS = {
+    register: re.compile(rb"%s=?([0-9A-Fa-f]+)" % register) for register in _HEX_REGISTERS
+}
+
+# Bare value with no register prefix (never matches "?<code>" errors)
+_BARE_DECIMAL = re.compile(rb"\s*(-?\d+)\s*(?:\s|$)")
+_BARE_HEX = re.compile(rb"\s*([0-9A-Fa-f]+)\s*(?:\s|$)")
+
+
+def _search(pattern: Pattern, bare: Pattern, data: Optional[BytesLike]) -> Optional[bytes]:
+    """Find the first register value, falling back to a bare value."""
+    if not data:
+        return None
+    match = pattern.search(data)
+    if match is None:
+        match = bare.match(data)
+        if match is None:
+            return None
+    return match.group(1)
+
+
+def parse_position(data: Optional[BytesLike], register: bytes = b"EP") -> Optional[int]:
+    """
+    Parse a signed position response (EP, IE, SP, IP).
+
+    Args:
+        data: Response frame without header or CR
+        register: Register name, e.g. b"EP" or b"IE"
+
+    Returns:
+        Position in counts/steps, or None if the frame holds no value
+    """
+    value = _search(_DECIMAL_PATTERNS[register], _BARE_DECIMAL, data)
+    return int(value) if value is not None else None
+
+
+def parse_status_code(data: Optional[BytesLike]) -> Optional[int]:
+    """
+    Parse an SC status code response.
+
+    Args:
+        data: Response frame without header or CR
+
+    Returns:
+        SC bitfield, or None if the frame holds no value
+    """
+    value = _search(_HEX_PATTERNS[b"SC"], _BARE_HEX, data)
+    return int(value, 16) if value is not None else None
+
+
+def parse_alarm_code(data: Optional[BytesLike]) -> Optional[int]:
+    """
+    Parse an AL alarm code response.
+
+    Args:
+        data: Response frame without header or CR
+
+    Returns:
+        AL bitfield, or None if the frame holds no value
+    """
+    value = _search(_HEX_PATTERNS[b"AL"], _BARE_HEX, data)
+    return int(value, 16) if value is not None else None
+
+
+def format_code(code: int) -> str:
+    """Format an SC/AL bitfield the way the drive prints it (e.g. "0009")."""
+    return f"{code:04X}"
@@ -2,13 +2,17 @@
 Serial Manager Module
 
 Handles serial port connection, communication, and status polling.
-Runs serial operations on a background thread for non-blocking GUI.
+Runs serial operations on background threads for non-blocking GUI:
+the reader blocks on the port until data arrives and the writer blocks
+on the command queue, so neither wakes up while the link is idle.
+
+With STATUS_STREAM_RATE_HZ set, the controller is subscribed to push
+status on its own and polling only resumes if that stream stalls.
 """
 
 import threading
-import queue
 import time
-from typing import Callable, Optional, List
+from typing import Callable, Iterable, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
@@ -20,13 +24,26 @@ from .config import (
     SERIAL_TIMEOUT,
     SERIAL_WRITE_TIMEOUT,
     WINCH_POLL_INTERVAL_SEC,
+    STATUS_BINARY_FRAMES,
+    STATUS_BINARY_MAX_ERRORS,
+    STATUS_STREAM_RATE_HZ,
+    STATUS_STREAM_STALL_SEC,
+    STATUS_STREAM_MOTION_STALL_SEC,
 )
 from .command_protocol import (
+    BINARY_STATUS_LENGTH,
+    BINARY_STATUS_SYNC,
+    check_binary_status,
     Commands,
+    MotionMode,
     WinchStatus,
     ResponseParser,
     format_command
 )
+from .command_queue import CoalescingCommandQueue
+from .line_framer import LineFramer
+from .port_detect import PortDetector, default_detector
+from .status_delta import StatusDelta, StatusDiffer
 
 
 class ConnectionState(Enum):
@@ -56,6 +73,14 @@ class SerialManager:
     # Polling interval in seconds
     POLL_INTERVAL = WINCH_POLL_INTERVAL_SEC
 
+    # Request binary status frames on connect
+    BINARY_STATUS = STATUS_BINARY_FRAMES
+
+    # Status stream subscription rate (0 = poll) and stall timeout
+    STREAM_RATE_HZ = STATUS_STREAM_RATE_HZ
+    STREAM_STALL_TIMEOUT = STATUS_STREAM_STALL_SEC
+    STREAM_MOTION_STALL_TIMEOUT = STATUS_STREAM_MOTION_STALL_SEC
+
     def __init__(self):
         self._serial: Optional[serial.Serial] = None
         self._config = SerialConfig()
@@ -63,15 +88,18 @@ class SerialManager:
 
         # Threading
         self._read_thread: Optional[threading.Thread] = None
+        self._write_thread: Optional[threading.Thread] = None
         self._poll_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # Serializes writes and open/close
 
-        # Command queue for thread-safe sending
-        self._command_queue: queue.Queue = queue.Queue()
+        # Command queue for thread-safe sending (None wakes the writer to
+        # exit); superseded speed setpoints and repeated ? are merged
+        self._command_queue = CoalescingCommandQueue(Commands.SETPOINT_PREFIXES)
 
         # Callbacks
         self._status_callback: Optional[Callable[[WinchStatus], None]] = None
+        self._delta_callback: Optional[Callable[[StatusDelta], None]] = None
         self._connection_callback: Optional[Callable[[ConnectionState, str], None]] = None
         self._command_sent_callback: Optional[Callable[[str], None]] = None
         self._response_callback: Optional[Callable[[str], None]] = None
@@ -80,6 +108,16 @@ class SerialManager:
         # Last known status
         self._last_status: Optional[WinchStatus] = None
         self._last_response_time: float = 0
+        self._status_differ = StatusDiffer()
+
+        # Binary status negotiation
+        self._binary_status_active = False
+        self._binary_status_errors = 0
+
+        # Status stream subscription (polling resumes while not streaming)
+        self._streaming = False
+        self.stream_stalls = 0
+        self._negotiated = False  # SF/SU sent for this connection
 
     @property
     def state(self) -> ConnectionState:
@@ -101,16 +139,47 @@ class SerialManager:
         """Get timestamp of last successful response."""
         return self._last_response_time
 
+    @property
+    def binary_status_active(self) -> bool:
+        """Check if the controller acknowledged binary status frames."""
+        return self._binary_status_active
+
+    @property
+    def streaming(self) -> bool:
+        """Check if the controller is pushing status (no polling needed)."""
+        return self._streaming
+
     @staticmethod
     def list_ports() -> List[str]:
         """Get list of available serial ports."""
         ports = serial.tools.list_ports.comports()
         return [port.device for port in ports]
 
+    @staticmethod
+    def auto_detect_port(detector: Optional[PortDetector] = None,
+                         exclude: Iterable[str] = ()) -> Optional[str]:
+        """
+        Find the port the winch controller is on.
+
+        Args:
+            detector: Port detector (default: the shared one, whose USB
+                      serial number cache makes repeat lookups instant)
+            exclude: Port names to leave alone (e.g. in use)
+
+        Returns:
+            Port name, or None if no winch controller answered
+        """
+        found = (detector or default_detector).find(exclude)
+        return found.device if found else None
+
     def set_status_callback(self, callback: Callable[[WinchStatus], None]) -> None:
         """Set callback for status updates."""
         self._status_callback = callback
 
+    def set_delta_callback(self, callback: Callable[[StatusDelta], None]) -> None:
+        """Set callback for status changes (plus a periodic heartbeat)."""
+        self._delta_callback = callback
+
     def set_connection_callback(self, callback: Callable[[ConnectionState, str], None]) -> None:
         """Set callback for connection state changes."""
         self._connection_callback = callback
@@ -166,16 +235,22 @@ class SerialManager:
             # Small delay for Arduino reset
             time.sleep(0.5)
 
+            # Connected before the threads start so the first poll goes out
+            self._set_state(ConnectionState.CONNECTED, f"Connected to {port}")
+
             # Start background threads
             self._stop_event.clear()
+            self._command_queue = CoalescingCommandQueue(Commands.SETPOINT_PREFIXES)
 
             self._read_thread = threading.Thread(target=self._read_loop, daemon=True)
             self._read_thread.start()
 
+            self._write_thread = threading.Thread(
+                target=self._write_loop, args=(self._command_queue,), daemon=True)
+            self._write_thread.start()
+
             self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
             self._poll_thread.start()
-
-            self._set_state(ConnectionState.CONNECTED, f"Connected to {port}")
             return True
 
         except serial.SerialException as e:
@@ -186,12 +261,21 @@ class SerialManager:
 
     def disconnect(self) -> None:
         """Disconnect from the serial port."""
-        # Signal threads to stop
+        # Signal threads to stop and wake any blocked read/queue wait
         self._stop_event.set()
+        self._command_queue.put(None)
+        serial_port = self._serial
+        if serial_port is not None:
+            try:
+                serial_port.cancel_read()
+            except (AttributeError, serial.SerialException):
+                pass
 
         # Wait for threads to finish
         if self._read_thread and self._read_thread.is_alive():
             self._read_thread.join(timeout=1.0)
+        if self._write_thread and self._write_thread.is_alive():
+            self._write_thread.join(timeout=1.0)
         if self._poll_thread and self._poll_thread.is_alive():
             self._poll_thread.join(timeout=1.0)
 
@@ -253,53 +337,107 @@ class SerialManager:
                 self._handle_disconnection()
                 return False
 
+    def _write_loop(self, commands: CoalescingCommandQueue) -> None:
+        """
+        Background thread for sending queued commands.
+
+        Blocks on the queue, so a command goes out as soon as it is queued.
+
+        Args:
+            commands: Queue for this connection (each connect gets a new one)
+        """
+        while not self._stop_event.is_set():
+            command = commands.get()
+            if command is None:
+                break
+            self._send_command_direct(command)
+
     def _read_loop(self) -> None:
         """Background thread for reading serial responses."""
-        buffer = ""
+        framer = LineFramer(frame_sync=BINARY_STATUS_SYNC, frame_length=BINARY_STATUS_LENGTH,
+                            frame_check=check_binary_status)
+        self._status_differ.reset()  # First status on a new link is sent in full
+        self._binary_status_active = False
+        self._binary_status_errors = 0
+        self._streaming = False
+        self._negotiated = False
 
         while not self._stop_event.is_set():
-            # Process any queued commands first
-            try:
-                while True:
-                    command = self._command_queue.get_nowait()
-                    self._send_command_direct(command)
-            except queue.Empty:
-                pass
-
-            # Read available data
-            with self._lock:
-                if not self._serial or not self._serial.is_open:
-                    break
+            serial_port = self._serial
+            if not serial_port or not serial_port.is_open:
+                break
 
-                try:
-                    if self._serial.in_waiting > 0:
-                        data = self._serial.read(self._serial.in_waiting)
-                        buffer += data.decode('ascii', errors='ignore')
-                except serial.SerialException as e:
-                    if self._error_callback:
-                        self._error_callback(f"Read error: {e}")
-                    self._handle_disconnection()
+            # Block until the first byte arrives (or the read timeout
+            # expires), then take whatever else is already buffered.
+            # Reads don't take _lock, so writes are never held up.
+            try:
+                data = serial_port.read(1)
+                if data:
+                    waiting = serial_port.in_waiting
+                    if waiting:
+                        data += serial_port.read(waiting)
+            except Exception as e:
+                # SerialException, or a driver failing some other way: the
+                # link is unusable either way, so report it instead of
+                # letting the reader thread die silently
+                if self._stop_event.is_set():
                     break
+                if not isinstance(e, serial.SerialException):
+                    print(f"[WINCH] Unexpected read error: {e!r}")
+                if self._error_callback:
+                    self._error_callback(f"Read error: {e}")
+                self._handle_disconnection()
+                break
 
-            # Process complete lines
-            while '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
-                line = line.strip()
-                if line:
-                    self._process_response(line)
+            if not data:
+                continue
 
-            # Small sleep to prevent busy-waiting
-            time.sleep(0.01)
+            for line in framer.feed(data):
+                try:
+                    if line[0] == BINARY_STATUS_SYNC:
+                        self._process_binary_status(line)
+                    else:
+                        self._process_response(line.decode('ascii', errors='ignore'))
+                except Exception as e:
+                    # A bad line or a failing callback must not stop the reader
+                    print(f"[WINCH] Error processing {line!r}: {e!r}")
 
     def _poll_loop(self) -> None:
-        """Background thread for periodic status polling."""
+        """
+        Background thread for periodic status polling.
+
+        Skips the poll while a status stream is running. A stream that
+        goes quiet for STREAM_STALL_TIMEOUT (e.g. the controller reset) is
+        dropped back to polling and resubscribed. While the last status
+        shows motion the winch pushes less often, so the longer
+        STREAM_MOTION_STALL_TIMEOUT applies instead. Polls go through the
+        command queue, so while the writer is behind a poll merges with
+        one already queued instead of piling up.
+        """
         while not self._stop_event.is_set():
             if self.is_connected:
-                self._send_command_direct(Commands.STATUS)
+                poll = not self._streaming
+                if self._streaming and self._stream_stalled():
+                    self._streaming = False
+                    self.stream_stalls += 1
+                    print("[WINCH] Status stream stalled, polling and resubscribing")
+                    self._command_queue.put(Commands.subscribe_status(self.STREAM_RATE_HZ))
+                    poll = True
+                if poll:
+                    self._command_queue.put(Commands.STATUS)
 
             # Wait for poll interval or stop event
             self._stop_event.wait(self.POLL_INTERVAL)
 
+    def _stream_stalled(self) -> bool:
+        """Check if the status stream has been silent too long."""
+        status = self._last_status
+        if status is not None and status.mode != MotionMode.IDLE:
+            timeout = max(self.STREAM_STALL_TIMEOUT, self.STREAM_MOTION_STALL_TIMEOUT)
+        else:
+            timeout = self.STREAM_STALL_TIMEOUT
+        return time.time() - self._last_response_time > timeout
+
     def _process_response(self, response: str) -> None:
         """
         Process a received response line.
@@ -311,14 +449,69 @@ class SerialManager:
         if self._response_callback:
             self._response_callback(response)
 
+        if response == Commands.STATUS_BINARY_ACK:
+            self._binary_status_active = True
+            self._binary_status_errors = 0
+            return
+        if response == Commands.STATUS_ASCII_ACK:
+            self._binary_status_active = False
+            return
+        if response.startswith(Commands.STATUS_STREAM_ACK):
+            self._streaming = response != Commands.STATUS_STREAM_ACK + "0"
+            self._last_response_time = time.time()  # Stall timer starts now
+            return
+
         # Try to parse as status
         status = ResponseParser.parse_status(response)
         if status:
-            self._last_status = status
-            self._last_response_time = time.time()
+            self._handle_status(status)
 
-            if self._status_callback:
-                self._status_callback(status)
+    def _process_binary_status(self, frame: bytes) -> None:
+        """
+        Process a received binary status frame.
+
+        After STATUS_BINARY_MAX_ERRORS corrupt frames in a row the
+        controller is switched back to ASCII status lines.
+
+        Args:
+            frame: Frame bytes from the framer
+        """
+        if self._response_callback:
+            self._response_callback(frame.hex())
+
+        status = ResponseParser.parse_binary_status(frame)
+        if status is None:
+            self._binary_status_errors += 1
+            if self._binary_status_errors == STATUS_BINARY_MAX_ERRORS:
+                print(f"[WINCH] {self._binary_status_errors} corrupt status frames, "
+                      f"reverting to ASCII status")
+                self._binary_status_active = False
+                self.send_command(Commands.STATUS_ASCII)
+            return
+
+        self._binary_status_errors = 0
+        self._handle_status(status)
+
+    def _handle_status(self, status: WinchStatus) -> None:
+        """Record a parsed status and notify the status/delta callbacks."""
+        self._last_status = status
+        self._last_response_time = time.time()
+
+        # The first status shows the firmware is up (past any reset on open)
+        if not self._negotiated:
+            self._negotiated = True
+            if self.BINARY_STATUS:
+                self.send_command(Commands.STATUS_BINARY)
+            if self.STREAM_RATE_HZ:
+                self.send_command(Commands.subscribe_status(self.STREAM_RATE_HZ))
+
+        if self._status_callback:
+            self._status_callback(status)
+
+        if self._delta_callback:
+            delta = self._status_differ.update(status)
+            if delta is not None:
+                self._delta_callback(delta)
 
     def _handle_disconnection(self) -> None:
         """Handle unexpected disconnection."""
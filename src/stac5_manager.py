@@ -7,18 +7,70 @@ Handles direct TCP communication with the STAC5-IP stepper drive using eSCL prot
 import socket
 import threading
 import time
-from typing import Optional, Callable, Tuple
-from dataclasses import dataclass
+from typing import Optional, Callable, Dict, List
+from dataclasses import replace
+
+from .escl_protocol import (
+    ESCL_HEADER,
+    CARRIAGE_RETURN,
+    SC_MOTOR_ENABLED,
+    SC_MOVING,
+    build_packet,
+    parse_response,
+)
+from .config import (
+    STAC5_UDP_PORT,
+    STAC5_MOVE_TIMEOUT_SEC,
+    STAC5_ENCODER_COUNTS_PER_REV,
+    STAC5_IN_POSITION_TOLERANCE_COUNTS,
+)
+from .escl_transport import (
+    ESCLTransport,
+    ESCLUdpTransport,
+    PRIORITY_SAFETY,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+)
+from .metrics import LatencyRecorder, LatencySummary
+from .move_handle import MoveHandle
+from .scl_parser import parse_position, parse_status_code, parse_alarm_code, format_code
+from .poll_scheduler import PollScheduler, AdaptivePollScheduler
+from .records import record
+from .status_delta import StatusDelta, StatusDiffer
+
+
+@record(frozen=False)
+class STAC5Status:
+    """
+    Live status data from the STAC5 controller.
 
+    Updated in place by the manager; hand snapshot() to anything that
+    keeps or queues the status.
+    """
+    connected: bool = False
+    encoder_position: int = 0
+    alarm_code: str = "0000"
+    status_code: str = "0000"
+    is_moving: bool = False
+    motor_enabled: bool = False
+    home_position: Optional[int] = None
+    well_position: Optional[int] = None
+    jog_velocity: float = 2.0
+    move_velocity: float = 1.5
 
-# eSCL Protocol Constants
-ESCL_HEADER = bytes([0x00, 0x07])
-CARRIAGE_RETURN = bytes([0x0D])
+    def snapshot(self) -> "STAC5StatusSnapshot":
+        """Get an immutable copy of the current status."""
+        return STAC5StatusSnapshot(
+            self.connected, self.encoder_position, self.alarm_code,
+            self.status_code, self.is_moving, self.motor_enabled,
+            self.home_position, self.well_position,
+            self.jog_velocity, self.move_velocity,
+        )
 
 
-@dataclass
-class STAC5Status:
-    """Status data from the STAC5 controller."""
+@record
+class STAC5StatusSnapshot:
+    """Immutable point-in-time copy of STAC5Status."""
     connected: bool = False
     encoder_position: int = 0
     alarm_code: str = "0000"
@@ -36,15 +88,30 @@ class STAC5Manager:
     Manages communication with STAC5 motor controller over Ethernet.
 
     Uses eSCL (SCL over Ethernet) protocol:
-    - TCP port 7776
+    - TCP port 7776, or UDP port 7775 when use_udp is set
     - Packet format: [0x00, 0x07] + ASCII command + [0x0D]
+
+    Commands are pipelined through an ESCLTransport, so callers on
+    different threads do not wait on each other's round-trips. Stop
+    commands (ST, SK, SJ) use the transport's priority lane, which puts
+    them ahead of unsent polls but behind requests already in flight,
+    and their latency is recorded for safety review.
     """
 
-    def __init__(self, host: str = "192.168.1.40", port: int = 7776):
+    # Drive parameters shadowed on the host
+    CACHED_PARAMETERS = ("VE", "JS", "AC", "DE", "DI")
+
+    # Moves that load their argument into DI (FP5000 leaves DI=5000)
+    DI_LOADING_COMMANDS = ("FP", "FL")
+
+    def __init__(self, host: str = "192.168.1.40", port: int = 7776,
+                 use_udp: bool = False, udp_port: int = STAC5_UDP_PORT):
         self.host = host
         self.port = port
+        self.udp_port = udp_port
+        self.use_udp = use_udp  # Takes effect on the next connect()
         self.socket: Optional[socket.socket] = None
-        self._lock = threading.Lock()
+        self._transport = None  # ESCLTransport or ESCLUdpTransport
         self._connected = False
 
         # Status
@@ -54,10 +121,18 @@ class STAC5Manager:
         self._poll_thread: Optional[threading.Thread] = None
         self._polling = False
         self._poll_interval = 0.15  # 150ms
+        self._poll_scheduler: PollScheduler = AdaptivePollScheduler(self._poll_interval)
+        self._poll_wake = threading.Event()  # Set to cut the current poll wait short
+
+        # Stop command latency: call -> on the wire, and call -> drive ack
+        self.stop_write_latency = LatencyRecorder()
+        self.stop_ack_latency = LatencyRecorder()
 
         # Callbacks
         self._status_callback: Optional[Callable[[STAC5Status], None]] = None
+        self._delta_callback: Optional[Callable[[StatusDelta], None]] = None
         self._error_callback: Optional[Callable[[str], None]] = None
+        self._status_differ = StatusDiffer()
 
         # Motion defaults
         self.default_jog_velocity = 2.0    # rev/sec
@@ -68,6 +143,7 @@ class STAC5Manager:
         # Electronic gearing ratio (EG/ER = 20000/8000 = 2.5)
         # Motor steps = encoder counts * gear_ratio
         self.gear_ratio = 2.5
+        self.encoder_counts_per_rev = STAC5_ENCODER_COUNTS_PER_REV
 
         # Track when last move command was sent for fast polling
         self._last_move_time = 0.0
@@ -76,6 +152,19 @@ class STAC5Manager:
         self._min_command_interval = 0.5  # 500ms between move commands
         self._last_move_command_time = 0.0
 
+        # Last alarm code seen by polling (to detect new faults)
+        self._last_alarm = 0
+
+        # Shadow copy of acknowledged parameter writes (register -> value text),
+        # so unchanged VE/JS/AC/DE/DI values are not resent
+        self._param_cache: Dict[str, str] = {}
+        self._param_lock = threading.Lock()
+        self.param_writes_skipped = 0
+
+        # Move currently being tracked to In Position
+        self._active_move: Optional[MoveHandle] = None
+        self.in_position_tolerance = STAC5_IN_POSITION_TOLERANCE_COUNTS
+
         # Jog state tracking
         self._jog_active = False  # True when jog is running
         self._jog_stop_time = 0.0  # When jog stop was sent
@@ -85,10 +174,20 @@ class STAC5Manager:
         """Set callback for status updates."""
         self._status_callback = callback
 
+    def set_delta_callback(self, callback: Callable[[StatusDelta], None]):
+        """Set callback for status changes (plus a periodic heartbeat)."""
+        self._delta_callback = callback
+
     def set_error_callback(self, callback: Callable[[str], None]):
         """Set callback for error notifications."""
         self._error_callback = callback
 
+    def set_poll_scheduler(self, scheduler: PollScheduler):
+        """Replace the poll scheduler (takes effect on the next poll)."""
+        scheduler.idle_interval = self._poll_interval
+        self._poll_scheduler = scheduler
+        self._poll_wake.set()
+
     def _notify_error(self, message: str):
         """Notify error via callback."""
         print(f"[STAC5] Error: {message}")
@@ -96,9 +195,14 @@ class STAC5Manager:
             self._error_callback(message)
 
     def _notify_status(self):
-        """Notify status update via callback."""
+        """Notify status update via callbacks."""
         if self._status_callback:
             self._status_callback(self.status)
+        if self._delta_callback:
+            delta = self._status_differ.update(self.status)
+            if delta is not None:
+                # self.status is updated in place - hand out a snapshot
+                self._delta_callback(replace(delta, status=self.status.snapshot()))
 
     def _decode_alarm(self, alarm_code: str) -> str:
         """Decode alarm code to human-readable message."""
@@ -142,21 +246,11 @@ class STAC5Manager:
 
     def _build_packet(self, command: str) -> bytes:
         """Build an eSCL packet for the given SCL command."""
-        return ESCL_HEADER + command.encode('ascii') + CARRIAGE_RETURN
+        return build_packet(command)
 
     def _parse_response(self, data: bytes) -> Optional[str]:
         """Parse an eSCL response packet."""
-        if len(data) < 3:
-            return None
-
-        # Check header
-        if data[0] != 0x00 or data[1] != 0x07:
-            # Some responses might not have header
-            return data.decode('ascii', errors='replace').strip()
-
-        # Extract the response (skip header, remove CR)
-        response = data[2:].decode('ascii', errors='replace').strip()
-        return response
+        return parse_response(data)
 
     def connect(self) -> bool:
         """Connect to the STAC5 controller."""
@@ -166,12 +260,21 @@ class STAC5Manager:
             self.disconnect()
 
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(5.0)
-            self.socket.connect((self.host, self.port))
-            self._connected = True
+            if self.use_udp:
+                self._open_udp()
+            else:
+                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.socket.settimeout(5.0)
+                self.socket.connect((self.host, self.port))
+
+                # Reader thread takes ownership of the receive side
+                self._transport = ESCLTransport(self.socket, on_closed=self._on_transport_closed)
+                self._transport.start()
+                self._connected = True
+
             self.status.connected = True
-            print(f"[STAC5] Connected to {self.host}:{self.port}")
+            print(f"[STAC5] Connected to {self.host}:{self.udp_port if self.use_udp else self.port}"
+                  f" ({'UDP' if self.use_udp else 'TCP'})")
 
             # Initialize drive settings
             self._init_drive()
@@ -184,9 +287,39 @@ class STAC5Manager:
             self.status.connected = False
             return False
 
+    def _open_udp(self):
+        """Open the UDP transport and check that the drive answers."""
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.connect((self.host, self.udp_port))
+        self._transport = ESCLUdpTransport(self.socket, on_closed=self._on_transport_closed)
+        self._transport.start()
+
+        # UDP has no handshake - a status query proves the drive is there
+        self._connected = True
+        if self.send_command("SC") is None:
+            self._transport.close()
+            self._transport = None
+            raise ConnectionError(f"No eSCL response on UDP port {self.udp_port}")
+
+    def _on_transport_closed(self, reason: str):
+        """Handle the eSCL link dropping (called from reader thread)."""
+        self._connected = False
+        self._invalidate_param_cache()
+        self._cancel_move("Connection lost")
+        self.status.connected = False
+        self._notify_error(f"Command failed: {reason}")
+
     def disconnect(self):
         """Disconnect from the STAC5 controller."""
         self.stop_polling()
+        self._cancel_move("Disconnected")
+
+        if self.stop_ack_latency.count:
+            print(f"[STAC5] Stop latency: {self.get_stop_latency()}")
+
+        if self._transport:
+            self._transport.close()
+            self._transport = None
 
         if self.socket:
             try:
@@ -210,9 +343,13 @@ class STAC5Manager:
 
     def _init_drive(self):
         """Initialize drive with default settings."""
-        self.send_command(f"AC{self.default_acceleration:.1f}")  # Acceleration
-        self.send_command(f"DE{self.default_deceleration:.1f}")  # Deceleration
-        self.send_command("ME")  # Motor Enable
+        # The drive may have been power-cycled or reconfigured since last time
+        self._invalidate_param_cache()
+        self.send_commands([
+            f"AC{self.default_acceleration:.1f}",  # Acceleration
+            f"DE{self.default_deceleration:.1f}",  # Deceleration
+            "ME",                                  # Motor Enable
+        ])
         self.status.motor_enabled = True
 
         # Sync internal position (SP) to encoder position (EP)
@@ -236,63 +373,185 @@ class STAC5Manager:
             self.send_command(f"SP{motor_steps}")
             print(f"[STAC5] Synced SP to EP: encoder={ep}, motor={motor_steps}")
 
-    def send_command(self, command: str, timeout: float = 1.0) -> Optional[str]:
+    def _estimate_move_time(self, motor_steps: int, velocity: float) -> float:
+        """
+        Estimate the duration of a trapezoidal move.
+
+        Args:
+            motor_steps: Move distance in motor steps (sign ignored)
+            velocity: Move velocity in rev/sec
+
+        Returns:
+            Estimated move time in seconds
+        """
+        revs = abs(motor_steps) / (self.encoder_counts_per_rev * self.gear_ratio)
+        accel = self.default_acceleration
+        decel = self.default_deceleration
+        if revs == 0 or velocity <= 0:
+            return 0.0
+
+        ramp_revs = velocity ** 2 / (2 * accel) + velocity ** 2 / (2 * decel)
+        if ramp_revs >= revs:
+            # Triangular profile - never reaches full velocity
+            peak = (2 * revs * accel * decel / (accel + decel)) ** 0.5
+            return peak / accel + peak / decel
+        return velocity / accel + velocity / decel + (revs - ramp_revs) / velocity
+
+    def _notify_move_started(self, eta: Optional[float] = None):
+        """Switch polling to motion rate after a motion command is accepted."""
+        self._last_move_time = time.time()
+        self._poll_scheduler.notify_move(eta)
+        self._poll_wake.set()
+
+    def send_command(self, command: str, timeout: float = 1.0,
+                     priority: int = PRIORITY_COMMAND) -> Optional[str]:
         """
         Send an SCL command and get response.
 
         Args:
             command: SCL command string (e.g., "RV", "ME", "EP")
             timeout: Response timeout in seconds
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            Response string, or None if failed
+        """
+        return self.send_commands([command], timeout, priority)[0]
+
+    def send_commands(self, commands: List[str], timeout: float = 1.0,
+                      priority: int = PRIORITY_COMMAND) -> List[Optional[str]]:
+        """
+        Send several SCL commands pipelined and collect their responses.
+
+        All packets are written in one send, so the sequence costs a single
+        round-trip instead of one per command. The drive still executes
+        them in order.
+
+        Args:
+            commands: SCL command strings
+            timeout: Response timeout in seconds (for the whole batch)
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            Response string (or None) for each command, in order
+        """
+        return [self._parse_response(data) if data is not None else None
+                for data in self._send_frames(commands, timeout, priority)]
+
+    def _query(self, command: str, timeout: float = 1.0,
+               priority: int = PRIORITY_COMMAND) -> Optional[bytes]:
+        """Send a query and return the raw response frame."""
+        return self._send_frames([command], timeout, priority)[0]
+
+    def _send_frames(self, commands: List[str], timeout: float = 1.0,
+                     priority: int = PRIORITY_COMMAND) -> List[Optional[bytes]]:
+        """
+        Send several SCL commands pipelined and collect the raw frames.
+
+        Args:
+            commands: SCL command strings
+            timeout: Response timeout in seconds (for the whole batch)
+            priority: Outbound priority (PRIORITY_SAFETY/COMMAND/POLL)
+
+        Returns:
+            Response frame (or None) for each command, in order
+        """
+        transport = self._transport
+        if not self._connected or transport is None:
+            return [None] * len(commands)
+
+        requests = transport.submit_many(commands, priority)
+        deadline = time.perf_counter() + timeout
+        responses = []
+        for request in requests:
+            data = request.wait(max(0.0, deadline - time.perf_counter()))
+            if data is None:
+                transport.abandon(request)
+                data = request.response
+            logged = self._parse_response(data) if data is not None else None
+            print(f"[STAC5] TX: {request.command} | RX: {logged}")
+            self._update_param_cache(request.command, data)
+            responses.append(data)
+        return responses
+
+    def _skip_cached(self, commands: List[str]) -> List[str]:
+        """
+        Drop parameter writes whose value the drive already holds.
+
+        Args:
+            commands: SCL command strings
+
+        Returns:
+            Commands that still need to be sent, in order
+        """
+        with self._param_lock:
+            needed = [command for command in commands
+                      if not (command[:2] in self.CACHED_PARAMETERS and len(command) > 2
+                              and self._param_cache.get(command[:2]) == command[2:])]
+            self.param_writes_skipped += len(commands) - len(needed)
+        return needed
+
+    def _update_param_cache(self, command: str, data: Optional[bytes]):
+        """Record an acknowledged parameter write, or invalidate on rejection."""
+        if data is not None and data[:1] == b"?":
+            # The drive rejected something - its parameter state is unknown
+            self._invalidate_param_cache()
+            return
+        register = command[:2]
+        if register in self.DI_LOADING_COMMANDS and len(command) > 2:
+            with self._param_lock:
+                self._param_cache.pop("DI", None)
+            return
+        if register not in self.CACHED_PARAMETERS or len(command) <= 2:
+            return
+        with self._param_lock:
+            if data is None:
+                self._param_cache.pop(register, None)  # May or may not have landed
+            else:
+                self._param_cache[register] = command[2:]
+
+    def _invalidate_param_cache(self):
+        """Forget all shadowed parameter values."""
+        with self._param_lock:
+            self._param_cache.clear()
+
+    def _send_stop_command(self, command: str, timeout: float = 1.0) -> Optional[str]:
+        """
+        Send a stop command on the priority lane and record its latency.
+
+        The stop is written ahead of queued polls, but its acknowledgement
+        arrives after the replies to requests already in flight.
+
+        Args:
+            command: "ST", "SK" or "SJ"
+            timeout: Response timeout in seconds
 
         Returns:
             Response string, or None if failed
         """
-        if not self._connected or not self.socket:
+        transport = self._transport
+        if not self._connected or transport is None:
             return None
 
-        with self._lock:
-            try:
-                # Clear any pending data in receive buffer first
-                self.socket.setblocking(False)
-                try:
-                    while True:
-                        self.socket.recv(1024)
-                except:
-                    pass
-                self.socket.setblocking(True)
-
-                # Build and send packet
-                packet = self._build_packet(command)
-                self.socket.sendall(packet)
-
-                # Small delay to let response arrive
-                time.sleep(0.01)  # Reduced from 50ms to 10ms for faster polling
-
-                # Read response
-                self.socket.settimeout(timeout)
-                response_data = b""
-
-                while True:
-                    try:
-                        data = self.socket.recv(1024)
-                        if not data:
-                            break
-                        response_data += data
-                        # Check for response terminators
-                        if b'\r' in response_data or b'%' in response_data or b'?' in response_data:
-                            break
-                    except socket.timeout:
-                        break
-
-                response = self._parse_response(response_data)
-                print(f"[STAC5] TX: {command} | RX: {response}")
-                return response
+        start = time.perf_counter()
+        request = transport.submit(command, PRIORITY_SAFETY)
+        data = request.wait(timeout)
+        if data is None:
+            transport.abandon(request)
+            data = request.response
+        if request.sent_time:
+            self.stop_write_latency.record(request.sent_time - start)
+        if data is not None:
+            self.stop_ack_latency.record(request.received_time - start)
+
+        response = self._parse_response(data) if data is not None else None
+        print(f"[STAC5] TX: {command} | RX: {response}")
+        self._update_param_cache(command, data)
+        return response
 
-            except Exception as e:
-                self._notify_error(f"Command failed: {e}")
-                self._connected = False
-                self.status.connected = False
-                return None
+    def get_stop_latency(self) -> LatencySummary:
+        """Get measured stop command latency (call to drive acknowledgement)."""
+        return self.stop_ack_latency.summary()
 
     # =========================================================================
     # Status Commands
@@ -300,79 +559,21 @@ class STAC5Manager:
 
     def get_encoder_position(self) -> Optional[int]:
         """Read current encoder position (use when drive is idle)."""
-        response = self.send_command("EP")
-        if response:
-            try:
-                # Response format: "EP=12345" or "EP=12345 EP=12345" (duplicated)
-                # Find first EP= and extract the number after it
-                if "EP=" in response:
-                    idx = response.find("EP=") + 3
-                    end = idx
-                    # Extract digits and minus sign
-                    while end < len(response) and (response[end].isdigit() or response[end] == '-'):
-                        end += 1
-                    return int(response[idx:end])
-                else:
-                    # Fallback: try to parse cleaned response
-                    clean = response.replace("=", "").replace("EP", "")
-                    clean = clean.replace("%", "").replace("?", "").replace("*", "").strip()
-                    # Take first number if multiple
-                    parts = clean.split()
-                    if parts:
-                        return int(parts[0])
-            except ValueError:
-                pass
-        return None
+        return parse_position(self._query("EP"), b"EP")
 
     def get_immediate_encoder(self) -> Optional[int]:
         """Read encoder position using Immediate Encoder command (works during motion)."""
-        response = self.send_command("IE")
-        if response:
-            try:
-                # Response format: "IE=12345"
-                if "IE=" in response:
-                    idx = response.find("IE=") + 3
-                    end = idx
-                    while end < len(response) and (response[end].isdigit() or response[end] == '-'):
-                        end += 1
-                    return int(response[idx:end])
-                else:
-                    clean = response.replace("=", "").replace("IE", "")
-                    clean = clean.replace("%", "").replace("?", "").replace("*", "").strip()
-                    parts = clean.split()
-                    if parts:
-                        return int(parts[0])
-            except ValueError:
-                pass
-        return None
+        return parse_position(self._query("IE"), b"IE")
 
     def get_alarm_code(self) -> Optional[str]:
-        """Read alarm status."""
-        response = self.send_command("AL")
-        if response:
-            clean = response.replace("=", "").replace("AL", "")
-            clean = clean.replace("%", "").replace("?", "").replace("*", "").strip()
-            return clean
-        return None
+        """Read alarm status (hex string, e.g. "0000")."""
+        code = parse_alarm_code(self._query("AL"))
+        return format_code(code) if code is not None else None
 
     def get_status_code(self) -> Optional[str]:
-        """Read drive status code."""
-        response = self.send_command("SC")
-        if response:
-            # Response format: "SC=0001" or duplicated
-            if "SC=" in response:
-                idx = response.find("SC=") + 3
-                end = idx
-                while end < len(response) and response[end].isalnum():
-                    end += 1
-                return response[idx:end]
-            else:
-                clean = response.replace("=", "").replace("SC", "")
-                clean = clean.replace("%", "").replace("?", "").replace("*", "").strip()
-                parts = clean.split()
-                if parts:
-                    return parts[0]
-        return None
+        """Read drive status code (hex string, e.g. "0009")."""
+        code = parse_status_code(self._query("SC"))
+        return format_code(code) if code is not None else None
 
     def get_immediate_velocity(self) -> Optional[float]:
         """Read current velocity."""
@@ -409,6 +610,8 @@ class STAC5Manager:
     def alarm_reset(self) -> bool:
         """Clear any alarms."""
         old_alarm = self.status.alarm_code
+        # An alarm can leave the drive with parameters we did not set
+        self._invalidate_param_cache()
         response = self.send_command("AR")
         if response is not None:
             print(f"[STAC5] Alarm reset sent (was: {old_alarm})")
@@ -418,18 +621,20 @@ class STAC5Manager:
 
     def stop(self) -> bool:
         """Stop motion (controlled deceleration)."""
-        response = self.send_command("ST")
+        response = self._send_stop_command("ST")
         self._jog_active = False
         self._jog_stop_time = time.time()  # Start lockout period
         self.status.is_moving = False
+        self._cancel_move("Stopped")
         return response is not None
 
     def stop_kill(self) -> bool:
         """Emergency stop (immediate)."""
-        response = self.send_command("SK")
+        response = self._send_stop_command("SK")
         self._jog_active = False
         self._jog_stop_time = time.time()
         self.status.is_moving = False
+        self._cancel_move("Emergency stop")
         return response is not None
 
     # =========================================================================
@@ -461,19 +666,20 @@ class STAC5Manager:
 
         # Mark as active BEFORE sending commands to prevent race conditions
         self._jog_active = True
+        self._cancel_move("Superseded by jog")
 
-        # Set direction using DI command (DI1 = positive, DI-1 = negative)
+        # Set direction using DI command (DI1 = positive, DI-1 = negative),
+        # set jog speed and commence jogging - pipelined in one send
+        # (direction and speed are skipped if the drive already has them)
         dir_cmd = "DI1" if direction >= 0 else "DI-1"
-        self.send_command(dir_cmd)
-
-        # Set jog speed
-        self.send_command(f"JS{self.status.jog_velocity:.1f}")
-
-        # Commence jogging
-        response = self.send_command("CJ")
+        response = self.send_commands(self._skip_cached([
+            dir_cmd,
+            f"JS{self.status.jog_velocity:.1f}",
+            "CJ",
+        ]))[-1]
         if response is not None:
             self.status.is_moving = True
-            self._last_move_time = time.time()  # Trigger fast polling
+            self._notify_move_started()  # Trigger fast polling
             return True
         else:
             # Failed to start, reset state
@@ -488,7 +694,7 @@ class STAC5Manager:
         self.status.is_moving = False
 
         # Send SJ to decelerate to stop (don't use ST - that's immediate stop)
-        self.send_command("SJ")
+        self._send_stop_command("SJ")
 
         return True
 
@@ -503,42 +709,62 @@ class STAC5Manager:
     # Move Commands
     # =========================================================================
 
-    def move_relative(self, steps: int) -> bool:
-        """Move relative number of steps."""
+    def move_relative(self, steps: int) -> MoveHandle:
+        """
+        Move relative number of steps.
+
+        Returns:
+            MoveHandle that resolves when the drive settles In Position
+            (falsy if the move was not accepted)
+        """
         # Rate limiting - ignore if command sent too recently
         now = time.time()
         if now - self._last_move_command_time < self._min_command_interval:
             print(f"[STAC5] Move command ignored - rate limited ({self._min_command_interval}s)")
-            return False
+            return MoveHandle.rejected("Rate limited")
         self._last_move_command_time = now
 
-        # Set velocity (always positive, with decimal point for compatibility)
-        self.send_command(f"VE{self.status.move_velocity:.1f}")
-
-        # Set distance (signed value - DI accepts positive and negative)
-        self.send_command(f"DI{steps}")
-
-        # Feed to length (execute move)
-        response = self.send_command("FL")
+        # Set velocity (always positive, with decimal point for compatibility),
+        # set distance (signed value - DI accepts positive and negative)
+        # and feed to length (execute move)
+        response = self.send_commands(self._skip_cached([
+            f"VE{self.status.move_velocity:.1f}",
+            f"DI{steps}",
+            "FL",
+        ]))[-1]
         if response is not None:
             self.status.is_moving = True
-            self._last_move_time = time.time()  # Trigger fast polling
-            return True
-        return False
+            eta = self._estimate_move_time(steps, self.status.move_velocity)
+            handle = self._track_move(None, eta)
+            self._notify_move_started(eta)  # Trigger fast polling
+            return handle
+        return MoveHandle.rejected("Move command failed")
+
+    def move_to_position(self, target_steps: int,
+                         tolerance: Optional[int] = None) -> MoveHandle:
+        """
+        Move to an absolute encoder position using FP command.
+
+        Args:
+            target_steps: Target encoder position
+            tolerance: Distance from target in encoder counts still counted
+                       as arrived (default in_position_tolerance)
 
-    def move_to_position(self, target_steps: int) -> bool:
-        """Move to an absolute encoder position using FP command."""
+        Returns:
+            MoveHandle that resolves when SC reports In Position at the
+            target (falsy if the move was not accepted)
+        """
         # Rate limiting - ignore if command sent too recently
         now = time.time()
         if now - self._last_move_command_time < self._min_command_interval:
             print(f"[STAC5] Move command ignored - rate limited ({self._min_command_interval}s)")
-            return False
+            return MoveHandle.rejected("Rate limited", target_steps)
         self._last_move_command_time = now
 
         # Stop any current motion before starting new move
         if self.status.is_moving:
             print("[STAC5] Stopping current motion before new move")
-            self.send_command("ST")
+            self._send_stop_command("ST")
             time.sleep(0.05)  # Brief pause for stop to take effect
 
         current = self.get_encoder_position()
@@ -546,7 +772,8 @@ class STAC5Manager:
 
         if current is not None and current == target_steps:
             print("[STAC5] Already at target position")
-            return True
+            self._cancel_move("Superseded")
+            return MoveHandle.completed(target_steps)
 
         # Sync SP to current encoder position (scaled to motor steps)
         self._sync_positions()
@@ -554,18 +781,54 @@ class STAC5Manager:
         # Convert target encoder position to motor steps
         target_motor = self._encoder_to_motor(target_steps)
 
-        # Set velocity
-        self.send_command(f"VE{self.status.move_velocity:.1f}")
-
-        # Use FP (Feed to Position) for absolute positioning in motor steps
-        response = self.send_command(f"FP{target_motor}")
+        # Set velocity, then use FP (Feed to Position) for absolute
+        # positioning in motor steps
+        response = self.send_commands(self._skip_cached([
+            f"VE{self.status.move_velocity:.1f}",
+            f"FP{target_motor}",
+        ]))[-1]
         print(f"[STAC5] FP{target_motor} (encoder target: {target_steps}) response: {response}")
 
         if response is not None:
             self.status.is_moving = True
-            self._last_move_time = time.time()  # Trigger fast polling
-            return True
-        return False
+            eta = None
+            if current is not None:
+                distance = self._encoder_to_motor(target_steps - current)
+                eta = self._estimate_move_time(distance, self.status.move_velocity)
+            handle = self._track_move(target_steps, eta, tolerance)
+            self._notify_move_started(eta)  # Trigger fast polling
+            return handle
+        return MoveHandle.rejected("Move command failed", target_steps)
+
+    def _track_move(self, target: Optional[int], eta: Optional[float],
+                    tolerance: Optional[int] = None) -> MoveHandle:
+        """Start tracking a newly accepted move, superseding any previous one."""
+        timeout = eta * 2 + 2.0 if eta is not None else STAC5_MOVE_TIMEOUT_SEC
+        if tolerance is None:
+            tolerance = self.in_position_tolerance
+        handle = MoveHandle(target, timeout, tolerance)
+        handle.add_done_callback(self._on_move_done)
+        previous, self._active_move = self._active_move, handle
+        if previous is not None:
+            previous.fail("Superseded")
+        return handle
+
+    def _cancel_move(self, reason: str):
+        """Fail the tracked move, if any."""
+        handle, self._active_move = self._active_move, None
+        if handle is not None:
+            handle.fail(reason)
+
+    def _on_move_done(self, handle: MoveHandle):
+        """Log the outcome of a tracked move."""
+        if self._active_move is handle:
+            self._active_move = None
+        if handle.succeeded:
+            settle = f"{handle.settle_time:.3f}s" if handle.settle_time is not None else "n/a"
+            print(f"[STAC5] Move complete at {handle.final_position} in "
+                  f"{handle.duration:.3f}s (settle {settle})")
+        else:
+            print(f"[STAC5] Move to {handle.target} failed: {handle.error}")
 
     def set_move_velocity(self, rps: float) -> bool:
         """Set move velocity in rev/sec."""
@@ -596,21 +859,21 @@ class STAC5Manager:
             return True
         return False
 
-    def go_home(self) -> bool:
-        """Move to saved home position."""
+    def go_home(self) -> MoveHandle:
+        """Move to saved home position (see move_to_position)."""
         print(f"[STAC5] Go Home called - saved position: {self.status.home_position}")
         if self.status.home_position is not None:
             return self.move_to_position(self.status.home_position)
         print("[STAC5] Go Home failed - no home position saved")
-        return False
+        return MoveHandle.rejected("No home position saved")
 
-    def go_well(self) -> bool:
-        """Move to saved well position."""
+    def go_well(self) -> MoveHandle:
+        """Move to saved well position (see move_to_position)."""
         print(f"[STAC5] Go Well called - saved position: {self.status.well_position}")
         if self.status.well_position is not None:
             return self.move_to_position(self.status.well_position)
         print("[STAC5] Go Well failed - no well position saved")
-        return False
+        return MoveHandle.rejected("No well position saved")
 
     def zero_encoder(self) -> bool:
         """Zero the encoder position (set current position as 0)."""
@@ -633,6 +896,7 @@ class STAC5Manager:
             self.stop_polling()
 
         self._poll_interval = interval
+        self._poll_scheduler.idle_interval = interval
         self._polling = True
         self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._poll_thread.start()
@@ -641,6 +905,7 @@ class STAC5Manager:
     def stop_polling(self):
         """Stop polling for status updates."""
         self._polling = False
+        self._poll_wake.set()
         if self._poll_thread:
             self._poll_thread.join(timeout=2.0)
             if self._poll_thread.is_alive():
@@ -649,58 +914,30 @@ class STAC5Manager:
         print("[STAC5] Stopped polling")
 
     def _poll_loop(self):
-        """Background polling loop."""
-        last_alarm = "0000"  # Track last alarm to detect new faults
-        full_poll_counter = 0  # Counter for full status polls
+        """Background polling loop (rate chosen by the poll scheduler)."""
+        self._last_alarm = 0  # Track last alarm to detect new faults
+        self._status_differ.reset()  # First status after (re)start is sent in full
+        last_snapshot = None
         print("[STAC5] Poll loop started")
 
         while self._polling and self._connected:
-            # Check if we should be in fast polling mode
-            # Fast mode when: is_moving flag is set OR a move was started recently (within 3 seconds)
-            time_since_move = time.time() - self._last_move_time
-            in_motion_mode = self.status.is_moving or time_since_move < 3.0
+            # Use IE (Immediate Encoder) during motion - it works while drive is busy
+            # Use EP (Encoder Position) when idle - it's the standard command
+            in_motion_mode = self.status.is_moving or self._poll_scheduler.in_motion
+            status_code = None
+            changed = False
 
             try:
-                # Read encoder position
-                # Use IE (Immediate Encoder) during motion - it works while drive is busy
-                # Use EP (Encoder Position) when idle - it's the standard command
-                if in_motion_mode:
-                    pos = self.get_immediate_encoder()
-                else:
-                    pos = self.get_encoder_position()
-
-                if pos is not None:
-                    self.status.encoder_position = pos
-
-                # Only read SC and AL every 5th cycle when in motion mode
-                # Always read when idle for full status
-                full_poll_counter += 1
-                if full_poll_counter >= 5 or not in_motion_mode:
-                    full_poll_counter = 0
-
-                    # Read status code
-                    sc = self.get_status_code()
-                    if sc:
-                        self.status.status_code = sc
-                        try:
-                            sc_int = int(sc, 16)
-                            # Bit 0: Motor enabled
-                            self.status.motor_enabled = bool(sc_int & 0x0001)
-                            # Bit 4 (0x0010): Moving/In Motion
-                            self.status.is_moving = bool(sc_int & 0x0010)
-                        except:
-                            pass
-
-                    # Read alarm code and detect new faults
-                    al = self.get_alarm_code()
-                    if al:
-                        self.status.alarm_code = al
-                        # Check if this is a new fault (non-zero and different from last)
-                        if al != "0000" and al != last_alarm:
-                            fault_msg = self._decode_alarm(al)
-                            print(f"[STAC5] FAULT DETECTED: {al} - {fault_msg}")
-                            self._notify_error(f"FAULT {al}: {fault_msg}")
-                        last_alarm = al
+                # Position, status and alarm in one round-trip
+                self.poll_status_batch(immediate=in_motion_mode)
+
+                snapshot = (self.status.encoder_position, self.status.status_code, self.status.alarm_code)
+                changed = snapshot != last_snapshot
+                last_snapshot = snapshot
+                try:
+                    status_code = int(self.status.status_code, 16)
+                except ValueError:
+                    pass
 
                 # Notify callback
                 self._notify_status()
@@ -708,26 +945,68 @@ class STAC5Manager:
             except Exception as e:
                 print(f"[STAC5] Poll error: {e}")
 
-            # Use shorter sleep when in motion mode for faster updates
-            if in_motion_mode:
-                time.sleep(0.03)  # 30ms when moving for ~30 updates/sec
-            else:
-                time.sleep(self._poll_interval)  # Normal interval when idle
+            interval = self._poll_scheduler.update(status_code, changed)
+            self._poll_wake.wait(interval)
+            self._poll_wake.clear()
 
         print(f"[STAC5] Poll loop exited (polling={self._polling}, connected={self._connected})")
 
-    def poll_once(self) -> STAC5Status:
-        """Poll status once (blocking)."""
-        pos = self.get_encoder_position()
+    def poll_status_batch(self, immediate: bool = False, timeout: float = 1.0) -> STAC5Status:
+        """
+        Refresh position, status code and alarm code in a single transaction.
+
+        All three query packets are written back-to-back in one send and
+        the replies are collected in one read window, so a full refresh
+        costs one round-trip instead of three.
+
+        Args:
+            immediate: Use IE (works during motion) instead of EP
+            timeout: Response timeout in seconds for the whole batch
+
+        Returns:
+            The updated status
+        """
+        position_cmd = "IE" if immediate else "EP"
+        pos_resp, sc_resp, al_resp = self._send_frames(
+            [position_cmd, "SC", "AL"], timeout, PRIORITY_POLL)
+
+        pos = parse_position(pos_resp, position_cmd.encode('ascii'))
         if pos is not None:
             self.status.encoder_position = pos
 
-        sc = self.get_status_code()
-        if sc:
-            self.status.status_code = sc
+        sc = parse_status_code(sc_resp)
+        if sc is not None:
+            self._apply_status_code(sc)
+
+        al = parse_alarm_code(al_resp)
+        if al is not None:
+            self._apply_alarm_code(al)
 
-        al = self.get_alarm_code()
-        if al:
-            self.status.alarm_code = al
+        move = self._active_move
+        if move is not None:
+            move.update(pos, sc, al)
 
         return self.status
+
+    def _apply_status_code(self, sc: int):
+        """Update status flags from an SC status bitfield."""
+        self.status.status_code = format_code(sc)
+        # Bit 0: Motor enabled
+        self.status.motor_enabled = bool(sc & SC_MOTOR_ENABLED)
+        # Bit 4 (0x0010): Moving/In Motion
+        self.status.is_moving = bool(sc & SC_MOVING)
+
+    def _apply_alarm_code(self, al: int):
+        """Update alarm code and report newly raised faults."""
+        code = format_code(al)
+        self.status.alarm_code = code
+        # Check if this is a new fault (non-zero and different from last)
+        if al and al != self._last_alarm:
+            fault_msg = self._decode_alarm(code)
+            print(f"[STAC5] FAULT DETECTED: {code} - {fault_msg}")
+            self._notify_error(f"FAULT {code}: {fault_msg}")
+        self._last_alarm = al
+
+    def poll_once(self) -> STAC5Status:
+        """Poll status once (blocking)."""
+        return self.poll_status_batch()
@@ -0,0 +1,106 @@
+"""
+Status Delta Module
+
+Change-only status delivery for the device managers. A StatusDiffer
+compares each polled status record with the last one delivered and
+produces a StatusDelta naming the fields that changed, or nothing at all
+when the poll brought no news. A heartbeat delta (no changed fields) is
+still produced periodically so consumers can tell the link is alive.
+"""
+
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Optional
+
+from .config import STATUS_HEARTBEAT_SEC
+
+
+@dataclass(frozen=True)
+class StatusDelta:
+    """
+    Fields that changed between two status records.
+
+    Attributes:
+        status: The current (complete) status record
+        changed: Field name -> new value for every changed field; on the
+                 first delta after a reset this holds every field
+        heartbeat: True if emitted only for liveness (nothing changed)
+    """
+    status: Any
+    changed: Dict[str, Any]
+    heartbeat: bool = False
+
+    def __contains__(self, field_name: str) -> bool:
+        return field_name in self.changed
+
+    def __bool__(self) -> bool:
+        return bool(self.changed)
+
+
+class StatusDiffer:
+    """
+    Field-level differ for dataclass status records.
+
+    Values are snapshotted when compared, so records that are updated in
+    place (such as STAC5Status) diff correctly.
+    """
+
+    def __init__(self, heartbeat_interval: float = STATUS_HEARTBEAT_SEC,
+                 ignore: Iterable[str] = ("raw_response",)):
+        """
+        Initialize the differ.
+
+        Args:
+            heartbeat_interval: Seconds without changes before a heartbeat
+                                delta is produced (0 disables heartbeats)
+            ignore: Field names excluded from comparison
+        """
+        self.heartbeat_interval = heartbeat_interval
+        self._ignore = frozenset(ignore)
+        self._previous: Optional[Dict[str, Any]] = None
+        self._last_emit = 0.0
+
+        # Counters
+        self.updates = 0
+        self.suppressed = 0
+
+    def reset(self) -> None:
+        """Forget the last status so the next update reports every field."""
+        self._previous = None
+
+    def update(self, status: Any, now: Optional[float] = None) -> Optional[StatusDelta]:
+        """
+        Compare a status record with the last one delivered.
+
+        Args:
+            status: Dataclass status record
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            StatusDelta with the changed fields, a heartbeat delta, or None
+            if nothing changed and no heartbeat is due
+        """
+        if now is None:
+            now = time.monotonic()
+        self.updates += 1
+
+        values = {f.name: getattr(status, f.name) for f in fields(status)
+                  if f.name not in self._ignore}
+        previous = self._previous
+        if previous is None:
+            changed = values
+        else:
+            changed = {name: value for name, value in values.items()
+                       if previous.get(name) != value}
+        self._previous = values
+
+        if changed:
+            self._last_emit = now
+            return StatusDelta(status, changed)
+
+        if self.heartbeat_interval and now - self._last_emit >= self.heartbeat_interval:
+            self._last_emit = now
+            return StatusDelta(status, {}, heartbeat=True)
+
+        self.suppressed += 1
+        return None
@@ -3,13 +3,19 @@ Drop Cylinder Manager Module
 
 Handles communication with the ESP32 drop cylinder controller.
 Supports both WiFi/TCP and USB serial connections.
+
+With STATUS_STREAM_RATE_HZ set, the controller is subscribed to push
+status on its own and polling only resumes if that stream stalls.
+
+Commands are timed from send to acknowledgement (see command_tracker):
+by sequence tag with DROP_CYLINDER_ACK_TAGS, otherwise by the first
+status that shows their effect.
 """
 
 import socket
 import threading
-import queue
 import time
-from typing import Callable, Optional, List
+from typing import Callable, Dict, Optional, List, Sequence
 from enum import Enum
 
 try:
@@ -22,13 +28,30 @@ except ImportError:
 from .config import (
     DROP_CYLINDER_TCP_PORT,
     DROP_CYLINDER_POLL_INTERVAL_SEC,
+    DROP_CYLINDER_ACK_TAGS,
+    DROP_CYLINDER_ACK_TIMEOUT_SEC,
     SERIAL_BAUD_DEFAULT,
+    STATUS_BINARY_FRAMES,
+    STATUS_BINARY_MAX_ERRORS,
+    STATUS_STREAM_RATE_HZ,
+    STATUS_STREAM_STALL_SEC,
 )
 from .drop_cylinder_protocol import (
+    BINARY_STATUS_LENGTH,
+    BINARY_STATUS_SYNC,
+    DropCylinderCommands,
     DropCylinderStatus,
     DropCylinderResponseParser,
+    check_drop_cylinder_binary_status,
+    command_kind,
     format_drop_cylinder_command,
+    status_confirms,
 )
+from .command_queue import CoalescingCommandQueue
+from .command_tracker import CommandTracker
+from .line_framer import LineFramer
+from .metrics import HISTOGRAM_EDGES_MS, LatencySummary
+from .status_delta import StatusDelta, StatusDiffer
 
 
 class ConnectionMode(Enum):
@@ -58,6 +81,10 @@ class DropCylinderManager:
     DEFAULT_PORT = DROP_CYLINDER_TCP_PORT
     DEFAULT_BAUDRATE = SERIAL_BAUD_DEFAULT
     POLL_INTERVAL = DROP_CYLINDER_POLL_INTERVAL_SEC
+    BINARY_STATUS = STATUS_BINARY_FRAMES
+    STREAM_RATE_HZ = STATUS_STREAM_RATE_HZ
+    STREAM_STALL_TIMEOUT = STATUS_STREAM_STALL_SEC
+    ACK_TAGS = DROP_CYLINDER_ACK_TAGS
 
     def __init__(self):
         # Connection mode and transports
@@ -74,21 +101,37 @@ class DropCylinderManager:
 
         # Threading
         self._read_thread: Optional[threading.Thread] = None
+        self._write_thread: Optional[threading.Thread] = None
         self._poll_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
 
-        # Command queue
-        self._command_queue: queue.Queue = queue.Queue()
+        # Command queue (superseded setpoints and repeated ? are merged)
+        self._command_queue = CoalescingCommandQueue(DropCylinderCommands.SETPOINT_PREFIXES)
 
         # Callbacks
         self._status_callback: Optional[Callable[[DropCylinderStatus], None]] = None
+        self._delta_callback: Optional[Callable[[StatusDelta], None]] = None
         self._connection_callback: Optional[Callable[[DropCylinderConnectionState, str], None]] = None
         self._error_callback: Optional[Callable[[str], None]] = None
 
         # Last status
         self._last_status: Optional[DropCylinderStatus] = None
         self._last_response_time: float = 0
+        self._status_differ = StatusDiffer()
+
+        # Binary status negotiation
+        self._binary_status_active = False
+        self._binary_status_errors = 0
+
+        # Status stream subscription (polling resumes while not streaming)
+        self._streaming = False
+        self.stream_stalls = 0
+        self._negotiated = False  # AK/SF/SU sent for this connection
+
+        # Command acknowledgement and round-trip latency
+        self.command_tracker = CommandTracker(status_confirms, command_kind,
+                                              DROP_CYLINDER_ACK_TIMEOUT_SEC)
 
     @property
     def state(self) -> DropCylinderConnectionState:
@@ -102,6 +145,14 @@ class DropCylinderManager:
     def is_connected(self) -> bool:
         return self._state == DropCylinderConnectionState.CONNECTED
 
+    @property
+    def binary_status_active(self) -> bool:
+        return self._binary_status_active
+
+    @property
+    def streaming(self) -> bool:
+        return self._streaming
+
     @property
     def last_status(self) -> Optional[DropCylinderStatus]:
         return self._last_status
@@ -109,6 +160,9 @@ class DropCylinderManager:
     def set_status_callback(self, callback: Callable[[DropCylinderStatus], None]) -> None:
         self._status_callback = callback
 
+    def set_delta_callback(self, callback: Callable[[StatusDelta], None]) -> None:
+        self._delta_callback = callback
+
     def set_connection_callback(self, callback: Callable[[DropCylinderConnectionState, str], None]) -> None:
         self._connection_callback = callback
 
@@ -150,14 +204,7 @@ class DropCylinderManager:
             self._socket.connect((ip_address, port))
             self._socket.settimeout(0.1)
 
-            # Start background threads
-            self._stop_event.clear()
-
-            self._read_thread = threading.Thread(target=self._read_loop, daemon=True)
-            self._read_thread.start()
-
-            self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
-            self._poll_thread.start()
+            self._start_threads()
 
             self._set_state(DropCylinderConnectionState.CONNECTED, f"Connected to {ip_address}")
             return True
@@ -193,14 +240,7 @@ class DropCylinderManager:
                 write_timeout=1.0
             )
 
-            # Start background threads
-            self._stop_event.clear()
-
-            self._read_thread = threading.Thread(target=self._read_loop, daemon=True)
-            self._read_thread.start()
-
-            self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
-            self._poll_thread.start()
+            self._start_threads()
 
             self._set_state(DropCylinderConnectionState.CONNECTED, f"Connected to {port}")
             return True
@@ -212,12 +252,37 @@ class DropCylinderManager:
                 self._error_callback(f"Serial connection failed: {e}")
             return False
 
+    def _start_threads(self) -> None:
+        """Start the reader, writer and poll threads for a new connection."""
+        self._stop_event.clear()
+        self._command_queue = CoalescingCommandQueue(DropCylinderCommands.SETPOINT_PREFIXES)
+
+        self._read_thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._read_thread.start()
+
+        self._write_thread = threading.Thread(
+            target=self._write_loop, args=(self._command_queue,), daemon=True)
+        self._write_thread.start()
+
+        self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self._poll_thread.start()
+
     def disconnect(self) -> None:
         """Disconnect from the ESP32 (works for both WiFi and serial)."""
+        # Signal threads to stop and wake any blocked read/queue wait
         self._stop_event.set()
+        self._command_queue.put(None)
+        serial_port = self._serial
+        if serial_port is not None:
+            try:
+                serial_port.cancel_read()
+            except (AttributeError, serial.SerialException):
+                pass
 
         if self._read_thread and self._read_thread.is_alive():
             self._read_thread.join(timeout=1.0)
+        if self._write_thread and self._write_thread.is_alive():
+            self._write_thread.join(timeout=1.0)
         if self._poll_thread and self._poll_thread.is_alive():
             self._poll_thread.join(timeout=1.0)
 
@@ -276,78 +341,130 @@ class DropCylinderManager:
 
             return False
 
+    def _send_tracked(self, command: str) -> bool:
+        """Send a queued command, timing it until it is acknowledged."""
+        if (command == DropCylinderCommands.STATUS
+                or command.startswith(DropCylinderCommands.UNTRACKED_PREFIXES)):
+            return self._send_command_direct(command)
+        return self._send_command_direct(self.command_tracker.sent(command))
+
+    def _write_loop(self, commands: CoalescingCommandQueue) -> None:
+        """
+        Background thread for sending queued commands.
+
+        Blocks on the queue, so a command goes out as soon as it is queued.
+
+        Args:
+            commands: Queue for this connection (each connect gets a new one)
+        """
+        while not self._stop_event.is_set():
+            command = commands.get()
+            if command is None:
+                break
+            self._send_tracked(command)
+
     def _read_loop(self) -> None:
         """Background thread for reading responses."""
-        buffer = ""
+        framer = LineFramer(frame_sync=BINARY_STATUS_SYNC, frame_length=BINARY_STATUS_LENGTH,
+                            frame_check=check_drop_cylinder_binary_status)
         disconnected_by_error = False
+        self._status_differ.reset()  # First status on a new link is sent in full
+        self._binary_status_active = False
+        self._binary_status_errors = 0
+        self._streaming = False
+        self._negotiated = False
+        self.command_tracker.clear()
+        self.command_tracker.tagging = False
 
         while not self._stop_event.is_set():
-            # Process queued commands
-            try:
-                while True:
-                    command = self._command_queue.get_nowait()
-                    self._send_command_direct(command)
-            except queue.Empty:
-                pass
-
-            # Read data based on connection mode
-            with self._lock:
-                if self._mode == ConnectionMode.WIFI:
-                    if not self._socket:
-                        break
-                    try:
-                        data = self._socket.recv(1024)
-                        if data:
-                            buffer += data.decode('ascii', errors='ignore')
-                        else:
-                            # Empty data means connection closed
-                            disconnected_by_error = True
-                            break
-                    except socket.timeout:
-                        pass
-                    except socket.error:
-                        disconnected_by_error = True
-                        break
-
-                elif self._mode == ConnectionMode.SERIAL:
-                    if not self._serial or not self._serial.is_open:
-                        break
-                    try:
-                        if self._serial.in_waiting > 0:
-                            data = self._serial.read(self._serial.in_waiting)
-                            if data:
-                                buffer += data.decode('ascii', errors='ignore')
-                    except serial.SerialException:
+            # Block until data arrives (or the read timeout expires). Reads
+            # don't take _lock, so the writer is never held up.
+            data = b""
+            if self._mode == ConnectionMode.WIFI:
+                sock = self._socket
+                if not sock:
+                    break
+                try:
+                    data = sock.recv(1024)
+                    if not data:
+                        # Empty data means connection closed
                         disconnected_by_error = True
                         break
+                except socket.timeout:
+                    pass
+                except (socket.error, ValueError):
+                    disconnected_by_error = True
+                    break
 
-                else:
-                    # No valid mode, exit loop
+            elif self._mode == ConnectionMode.SERIAL:
+                serial_port = self._serial
+                if not serial_port or not serial_port.is_open:
+                    break
+                # First byte blocks, then take whatever else is buffered
+                try:
+                    data = serial_port.read(1)
+                    if data:
+                        waiting = serial_port.in_waiting
+                        if waiting:
+                            data += serial_port.read(waiting)
+                except Exception as e:
+                    # SerialException, or a driver failing some other way:
+                    # the link is unusable either way
+                    if not isinstance(e, serial.SerialException):
+                        print(f"[DROP] Unexpected read error: {e!r}")
+                    disconnected_by_error = True
                     break
 
-            # Process complete lines
-            while '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
-                line = line.strip()
-                if line:
-                    self._process_response(line)
+            else:
+                # No valid mode, exit loop
+                break
 
-            time.sleep(0.01)
+            if not data:
+                continue
+
+            # Process complete lines
+            for line in framer.feed(data):
+                try:
+                    if line[0] == BINARY_STATUS_SYNC:
+                        self._process_binary_status(line)
+                    else:
+                        self._process_response(line.decode('ascii', errors='ignore'))
+                except Exception as e:
+                    # A bad line or a failing callback must not stop the reader
+                    print(f"[DROP] Error processing {line!r}: {e!r}")
 
         # If we exited due to error/disconnect (not user-initiated), notify
         if disconnected_by_error and not self._stop_event.is_set():
             self._handle_unexpected_disconnect()
 
     def _poll_loop(self) -> None:
-        """Background thread for status polling."""
+        """
+        Background thread for status polling (paused while a stream is running).
+
+        Polls go through the command queue, so a poll merges with one
+        still queued instead of piling up behind slow commands.
+        """
         while not self._stop_event.is_set():
             if self.is_connected:
-                self._send_command_direct("?")
+                poll = not self._streaming
+                if self._streaming and time.time() - self._last_response_time > self.STREAM_STALL_TIMEOUT:
+                    # Stream went quiet: poll until the resubscription is acked
+                    self._streaming = False
+                    self.stream_stalls += 1
+                    print("[DROP] Status stream stalled, polling and resubscribing")
+                    self._command_queue.put(DropCylinderCommands.subscribe_status(self.STREAM_RATE_HZ))
+                    poll = True
+                if poll:
+                    self._command_queue.put(DropCylinderCommands.STATUS)
+                for pending in self.command_tracker.expire():
+                    print(f"[DROP] No acknowledgement for {pending.command}")
             self._stop_event.wait(self.POLL_INTERVAL)
 
     def _handle_unexpected_disconnect(self) -> None:
         """Handle unexpected disconnection (e.g., WiFi lost or serial unplugged)."""
         mode = self._mode
+        self._stop_event.set()
+        self._command_queue.put(None)  # Release the writer
         with self._lock:
             if self._socket:
                 try:
@@ -374,17 +491,82 @@ class DropCylinderManager:
 
     def _process_response(self, response: str) -> None:
         """Process a response from the ESP32."""
+        if response == DropCylinderCommands.STATUS_BINARY_ACK:
+            self._binary_status_active = True
+            self._binary_status_errors = 0
+            return
+        if response == DropCylinderCommands.STATUS_ASCII_ACK:
+            self._binary_status_active = False
+            return
+        if response == DropCylinderCommands.ACK_TAGS_ACK:
+            self.command_tracker.tagging = True
+            return
+        if response.startswith(DropCylinderCommands.ACK_PREFIX):
+            try:
+                self.command_tracker.on_ack(int(response[len(DropCylinderCommands.ACK_PREFIX):]))
+            except ValueError:
+                pass
+            return
+        if response.startswith(DropCylinderCommands.STATUS_STREAM_ACK):
+            self._streaming = response != DropCylinderCommands.STATUS_STREAM_ACK + "0"
+            self._last_response_time = time.time()  # Stall timer starts now
+            return
+
         status = self._parse_status(response)
         if status:
-            self._last_status = status
-            self._last_response_time = time.time()
-            if self._status_callback:
-                self._status_callback(status)
+            self._handle_status(status)
+
+    def _process_binary_status(self, frame: bytes) -> None:
+        """Process a binary status frame, reverting to ASCII on repeated corruption."""
+        status = DropCylinderResponseParser.parse_binary_status(frame)
+        if status is None:
+            self._binary_status_errors += 1
+            if self._binary_status_errors == STATUS_BINARY_MAX_ERRORS:
+                print(f"[DROP] {self._binary_status_errors} corrupt status frames, "
+                      f"reverting to ASCII status")
+                self._binary_status_active = False
+                self._send_command_direct(DropCylinderCommands.STATUS_ASCII)
+            return
+
+        self._binary_status_errors = 0
+        self._handle_status(status)
+
+    def _handle_status(self, status: DropCylinderStatus) -> None:
+        """Record a parsed status and notify the status/delta callbacks."""
+        self._last_status = status
+        self._last_response_time = time.time()
+
+        # The first status shows the firmware is up (past any reset on open)
+        if not self._negotiated:
+            self._negotiated = True
+            if self.ACK_TAGS:
+                self._send_command_direct(DropCylinderCommands.ACK_TAGS)
+            if self.BINARY_STATUS:
+                self._send_command_direct(DropCylinderCommands.STATUS_BINARY)
+            if self.STREAM_RATE_HZ:
+                self._send_command_direct(DropCylinderCommands.subscribe_status(self.STREAM_RATE_HZ))
+
+        self.command_tracker.on_status(status)
+        if self._status_callback:
+            self._status_callback(status)
+        if self._delta_callback:
+            delta = self._status_differ.update(status)
+            if delta is not None:
+                self._delta_callback(delta)
 
     def _parse_status(self, response: str) -> Optional[DropCylinderStatus]:
         """Parse a status response using the protocol parser."""
         return DropCylinderResponseParser.parse_status(response)
 
+    def get_command_latency(self) -> Dict[str, LatencySummary]:
+        """Get command round-trip latency per command kind (e.g. "GS", "TR")."""
+        return self.command_tracker.latency()
+
+    def get_command_histogram(self, kind: str,
+                              edges_ms: Sequence[float] = HISTOGRAM_EDGES_MS) -> List[int]:
+        """Get command round-trip latency bucket counts for one command kind."""
+        return self.command_tracker.histogram(kind, edges_ms)
+
     # Convenience methods
 
     def jog_down(self) -> bool:
@@ -0,0 +1,165 @@
+"""
+Unit tests for async_stac5_client module.
+"""
+
+import asyncio
+import time
+import unittest
+
+from src.escl_protocol import ESCL_HEADER, ESCLFramer
+from src.async_stac5_client import AsyncSTAC5Client
+
+
+class AsyncScriptedDrive:
+    """Minimal asyncio eSCL server that answers from a dict."""
+
+    def __init__(self, replies=None, delays=None):
+        self.replies = {"EP": "EP=0", "IE": "IE=0", "SC": "SC=0001", "AL": "AL=0000"}
+        self.replies.update(replies or {})
+        self.delays = dict(delays or {})
+        self.received = []
+        self.received_times = []
+        self.port = None
+        self._server = None
+        self._writers = []
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader, writer):
+        self._writers.append(writer)
+        framer = ESCLFramer()
+        while True:
+            data = await reader.read(1024)
+            if not data:
+                break
+            for command in framer.feed(data):
+                command = command.decode('ascii')
+                self.received.append(command)
+                self.received_times.append(time.monotonic())
+                delay = self.delays.pop(command[:2], 0.0)
+                if delay:
+                    await asyncio.sleep(delay)
+                reply = self.replies.get(command[:2], "%")
+                writer.write(ESCL_HEADER + reply.encode('ascii') + b'\r')
+        writer.close()
+
+    def drop(self):
+        for writer in self._writers:
+            writer.close()
+
+    async def close(self):
+        self.drop()
+        self._server.close()
+        await self._server.wait_closed()
+
+
+class TestAsyncSTAC5Client(unittest.IsolatedAsyncioTestCase):
+    """Tests for the asyncio eSCL client."""
+
+    async def asyncSetUp(self):
+        self.drive = AsyncScriptedDrive({"EP": "EP=1200"})
+        await self.drive.start()
+        self.client = AsyncSTAC5Client("127.0.0.1", self.drive.port)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.drive.close()
+
+    async def test_connect_initializes_drive(self):
+        """Test that connect sends the init sequence and syncs SP."""
+        self.assertTrue(await self.client.connect())
+        self.assertTrue(self.client.is_connected())
+        self.assertEqual(self.drive.received, ["AC10.0", "DE10.0", "ME", "EP", "SP3000"])
+
+    async def test_concurrent_commands_matched_in_order(self):
+        """Test that concurrent coroutines get their own replies."""
+        await self.client.connect()
+
+        results = await asyncio.gather(
+            self.client.get_immediate_encoder(),
+            self.client.get_status_code(),
+            self.client.get_alarm_code(),
+        )
+
+        self.assertEqual(results, [0, "0001", "0000"])
+
+    async def test_poll_status(self):
+        """Test a batched status refresh."""
+        self.drive.replies["SC"] = "SC=0019"
+        await self.client.connect()
+
+        status = await self.client.poll_status(immediate=True)
+
+        self.assertEqual(self.drive.received[-3:], ["IE", "SC", "AL"])
+        self.assertTrue(status.is_moving)
+        self.assertTrue(status.motor_enabled)
+
+    async def test_jog_start_sequence(self):
+        """Test jog direction, speed and start are sent in order."""
+        await self.client.connect()
+
+        self.assertTrue(await self.client.jog_start(-1))
+        self.assertFalse(await self.client.jog_start(1))  # Already jogging
+
+        self.assertEqual(self.drive.received[-3:], ["DI-1", "JS2.0", "CJ"])
+
+    async def test_move_to_position(self):
+        """Test SP sync and FP in motor steps."""
+        await self.client.connect()
+
+        self.assertTrue(await self.client.move_to_position(2000))
+
+        self.assertEqual(self.drive.received[-4:], ["EP", "SP3000", "VE1.5", "FP5000"])
+        self.assertTrue(self.client.status.is_moving)
+
+    async def test_move_while_moving_waits_for_stop(self):
+        """Test that the position is read only after the stop has settled."""
+        await self.client.connect()
+        self.client.status.is_moving = True
+        sent = len(self.drive.received)
+
+        self.assertTrue(await self.client.move_to_position(2000))
+
+        self.assertEqual(self.drive.received[sent:], ["ST", "EP", "SP3000", "VE1.5", "FP5000"])
+        settle = self.drive.received_times[sent + 1] - self.drive.received_times[sent]
+        self.assertGreaterEqual(settle, 0.045)
+
+    async def test_already_at_target(self):
+        """Test that no move is sent when already at the target."""
+        await self.client.connect()
+        sent = len(self.drive.received)
+
+        self.assertTrue(await self.client.move_to_position(1200))
+
+        self.assertEqual(self.drive.received[sent:], ["EP"])
+
+    async def test_late_reply_not_misattributed(self):
+        """Test that a reply to a timed-out request is discarded."""
+        await self.client.connect()
+        self.drive.delays["EP"] = 0.2
+
+        self.assertIsNone(await self.client.send_command("EP", timeout=0.05))
+        self.assertEqual(await self.client.send_command("SC", timeout=1.0), "SC=0001")
+
+    async def test_connection_drop_fails_pending(self):
+        """Test that a dropped link fails requests and marks disconnected."""
+        await self.client.connect()
+        self.drive.delays["EP"] = 1.0
+
+        request = asyncio.ensure_future(self.client.send_command("EP", timeout=2.0))
+        await asyncio.sleep(0.05)
+        self.drive.drop()
+
+        self.assertIsNone(await request)
+        self.assertFalse(self.client.is_connected())
+
+    async def test_not_connected(self):
+        """Test commands fail cleanly before connect."""
+        self.assertIsNone(await self.client.send_command("EP"))
+        self.assertFalse(await self.client.stop())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Unit tests for the binary status frames of the winch and drop cylinder
+controllers (host-side encoders, decoders and ASCII fallback).
+"""
+
+import binascii
+import unittest
+from dataclasses import replace
+from unittest.mock import Mock
+
+from src.command_protocol import (
+    BINARY_STATUS_LENGTH,
+    Commands,
+    MotionMode,
+    ResponseParser,
+    check_binary_status,
+    encode_binary_status,
+)
+from src.drop_cylinder_protocol import (
+    BINARY_STATUS_LENGTH as DROP_BINARY_STATUS_LENGTH,
+    DropCylinderCommands,
+    DropCylinderResponseParser,
+    check_drop_cylinder_binary_status,
+    encode_drop_cylinder_binary_status,
+)
+from src.serial_manager import SerialManager
+from src.wifi_manager import DropCylinderManager
+from src.config import STATUS_BINARY_MAX_ERRORS
+
+
+WINCH_LINE = "POS:-12345 MODE:MOVE SPD:1.25 HOME:Y@0 WELL:Y@96000 ESTOP:1 VJOG:10.00 VMOVE:7.50"
+DROP_LINE = "POS:2500 MODE:JOG_DOWN START:Y@0 STOP:N TRIM:-12 WIFI:STA IP:192.168.1.10 SPEED:75"
+
+
+def corrupt(frame: bytes) -> bytes:
+    """Flip one payload bit."""
+    return frame[:4] + bytes([frame[4] ^ 0x01]) + frame[5:]
+
+
+class TestWinchBinaryStatus(unittest.TestCase):
+    """Tests for the winch status frame."""
+
+    def setUp(self):
+        self.status = ResponseParser.parse_status(WINCH_LINE)
+
+    def test_frame_size(self):
+        """Test that the frame is a fraction of the ASCII line."""
+        frame = encode_binary_status(self.status)
+
+        self.assertEqual(len(frame), BINARY_STATUS_LENGTH)
+        self.assertEqual(BINARY_STATUS_LENGTH, 24)
+        self.assertLess(len(frame), len(WINCH_LINE) // 3)
+
+    def test_round_trip_matches_ascii(self):
+        """Test that the decoded frame equals the parsed ASCII line."""
+        frame = encode_binary_status(self.status)
+
+        self.assertEqual(ResponseParser.parse_binary_status(frame), self.status)
+
+    def test_unsaved_positions(self):
+        """Test that unsaved home/well decode as None."""
+        status = replace(self.status, home_saved=False, home_position=None,
+                         well_saved=False, well_position=None, mode=MotionMode.IDLE)
+
+        decoded = ResponseParser.parse_binary_status(encode_binary_status(status))
+
+        self.assertIsNone(decoded.home_position)
+        self.assertIsNone(decoded.well_position)
+        self.assertEqual(decoded.mode, MotionMode.IDLE)
+
+    def test_unknown_mode(self):
+        """Test that an unrecognized mode byte decodes as UNKNOWN."""
+        status = replace(self.status, mode=MotionMode.UNKNOWN)
+
+        decoded = ResponseParser.parse_binary_status(encode_binary_status(status))
+
+        self.assertEqual(decoded.mode, MotionMode.UNKNOWN)
+
+    def test_rejects_bad_frames(self):
+        """Test CRC, sync, type and length checks."""
+        frame = encode_binary_status(self.status)
+
+        self.assertIsNone(ResponseParser.parse_binary_status(corrupt(frame)))
+        self.assertIsNone(ResponseParser.parse_binary_status(b"\x00" + frame[1:]))
+        self.assertIsNone(ResponseParser.parse_binary_status(frame[:1] + b"D" + frame[2:]))
+        self.assertIsNone(ResponseParser.parse_binary_status(frame[:-1]))
+
+    def test_frame_check(self):
+        """Test the framer check, which also rejects the other controller's frames."""
+        frame = encode_binary_status(self.status)
+        drop_frame = encode_drop_cylinder_binary_status(
+            DropCylinderResponseParser.parse_status(DROP_LINE))
+
+        self.assertTrue(check_binary_status(frame))
+        self.assertFalse(check_binary_status(corrupt(frame)))
+        self.assertFalse(check_binary_status(drop_frame))
+        self.assertTrue(check_drop_cylinder_binary_status(drop_frame))
+        self.assertFalse(check_drop_cylinder_binary_status(frame + b"\x00"))
+
+    def test_crc_known_value(self):
+        """Test the CRC against the CRC-16/CCITT check value."""
+        self.assertEqual(binascii.crc_hqx(b"123456789", 0xFFFF), 0x29B1)
+
+
+class TestDropCylinderBinaryStatus(unittest.TestCase):
+    """Tests for the drop cylinder status frame."""
+
+    def setUp(self):
+        self.status = DropCylinderResponseParser.parse_status(DROP_LINE)
+
+    def test_round_trip_matches_ascii(self):
+        """Test that the decoded frame equals the parsed ASCII line."""
+        frame = encode_drop_cylinder_binary_status(self.status)
+
+        self.assertEqual(len(frame), DROP_BINARY_STATUS_LENGTH)
+        self.assertEqual(DropCylinderResponseParser.parse_binary_status(frame), self.status)
+
+    def test_access_point_mode(self):
+        """Test the AP flag and the stop position."""
+        status = replace(self.status, wifi_mode="AP", ip_address="192.168.4.1",
+                         stop_saved=True, stop_position_ms=5000, mode="MOVE_STOP")
+
+        decoded = DropCylinderResponseParser.parse_binary_status(
+            encode_drop_cylinder_binary_status(status))
+
+        self.assertEqual(decoded, status)
+
+    def test_rejects_corrupt_frame(self):
+        """Test that a CRC mismatch is rejected."""
+        frame = encode_drop_cylinder_binary_status(self.status)
+
+        self.assertIsNone(DropCylinderResponseParser.parse_binary_status(corrupt(frame)))
+
+
+class TestSerialManagerBinaryStatus(unittest.TestCase):
+    """Tests for binary status handling in the winch serial manager."""
+
+    def setUp(self):
+        self.manager = SerialManager()
+        self.manager.send_command = Mock(return_value=True)
+        self.status_callback = Mock()
+        self.manager.set_status_callback(self.status_callback)
+        self.frame = encode_binary_status(ResponseParser.parse_status(WINCH_LINE))
+
+    def test_ack_activates(self):
+        """Test that the controller's ack switches the mode flag."""
+        self.manager._process_response(Commands.STATUS_BINARY_ACK)
+        self.assertTrue(self.manager.binary_status_active)
+
+        self.manager._process_response(Commands.STATUS_ASCII_ACK)
+        self.assertFalse(self.manager.binary_status_active)
+
+    def test_frame_delivered(self):
+        """Test that a good frame reaches the status callback."""
+        self.manager._process_binary_status(self.frame)
+
+        self.status_callback.assert_called_once()
+        self.assertEqual(self.manager.last_status.position, -12345)
+
+    def test_falls_back_to_ascii(self):
+        """Test that repeated corrupt frames request ASCII status once."""
+        self.manager._process_response(Commands.STATUS_BINARY_ACK)
+        for _ in range(STATUS_BINARY_MAX_ERRORS + 2):
+            self.manager._process_binary_status(corrupt(self.frame))
+
+        self.manager.send_command.assert_called_once_with(Commands.STATUS_ASCII)
+        self.assertFalse(self.manager.binary_status_active)
+        self.status_callback.assert_not_called()
+
+        # ASCII lines are still parsed
+        self.manager._process_response(WINCH_LINE)
+        self.status_callback.assert_called_once()
+
+    def test_good_frame_resets_error_count(self):
+        """Test that isolated corrupt frames do not trigger the fallback."""
+        for _ in range(5):
+            self.manager._process_binary_status(corrupt(self.frame))
+            self.manager._process_binary_status(self.frame)
+
+        self.manager.send_command.assert_not_called()
+
+
+class TestDropCylinderManagerBinaryStatus(unittest.TestCase):
+    """Tests for binary status handling in the drop cylinder manager."""
+
+    def setUp(self):
+        self.manager = DropCylinderManager()
+        self.manager._send_command_direct = Mock(return_value=True)
+        self.frame = encode_drop_cylinder_binary_status(
+            DropCylinderResponseParser.parse_status(DROP_LINE))
+
+    def test_frame_delivered(self):
+        """Test that a good frame updates the last status."""
+        self.manager._process_response(DropCylinderCommands.STATUS_BINARY_ACK)
+        self.manager._process_binary_status(self.frame)
+
+        self.assertTrue(self.manager.binary_status_active)
+        self.assertEqual(self.manager.last_status.position_ms, 2500)
+
+    def test_falls_back_to_ascii(self):
+        """Test that repeated corrupt frames request ASCII status."""
+        for _ in range(STATUS_BINARY_MAX_ERRORS):
+            self.manager._process_binary_status(corrupt(self.frame))
+
+        self.manager._send_command_direct.assert_called_once_with(
+            DropCylinderCommands.STATUS_ASCII)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Unit tests for concurrent camera discovery.
+"""
+
+import socket
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.camera_manager import CameraDiscovery
+
+CAMERA_PAGE = b'<html><body><img src="http://127.0.0.5:81/stream" id="stream"></body></html>'
+CAMERA_RESPONSE = (b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+                   b"Content-Length: %d\r\n\r\n%s" % (len(CAMERA_PAGE), CAMERA_PAGE))
+HTML_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nContent-Length: 2\r\n\r\nhi"
+NOT_FOUND_RESPONSE = (b"HTTP/1.1 404 Not Found\r\nContent-Type: text/html\r\n"
+                      b"Content-Length: %d\r\n\r\n%s" % (len(CAMERA_PAGE), CAMERA_PAGE))
+
+
+class FakeHttpServer:
+    """Answers every connection with a fixed response."""
+
+    def __init__(self, host, port, response):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen(8)
+        self.port = self._server.getsockname()[1]
+        self._response = response
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            with client:
+                client.recv(1024)
+                client.sendall(self._response)
+
+    def close(self):
+        self._server.close()
+
+
+class TestCameraDiscovery(unittest.TestCase):
+    """Tests for CameraDiscovery against fake servers on 127.0.0.0/24."""
+
+    def setUp(self):
+        CameraDiscovery.clear_cache()
+        self.camera = FakeHttpServer("127.0.0.5", 0, CAMERA_RESPONSE)
+        self.port = self.camera.port
+        try:
+            self.other = FakeHttpServer("127.0.0.7", self.port, HTML_RESPONSE)
+        except OSError:
+            self.camera.close()
+            self.skipTest("127.0.0.7 not usable as a loopback address")
+
+    def tearDown(self):
+        self.camera.close()
+        self.other.close()
+        CameraDiscovery.clear_cache()
+
+    def scan(self, **kwargs):
+        found, progress = [], []
+        done = threading.Event()
+        thread = CameraDiscovery.scan_subnet(
+            "127.0.0.1", found.append, done.set, progress.append,
+            port=self.port, timeout=0.5, **kwargs)
+        self.assertTrue(done.wait(5.0))
+        thread.join(1.0)
+        return found, progress
+
+    def test_check_camera(self):
+        """Test that only the camera index page counts as a camera."""
+        self.assertTrue(CameraDiscovery.check_camera("127.0.0.5", 0.5, self.port))
+        self.assertFalse(CameraDiscovery.check_camera("127.0.0.7", 0.5, self.port))
+        self.assertFalse(CameraDiscovery.check_camera("127.0.0.9", 0.5, self.port))
+
+    def test_check_camera_error_status(self):
+        """Test that an error page mentioning the stream is not a camera."""
+        server = FakeHttpServer("127.0.0.8", self.port, NOT_FOUND_RESPONSE)
+        try:
+            self.assertFalse(CameraDiscovery.check_camera("127.0.0.8", 0.5, self.port))
+        finally:
+            server.close()
+
+    def test_check_camera_requests_index(self):
+        """Test that the probe asks the control server for / and not the stream."""
+        requests = []
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.6", 0))
+        server.listen(1)
+
+        def serve():
+            client, _ = server.accept()
+            with client:
+                requests.append(client.recv(1024))
+                client.sendall(CAMERA_RESPONSE)
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        try:
+            self.assertTrue(CameraDiscovery.check_camera("127.0.0.6", 0.5, server.getsockname()[1]))
+            thread.join(1.0)
+        finally:
+            server.close()
+        self.assertTrue(requests[0].startswith(b"GET / HTTP/1.1\r\n"))
+
+    def test_scan_finds_camera(self):
+        """Test a concurrent scan of the subnet with progress reporting."""
+        start = time.monotonic()
+        found, progress = self.scan()
+
+        self.assertEqual(found, ["127.0.0.5"])
+        self.assertEqual(sorted(progress), list(range(1, 255)))
+        self.assertLess(time.monotonic() - start, 3.0)
+
+    def test_results_cached(self):
+        """Test that a second scan within the TTL probes nothing."""
+        self.scan()
+
+        with patch.object(CameraDiscovery, "check_camera") as check:
+            found, progress = self.scan()
+
+        check.assert_not_called()
+        self.assertEqual(found, ["127.0.0.5"])
+        self.assertEqual(progress, [254])
+        self.assertEqual(CameraDiscovery.cached_cameras("127.0.0.200"), ["127.0.0.5"])
+
+    def test_expired_cache_rescans(self):
+        """Test that max_age=0 forces a new scan."""
+        self.scan()
+
+        with patch.object(CameraDiscovery, "check_camera", return_value=False) as check:
+            found, _ = self.scan(max_age=0)
+
+        self.assertEqual(check.call_count, 254)
+        self.assertEqual(found, [])
+        self.assertIsNone(CameraDiscovery.cached_cameras("127.0.0.1", max_age=-1))
+
+    def test_empty_result_not_cached(self):
+        """Test that a scan finding nothing does not hide a camera found later."""
+        with patch.object(CameraDiscovery, "check_camera", return_value=False):
+            found, _ = self.scan()
+        self.assertEqual(found, [])
+        self.assertIsNone(CameraDiscovery.cached_cameras("127.0.0.1"))
+
+        found, _ = self.scan()
+        self.assertEqual(found, ["127.0.0.5"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Unit tests for the camera panel module.
+"""
+
+import importlib
+import importlib.util
+import sys
+import unittest
+from unittest.mock import patch
+
+SERIAL_AVAILABLE = importlib.util.find_spec("serial") is not None
+
+
+@unittest.skipUnless(SERIAL_AVAILABLE, "requires pyserial (imported by the src.gui package)")
+class TestCameraPanelImport(unittest.TestCase):
+    """Tests for importing the camera panel without optional dependencies."""
+
+    def test_import_without_pillow(self):
+        """Test that the module imports and reports PIL_AVAILABLE = False."""
+        blocked = {name: None for name in ("PIL", "PIL.Image", "PIL.ImageTk")}
+        with patch.dict(sys.modules, blocked):
+            for name in ("src.gui.camera_panel", "src.frame_decoder"):
+                sys.modules.pop(name, None)
+            module = importlib.import_module("src.gui.camera_panel")
+
+        self.assertFalse(module.PIL_AVAILABLE)
+        self.assertTrue(hasattr(module, "CameraPanel"))
+        self.assertTrue(hasattr(module, "TapoCameraPanel"))
+
+
+if __name__ == '__main__':
+    unittest.main()
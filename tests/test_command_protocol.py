@@ -2,6 +2,7 @@
 Unit tests for command_protocol module.
 """
 
+import dataclasses
 import unittest
 from src.command_protocol import (
     Commands,
@@ -138,6 +139,59 @@ class TestResponseParser(unittest.TestCase):
         self.assertEqual(status.position_revolutions, 0.5)
 
 
+class TestResponseParserCache(unittest.TestCase):
+    """Tests for the status parse cache."""
+
+    IDLE = "POS:500 MODE:IDLE SPD:0.00 HOME:Y@0 WELL:N ESTOP:0"
+
+    def setUp(self):
+        ResponseParser.cache_clear()
+
+    def test_repeated_line_shares_status(self):
+        """Test that an identical line returns the cached status object."""
+        first = ResponseParser.parse_status(self.IDLE)
+        second = ResponseParser.parse_status(self.IDLE)
+
+        self.assertIs(first, second)
+        info = ResponseParser.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertAlmostEqual(ResponseParser.cache_hit_rate(), 0.5)
+
+    def test_changed_line_parsed_fresh(self):
+        """Test that a different line is parsed, not served from cache."""
+        first = ResponseParser.parse_status(self.IDLE)
+        moved = ResponseParser.parse_status(self.IDLE.replace("POS:500", "POS:501"))
+
+        self.assertEqual(first.position, 500)
+        self.assertEqual(moved.position, 501)
+
+    def test_non_status_lines_not_cached(self):
+        """Test that acknowledgements do not occupy cache entries."""
+        self.assertIsNone(ResponseParser.parse_status("OK"))
+        self.assertEqual(ResponseParser.cache_info().currsize, 0)
+
+    def test_cached_status_is_immutable(self):
+        """Test that shared status objects cannot be modified."""
+        status = ResponseParser.parse_status(self.IDLE)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            status.position = 0
+
+    def test_raw_response_optional(self):
+        """Test that the raw line is kept only when enabled."""
+        self.assertIsNone(ResponseParser.parse_status(self.IDLE).raw_response)
+
+        ResponseParser.set_keep_raw_response(True)
+        try:
+            self.assertEqual(ResponseParser.parse_status(self.IDLE).raw_response, self.IDLE)
+        finally:
+            ResponseParser.set_keep_raw_response(False)
+
+    def test_empty_hit_rate(self):
+        """Test the hit rate before any lookups."""
+        self.assertEqual(ResponseParser.cache_hit_rate(), 0.0)
+
+
 class TestFormatCommand(unittest.TestCase):
     """Tests for command formatting."""
 
@@ -211,7 +265,7 @@ class TestWinchStatus(unittest.TestCase):
         self.assertFalse(status.well_saved)
         self.assertIsNone(status.well_position)
         self.assertFalse(status.estop_active)
-        self.assertEqual(status.raw_response, "")
+        self.assertIsNone(status.raw_response)
 
 
 class TestMotionMode(unittest.TestCase):
@@ -0,0 +1,94 @@
+"""
+Unit tests for command_queue module.
+"""
+
+import queue
+import threading
+import unittest
+
+from src.command_protocol import Commands
+from src.command_queue import CoalescingCommandQueue
+from src.drop_cylinder_protocol import DropCylinderCommands
+
+
+class TestCoalescingCommandQueue(unittest.TestCase):
+    """Tests for setpoint coalescing and ordering."""
+
+    def setUp(self):
+        self.queue = CoalescingCommandQueue(DropCylinderCommands.SETPOINT_PREFIXES)
+
+    def drain(self):
+        commands = []
+        while True:
+            try:
+                commands.append(self.queue.get_nowait())
+            except queue.Empty:
+                return commands
+
+    def test_setpoints_collapse_to_latest(self):
+        """Test that a slider drag leaves only the final value queued."""
+        for percent in range(10, 101, 5):
+            self.queue.put(DropCylinderCommands.set_speed(percent))
+
+        self.assertEqual(self.drain(), ["VS100"])
+        self.assertEqual(self.queue.coalesced, 18)
+
+    def test_kinds_are_independent(self):
+        """Test that different setpoints do not replace each other."""
+        for command in ("VS20", "TR5", "VS30", "TR-5"):
+            self.queue.put(command)
+
+        self.assertEqual(self.drain(), ["VS30", "TR-5"])
+
+    def test_status_requests_merge(self):
+        """Test that duplicate ? requests are sent once."""
+        for _ in range(3):
+            self.queue.put("?")
+
+        self.assertEqual(self.drain(), ["?"])
+
+    def test_motion_commands_never_merge(self):
+        """Test that repeated motion commands are all kept in order."""
+        for command in ("JD", "JS", "JD", "JS", "ST"):
+            self.queue.put(command)
+
+        self.assertEqual(self.drain(), ["JD", "JS", "JD", "JS", "ST"])
+
+    def test_no_merge_across_barrier(self):
+        """Test that a setpoint is not moved ahead of a later motion command."""
+        for command in ("VS20", "VS25", "JD", "VS30", "ST", "VS40", "VS50"):
+            self.queue.put(command)
+
+        self.assertEqual(self.drain(), ["VS25", "JD", "VS30", "ST", "VS50"])
+
+    def test_sentinel_is_barrier(self):
+        """Test that the None sentinel is queued and blocks merging."""
+        self.queue.put("VS20")
+        self.queue.put(None)
+        self.queue.put("VS30")
+
+        self.assertEqual(self.drain(), ["VS20", None, "VS30"])
+
+    def test_blocking_get(self):
+        """Test that get() wakes when a command is queued from another thread."""
+        threading.Timer(0.05, self.queue.put, args=("ST",)).start()
+
+        self.assertEqual(self.queue.get(timeout=1.0), "ST")
+        with self.assertRaises(queue.Empty):
+            self.queue.get(timeout=0.01)
+
+    def test_winch_setpoints(self):
+        """Test the winch jog/move speed prefixes."""
+        winch_queue = CoalescingCommandQueue(Commands.SETPOINT_PREFIXES)
+        for rps in (1.0, 2.0, 3.0):
+            winch_queue.put(Commands.set_jog_speed(rps))
+            winch_queue.put(Commands.set_move_speed(rps))
+
+        self.assertEqual(winch_queue.qsize(), 2)
+        self.assertEqual(winch_queue.get(), "VJ3.00")
+        self.assertEqual(winch_queue.get(), "VM3.00")
+        self.assertTrue(winch_queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
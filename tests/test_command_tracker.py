@@ -0,0 +1,213 @@
+"""
+Unit tests for drop cylinder command acknowledgement tracking.
+"""
+
+import time
+import unittest
+
+from src.command_tracker import CommandTracker
+from src.drop_cylinder_protocol import DropCylinderStatus, command_kind, status_confirms
+from src.wifi_manager import DropCylinderManager
+from simulator import DropCylinderSimulator
+
+
+def wait_for(predicate, timeout=2.0):
+    """Poll predicate until true or timeout; return its final value."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestStatusConfirms(unittest.TestCase):
+    """Tests for the command kinds and status confirmation predicates."""
+
+    def test_command_kind(self):
+        """Test stripping command arguments."""
+        self.assertEqual(command_kind("GS"), "GS")
+        self.assertEqual(command_kind("TR-5"), "TR")
+        self.assertEqual(command_kind("VS50"), "VS")
+        self.assertEqual(command_kind("ZERO"), "ZERO")
+        self.assertEqual(command_kind("WIFI:net:pass"), "WIFI")
+        self.assertEqual(command_kind("?"), "?")
+
+    def test_mode_commands(self):
+        """Test that motion commands are confirmed by the mode."""
+        jogging = DropCylinderStatus(mode="JOG_DOWN")
+        self.assertTrue(status_confirms("JD", jogging))
+        self.assertFalse(status_confirms("JU", jogging))
+        self.assertFalse(status_confirms("JS", jogging))
+        self.assertTrue(status_confirms("ST", DropCylinderStatus(mode="IDLE")))
+
+    def test_setpoint_commands(self):
+        """Test that setpoints are confirmed by the reported value."""
+        status = DropCylinderStatus(trim_us=-5, speed_percent=80)
+        self.assertTrue(status_confirms("TR-5", status))
+        self.assertFalse(status_confirms("TR5", status))
+        self.assertTrue(status_confirms("VS80", status))
+
+    def test_move_confirmed_on_arrival(self):
+        """Test that a move is confirmed once the position is reached."""
+        arrived = DropCylinderStatus(position_ms=0, start_saved=True, start_position_ms=0)
+        self.assertTrue(status_confirms("GS", arrived))
+
+    def test_invisible_command(self):
+        """Test that commands without a status effect are not judged."""
+        self.assertIsNone(status_confirms("WIFI_CLEAR", DropCylinderStatus()))
+
+
+class TestCommandTracker(unittest.TestCase):
+    """Tests for CommandTracker."""
+
+    def setUp(self):
+        self.tracker = CommandTracker(status_confirms, command_kind, timeout=1.0)
+
+    def test_untagged_by_default(self):
+        """Test that commands go out unchanged while tagging is off."""
+        self.assertEqual(self.tracker.sent("GS"), "GS")
+        self.assertEqual(self.tracker.pending, 1)
+
+    def test_tagged_ack(self):
+        """Test closing a tagged command and its recorded latency."""
+        self.tracker.tagging = True
+        wire = self.tracker.sent("TR10", now=10.0)
+        seq = int(wire.rpartition("#")[2])
+
+        self.assertTrue(self.tracker.on_ack(seq, now=10.05))
+
+        self.assertFalse(self.tracker.on_ack(seq, now=10.06))
+        self.assertEqual(self.tracker.pending, 0)
+        self.assertEqual(self.tracker.acked, 1)
+        self.assertAlmostEqual(self.tracker.latency()["TR"].worst_ms, 50.0)
+
+    def test_status_confirmation(self):
+        """Test closing only the commands the status reflects."""
+        self.tracker.sent("JD", now=1.0)
+        self.tracker.sent("VS80", now=1.0)
+
+        self.tracker.on_status(DropCylinderStatus(mode="JOG_DOWN", speed_percent=50), now=1.2)
+
+        self.assertEqual(self.tracker.confirmed, 1)
+        self.assertEqual(self.tracker.pending, 1)
+        self.assertEqual(self.tracker.histogram("JD", (100, 500)), [0, 1, 0])
+
+    def test_invisible_command_dropped(self):
+        """Test that an unconfirmable command is dropped untimed."""
+        self.tracker.sent("WIFI_CLEAR")
+        self.tracker.on_status(DropCylinderStatus())
+
+        self.assertEqual(self.tracker.pending, 0)
+        self.assertEqual(self.tracker.latency(), {})
+
+    def test_expire(self):
+        """Test giving up on commands past the timeout."""
+        self.tracker.sent("GS", now=0.0)
+        self.tracker.sent("GP", now=0.5)
+
+        expired = self.tracker.expire(now=1.2)
+
+        self.assertEqual([pending.command for pending in expired], ["GS"])
+        self.assertEqual(self.tracker.timeouts, 1)
+        self.assertEqual(self.tracker.pending, 1)
+
+    def test_histogram_unknown_kind(self):
+        """Test that an untimed kind has empty buckets."""
+        self.assertEqual(self.tracker.histogram("GS", (10,)), [0, 0])
+
+
+class TestManagerTracking(unittest.TestCase):
+    """Tests for DropCylinderManager tracking against the TCP simulator."""
+
+    def start(self, ack_tags, legacy=False, latency=0.0):
+        self.simulator = DropCylinderSimulator(
+            DropCylinderStatus(start_saved=True, start_position_ms=2000, position_ms=4000,
+                               ip_address="192.168.4.1"),
+            legacy=legacy, latency=latency)
+        self.simulator.start()
+        self.manager = DropCylinderManager()
+        self.manager.POLL_INTERVAL = 0.05
+        self.manager.ACK_TAGS = ack_tags
+        self.assertTrue(self.manager.connect_wifi(self.simulator.host, self.simulator.port))
+
+    def tearDown(self):
+        self.manager.disconnect()
+        self.simulator.stop()
+
+    def test_tagged_round_trip(self):
+        """Test that tagged commands are acked and timed per kind."""
+        self.start(ack_tags=True, latency=0.02)
+        self.assertTrue(wait_for(lambda: self.manager.command_tracker.tagging))
+
+        self.manager.set_trim(5)
+        self.manager.go_start()
+        tracker = self.manager.command_tracker
+        self.assertTrue(wait_for(lambda: tracker.acked == 2))
+
+        self.assertEqual(self.simulator.status.trim_us, 5)
+        latency = self.manager.get_command_latency()
+        self.assertEqual(set(latency), {"TR", "GS"})
+        self.assertGreaterEqual(latency["GS"].worst_ms, 20.0)
+        self.assertEqual(sum(self.manager.get_command_histogram("GS")), 1)
+
+    def test_status_confirmed_on_legacy_firmware(self):
+        """Test falling back to status confirmation when AK1 is ignored."""
+        self.start(ack_tags=True, legacy=True)
+
+        self.manager.jog_down()
+        tracker = self.manager.command_tracker
+        self.assertTrue(wait_for(lambda: tracker.confirmed == 1))
+
+        self.assertFalse(tracker.tagging)
+        self.assertIn("JD", self.simulator.commands)
+        self.assertEqual(sum(self.manager.get_command_histogram("JD")), 1)
+
+    def test_unconfirmed_command_times_out(self):
+        """Test that a command the status never reflects is given up."""
+        self.start(ack_tags=False)
+        self.manager.command_tracker.timeout = 0.2
+
+        self.manager.go_stop_position()  # No stop position saved: ignored
+        tracker = self.manager.command_tracker
+        self.assertTrue(wait_for(lambda: tracker.timeouts == 1))
+        self.assertEqual(tracker.pending, 0)
+
+    def test_negotiation_after_first_status(self):
+        """Test that AK1 is only sent once the controller has answered."""
+        self.start(ack_tags=True)
+        self.assertTrue(wait_for(lambda: self.manager.command_tracker.tagging))
+
+        commands = self.simulator.commands
+        self.assertEqual(commands.count("AK1"), 1)
+        self.assertLess(commands.index("?"), commands.index("AK1"))
+
+    def test_callback_error_keeps_reader_running(self):
+        """Test that a failing status callback does not stop the reader."""
+        calls = []
+
+        def failing_callback(status):
+            calls.append(status)
+            raise RuntimeError("callback failed")
+
+        self.start(ack_tags=True)
+        self.manager.set_status_callback(failing_callback)
+
+        self.assertTrue(wait_for(lambda: len(calls) >= 3))
+        self.manager.set_trim(5)
+        self.assertTrue(wait_for(lambda: self.manager.command_tracker.acked == 1))
+
+
+    def test_connection_lost_stops_writer(self):
+        """Test that the writer and poll threads end when the link drops."""
+        self.start(ack_tags=False)
+        self.assertTrue(wait_for(lambda: self.manager.last_status is not None))
+        self.assertTrue(self.manager._write_thread.is_alive())
+
+        self.simulator.stop()
+
+        self.assertTrue(wait_for(lambda: not self.manager.is_connected))
+        self.assertTrue(wait_for(lambda: not self.manager._write_thread.is_alive()))
+        self.assertTrue(wait_for(lambda: not self.manager._poll_thread.is_alive()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,437 @@
+"""
+Unit tests for escl_protocol and escl_transport modules.
+"""
+
+import socket
+import threading
+import time
+import unittest
+
+from src.escl_protocol import (
+    ESCL_HEADER,
+    ESCLFramer,
+    build_packet,
+    parse_response,
+)
+from src.escl_transport import (
+    ESCLTransport,
+    ESCLUdpTransport,
+    PRIORITY_SAFETY,
+    PRIORITY_POLL,
+)
+
+
+def escl_reply(text: str) -> bytes:
+    """Build a drive response frame."""
+    return ESCL_HEADER + text.encode('ascii') + b'\r'
+
+
+class TestESCLPackets(unittest.TestCase):
+    """Tests for packet building and response decoding."""
+
+    def test_build_packet(self):
+        """Test packet format for a simple command."""
+        self.assertEqual(build_packet("ME"), bytes([0x00, 0x07, 0x4D, 0x45, 0x0D]))
+
+    def test_parse_response_with_header(self):
+        """Test decoding a response with the eSCL header."""
+        self.assertEqual(parse_response(ESCL_HEADER + b"EP=123"), "EP=123")
+
+    def test_parse_response_without_header(self):
+        """Test decoding a header-less response."""
+        self.assertEqual(parse_response(b"%"), "%")
+
+    def test_parse_empty_response(self):
+        """Test decoding an empty response."""
+        self.assertIsNone(parse_response(b""))
+
+
+class TestESCLFramer(unittest.TestCase):
+    """Tests for response framing."""
+
+    def setUp(self):
+        self.framer = ESCLFramer()
+
+    def test_single_frame(self):
+        """Test a complete frame in one read."""
+        self.assertEqual(self.framer.feed(escl_reply("SC=0009")), [b"SC=0009"])
+
+    def test_multiple_frames(self):
+        """Test several frames in one read."""
+        data = escl_reply("IE=100") + escl_reply("SC=0019") + escl_reply("AL=0000")
+        self.assertEqual(self.framer.feed(data), [b"IE=100", b"SC=0019", b"AL=0000"])
+
+    def test_split_frame(self):
+        """Test a frame split across reads, including inside the header."""
+        data = escl_reply("EP=-42")
+        self.assertEqual(self.framer.feed(data[:1]), [])
+        self.assertEqual(self.framer.feed(data[1:4]), [])
+        self.assertEqual(self.framer.feed(data[4:]), [b"EP=-42"])
+
+    def test_headerless_frame(self):
+        """Test a response without the eSCL header."""
+        self.assertEqual(self.framer.feed(b"%\r"), [b"%"])
+
+    def test_oversized_garbage_discarded(self):
+        """Test that an unterminated run of bytes does not grow forever."""
+        self.framer.feed(b"x" * 1000)
+        self.assertEqual(self.framer.feed(escl_reply("%")), [b"%"])
+
+
+class FakeDrive:
+    """Scripted drive on the far end of a socketpair."""
+
+    def __init__(self, sock: socket.socket, responder):
+        self._sock = sock
+        self._responder = responder
+        self._framer = ESCLFramer()
+        self.received = []
+        self.reads = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                data = self._sock.recv(1024)
+            except OSError:
+                return
+            if not data:
+                return
+            self.reads += 1
+            for command in self._framer.feed(data):
+                command = command.decode('ascii')
+                self.received.append(command)
+                reply = self._responder(command)
+                if reply is not None:
+                    try:
+                        self._sock.sendall(escl_reply(reply))
+                    except OSError:
+                        return
+
+
+class TestESCLTransport(unittest.TestCase):
+    """Tests for the pipelined transport."""
+
+    def setUp(self):
+        self.host_sock, self.drive_sock = socket.socketpair()
+        self.closed_reasons = []
+        self.transport = ESCLTransport(self.host_sock, on_closed=self.closed_reasons.append)
+
+    def tearDown(self):
+        self.transport.close()
+        self.host_sock.close()
+        self.drive_sock.close()
+
+    def test_request_response(self):
+        """Test a single request."""
+        FakeDrive(self.drive_sock, lambda cmd: f"{cmd}=123")
+        self.transport.start()
+
+        self.assertEqual(self.transport.request("EP"), b"EP=123")
+
+    def test_pipelined_fifo_matching(self):
+        """Test that several in-flight requests are matched in order."""
+        FakeDrive(self.drive_sock, lambda cmd: f"{cmd}=1")
+        self.transport.start()
+
+        requests = self.transport.submit_many(["IE", "SC", "AL"])
+        responses = [r.wait(1.0) for r in requests]
+
+        self.assertEqual(responses, [b"IE=1", b"SC=1", b"AL=1"])
+        for request in requests:
+            self.assertIsNotNone(request.round_trip)
+
+    def test_submit_many_single_write(self):
+        """Test that a batch is written in one send."""
+        drive = FakeDrive(self.drive_sock, lambda cmd: "%")
+        self.transport.start()
+
+        requests = self.transport.submit_many(["VE1.5", "DI100", "FL"])
+        for request in requests:
+            request.wait(1.0)
+
+        self.assertEqual(drive.received, ["VE1.5", "DI100", "FL"])
+        self.assertEqual(drive.reads, 1)
+
+    def test_safety_jumps_queued_polls(self):
+        """Test that a stop queued behind polls is written first."""
+        drive = FakeDrive(self.drive_sock, lambda cmd: "%")
+        self.transport.start()
+
+        # Hold the wire so everything below queues up
+        with self.transport._write_lock:
+            polls = self.transport.submit_many(["IE", "SC", "AL"], PRIORITY_POLL)
+            stop_thread = threading.Thread(
+                target=lambda: self.transport.submit("SK", PRIORITY_SAFETY))
+            stop_thread.start()
+            while len(self.transport._outbox) < 2:
+                time.sleep(0.001)
+
+        stop_thread.join(1.0)
+        for request in polls:
+            request.wait(1.0)
+
+        self.assertEqual(drive.received, ["SK", "IE", "SC", "AL"])
+
+    def test_safety_keeps_order_with_queued_motion(self):
+        """Test that a jog stop is written after a jog start queued before it."""
+        drive = FakeDrive(self.drive_sock, lambda cmd: "%")
+        self.transport.start()
+
+        with self.transport._write_lock:
+            polls = self.transport.submit_many(["IE", "SC", "AL"], PRIORITY_POLL)
+            jog = self.transport.submit_many(["DI1", "JS2.0", "CJ"])
+            stop_thread = threading.Thread(
+                target=lambda: self.transport.submit("SJ", PRIORITY_SAFETY))
+            stop_thread.start()
+            while len(self.transport._outbox) < 3:
+                time.sleep(0.001)
+
+        stop_thread.join(1.0)
+        for request in jog + polls:
+            request.wait(1.0)
+
+        self.assertEqual(drive.received, ["DI1", "JS2.0", "CJ", "SJ", "IE", "SC", "AL"])
+
+    def test_queue_delay_recorded(self):
+        """Test that queue delay and round trip are measured."""
+        FakeDrive(self.drive_sock, lambda cmd: "%")
+        self.transport.start()
+
+        request = self.transport.submit("ST", PRIORITY_SAFETY)
+        request.wait(1.0)
+
+        self.assertGreaterEqual(request.queue_delay, 0.0)
+        self.assertGreaterEqual(request.round_trip, 0.0)
+
+    def test_late_reply_not_misattributed(self):
+        """Test that a reply to a timed-out request is discarded."""
+        delay = {"EP": 0.2}
+
+        def responder(cmd):
+            time.sleep(delay.pop(cmd, 0.0))
+            return f"{cmd}=7"
+
+        FakeDrive(self.drive_sock, responder)
+        self.transport.start()
+
+        self.assertIsNone(self.transport.request("EP", timeout=0.05))
+        self.assertEqual(self.transport.request("SC", timeout=1.0), b"SC=7")
+
+    def test_connection_drop_fails_pending(self):
+        """Test that outstanding requests fail when the drive disconnects."""
+        self.transport.start()
+        request = self.transport.submit("EP")
+
+        self.drive_sock.close()
+
+        self.assertIsNone(request.wait(2.0))
+        self.assertTrue(request.done)
+        self.assertFalse(self.transport.is_open)
+        self.assertEqual(len(self.closed_reasons), 1)
+
+    def test_submit_after_close(self):
+        """Test that requests on a closed transport complete immediately."""
+        self.transport.start()
+        self.transport.close()
+
+        request = self.transport.submit("EP")
+
+        self.assertTrue(request.done)
+        self.assertIsNone(request.response)
+
+
+class FakeUdpDrive:
+    """Scripted drive on a localhost UDP socket.
+
+    The responder returns a reply string, a list of (delay, reply) pairs,
+    or None to drop the request.
+    """
+
+    def __init__(self, responder):
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self.address = self._sock.getsockname()
+        self._responder = responder
+        self.received = []
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        framer = ESCLFramer()
+        while True:
+            try:
+                data, peer = self._sock.recvfrom(1024)
+            except OSError:
+                return
+            for command in framer.feed(data):
+                command = command.decode('ascii')
+                self.received.append(command)
+                replies = self._responder(command)
+                if replies is None:
+                    continue
+                if isinstance(replies, str):
+                    replies = [(0.0, replies)]
+                for delay, reply in replies:
+                    threading.Timer(delay, self._send, args=(reply, peer)).start()
+            framer.reset()
+
+    def _send(self, reply, peer):
+        try:
+            self._sock.sendto(escl_reply(reply), peer)
+        except OSError:
+            pass
+
+    def close(self):
+        self._sock.close()
+
+
+class TestESCLUdpTransport(unittest.TestCase):
+    """Tests for the UDP transport."""
+
+    def start(self, responder, retry_interval=0.05, max_retries=3):
+        self.drive = FakeUdpDrive(responder)
+        self.host_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.host_sock.connect(self.drive.address)
+        self.transport = ESCLUdpTransport(
+            self.host_sock, retry_interval=retry_interval, max_retries=max_retries)
+        self.transport.start()
+
+    def tearDown(self):
+        self.transport.close()
+        self.host_sock.close()
+        self.drive.close()
+
+    def test_query_response(self):
+        """Test a single query."""
+        self.start(lambda cmd: f"{cmd}=123")
+
+        self.assertEqual(self.transport.request("EP"), b"EP=123")
+
+    def test_queries_matched_by_register(self):
+        """Test that pipelined query replies arriving out of order are matched."""
+        delays = {"IE": 0.06, "SC": 0.03, "AL": 0.0}
+        self.start(lambda cmd: [(delays[cmd], f"{cmd}=1")], retry_interval=0.5)
+
+        requests = self.transport.submit_many(["IE", "SC", "AL"])
+        responses = [r.wait(1.0) for r in requests]
+
+        self.assertEqual(responses, [b"IE=1", b"SC=1", b"AL=1"])
+
+    def test_lost_query_retransmitted(self):
+        """Test that a dropped query is resent."""
+        dropped = []
+
+        def responder(cmd):
+            if not dropped:
+                dropped.append(cmd)
+                return None
+            return f"{cmd}=5"
+
+        self.start(responder)
+
+        self.assertEqual(self.transport.request("SC", timeout=1.0), b"SC=5")
+        self.assertEqual(self.drive.received, ["SC", "SC"])
+        self.assertEqual(self.transport.retransmits, 1)
+
+    def test_duplicate_query_reply_dropped(self):
+        """Test that a second reply to the same query is ignored."""
+        self.start(lambda cmd: [(0.0, f"{cmd}=1"), (0.0, f"{cmd}=1")])
+
+        self.assertEqual(self.transport.request("EP"), b"EP=1")
+        self.assertEqual(self.transport.request("SC"), b"SC=1")
+        time.sleep(0.05)
+        self.assertEqual(self.transport.duplicates, 2)
+
+    def test_motion_command_not_retransmitted(self):
+        """Test that a lost FL is never resent."""
+        self.start(lambda cmd: None if cmd == "FL" else "%", max_retries=2)
+
+        self.assertIsNone(self.transport.request("FL", timeout=0.5))
+        self.assertEqual(self.drive.received, ["FL"])
+
+    def test_commands_sent_one_at_a_time(self):
+        """Test that commands wait for the previous ack."""
+        self.start(lambda cmd: [(0.02, "%")])
+
+        requests = self.transport.submit_many(["VE1.5", "DI100", "FL"])
+        responses = [r.wait(1.0) for r in requests]
+
+        self.assertEqual(responses, [b"%", b"%", b"%"])
+        self.assertEqual(self.drive.received, ["VE1.5", "DI100", "FL"])
+        self.assertGreaterEqual(requests[1].sent_time - requests[0].sent_time, 0.02)
+
+    def test_duplicate_ack_not_misattributed(self):
+        """Test that a late ack to a retransmitted command is dropped."""
+        first = []
+
+        def responder(cmd):
+            if cmd == "VE1.5" and not first:
+                first.append(cmd)
+                return [(0.08, "%")]  # Late - arrives after the retransmit's ack
+            return "?1" if cmd.startswith("DI") else "%"
+
+        self.start(responder)
+
+        requests = self.transport.submit_many(["VE1.5", "DI100"])
+        responses = [r.wait(1.0) for r in requests]
+
+        self.assertEqual(responses, [b"%", b"?1"])
+        self.assertEqual(self.transport.duplicates, 1)
+
+    def test_query_error_not_misattributed(self):
+        """Test that an error reply to a query goes to the query, not a later command."""
+        replies = {"IP": [(0.0, "?4")], "VE1.5": [(0.02, "%")],
+                   "DI1": [(0.0, "?1")], "SC": [(0.02, "?4")]}
+        self.start(lambda cmd: replies[cmd], retry_interval=0.5)
+
+        query = self.transport.submit("IP")
+        command = self.transport.submit("VE1.5")
+
+        self.assertEqual(query.wait(0.3), b"?4")
+        self.assertEqual(command.wait(0.3), b"%")
+
+        # Command sent first: its error reply is not taken by the query
+        command = self.transport.submit("DI1")
+        query = self.transport.submit("SC")
+        self.assertEqual(command.wait(0.3), b"?1")
+        self.assertEqual(query.wait(0.3), b"?4")
+        self.assertEqual(self.transport.duplicates, 0)
+
+    def test_safety_bypasses_command_in_flight(self):
+        """Test that a stop goes out while a command awaits its ack."""
+        self.start(lambda cmd: None if cmd == "FL" else "%")
+
+        self.transport.submit("FL")
+        stop = self.transport.submit("ST", PRIORITY_SAFETY)
+
+        self.assertEqual(stop.wait(1.0), b"%")
+        self.assertEqual(self.drive.received[:2], ["FL", "ST"])
+
+    def test_safety_cancels_queued_motion(self):
+        """Test that a stop cancels a motion start still waiting to be sent."""
+        self.start(lambda cmd: None if cmd == "DI1" else "%")
+
+        self.transport.submit("DI1")
+        jog = self.transport.submit("CJ")
+        stop = self.transport.submit("SJ", PRIORITY_SAFETY)
+
+        self.assertTrue(jog.done)
+        self.assertIsNone(jog.response)
+        self.assertEqual(stop.wait(1.0), b"%")
+        time.sleep(0.1)
+        self.assertNotIn("CJ", self.drive.received)
+
+    def test_submit_after_close(self):
+        """Test that requests on a closed transport complete immediately."""
+        self.start(lambda cmd: "%")
+        self.transport.close()
+
+        request = self.transport.submit("EP")
+
+        self.assertTrue(request.done)
+        self.assertIsNone(request.response)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Unit tests for the background frame decoder.
+"""
+
+import io
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+try:
+    from PIL import Image
+    from src.frame_decoder import FrameDecoder
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+def make_jpeg(size=(640, 480), color=(200, 30, 30)):
+    """Encode a solid-color JPEG."""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@unittest.skipUnless(PIL_AVAILABLE, "requires Pillow")
+class TestFrameDecoder(unittest.TestCase):
+    """Tests for FrameDecoder."""
+
+    def setUp(self):
+        self.frames = []
+        self.threads = []
+        self.ready = threading.Event()
+
+        def on_ready(frame):
+            self.threads.append(threading.current_thread())
+            self.frames.append(frame)
+            self.ready.set()
+
+        self.decoder = FrameDecoder(on_ready, size=(320, 240))
+
+    def tearDown(self):
+        self.decoder.stop()
+
+    def test_decode_scales_to_rgb(self):
+        """Test that frames come out as RGB at the display size."""
+        frame = self.decoder.decode(make_jpeg())
+
+        self.assertEqual(frame.image.mode, "RGB")
+        self.assertEqual(frame.image.size, (320, 240))
+        self.assertEqual(frame.source_size, (640, 480))
+        self.assertGreater(frame.decode_time, 0.0)
+
+    def test_fit_keeps_aspect(self):
+        """Test scaling to fit inside the display area."""
+        self.decoder.set_size((320, 320), fit=True)
+        frame = self.decoder.decode(make_jpeg((640, 480)))
+        self.assertEqual(frame.image.size, (320, 240))
+
+    def test_scaled_decode(self):
+        """Test that small display sizes decode at a reduced JPEG scale."""
+        from PIL import JpegImagePlugin
+        draft = JpegImagePlugin.JpegImageFile.draft
+        with patch.object(JpegImagePlugin.JpegImageFile, "draft", autospec=True,
+                          side_effect=draft) as spy:
+            frame = self.decoder.decode(make_jpeg())
+
+        spy.assert_called_once()
+        self.assertEqual(frame.image.size, (320, 240))
+        self.assertEqual(frame.source_size, (640, 480))
+
+    def test_no_scaled_decode_for_large_displays(self):
+        """Test that displays less than 2x smaller than the frame decode at full size."""
+        from PIL import JpegImagePlugin
+        for size in [(640, 480), (800, 600), (400, 300)]:
+            self.decoder.set_size(size)
+            with patch.object(JpegImagePlugin.JpegImageFile, "draft", autospec=True) as spy:
+                frame = self.decoder.decode(make_jpeg())
+
+            spy.assert_not_called()
+            self.assertEqual(frame.image.size, size)
+
+    def test_scaled_decode_off(self):
+        """Test the full-size decode path."""
+        self.decoder.scaled_decode = False
+        self.decoder.set_size((240, 180))
+        frame = self.decoder.decode(make_jpeg())
+        self.assertEqual(frame.image.size, (240, 180))
+
+    def test_worker_delivers(self):
+        """Test decoding on the worker thread with timing recorded."""
+        self.decoder.start()
+        self.decoder.submit(make_jpeg())
+
+        self.assertTrue(self.ready.wait(2.0))
+        self.assertEqual(self.decoder.decoded, 1)
+        self.assertEqual(self.decoder.decode_latency.count, 1)
+        self.assertNotIn(threading.current_thread(), self.threads)
+
+    def test_stale_frames_dropped(self):
+        """Test that only the newest frame is decoded when frames pile up."""
+        self.decoder.min_interval = 0.2
+        self.decoder.start()
+        self.decoder.submit(make_jpeg(color=(0, 0, 0)))
+        self.assertTrue(self.ready.wait(2.0))
+        self.ready.clear()
+
+        # Arrive inside the minimum interval: all but the last are skipped
+        for _ in range(4):
+            self.decoder.submit(make_jpeg(color=(0, 0, 0)))
+        self.decoder.submit(make_jpeg(color=(255, 255, 255)))
+
+        self.assertTrue(self.ready.wait(2.0))
+        time.sleep(0.3)
+        self.assertEqual(self.decoder.decoded, 2)
+        self.assertEqual(self.decoder.dropped, 4)
+        self.assertGreater(self.frames[-1].image.getpixel((0, 0))[0], 240)
+
+    def test_bad_frame_counted(self):
+        """Test that undecodable data is counted and skipped."""
+        self.decoder.start()
+        self.decoder.submit(b"\xff\xd8not a jpeg\xff\xd9")
+        time.sleep(0.1)
+        self.decoder.submit(make_jpeg())
+
+        self.assertTrue(self.ready.wait(2.0))
+        self.assertEqual(self.decoder.errors, 1)
+        self.assertEqual(self.decoder.decoded, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Unit tests for line_framer module.
+"""
+
+import unittest
+from dataclasses import replace
+
+from src.command_protocol import (
+    ResponseParser,
+    check_binary_status,
+    encode_binary_status,
+)
+from src.line_framer import LineFramer
+
+
+class TestLineFramer(unittest.TestCase):
+    """Tests for newline framing."""
+
+    def setUp(self):
+        self.framer = LineFramer(max_line_length=64)
+
+    def test_single_line(self):
+        """Test a complete line in one read."""
+        self.assertEqual(self.framer.feed(b"POS:100 MODE:IDLE\n"), [b"POS:100 MODE:IDLE"])
+
+    def test_burst_of_lines(self):
+        """Test several lines in one read, with CRLF and blank lines."""
+        data = b"OK\r\n\nPOS:1\nPOS:2\r\n"
+        self.assertEqual(self.framer.feed(data), [b"OK", b"POS:1", b"POS:2"])
+
+    def test_split_line(self):
+        """Test a line split across reads."""
+        self.assertEqual(self.framer.feed(b"POS:1"), [])
+        self.assertEqual(self.framer.feed(bytearray(b"23")), [])
+        self.assertEqual(self.framer.feed(memoryview(b"45\nPO")), [b"POS:12345"])
+        self.assertEqual(self.framer.feed(b"S:6\n"), [b"POS:6"])
+
+    def test_bare_cr_ignored_by_default(self):
+        """Test that a bare CR does not end a line unless enabled."""
+        self.assertEqual(self.framer.feed(b"JL\rJR\n"), [b"JL\rJR"])
+
+    def test_accept_cr(self):
+        """Test CR, LF and CRLF terminators when CR is accepted."""
+        framer = LineFramer(accept_cr=True)
+        self.assertEqual(framer.feed(b"JL\rJR\nJS\r\nST"), [b"JL", b"JR", b"JS"])
+        self.assertEqual(framer.feed(b"\r"), [b"ST"])
+
+    def test_oversized_garbage_discarded(self):
+        """Test that an unterminated run of bytes is dropped up to its terminator."""
+        self.assertEqual(self.framer.feed(b"x" * 100), [])
+        self.assertEqual(self.framer.feed(b"xxxx\nOK\n"), [b"OK"])
+        self.assertEqual(self.framer.overflows, 1)
+
+    def test_oversized_complete_line_dropped(self):
+        """Test that a terminated line over the limit is dropped."""
+        self.assertEqual(self.framer.feed(b"y" * 80 + b"\nOK\n"), [b"OK"])
+        self.assertEqual(self.framer.overflows, 1)
+
+    def test_reset(self):
+        """Test discarding a partial line."""
+        self.framer.feed(b"POS:")
+        self.framer.reset()
+        self.assertEqual(self.framer.feed(b"OK\n"), [b"OK"])
+
+
+
+class TestLineFramerBinaryFrames(unittest.TestCase):
+    """Tests for fixed-length binary frames mixed with lines."""
+
+    FRAME = b"\xa5W\n\r\x00\x01\x02\x03"  # Payload contains terminators
+
+    def setUp(self):
+        self.framer = LineFramer(frame_sync=0xA5, frame_length=len(self.FRAME))
+
+    def test_frame_between_lines(self):
+        """Test that a frame is returned whole, unstripped, in order."""
+        data = b"OK:SF1\r\n" + self.FRAME + b"POS:1\n" + self.FRAME
+
+        self.assertEqual(self.framer.feed(data), [b"OK:SF1", self.FRAME, b"POS:1", self.FRAME])
+
+    def test_split_frame(self):
+        """Test a frame split across reads."""
+        self.assertEqual(self.framer.feed(self.FRAME[:3]), [])
+        self.assertEqual(self.framer.feed(self.FRAME[3:] + self.FRAME[:1]), [self.FRAME])
+        self.assertEqual(self.framer.feed(self.FRAME[1:]), [self.FRAME])
+
+    def test_fragment_before_frame_dropped(self):
+        """Test that an unterminated partial line ends at a sync byte."""
+        self.assertEqual(self.framer.feed(b"POS:1" + self.FRAME + b"OK\n"), [self.FRAME, b"OK"])
+
+
+class TestLineFramerResync(unittest.TestCase):
+    """Tests for recovering frame alignment after lost or corrupt bytes."""
+
+    LINE = "POS:0 MODE:IDLE SPD:0.00 HOME:N WELL:N ESTOP:0 VJOG:10.00 VMOVE:7.50"
+
+    def setUp(self):
+        status = ResponseParser.parse_status(self.LINE)
+        # Positions 10..15 contain 0x0A (newline) bytes in the payload
+        self.frames = [encode_binary_status(replace(status, position=10 + i)) for i in range(6)]
+        self.framer = LineFramer(frame_sync=0xA5, frame_length=len(self.frames[0]),
+                                 frame_check=check_binary_status)
+
+    def positions(self, items):
+        return [ResponseParser.parse_binary_status(item).position
+                for item in items if check_binary_status(item)]
+
+    def test_shifted_frame(self):
+        """Test that a dropped byte costs one frame, not the rest of the stream."""
+        frames = self.frames
+        data = b"".join(frames[:2]) + frames[2][:5] + frames[2][6:] + b"".join(frames[3:])
+
+        items = self.framer.feed(data)
+
+        self.assertEqual(self.positions(items), [10, 11, 13, 14, 15])
+        self.assertGreaterEqual(self.framer.frame_errors, 1)
+        self.assertEqual(len(items) - 5, self.framer.frame_errors)  # Bad frames returned too
+
+    def test_corrupted_frame(self):
+        """Test that a corrupted frame is reported and the next one is found."""
+        frames = self.frames
+        bad = frames[2][:6] + bytes([frames[2][6] ^ 0x40]) + frames[2][7:]
+        data = frames[0] + b"OK:SF1\r\n" + frames[1] + bad + b"".join(frames[3:]) + b"POS:1\n"
+
+        items = self.framer.feed(data)
+
+        self.assertEqual(self.positions(items), [10, 11, 13, 14, 15])
+        self.assertIn(b"OK:SF1", items)
+        self.assertEqual(items[-1], b"POS:1")
+        self.assertEqual(self.framer.frame_errors, 1)
+
+    def test_resync_across_feeds(self):
+        """Test resynchronizing when the stream arrives in small reads."""
+        frames = self.frames
+        data = frames[0][1:] + b"".join(frames[1:])  # Starts mid-frame
+
+        items = []
+        for i in range(0, len(data), 7):
+            items += self.framer.feed(data[i:i + 7])
+
+        self.assertEqual(self.positions(items), [11, 12, 13, 14, 15])
+
+
+if __name__ == "__main__":
+    unittest.main()
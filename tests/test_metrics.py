@@ -0,0 +1,70 @@
+"""
+Unit tests for metrics module.
+"""
+
+import unittest
+
+from src.metrics import LatencyRecorder, LatencySummary
+
+
+class TestLatencyRecorder(unittest.TestCase):
+    """Tests for latency recording."""
+
+    def setUp(self):
+        self.recorder = LatencyRecorder(max_samples=100)
+
+    def test_empty_summary(self):
+        """Test summary with no samples."""
+        self.assertEqual(self.recorder.summary(), LatencySummary())
+        self.assertEqual(self.recorder.percentile(99), 0.0)
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles."""
+        for ms in range(1, 101):
+            self.recorder.record(ms / 1000.0)
+
+        self.assertAlmostEqual(self.recorder.percentile(50), 0.050)
+        self.assertAlmostEqual(self.recorder.percentile(99), 0.099)
+        self.assertAlmostEqual(self.recorder.percentile(100), 0.100)
+
+    def test_summary(self):
+        """Test summary values in milliseconds."""
+        for seconds in (0.001, 0.002, 0.003):
+            self.recorder.record(seconds)
+
+        summary = self.recorder.summary()
+
+        self.assertEqual(summary.count, 3)
+        self.assertAlmostEqual(summary.mean_ms, 2.0)
+        self.assertAlmostEqual(summary.worst_ms, 3.0)
+
+    def test_worst_survives_window(self):
+        """Test that the worst case is kept after it leaves the window."""
+        self.recorder.record(5.0)
+        for _ in range(200):
+            self.recorder.record(0.001)
+
+        self.assertEqual(self.recorder.count, 201)
+        self.assertEqual(self.recorder.worst, 5.0)
+        self.assertAlmostEqual(self.recorder.percentile(100), 0.001)
+
+    def test_histogram(self):
+        """Test bucket counts, including both open-ended buckets."""
+        for seconds in (0.001, 0.007, 0.010, 0.050, 2.0):
+            self.recorder.record(seconds)
+
+        counts = self.recorder.histogram((5, 10, 100))
+
+        self.assertEqual(counts, [1, 1, 2, 1])
+
+    def test_reset(self):
+        """Test discarding samples."""
+        self.recorder.record(0.5)
+        self.recorder.reset()
+
+        self.assertEqual(self.recorder.count, 0)
+        self.assertEqual(self.recorder.worst, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+Unit tests for the MJPEG demuxer.
+"""
+
+import socket
+import threading
+import time
+import unittest
+
+from src.camera_manager import MJPEGStreamReader
+from src.mjpeg_demux import MJPEGDemuxer
+
+BOUNDARY = b"123456789000000000000987654321"
+
+
+def jpeg(index, size=500):
+    """Fake JPEG: SOI, filler containing an FF D9 pair, EOI."""
+    body = bytes([index % 256]) * (size - 8) + b"\xff\xd9\x00\x00"
+    return b"\xff\xd8" + body[:size - 4] + b"\xff\xd9"
+
+
+def chunk(data):
+    """HTTP chunked transfer encoding of one chunk."""
+    return b"%x\r\n" % len(data) + data + b"\r\n"
+
+
+def esp32_stream(frames, chunked=True, content_length=True):
+    """Build a stream the way the ESP32-CAM firmware sends it."""
+    headers = (b"HTTP/1.1 200 OK\r\n"
+               b"Content-Type: multipart/x-mixed-replace;boundary=" + BOUNDARY + b"\r\n")
+    if chunked:
+        headers += b"Transfer-Encoding: chunked\r\n"
+    body = []
+    for frame in frames:
+        part = b"Content-Type: image/jpeg\r\n"
+        if content_length:
+            part += b"Content-Length: %d\r\n" % len(frame)
+        body += [b"\r\n--" + BOUNDARY + b"\r\n", part + b"\r\n", frame]
+    if chunked:
+        return headers + b"\r\n" + b"".join(chunk(piece) for piece in body) + b"0\r\n\r\n"
+    return headers + b"\r\n" + b"".join(body)
+
+
+def demux(data, piece_size=None, **kwargs):
+    """Feed data through a socket pair and collect the frames."""
+    reader, writer = socket.socketpair()
+
+    def send():
+        if piece_size:
+            for i in range(0, len(data), piece_size):
+                writer.sendall(data[i:i + piece_size])
+        else:
+            writer.sendall(data)
+        writer.close()
+
+    threading.Thread(target=send, daemon=True).start()
+    reader.settimeout(2.0)
+    demuxer = MJPEGDemuxer(reader, **kwargs)
+    frames = [bytes(frame) for frame in demuxer.frames()]
+    reader.close()
+    return demuxer, frames
+
+
+class TestMJPEGDemuxer(unittest.TestCase):
+    """Tests for MJPEGDemuxer."""
+
+    def setUp(self):
+        self.frames = [jpeg(i, 500 + 300 * i) for i in range(5)]
+
+    def test_chunked_multipart(self):
+        """Test the ESP32-CAM stream format takes the Content-Length path."""
+        demuxer, frames = demux(esp32_stream(self.frames))
+
+        self.assertEqual(frames, self.frames)
+        self.assertEqual(demuxer.boundary, BOUNDARY)
+        self.assertEqual(demuxer.frames_sized, 5)
+        self.assertEqual(demuxer.frames_scanned, 0)
+
+    def test_small_reads(self):
+        """Test frames split across many small receives."""
+        _, frames = demux(esp32_stream(self.frames), piece_size=7)
+        self.assertEqual(frames, self.frames)
+
+    def test_identity_multipart(self):
+        """Test a multipart stream without chunked encoding."""
+        demuxer, frames = demux(esp32_stream(self.frames, chunked=False))
+
+        self.assertEqual(frames, self.frames)
+        self.assertEqual(demuxer.frames_sized, 5)
+
+    def test_embedded_eoi_not_split(self):
+        """Test that an FF D9 inside the image does not end the frame."""
+        _, frames = demux(esp32_stream(self.frames))
+        self.assertTrue(all(frame.count(b"\xff\xd9") == 2 for frame in frames))
+
+    def test_fallback_without_content_length(self):
+        """Test the SOI/EOI scan for parts without Content-Length."""
+        frames = [b"\xff\xd8" + bytes([i]) * 300 + b"\xff\xd9" for i in range(3)]
+        demuxer, received = demux(esp32_stream(frames, content_length=False), piece_size=50)
+
+        self.assertEqual(received, frames)
+        self.assertEqual(demuxer.frames_sized, 0)
+        self.assertEqual(demuxer.frames_scanned, 3)
+
+    def test_fallback_without_boundary(self):
+        """Test the SOI/EOI scan for a bare JPEG stream."""
+        frames = [b"\xff\xd8" + bytes([i]) * 300 + b"\xff\xd9" for i in range(3)]
+        data = b"HTTP/1.1 200 OK\r\nContent-Type: image/jpeg\r\n\r\n" + b"junk".join(frames)
+        demuxer, received = demux(data, piece_size=64)
+
+        self.assertEqual(received, frames)
+        self.assertIsNone(demuxer.boundary)
+
+    def test_small_frames_dropped(self):
+        """Test that frames at or below the minimum size are skipped."""
+        _, frames = demux(esp32_stream([jpeg(0, 50)] + self.frames[:1]))
+        self.assertEqual(frames, self.frames[:1])
+
+    def test_keep_going_stops(self):
+        """Test that an idle stream ends once keep_going turns false."""
+        reader, writer = socket.socketpair()
+        writer.sendall(b"HTTP/1.1 200 OK\r\n\r\n")
+        reader.settimeout(0.05)
+        deadline = time.monotonic() + 0.2
+        demuxer = MJPEGDemuxer(reader, keep_going=lambda: time.monotonic() < deadline)
+
+        self.assertEqual(list(demuxer.frames()), [])
+        reader.close()
+        writer.close()
+
+
+class TestMJPEGStreamReader(unittest.TestCase):
+    """Tests for MJPEGStreamReader against a local HTTP server."""
+
+    def test_frames_delivered(self):
+        """Test reading an ESP32-CAM style stream end to end."""
+        frames = [jpeg(i, 1000) for i in range(3)]
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        def serve():
+            client, _ = server.accept()
+            client.recv(1024)  # GET request
+            client.sendall(esp32_stream(frames))
+            client.close()
+
+        threading.Thread(target=serve, daemon=True).start()
+        received, errors = [], []
+        reader = MJPEGStreamReader(f"http://127.0.0.1:{port}/stream",
+                                   on_frame=received.append, on_error=errors.append)
+        reader.start()
+        deadline = time.monotonic() + 2.0
+        while len(received) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        reader.stop()
+        server.close()
+
+        self.assertEqual([bytes(frame) for frame in received], frames)
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Unit tests for the MJPEG recorder and recording index.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from src.mjpeg_recorder import (
+    INDEX_HEADER,
+    INDEX_RECORD,
+    MJPEGRecorder,
+    RecordingReader,
+    SegmentIndex,
+    index_path,
+)
+
+
+def make_frame(number, size=1000):
+    """Build a JPEG-like frame whose payload identifies it."""
+    body = b"%06d" % number
+    return b"\xff\xd8" + body * (size // len(body)) + b"\xff\xd9"
+
+
+class TestMJPEGRecorder(unittest.TestCase):
+    """Tests for MJPEGRecorder."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def record(self, count, **kwargs):
+        recorder = MJPEGRecorder(self.directory, flush_interval=0.05, **kwargs)
+        recorder.start()
+        for i in range(count):
+            self.assertTrue(recorder.write(make_frame(i), timestamp=100.0 + i * 0.1))
+        recorder.stop()
+        return recorder
+
+    def test_frames_written_unchanged(self):
+        """Test that the segment is the received JPEGs back to back."""
+        recorder = self.record(20)
+
+        self.assertEqual(recorder.frames_written, 20)
+        self.assertEqual(len(recorder.segments), 1)
+        with open(recorder.segments[0], "rb") as f:
+            self.assertEqual(f.read(), b"".join(make_frame(i) for i in range(20)))
+        self.assertEqual(os.path.getsize(index_path(recorder.segments[0])),
+                         INDEX_HEADER.size + 20 * INDEX_RECORD.size)
+
+    def test_segments_roll(self):
+        """Test that segments start a new file at the size and time limits."""
+        recorder = self.record(25, segment_bytes=10 * len(make_frame(0)))
+        self.assertEqual([len(SegmentIndex(p)) for p in recorder.segments], [10, 10, 5])
+
+        shutil.rmtree(self.directory)
+        recorder = self.record(25, segment_seconds=1.0)
+        self.assertEqual([len(SegmentIndex(p)) for p in recorder.segments], [10, 10, 5])
+
+    def test_seek_by_time(self):
+        """Test finding the frame showing at a wall-clock time across segments."""
+        recorder = self.record(25, segment_bytes=10 * len(make_frame(0)))
+        reader = RecordingReader(list(reversed(recorder.segments)))
+        start = reader.segments[0].wall_times[0]  # Frame 0
+
+        self.assertEqual(len(reader), 25)
+        frame = reader.frame_at(start + 1.55)  # Between frames 15 and 16
+        self.assertEqual(frame.jpeg, make_frame(15))
+        self.assertAlmostEqual(frame.timestamp, start + 1.5, places=3)
+        self.assertAlmostEqual(frame.monotonic, 101.5)
+        self.assertEqual(frame.index, 5)
+        self.assertEqual(reader.frame_at(start).jpeg, make_frame(0))
+        self.assertEqual(reader.frame_at(start + 400.0).jpeg, make_frame(24))
+        self.assertIsNone(reader.frame_at(start - 0.1))
+
+    def test_wall_clock_anchor(self):
+        """Test that frame times map to wall-clock time through the header."""
+        recorder = MJPEGRecorder(self.directory, flush_interval=0.01)
+        recorder.start()
+        before = time.time()
+        recorder.write(make_frame(0))
+        after = time.time()
+        recorder.stop()
+
+        frame = RecordingReader(recorder.segments).frame_at(after + 1.0)
+        self.assertGreaterEqual(frame.timestamp, before - 0.01)
+        self.assertLessEqual(frame.timestamp, after + 0.01)
+
+    def test_from_directory(self):
+        """Test loading a recording from its directory by prefix."""
+        self.record(5)
+        self.assertEqual(len(RecordingReader.from_directory(self.directory, "camera")), 5)
+        self.assertEqual(len(RecordingReader.from_directory(self.directory, "other")), 0)
+
+    def test_sessions_not_mixed(self):
+        """Test that runs with overlapping monotonic stamps load separately."""
+        first = self.record(5)
+        second = MJPEGRecorder(self.directory, flush_interval=0.05)
+        second.start()
+        for i in range(3):
+            second.write(make_frame(100 + i), timestamp=100.0 + i * 0.1)  # Same stamps
+        second.stop()
+
+        self.assertNotEqual(first.session, second.session)
+        self.assertEqual(RecordingReader.sessions(self.directory),
+                         [first.session, second.session])
+        latest = RecordingReader.from_directory(self.directory, "camera")
+        self.assertEqual(len(latest), 3)
+        self.assertEqual(latest.frame_at(time.time()).jpeg, make_frame(102))
+        earlier = RecordingReader.from_directory(self.directory, session=first.session)
+        self.assertEqual(len(earlier), 5)
+        self.assertEqual(earlier.frame_at(time.time()).jpeg, make_frame(4))
+
+    def test_partial_index_record_ignored(self):
+        """Test that a truncated index (interrupted write) still loads."""
+        recorder = self.record(3)
+        with open(index_path(recorder.segments[0]), "ab") as f:
+            f.write(b"\x00" * 7)
+
+        index = SegmentIndex(recorder.segments[0])
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.read(2), make_frame(2))
+
+    def test_backpressure_drops(self):
+        """Test that frames are dropped, not blocked on, when the writer is behind."""
+        recorder = MJPEGRecorder(self.directory, flush_interval=60.0,
+                                 max_pending_bytes=5 * len(make_frame(0)))
+        recorder.start()
+        results = [recorder.write(make_frame(i)) for i in range(8)]
+        recorder.stop()
+
+        self.assertEqual(results, [True] * 5 + [False] * 3)
+        self.assertEqual(recorder.frames_dropped, 3)
+        self.assertEqual(recorder.frames_written, 5)
+
+    def test_write_from_stream_thread(self):
+        """Test frames queued from another thread with default timestamps."""
+        recorder = MJPEGRecorder(self.directory, flush_interval=0.01)
+        recorder.start()
+        thread = threading.Thread(target=lambda: [recorder.write(make_frame(i)) for i in range(50)])
+        thread.start()
+        thread.join()
+        recorder.stop()
+
+        index = SegmentIndex(recorder.segments[0])
+        self.assertEqual(len(index), 50)
+        self.assertEqual(index.timestamps, sorted(index.timestamps))
+        self.assertFalse(recorder.write(make_frame(0)))  # Stopped
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for move_handle module.
+"""
+
+import unittest
+
+from src.config import STAC5_IN_POSITION_TOLERANCE_COUNTS
+from src.escl_protocol import SC_MOTOR_ENABLED, SC_IN_POSITION, SC_MOVING
+from src.move_handle import MoveHandle, MoveState
+
+
+MOVING = SC_MOTOR_ENABLED | SC_MOVING
+SETTLED = SC_MOTOR_ENABLED | SC_IN_POSITION
+
+
+class TestMoveHandle(unittest.TestCase):
+    """Tests for move completion tracking."""
+
+    def setUp(self):
+        self.handle = MoveHandle(target=2000, timeout=10.0, tolerance=2, now=0.0)
+
+    def test_completes_in_position_at_target(self):
+        """Test completion with duration and settle time."""
+        self.handle.update(1000, MOVING, 0, now=0.5)
+        self.handle.update(1999, SC_MOTOR_ENABLED, 0, now=1.0)
+        self.handle.update(2001, SETTLED, 0, now=1.2)
+
+        self.assertTrue(self.handle.done)
+        self.assertTrue(self.handle.succeeded)
+        self.assertEqual(self.handle.final_position, 2001)
+        self.assertAlmostEqual(self.handle.duration, 1.2)
+        self.assertAlmostEqual(self.handle.settle_time, 0.2)
+
+    def test_stale_in_position_before_motion_ignored(self):
+        """Test that In Position at the start point does not fail the move."""
+        self.handle.update(0, SETTLED, 0, now=0.05)
+
+        self.assertFalse(self.handle.done)
+
+    def test_tolerance_boundary(self):
+        """Test that an overshoot settling at the tolerance passes and one count more fails."""
+        inside = MoveHandle(target=2000, timeout=10.0, tolerance=5, now=0.0)
+        inside.update(1000, MOVING, 0, now=0.5)
+        inside.update(2005, SETTLED, 0, now=1.0)
+        self.assertTrue(inside.succeeded)
+
+        outside = MoveHandle(target=2000, timeout=10.0, tolerance=5, now=0.0)
+        outside.update(1000, MOVING, 0, now=0.5)
+        outside.update(1994, SETTLED, 0, now=1.0)
+        self.assertEqual(outside.state, MoveState.FAILED)
+        self.assertIn("1994", outside.error)
+
+    def test_default_tolerance_from_config(self):
+        """Test that the default tolerance comes from the encoder resolution."""
+        handle = MoveHandle(target=2000, timeout=10.0, now=0.0)
+
+        self.assertEqual(handle.tolerance, STAC5_IN_POSITION_TOLERANCE_COUNTS)
+        self.assertGreater(handle.tolerance, 2)
+
+    def test_stopped_off_target_fails(self):
+        """Test failure when the drive settles away from the target."""
+        self.handle.update(500, MOVING, 0, now=0.5)
+        self.handle.update(900, SETTLED, 0, now=1.0)
+
+        self.assertEqual(self.handle.state, MoveState.FAILED)
+        self.assertIn("900", self.handle.error)
+
+    def test_alarm_fails(self):
+        """Test failure on a drive alarm."""
+        self.handle.update(500, MOVING, 0x0080, now=0.5)
+
+        self.assertFalse(self.handle.succeeded)
+        self.assertEqual(self.handle.error, "Alarm 0080")
+
+    def test_timeout(self):
+        """Test failure when the deadline passes."""
+        self.handle.update(500, MOVING, 0, now=10.5)
+
+        self.assertEqual(self.handle.error, "Timed out waiting for In Position")
+
+    def test_wait_enforces_deadline(self):
+        """Test that wait() fails the move without polling."""
+        handle = MoveHandle(target=100, timeout=0.05)
+
+        self.assertFalse(handle.wait())
+        self.assertTrue(handle.done)
+
+    def test_relative_move_short_motion(self):
+        """Test a relative move that finishes between polls."""
+        handle = MoveHandle(target=None, timeout=10.0, now=0.0)
+        handle.update(0, SETTLED, 0, now=0.1)
+        self.assertFalse(handle.done)
+        handle.update(40, SETTLED, 0, now=1.1)
+        self.assertTrue(handle.succeeded)
+
+    def test_callbacks(self):
+        """Test done callbacks before and after completion."""
+        seen = []
+        self.handle.add_done_callback(seen.append)
+        self.handle.fail("Stopped")
+        self.handle.add_done_callback(seen.append)
+
+        self.assertEqual(seen, [self.handle, self.handle])
+
+    def test_rejected_is_falsy(self):
+        """Test that a rejected move is falsy and already failed."""
+        handle = MoveHandle.rejected("Rate limited")
+
+        self.assertFalse(handle)
+        self.assertTrue(handle.done)
+        self.assertEqual(handle.error, "Rate limited")
+
+    def test_completed_is_truthy(self):
+        """Test the already-at-target handle."""
+        handle = MoveHandle.completed(100)
+
+        self.assertTrue(handle)
+        self.assertTrue(handle.wait(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
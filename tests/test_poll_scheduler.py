@@ -0,0 +1,120 @@
+"""
+Unit tests for poll_scheduler module.
+"""
+
+import unittest
+
+from src.escl_protocol import (
+    SC_MOTOR_ENABLED,
+    SC_IN_POSITION,
+    SC_MOVING,
+    SC_JOGGING,
+    SC_STOPPING,
+)
+from src.poll_scheduler import AdaptivePollScheduler, FixedPollScheduler, PollScheduler
+
+
+IDLE = SC_MOTOR_ENABLED | SC_IN_POSITION
+MOVING = SC_MOTOR_ENABLED | SC_MOVING
+
+
+class TestPollScheduler(unittest.TestCase):
+    """Tests for the scheduler base class."""
+
+    def test_update_required(self):
+        """Test that a scheduler without update() cannot be created."""
+        class Incomplete(PollScheduler):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class TestFixedPollScheduler(unittest.TestCase):
+    """Tests for the two-rate scheduler."""
+
+    def setUp(self):
+        self.scheduler = FixedPollScheduler(idle_interval=0.15, motion_interval=0.03)
+
+    def test_idle(self):
+        """Test idle interval when not moving."""
+        self.assertEqual(self.scheduler.update(IDLE, False, now=0.0), 0.15)
+        self.assertFalse(self.scheduler.in_motion)
+
+    def test_moving(self):
+        """Test motion interval while the moving bit is set."""
+        self.assertEqual(self.scheduler.update(MOVING, True, now=0.0), 0.03)
+        self.assertTrue(self.scheduler.in_motion)
+
+    def test_recent_move_holds_fast_rate(self):
+        """Test that a move command keeps the fast rate for a few seconds."""
+        self.scheduler.notify_move(now=10.0)
+        self.assertEqual(self.scheduler.update(IDLE, False, now=12.0), 0.03)
+        self.assertEqual(self.scheduler.update(IDLE, False, now=13.5), 0.15)
+
+
+class TestAdaptivePollScheduler(unittest.TestCase):
+    """Tests for the status-bit-driven scheduler."""
+
+    def setUp(self):
+        self.scheduler = AdaptivePollScheduler(
+            idle_interval=0.15,
+            motion_interval=0.03,
+            approach_interval=0.015,
+            approach_window=0.5,
+            backoff_cycles=4,
+            max_idle_interval=1.0,
+        )
+
+    def test_moving_and_jogging_use_motion_rate(self):
+        """Test motion interval for Moving and Jogging bits."""
+        self.assertEqual(self.scheduler.update(MOVING, True, now=0.0), 0.03)
+        self.assertEqual(self.scheduler.update(SC_MOTOR_ENABLED | SC_JOGGING, True, now=0.1), 0.03)
+
+    def test_stopping_uses_approach_rate(self):
+        """Test densest sampling while the Stopping bit is set."""
+        self.assertEqual(self.scheduler.update(SC_MOTOR_ENABLED | SC_STOPPING, True, now=0.0), 0.015)
+
+    def test_approach_window_before_eta(self):
+        """Test approach rate as the move nears its estimated end."""
+        self.scheduler.notify_move(eta=2.0, now=0.0)
+        self.assertEqual(self.scheduler.update(MOVING, True, now=1.0), 0.03)
+        self.assertEqual(self.scheduler.update(MOVING, True, now=1.6), 0.015)
+        # Overrunning the ETA keeps the approach rate until motion ends
+        self.assertEqual(self.scheduler.update(MOVING, True, now=2.4), 0.015)
+
+    def test_in_position_returns_to_idle(self):
+        """Test idle interval once the move settles."""
+        self.scheduler.notify_move(eta=1.0, now=0.0)
+        self.scheduler.update(MOVING, True, now=0.5)
+        self.assertEqual(self.scheduler.update(IDLE, True, now=1.1), 0.15)
+        self.assertFalse(self.scheduler.in_motion)
+
+    def test_move_pending_before_sc_confirms(self):
+        """Test that a fresh move command is treated as motion."""
+        self.scheduler.notify_move(eta=5.0, now=0.0)
+        self.assertEqual(self.scheduler.update(IDLE, False, now=0.05), 0.03)
+        self.assertTrue(self.scheduler.in_motion)
+
+    def test_idle_backoff(self):
+        """Test exponential back-off when nothing changes."""
+        intervals = [self.scheduler.update(IDLE, False, now=float(i)) for i in range(20)]
+
+        self.assertEqual(intervals[0], 0.15)
+        self.assertEqual(intervals[3], 0.3)
+        self.assertEqual(intervals[7], 0.6)
+        self.assertEqual(intervals[-1], 1.0)
+
+    def test_change_resets_backoff(self):
+        """Test that any change returns to the idle interval."""
+        for i in range(10):
+            self.scheduler.update(IDLE, False, now=float(i))
+        self.assertEqual(self.scheduler.update(IDLE, True, now=11.0), 0.15)
+
+    def test_failed_poll(self):
+        """Test that a failed poll (no SC) does not count as motion."""
+        self.assertEqual(self.scheduler.update(None, False, now=0.0), 0.15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Unit tests for port_detect module.
+"""
+
+import os
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from src.command_protocol import WinchStatus
+from src.port_detect import PortDetector, is_winch_status_line, probe_port
+from src.serial_manager import SerialManager
+from simulator import WinchControllerSimulator
+
+
+def port(device, vid=None, pid=None, serial_number=None):
+    """ListPortInfo stand-in."""
+    return SimpleNamespace(device=device, vid=vid, pid=pid,
+                           serial_number=serial_number, description=device)
+
+
+WINCH = port("/dev/ttyACM0", 0x2341, 0x0069, "W123")
+WINCH_2 = port("/dev/ttyACM3", 0x2341, 0x1002, "W999")  # Second winch board, not answering
+DROP = port("/dev/ttyACM1", 0x2341, 0x0070, "D456")
+BRIDGE = port("/dev/ttyUSB0", 0x1A86, 0x7523, "B789")  # Unknown USB-serial bridge
+UART = port("/dev/ttyS0")  # On-board UART, no USB IDs
+
+
+class FakeProbe:
+    """Probe answering from a table, slowly, and recording calls."""
+
+    def __init__(self, answers, delay=0.0):
+        self.answers = answers
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, device):
+        with self._lock:
+            self.calls.append(device)
+        time.sleep(self.delay)
+        return self.answers.get(device, False)
+
+
+class TestIdentify(unittest.TestCase):
+    """Tests for status line identification."""
+
+    def test_status_lines(self):
+        """Test that only the winch status line is accepted."""
+        self.assertTrue(is_winch_status_line(
+            "POS:0 MODE:IDLE SPD:0.00 HOME:N WELL:N ESTOP:0"))
+        self.assertFalse(is_winch_status_line(
+            "POS:0 MODE:IDLE START:N STOP:N TRIM:0 WIFI:AP IP:192.168.4.1"))
+        self.assertFalse(is_winch_status_line("Drop Cylinder Controller Starting..."))
+
+
+class TestPortDetector(unittest.TestCase):
+    """Tests for candidate selection, concurrency and the serial number cache."""
+
+    def setUp(self):
+        self.ports = [WINCH, WINCH_2, DROP, BRIDGE, UART]
+        self.probe = FakeProbe({WINCH.device: True}, delay=0.2)
+        self.detector = PortDetector(probe=self.probe, list_ports=lambda: self.ports)
+
+    def test_detect(self):
+        """Test that the winch is found and only winch USB IDs are opened."""
+        found = self.detector.detect()
+
+        self.assertEqual([p.device for p in found], [WINCH.device])
+        self.assertEqual(sorted(self.probe.calls), [WINCH.device, WINCH_2.device])
+
+    def test_probes_run_concurrently(self):
+        """Test that two 0.2 s probes take about 0.2 s in total."""
+        start = time.perf_counter()
+        self.detector.detect()
+
+        self.assertLess(time.perf_counter() - start, 0.35)
+
+    def test_probe_unknown(self):
+        """Test that unknown USB ports are probed only when asked, never the drop cylinder."""
+        detector = PortDetector(probe=self.probe, list_ports=lambda: self.ports,
+                                probe_unknown=True)
+        detector.detect()
+
+        self.assertIn(BRIDGE.device, self.probe.calls)
+        self.assertNotIn(DROP.device, self.probe.calls)
+        self.assertNotIn(UART.device, self.probe.calls)
+
+    def test_cache_skips_probe_after_rename(self):
+        """Test that a re-enumerated device is found by serial number without probing."""
+        self.detector.detect()
+        self.probe.calls.clear()
+        self.ports = [port("/dev/ttyACM2", 0x2341, 0x0069, "W123")]
+
+        found = self.detector.find()
+
+        self.assertEqual(found.device, "/dev/ttyACM2")
+        self.assertTrue(found.cached)
+        self.assertEqual(self.probe.calls, [])
+
+    def test_forget(self):
+        """Test that forgetting a serial number forces a new probe."""
+        self.detector.detect()
+        self.detector.forget("W123")
+        self.probe.calls.clear()
+
+        self.detector.find()
+
+        self.assertIn(WINCH.device, self.probe.calls)
+
+    def test_exclude(self):
+        """Test that excluded (connected) ports are not opened."""
+        self.detector.detect(exclude=[WINCH.device])
+
+        self.assertNotIn(WINCH.device, self.probe.calls)
+
+    def test_manager_lookup(self):
+        """Test SerialManager.auto_detect_port with a given detector."""
+        self.assertEqual(SerialManager.auto_detect_port(self.detector), WINCH.device)
+        self.assertIsNone(SerialManager.auto_detect_port(self.detector, exclude=[WINCH.device]))
+
+
+@unittest.skipUnless(hasattr(os, "openpty"), "requires a POSIX pty")
+class TestProbePort(unittest.TestCase):
+    """Tests for the ? handshake against the pty winch simulator."""
+
+    def test_probe_winch(self):
+        """Test that the simulator is identified from its status reply."""
+        with WinchControllerSimulator(WinchStatus()) as simulator:
+            self.assertTrue(probe_port(simulator.port, timeout=1.0))
+
+    def test_probe_silent_port(self):
+        """Test that a port that never answers times out."""
+        master, slave = os.openpty()
+        try:
+            start = time.perf_counter()
+            self.assertFalse(probe_port(os.ttyname(slave), timeout=0.3))
+            self.assertLess(time.perf_counter() - start, 1.0)
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    def test_probe_missing_port(self):
+        """Test that a port that cannot be opened is skipped."""
+        self.assertFalse(probe_port("/dev/does-not-exist", timeout=0.3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Unit tests for records module and the status records built on it.
+"""
+
+import dataclasses
+import pickle
+import unittest
+from typing import Optional
+
+from src.command_protocol import WinchStatus
+from src.drop_cylinder_protocol import DropCylinderStatus
+from src.records import record
+from src.stac5_manager import STAC5Status, STAC5StatusSnapshot
+
+
+@record
+class Sample:
+    position: int = 0
+    label: Optional[str] = None
+
+    @property
+    def doubled(self) -> int:
+        return self.position * 2
+
+
+class TestRecord(unittest.TestCase):
+    """Tests for the slotted dataclass decorator."""
+
+    def test_slotted(self):
+        """Test that instances have no __dict__."""
+        sample = Sample(3)
+
+        self.assertFalse(hasattr(sample, "__dict__"))
+        self.assertEqual(Sample.__slots__, ("position", "label"))
+
+    def test_dataclass_behaviour(self):
+        """Test defaults, equality, hashing, properties and replace()."""
+        sample = Sample(3)
+
+        self.assertEqual(sample, Sample(3, None))
+        self.assertEqual(hash(sample), hash(Sample(3)))
+        self.assertEqual(sample.doubled, 6)
+        self.assertEqual(dataclasses.replace(sample, label="x"), Sample(3, "x"))
+        self.assertEqual(repr(sample), "Sample(position=3, label=None)")
+
+    def test_frozen(self):
+        """Test that fields and new attributes cannot be set."""
+        sample = Sample(3)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            sample.position = 4
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            sample.other = 1
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            del sample.position
+
+    def test_pickle(self):
+        """Test that frozen records round-trip through pickle."""
+        sample = Sample(3, "x")
+
+        self.assertEqual(pickle.loads(pickle.dumps(sample)), sample)
+
+    def test_mutable_variant(self):
+        """Test a slotted record without frozen."""
+        status = STAC5Status()
+        status.encoder_position = 100
+
+        self.assertEqual(status.encoder_position, 100)
+        with self.assertRaises(AttributeError):
+            status.unknown = 1
+
+
+class TestStatusRecords(unittest.TestCase):
+    """Tests for the device status records."""
+
+    def test_status_records_slotted(self):
+        """Test that status records carry no per-instance __dict__."""
+        for status in (WinchStatus(), DropCylinderStatus(), STAC5Status(),
+                       STAC5StatusSnapshot()):
+            self.assertFalse(hasattr(status, "__dict__"), type(status).__name__)
+
+    def test_stac5_snapshot(self):
+        """Test that a snapshot is frozen and detached from the live status."""
+        status = STAC5Status(encoder_position=10, home_position=0)
+        snapshot = status.snapshot()
+        status.encoder_position = 20
+
+        self.assertEqual(snapshot.encoder_position, 10)
+        self.assertEqual(snapshot.home_position, 0)
+        self.assertEqual([f.name for f in dataclasses.fields(snapshot)],
+                         [f.name for f in dataclasses.fields(status)])
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.encoder_position = 0
+
+
+if __name__ == "__main__":
+    unittest.main()
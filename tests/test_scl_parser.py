@@ -0,0 +1,86 @@
+"""
+Unit tests for scl_parser module.
+"""
+
+import unittest
+
+from src.scl_parser import (
+    parse_position,
+    parse_status_code,
+    parse_alarm_code,
+    format_code,
+)
+
+
+class TestParsePosition(unittest.TestCase):
+    """Tests for EP/IE position parsing."""
+
+    def test_simple(self):
+        """Test a plain register=value response."""
+        self.assertEqual(parse_position(b"EP=12345"), 12345)
+
+    def test_negative(self):
+        """Test a negative position."""
+        self.assertEqual(parse_position(b"IE=-42", b"IE"), -42)
+
+    def test_duplicated_echo(self):
+        """Test that the first value of a duplicated echo is used."""
+        self.assertEqual(parse_position(b"EP=100 EP=101"), 100)
+
+    def test_prefix_without_equals(self):
+        """Test a response with the register but no '='."""
+        self.assertEqual(parse_position(b"EP8000"), 8000)
+
+    def test_bare_value(self):
+        """Test a value with no register prefix."""
+        self.assertEqual(parse_position(b"  -250 "), -250)
+
+    def test_memoryview_and_bytearray(self):
+        """Test parsing directly from buffer objects."""
+        self.assertEqual(parse_position(memoryview(b"EP=7")), 7)
+        self.assertEqual(parse_position(bytearray(b"EP=7")), 7)
+
+    def test_ack_and_error_have_no_value(self):
+        """Test that acks and error codes are not read as positions."""
+        for frame in (b"%", b"*", b"?4", b""):
+            self.assertIsNone(parse_position(frame), frame)
+        self.assertIsNone(parse_position(None))
+
+    def test_other_register_ignored(self):
+        """Test that a reply for a different register is rejected."""
+        self.assertIsNone(parse_position(b"SC=0009"))
+
+
+class TestParseCodes(unittest.TestCase):
+    """Tests for SC/AL bitfield parsing."""
+
+    def test_status_code(self):
+        """Test SC as a hex bitfield."""
+        self.assertEqual(parse_status_code(b"SC=0019"), 0x19)
+
+    def test_status_code_duplicated(self):
+        """Test a duplicated SC echo."""
+        self.assertEqual(parse_status_code(b"SC=0209 SC=0209"), 0x209)
+
+    def test_status_code_bare(self):
+        """Test a bare SC value."""
+        self.assertEqual(parse_status_code(b"000d"), 0x0D)
+
+    def test_alarm_code(self):
+        """Test AL as a hex bitfield."""
+        self.assertEqual(parse_alarm_code(b"AL=0200"), 0x200)
+        self.assertEqual(parse_alarm_code(b"AL=0000"), 0)
+
+    def test_error_response(self):
+        """Test that an error response has no code."""
+        self.assertIsNone(parse_status_code(b"?1"))
+        self.assertIsNone(parse_alarm_code(b"%"))
+
+    def test_format_code(self):
+        """Test formatting matches the drive's four hex digits."""
+        self.assertEqual(format_code(0x9), "0009")
+        self.assertEqual(format_code(0x200), "0200")
+
+
+if __name__ == "__main__":
+    unittest.main()
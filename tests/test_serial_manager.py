@@ -2,6 +2,7 @@
 Unit tests for serial_manager module.
 """
 
+import os
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import time
@@ -144,6 +145,8 @@ class TestSerialManagerConnection(unittest.TestCase):
         """Test successful connection."""
         mock_serial = MagicMock()
         mock_serial.is_open = True
+        mock_serial.read.return_value = b""  # Read timeout, nothing received
+        mock_serial.in_waiting = 0
         mock_serial_class.return_value = mock_serial
 
         result = self.manager.connect("COM3", 115200)
@@ -172,6 +175,8 @@ class TestSerialManagerConnection(unittest.TestCase):
         """Test disconnection."""
         mock_serial = MagicMock()
         mock_serial.is_open = True
+        mock_serial.read.return_value = b""  # Read timeout, nothing received
+        mock_serial.in_waiting = 0
         mock_serial_class.return_value = mock_serial
 
         self.manager.connect("COM3", 115200)
@@ -180,6 +185,24 @@ class TestSerialManagerConnection(unittest.TestCase):
         self.assertEqual(self.manager.state, ConnectionState.DISCONNECTED)
         self.assertFalse(self.manager.is_connected)
 
+    @patch('src.serial_manager.serial.Serial')
+    def test_unexpected_read_error_reported(self, mock_serial_class):
+        """Test that a non-serial exception from the port is reported as a lost link."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.side_effect = TypeError("driver failure")
+        mock_serial_class.return_value = mock_serial
+        errors = []
+        self.manager.set_error_callback(errors.append)
+
+        self.manager.connect("COM3", 115200)
+        self.manager._read_thread.join(1.0)
+
+        self.assertFalse(self.manager._read_thread.is_alive())
+        self.assertEqual(self.manager.state, ConnectionState.ERROR)
+        self.assertEqual(errors, ["Read error: driver failure"])
+        self.manager.disconnect()
+
     def test_send_command_disconnected(self):
         """Test sending command when disconnected."""
         result = self.manager.send_command("JL")
@@ -275,6 +298,20 @@ class TestSerialManagerResponseProcessing(unittest.TestCase):
         self.assertIsNotNone(self.manager.last_status)
         self.assertEqual(self.manager.last_status.position, 12345)
 
+    def test_delta_callback_suppresses_repeats(self):
+        """Test that repeated identical status lines are delivered once."""
+        deltas = []
+        self.manager.set_delta_callback(deltas.append)
+        response = "POS:12345 MODE:IDLE SPD:0.00 HOME:Y@0 WELL:Y@8000 ESTOP:0"
+
+        for _ in range(5):
+            self.manager._process_response(response)
+        self.manager._process_response(response.replace("POS:12345", "POS:12400"))
+
+        self.assertEqual(self.status_callback.call_count, 6)
+        self.assertEqual(len(deltas), 2)
+        self.assertEqual(deltas[1].changed, {"position": 12400})
+
     def test_process_invalid_response(self):
         """Test processing invalid response."""
         response = "INVALID DATA"
@@ -291,5 +328,77 @@ class TestSerialManagerResponseProcessing(unittest.TestCase):
         self.assertIsNone(self.manager.last_status)
 
 
+@unittest.skipUnless(hasattr(os, "openpty"), "requires a POSIX pty")
+class TestSerialManagerPty(unittest.TestCase):
+    """Tests for the reader and writer threads over a pseudo-terminal."""
+
+    STATUS = b"POS:100 MODE:IDLE SPD:0.00 HOME:N WELL:N ESTOP:0\n"
+
+    def setUp(self):
+        self.master, self.slave = os.openpty()
+        self.pending = b""
+        self.manager = SerialManager()
+        self.manager.POLL_INTERVAL = 3600.0
+        self.assertTrue(self.manager.connect(os.ttyname(self.slave)))
+
+    def tearDown(self):
+        self.manager.disconnect()
+        os.close(self.master)
+        os.close(self.slave)
+
+    def read_line(self):
+        """Read the next line written to the port, skipping status polls."""
+        while True:
+            while b"\n" not in self.pending:
+                self.pending += os.read(self.master, 64)
+            line, _, self.pending = self.pending.partition(b"\n")
+            if line != b"?":
+                return line + b"\n"
+
+    def test_command_written_immediately(self):
+        """Test that a queued command reaches the port without waiting for a tick."""
+        start = time.perf_counter()
+        self.manager.send_command(Commands.JOG_LEFT)
+
+        self.assertEqual(self.read_line(), b"JL\n")
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_status_line_delivered(self):
+        """Test that a line written by the controller reaches the status callback."""
+        received = threading.Event()
+        self.manager.set_status_callback(lambda status: received.set())
+
+        os.write(self.master, self.STATUS[:10])
+        os.write(self.master, self.STATUS[10:])
+
+        self.assertTrue(received.wait(1.0))
+        self.assertEqual(self.manager.last_status.position, 100)
+
+    def test_callback_error_does_not_stop_reader(self):
+        """Test that an exception while handling a line leaves the reader running."""
+        received = threading.Event()
+
+        def on_status(status):
+            if status.position == 100:
+                raise ValueError("callback failed")
+            received.set()
+
+        self.manager.set_status_callback(on_status)
+        os.write(self.master, self.STATUS + self.STATUS.replace(b"100", b"200"))
+
+        self.assertTrue(received.wait(1.0))
+        self.assertEqual(self.manager.last_status.position, 200)
+        self.assertTrue(self.manager._read_thread.is_alive())
+
+    def test_disconnect_wakes_threads(self):
+        """Test that disconnect does not wait out the read timeout."""
+        start = time.perf_counter()
+        self.manager.disconnect()
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertFalse(self.manager._read_thread.is_alive())
+        self.assertFalse(self.manager._write_thread.is_alive())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,212 @@
+"""
+Unit tests for the STAC5 drive simulator.
+"""
+
+import time
+import unittest
+
+from src.escl_protocol import (
+    SC_MOTOR_ENABLED,
+    SC_IN_POSITION,
+    SC_MOVING,
+    SC_JOGGING,
+    SC_STOPPING,
+    SC_ALARM_PRESENT,
+)
+from src.stac5_manager import STAC5Manager
+from simulator import ESCLSimulator, STAC5DriveModel
+
+
+class TestSTAC5DriveModel(unittest.TestCase):
+    """Tests for the drive model and SCL interpreter (simulated clock)."""
+
+    def setUp(self):
+        self.drive = STAC5DriveModel()
+        self.drive.advance(0.0)
+        for command in ("AC10.0", "DE10.0", "VE1.0", "ME"):
+            self.assertEqual(self.drive.handle(command, 0.0), "%")
+
+    def status(self, now):
+        return int(self.drive.handle("SC", now)[3:], 16)
+
+    def test_trapezoidal_move(self):
+        """Test a one-rev FL move: 0.1s ramp up, 0.9s cruise, 0.1s ramp down."""
+        self.drive.handle("DI20000", 0.0)
+        self.assertEqual(self.drive.handle("FL", 0.0), "%")
+
+        self.assertTrue(self.status(0.5) & SC_MOVING)
+        self.assertAlmostEqual(self.drive.speed, 1.0)
+        self.assertEqual(self.status(1.15), SC_MOTOR_ENABLED | SC_IN_POSITION)
+        self.assertEqual(self.drive.handle("EP", 1.15), "EP=8000")
+        self.assertEqual(self.drive.handle("IP", 1.15), "IP=20000")
+
+    def test_move_to_position(self):
+        """Test FP to an absolute position in both directions."""
+        self.drive.handle("FP-5000", 0.0)
+        self.drive.advance(2.0)
+        self.assertEqual(self.drive.handle("IE", 2.0), "IE=-2000")
+
+        self.drive.handle("FP0", 2.0)
+        self.drive.advance(4.0)
+        self.assertEqual(self.drive.encoder_position, 0)
+
+    def test_jog_and_stop(self):
+        """Test CJ in the DI direction and SJ decelerating to a stop."""
+        self.drive.handle("JS2.0", 0.0)
+        self.drive.handle("DI-1", 0.0)
+        self.drive.handle("CJ", 0.0)
+
+        self.assertEqual(self.status(1.0) & (SC_MOVING | SC_JOGGING), SC_MOVING | SC_JOGGING)
+        self.assertEqual(self.drive.handle("IV", 1.0), "IV=-120.00")
+
+        self.drive.handle("SJ", 1.0)
+        self.assertTrue(self.status(1.1) & SC_STOPPING)
+        self.assertEqual(self.status(1.3), SC_MOTOR_ENABLED | SC_IN_POSITION)
+        self.assertLess(self.drive.encoder_position, 0)
+
+    def test_stop_kill_is_immediate(self):
+        """Test that SK halts without deceleration."""
+        self.drive.handle("CJ", 0.0)
+        self.drive.advance(0.5)
+        self.drive.handle("SK", 0.5)
+
+        position = self.drive.encoder_position
+        self.drive.advance(1.0)
+        self.assertEqual(self.drive.encoder_position, position)
+
+    def test_rejected_formats(self):
+        """Test responses for malformed and unsupported commands."""
+        self.assertEqual(self.drive.handle("JS2", 0.0), "?")
+        self.assertEqual(self.drive.handle("JS-1.0", 0.0), "?5")
+        self.assertEqual(self.drive.handle("SD", 0.0), "?")
+        self.assertEqual(self.drive.handle("DIabc", 0.0), "?")
+
+    def test_motion_requires_enable(self):
+        """Test that motion commands are refused while disabled."""
+        self.drive.handle("MD", 0.0)
+
+        self.assertEqual(self.drive.handle("CJ", 0.0), "?")
+        self.assertEqual(self.status(0.0), 0)
+
+    def test_alarm_injection(self):
+        """Test that an alarm halts motion until cleared with AR."""
+        self.drive.handle("CJ", 0.0)
+        self.drive.inject_alarm(0x0080, 0.5)
+
+        self.assertTrue(self.status(0.5) & SC_ALARM_PRESENT)
+        self.assertFalse(self.status(0.5) & SC_MOVING)
+        self.assertEqual(self.drive.handle("AL", 0.5), "AL=0080")
+        self.assertEqual(self.drive.handle("CJ", 0.5), "?")
+
+        self.drive.handle("AR", 0.6)
+        self.assertEqual(self.drive.handle("AL", 0.6), "AL=0000")
+        self.assertEqual(self.drive.handle("CJ", 0.6), "%")
+
+    def test_position_registers(self):
+        """Test EP and SP set their own frame without moving the other."""
+        self.drive.handle("FP2500", 0.0)
+        self.drive.advance(2.0)
+
+        self.drive.handle("EP0", 2.0)
+        self.assertEqual(self.drive.handle("EP", 2.0), "EP=0")
+        self.assertEqual(self.drive.handle("SP", 2.0), "SP=2500")
+
+        self.drive.handle("SP0", 2.0)
+        self.assertEqual(self.drive.handle("EP", 2.0), "EP=0")
+        self.assertEqual(self.drive.handle("SP", 2.0), "SP=0")
+
+    def test_duplicate_echo(self):
+        """Test the duplicated query echo option."""
+        self.drive.duplicate_echo = True
+
+        self.assertEqual(self.drive.handle("AL", 0.0), "AL=0000 AL=0000")
+
+
+class TestESCLSimulator(unittest.TestCase):
+    """End-to-end tests of STAC5Manager against the simulator."""
+
+    def setUp(self):
+        self.simulator = ESCLSimulator(latency=0.01)
+        self.simulator.start()
+        self.manager = None
+
+    def tearDown(self):
+        if self.manager:
+            self.manager.disconnect()
+        self.simulator.stop()
+
+    def connect(self, use_udp=False):
+        if use_udp:
+            self.manager = STAC5Manager(self.simulator.host, use_udp=True,
+                                        udp_port=self.simulator.udp_port)
+        else:
+            self.manager = STAC5Manager(self.simulator.host, self.simulator.tcp_port)
+        self.manager._min_command_interval = 0.0
+        self.assertTrue(self.manager.connect())
+
+    def test_move_completes(self):
+        """Test that a move handle resolves from polled simulator status."""
+        self.connect()
+        self.manager.start_polling(0.02)
+
+        handle = self.manager.move_to_position(2000)
+
+        self.assertTrue(handle.wait(5.0), handle.error)
+        self.assertLessEqual(abs(handle.final_position - 2000), 2)
+        self.assertGreater(handle.duration, 0.25)  # ~0.32s trapezoid
+
+    def test_status_deltas_while_idle(self):
+        """Test that idle polling delivers the full status once, then nothing."""
+        deltas = []
+        self.connect()
+        self.manager.set_delta_callback(deltas.append)
+        self.manager.start_polling(0.02)
+        time.sleep(0.3)
+
+        changes = [delta for delta in deltas if not delta.heartbeat]
+        self.assertEqual(len(changes), 1)
+        self.assertIn("encoder_position", changes[0])
+
+    def test_alarm_fails_move(self):
+        """Test that an injected alarm mid-move fails the handle."""
+        self.connect()
+        self.manager.start_polling(0.02)
+
+        handle = self.manager.move_to_position(8000)
+        self.simulator.inject_alarm(0x0002, delay=0.2)
+
+        self.assertFalse(handle.wait(5.0))
+        self.assertEqual(handle.error, "Alarm 0002")
+
+    def test_udp_query(self):
+        """Test queries over the UDP port."""
+        self.connect(use_udp=True)
+        self.simulator.drive.handle("EP1234", time.monotonic())
+
+        self.assertEqual(self.manager.get_encoder_position(), 1234)
+
+    def test_latency_applied(self):
+        """Test that replies take at least the configured round trip."""
+        self.connect()
+        self.simulator.latency = 0.05
+
+        start = time.perf_counter()
+        self.manager.get_status_code()
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+    def test_reconnect_after_drop(self):
+        """Test that a dropped client can reconnect."""
+        self.connect()
+        self.simulator.drop_connections()
+        deadline = time.monotonic() + 2.0
+        while self.manager.is_connected() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertFalse(self.manager.is_connected())
+        self.assertTrue(self.manager.connect())
+        self.assertIsNotNone(self.manager.get_status_code())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,418 @@
+"""
+Unit tests for stac5_manager module.
+"""
+
+import socket
+import threading
+import unittest
+
+from src.escl_protocol import ESCL_HEADER, ESCLFramer
+from src.stac5_manager import STAC5Manager
+
+
+class ScriptedDriveServer:
+    """Minimal eSCL server on localhost that answers from a dict."""
+
+    def __init__(self, replies=None):
+        self.replies = {"EP": "EP=0", "IE": "IE=0", "SC": "SC=0001", "AL": "AL=0000"}
+        self.replies.update(replies or {})
+        self.received = []
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(1)
+        self.port = self._server.getsockname()[1]
+        self._client = None
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        try:
+            self._client, _ = self._server.accept()
+        except OSError:
+            return
+        framer = ESCLFramer()
+        while True:
+            try:
+                data = self._client.recv(1024)
+            except OSError:
+                return
+            if not data:
+                return
+            for command in framer.feed(data):
+                command = command.decode('ascii')
+                self.received.append(command)
+                reply = self.replies.get(command[:2], "%")
+                try:
+                    self._client.sendall(ESCL_HEADER + reply.encode('ascii') + b'\r')
+                except OSError:
+                    return
+
+    def close(self):
+        for sock in (self._client, self._server):
+            if sock:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+
+
+class ScriptedUdpDrive:
+    """Minimal eSCL responder on a localhost UDP socket."""
+
+    def __init__(self, replies=None):
+        self.replies = {"EP": "EP=0", "IE": "IE=0", "SC": "SC=0001", "AL": "AL=0000"}
+        self.replies.update(replies or {})
+        self.received = []
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        framer = ESCLFramer()
+        while True:
+            try:
+                data, peer = self._sock.recvfrom(1024)
+            except OSError:
+                return
+            for command in framer.feed(data):
+                command = command.decode('ascii')
+                self.received.append(command)
+                reply = self.replies.get(command[:2], "%")
+                self._sock.sendto(ESCL_HEADER + reply.encode('ascii') + b'\r', peer)
+            framer.reset()
+
+    def close(self):
+        self._sock.close()
+
+
+class TestSTAC5ManagerTransport(unittest.TestCase):
+    """Tests for command transport through STAC5Manager."""
+
+    def setUp(self):
+        self.drive = ScriptedDriveServer({"EP": "EP=1200"})
+        self.manager = STAC5Manager("127.0.0.1", self.drive.port)
+        self.errors = []
+        self.manager.set_error_callback(self.errors.append)
+
+    def tearDown(self):
+        self.manager.disconnect()
+        self.drive.close()
+
+    def test_connect_initializes_drive(self):
+        """Test that connect sends the init sequence and syncs SP."""
+        self.assertTrue(self.manager.connect())
+
+        self.assertEqual(self.drive.received[:4], ["AC10.0", "DE10.0", "ME", "EP"])
+        self.assertEqual(self.drive.received[4], "SP3000")
+
+    def test_send_command(self):
+        """Test a single command round-trip."""
+        self.manager.connect()
+
+        self.assertEqual(self.manager.send_command("EP"), "EP=1200")
+        self.assertEqual(self.manager.get_encoder_position(), 1200)
+
+    def test_send_commands_pipelined(self):
+        """Test that pipelined commands return responses in order."""
+        self.manager.connect()
+
+        responses = self.manager.send_commands(["EP", "SC", "AL"])
+
+        self.assertEqual(responses, ["EP=1200", "SC=0001", "AL=0000"])
+
+    def test_jog_start_sequence(self):
+        """Test the DI/JS/CJ jog sequence."""
+        self.manager.connect()
+        self.drive.received.clear()
+
+        self.assertTrue(self.manager.jog_start(-1))
+
+        self.assertEqual(self.drive.received, ["DI-1", "JS2.0", "CJ"])
+        self.assertTrue(self.manager.status.is_moving)
+
+    def test_poll_status_batch(self):
+        """Test that a batched refresh populates position, status and alarm."""
+        self.drive.replies.update({"IE": "IE=-250", "SC": "SC=0019", "AL": "AL=0000"})
+        self.manager.connect()
+        self.drive.received.clear()
+
+        status = self.manager.poll_status_batch(immediate=True)
+
+        self.assertEqual(self.drive.received, ["IE", "SC", "AL"])
+        self.assertEqual(status.encoder_position, -250)
+        self.assertEqual(status.status_code, "0019")
+        self.assertTrue(status.motor_enabled)
+        self.assertTrue(status.is_moving)
+        self.assertEqual(status.alarm_code, "0000")
+
+    def test_poll_status_batch_reports_new_fault(self):
+        """Test that a new alarm is reported once."""
+        self.drive.replies["AL"] = "AL=0080"
+        self.manager.connect()
+
+        self.manager.poll_status_batch()
+        self.manager.poll_status_batch()
+
+        faults = [e for e in self.errors if e.startswith("FAULT")]
+        self.assertEqual(len(faults), 1)
+        self.assertEqual(self.manager.status.alarm_code, "0080")
+
+    def test_stop_latency_recorded(self):
+        """Test that stop commands record write and ack latency."""
+        self.manager.connect()
+
+        self.assertTrue(self.manager.stop())
+        self.assertTrue(self.manager.stop_kill())
+        self.manager.jog_stop()
+
+        self.assertEqual(self.manager.stop_write_latency.count, 3)
+        summary = self.manager.get_stop_latency()
+        self.assertEqual(summary.count, 3)
+        self.assertGreaterEqual(summary.worst_ms, summary.p99_ms)
+        self.assertEqual(self.drive.received[-3:], ["ST", "SK", "SJ"])
+
+    def test_send_command_disconnected(self):
+        """Test sending when not connected."""
+        self.assertIsNone(self.manager.send_command("EP"))
+        self.assertEqual(self.manager.send_commands(["EP", "SC"]), [None, None])
+
+    def test_connection_drop_detected(self):
+        """Test that a dropped link marks the manager disconnected."""
+        self.manager.connect()
+
+        self.drive.close()
+        self.manager.send_command("EP", timeout=0.5)
+
+        self.assertFalse(self.manager.is_connected())
+        self.assertTrue(self.errors)
+
+
+class TestSTAC5ManagerParameterCache(unittest.TestCase):
+    """Tests for the shadow cache of drive parameters."""
+
+    def setUp(self):
+        self.drive = ScriptedDriveServer({"EP": "EP=1200"})
+        self.manager = STAC5Manager("127.0.0.1", self.drive.port)
+        self.manager._jog_decel_lockout = 0.0
+        self.manager._min_command_interval = 0.0
+        self.manager.connect()
+        self.drive.received.clear()
+
+    def tearDown(self):
+        self.manager.disconnect()
+        self.drive.close()
+
+    def jog_once(self, direction):
+        self.assertTrue(self.manager.jog_start(direction))
+        self.manager.jog_stop()
+
+    def test_repeated_jog_sends_only_cj(self):
+        """Test that an unchanged direction and speed are not resent."""
+        self.jog_once(1)
+        self.drive.received.clear()
+
+        self.jog_once(1)
+
+        self.assertEqual(self.drive.received, ["CJ", "SJ"])
+        self.assertEqual(self.manager.param_writes_skipped, 2)
+
+    def test_changed_value_is_sent(self):
+        """Test that only the changed parameter is resent."""
+        self.jog_once(1)
+        self.drive.received.clear()
+
+        self.jog_once(-1)
+
+        self.assertEqual(self.drive.received, ["DI-1", "CJ", "SJ"])
+
+    def test_move_relative_skips_velocity(self):
+        """Test that VE is not resent for a second move at the same speed."""
+        self.manager.move_relative(100)
+        self.drive.received.clear()
+
+        self.manager.move_relative(200)
+
+        self.assertEqual(self.drive.received, ["DI200", "FL"])
+
+    def test_absolute_move_invalidates_direction(self):
+        """Test that FP<n> loading DI forces the jog direction to be resent."""
+        self.jog_once(1)
+        self.manager.move_to_position(-2000)
+        self.drive.received.clear()
+
+        self.jog_once(1)
+
+        self.assertEqual(self.drive.received, ["DI1", "CJ", "SJ"])
+
+    def test_rejection_invalidates(self):
+        """Test that a '?' reply makes every parameter get resent."""
+        self.jog_once(1)
+        self.drive.replies["CJ"] = "?4"
+        self.jog_once(1)
+        self.drive.replies["CJ"] = "%"
+        self.drive.received.clear()
+
+        self.jog_once(1)
+
+        self.assertEqual(self.drive.received, ["DI1", "JS2.0", "CJ", "SJ"])
+
+    def test_alarm_reset_invalidates(self):
+        """Test that parameters are resent after an alarm reset."""
+        self.jog_once(1)
+        self.manager.alarm_reset()
+        self.drive.received.clear()
+
+        self.jog_once(1)
+
+        self.assertEqual(self.drive.received, ["DI1", "JS2.0", "CJ", "SJ"])
+
+    def test_reconnect_invalidates(self):
+        """Test that init resends AC/DE after reconnecting."""
+        self.manager.disconnect()
+        self.drive.close()
+        self.drive = ScriptedDriveServer()
+        self.manager.port = self.drive.port
+
+        self.manager.connect()
+
+        self.assertEqual(self.drive.received[:2], ["AC10.0", "DE10.0"])
+
+
+class TestSTAC5ManagerMoveTracking(unittest.TestCase):
+    """Tests for move completion handles."""
+
+    def setUp(self):
+        self.drive = ScriptedDriveServer({"EP": "EP=0"})
+        self.manager = STAC5Manager("127.0.0.1", self.drive.port)
+        self.manager._min_command_interval = 0.0
+        self.manager.connect()
+
+    def tearDown(self):
+        self.manager.disconnect()
+        self.drive.close()
+
+    def poll(self, position, status_code, alarm="0000"):
+        self.drive.replies.update({"EP": f"EP={position}", "IE": f"IE={position}",
+                                   "SC": f"SC={status_code}", "AL": f"AL={alarm}"})
+        self.manager.poll_status_batch()
+
+    def test_move_resolves_in_position(self):
+        """Test that the handle completes when SC shows In Position at target."""
+        handle = self.manager.move_to_position(2000)
+        self.assertTrue(handle)
+
+        self.poll(800, "0011")
+        self.assertFalse(handle.done)
+        self.poll(2000, "0009")
+
+        self.assertTrue(handle.wait(1.0))
+        self.assertIsNotNone(handle.duration)
+        self.assertIsNotNone(handle.settle_time)
+
+    def test_move_tolerance_parameter(self):
+        """Test that a per-move tolerance decides a settle just off target."""
+        loose = self.manager.move_to_position(2000, tolerance=20)
+        self.poll(800, "0011")
+        self.poll(2015, "0009")
+        self.assertTrue(loose.wait(1.0))
+
+        tight = self.manager.move_to_position(2000, tolerance=10)
+        self.poll(2005, "0011")
+        self.poll(2011, "0009")
+        self.assertFalse(tight.wait(1.0))
+        self.assertIn("2011", tight.error)
+
+    def test_move_fails_on_alarm(self):
+        """Test that a drive alarm fails the move."""
+        handle = self.manager.move_to_position(2000)
+
+        self.poll(800, "0211", alarm="0080")
+
+        self.assertFalse(handle.wait(1.0))
+        self.assertEqual(handle.error, "Alarm 0080")
+
+    def test_stop_fails_move(self):
+        """Test that stopping fails the tracked move."""
+        handle = self.manager.move_to_position(2000)
+
+        self.manager.stop()
+
+        self.assertEqual(handle.error, "Stopped")
+
+    def test_new_move_supersedes(self):
+        """Test that a second move fails the first."""
+        first = self.manager.move_relative(100)
+        second = self.manager.move_relative(100)
+
+        self.assertEqual(first.error, "Superseded")
+        self.assertFalse(second.done)
+
+    def test_already_at_target(self):
+        """Test the completed handle when no move is needed."""
+        handle = self.manager.move_to_position(0)
+
+        self.assertTrue(handle.done)
+        self.assertTrue(handle.succeeded)
+
+    def test_go_home_without_saved_position(self):
+        """Test that go_home returns a falsy handle."""
+        self.assertFalse(self.manager.go_home())
+
+
+class TestSTAC5ManagerUdp(unittest.TestCase):
+    """Tests for STAC5Manager over the UDP transport."""
+
+    def setUp(self):
+        self.drive = ScriptedUdpDrive({"EP": "EP=1200"})
+        self.manager = STAC5Manager("127.0.0.1", use_udp=True, udp_port=self.drive.port)
+
+    def tearDown(self):
+        self.manager.disconnect()
+        self.drive.close()
+
+    def test_connect_over_udp(self):
+        """Test that connect probes the drive and runs the init sequence."""
+        self.assertTrue(self.manager.connect())
+        self.assertEqual(self.drive.received, ["SC", "AC10.0", "DE10.0", "ME", "EP", "SP3000"])
+
+    def test_poll_status_batch(self):
+        """Test a status refresh over UDP."""
+        self.manager.connect()
+
+        status = self.manager.poll_status_batch()
+
+        self.assertEqual(status.encoder_position, 1200)
+        self.assertEqual(status.status_code, "0001")
+
+    def test_connect_fails_without_drive(self):
+        """Test that connect fails when nothing answers on the UDP port."""
+        self.drive.close()
+
+        self.assertFalse(self.manager.connect())
+        self.assertFalse(self.manager.is_connected())
+
+
+class TestSTAC5ManagerMoveEstimate(unittest.TestCase):
+    """Tests for move duration estimates used by the poll scheduler."""
+
+    def setUp(self):
+        self.manager = STAC5Manager()
+
+    def test_trapezoidal_move(self):
+        """Test a move long enough to reach full velocity."""
+        # 20000 motor steps = 1 rev at 1.5 rps with 10 rps^2 ramps
+        eta = self.manager._estimate_move_time(20000, 1.5)
+        self.assertAlmostEqual(eta, 0.15 + 0.15 + (1.0 - 0.225) / 1.5)
+
+    def test_triangular_move(self):
+        """Test a short move that never reaches full velocity."""
+        eta = self.manager._estimate_move_time(-2000, 1.5)
+        self.assertAlmostEqual(eta, 2 * (0.1 * 10.0) ** 0.5 / 10.0)
+
+    def test_zero_move(self):
+        """Test a zero-length move."""
+        self.assertEqual(self.manager._estimate_move_time(0, 1.5), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for status_delta module.
+"""
+
+import unittest
+
+from src.command_protocol import ResponseParser, WinchStatus, MotionMode
+from src.stac5_manager import STAC5Status
+from src.status_delta import StatusDelta, StatusDiffer
+
+
+class TestStatusDiffer(unittest.TestCase):
+    """Tests for change-only status delivery."""
+
+    def setUp(self):
+        self.differ = StatusDiffer(heartbeat_interval=1.0)
+
+    def test_first_update_reports_all_fields(self):
+        """Test that the first status is delivered in full."""
+        delta = self.differ.update(WinchStatus(position=10), now=0.0)
+
+        self.assertIn("position", delta)
+        self.assertIn("estop_active", delta)
+        self.assertNotIn("raw_response", delta)
+        self.assertFalse(delta.heartbeat)
+
+    def test_unchanged_status_suppressed(self):
+        """Test that an identical status produces no delta."""
+        self.differ.update(WinchStatus(position=10, raw_response="a"), now=0.0)
+
+        self.assertIsNone(self.differ.update(WinchStatus(position=10, raw_response="b"), now=0.2))
+        self.assertEqual(self.differ.suppressed, 1)
+
+    def test_changed_fields_only(self):
+        """Test that only changed fields are listed."""
+        self.differ.update(WinchStatus(position=10), now=0.0)
+
+        delta = self.differ.update(WinchStatus(position=20, mode=MotionMode.JOG), now=0.2)
+
+        self.assertEqual(delta.changed, {"position": 20, "mode": MotionMode.JOG})
+        self.assertEqual(delta.status.position, 20)
+
+    def test_heartbeat_when_idle(self):
+        """Test a heartbeat delta after the interval with no changes."""
+        status = WinchStatus()
+        self.differ.update(status, now=0.0)
+        self.assertIsNone(self.differ.update(status, now=0.5))
+
+        delta = self.differ.update(status, now=1.0)
+
+        self.assertTrue(delta.heartbeat)
+        self.assertFalse(delta)
+        self.assertIsNone(self.differ.update(status, now=1.5))
+
+    def test_heartbeat_disabled(self):
+        """Test that a zero interval never emits heartbeats."""
+        differ = StatusDiffer(heartbeat_interval=0)
+        differ.update(WinchStatus(), now=0.0)
+
+        self.assertIsNone(differ.update(WinchStatus(), now=100.0))
+
+    def test_in_place_updates(self):
+        """Test diffing a mutable record that is updated in place."""
+        status = STAC5Status()
+        self.differ.update(status, now=0.0)
+
+        status.encoder_position = 500
+        delta = self.differ.update(status, now=0.1)
+
+        self.assertEqual(delta.changed, {"encoder_position": 500})
+
+    def test_reset(self):
+        """Test that reset makes the next delta complete again."""
+        status = ResponseParser.parse_status("POS:1 MODE:IDLE SPD:0.00 HOME:N WELL:N ESTOP:0")
+        self.differ.update(status, now=0.0)
+        self.differ.reset()
+
+        delta = self.differ.update(status, now=0.1)
+
+        self.assertIsInstance(delta, StatusDelta)
+        self.assertIn("home_saved", delta)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Unit tests for status stream subscription against the controller simulators.
+"""
+
+import os
+import threading
+import time
+import unittest
+from dataclasses import replace
+
+from src.command_protocol import Commands, MotionMode, WinchStatus
+from src.drop_cylinder_protocol import DropCylinderCommands, DropCylinderStatus
+from src.serial_manager import SerialManager
+from src.wifi_manager import DropCylinderManager
+from simulator import DropCylinderSimulator, WinchControllerSimulator
+
+
+def wait_for(predicate, timeout=2.0):
+    """Poll predicate until true or timeout; return its final value."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestCommands(unittest.TestCase):
+    """Tests for the subscription commands."""
+
+    def test_subscribe_status(self):
+        """Test command generation for both controllers."""
+        self.assertEqual(Commands.subscribe_status(20), "SU20")
+        self.assertEqual(DropCylinderCommands.subscribe_status(0), "SU0")
+
+
+@unittest.skipUnless(hasattr(os, "openpty"), "requires a POSIX pty")
+class TestWinchStatusStream(unittest.TestCase):
+    """Tests for SerialManager streaming against the pty winch simulator."""
+
+    def start(self, legacy=False):
+        self.simulator = WinchControllerSimulator(WinchStatus(position=100), legacy=legacy)
+        self.simulator.start()
+        self.manager = SerialManager()
+        self.manager.POLL_INTERVAL = 0.05
+        self.manager.STREAM_RATE_HZ = 20
+        self.manager.STREAM_STALL_TIMEOUT = 0.3
+        self.statuses = []
+        self.manager.set_status_callback(self.statuses.append)
+        self.assertTrue(self.manager.connect(self.simulator.port))
+
+    def tearDown(self):
+        self.manager.disconnect()
+        self.simulator.stop()
+
+    def test_stream_replaces_polling(self):
+        """Test that no ? is sent while the stream is running."""
+        self.start()
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+
+        polls = self.simulator.commands.count("?")
+        received = len(self.statuses)
+        time.sleep(0.5)
+
+        self.assertEqual(self.simulator.commands.count("?"), polls)
+        self.assertGreaterEqual(len(self.statuses) - received, 5)
+
+    def test_stream_follows_status(self):
+        """Test that pushed status reflects controller changes."""
+        self.start()
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+
+        self.simulator.status = replace(self.simulator.status, position=4000)
+
+        self.assertTrue(wait_for(lambda: self.manager.last_status.position == 4000))
+
+    def test_stall_falls_back_and_resubscribes(self):
+        """Test that a controller reset is detected and the stream restored."""
+        self.start()
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+        polls = self.simulator.commands.count("?")
+
+        self.simulator.reset()
+
+        self.assertTrue(wait_for(lambda: self.manager.stream_stalls == 1))
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+        self.assertGreater(self.simulator.commands.count("?"), polls)
+        self.assertEqual(self.simulator.commands.count("SU20"), 2)
+
+    def test_polls_merge_while_writer_blocked(self):
+        """Test that polls go through the command queue and merge there."""
+        self.start(legacy=True)
+        self.assertTrue(wait_for(lambda: self.simulator.commands.count("?") >= 1))
+
+        with self.manager._lock:  # Writer stalls, as on a slow link
+            time.sleep(0.3)
+
+        self.assertGreaterEqual(self.manager._command_queue.coalesced, 3)
+        self.assertLessEqual(self.manager._command_queue.qsize(), 1)
+
+    def test_long_move_is_not_a_stall(self):
+        """Test that the slower stream during a move does not count as a stall."""
+        self.start()
+        self.manager.STREAM_STALL_TIMEOUT = 0.2  # Shorter than the motion push interval
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+
+        self.simulator.status = replace(self.simulator.status, mode=MotionMode.MOVE)
+        time.sleep(1.0)  # Several stall timeouts
+        self.simulator.status = replace(self.simulator.status, mode=MotionMode.IDLE)
+
+        self.assertTrue(wait_for(lambda: self.manager.last_status.mode == MotionMode.IDLE))
+        self.assertEqual(self.manager.stream_stalls, 0)
+        self.assertTrue(self.manager.streaming)
+        self.assertEqual(self.simulator.commands.count("SU20"), 1)
+
+    def test_reset_during_move_detected(self):
+        """Test that a controller reset mid-move is still caught as a stall."""
+        self.start()
+        self.manager.STREAM_MOTION_STALL_TIMEOUT = 0.6
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+        self.simulator.status = replace(self.simulator.status, mode=MotionMode.MOVE)
+        self.assertTrue(wait_for(lambda: self.manager.last_status.mode == MotionMode.MOVE))
+
+        self.simulator.status = replace(self.simulator.status, mode=MotionMode.IDLE)
+        self.simulator.reset()
+
+        self.assertTrue(wait_for(lambda: self.manager.stream_stalls == 1))
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+
+    def test_legacy_firmware_keeps_polling(self):
+        """Test that firmware ignoring SU is polled as before."""
+        self.start(legacy=True)
+
+        self.assertTrue(wait_for(lambda: self.simulator.commands.count("?") >= 5))
+        self.assertFalse(self.manager.streaming)
+        self.assertEqual(self.manager.last_status.position, 100)
+
+
+class TestDropCylinderStatusStream(unittest.TestCase):
+    """Tests for DropCylinderManager streaming against the TCP simulator."""
+
+    def setUp(self):
+        self.status = DropCylinderStatus(position_ms=1500, ip_address="127.0.0.1")
+        self.simulator = DropCylinderSimulator(self.status)
+        self.simulator.start()
+        self.manager = DropCylinderManager()
+        self.manager.POLL_INTERVAL = 0.05
+        self.manager.STREAM_RATE_HZ = 20
+        self.manager.STREAM_STALL_TIMEOUT = 0.3
+
+    def tearDown(self):
+        self.manager.disconnect()
+        self.simulator.stop()
+
+    def test_binary_stream(self):
+        """Test a binary status stream over WiFi."""
+        self.manager.BINARY_STATUS = True
+        received = threading.Event()
+        self.manager.set_status_callback(lambda status: received.set())
+        self.assertTrue(self.manager.connect_wifi(self.simulator.host, self.simulator.port))
+
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+        self.assertTrue(self.manager.binary_status_active)
+        self.assertTrue(received.wait(1.0))
+        self.assertEqual(self.manager.last_status, self.status)
+
+    def test_stall_falls_back_to_polling(self):
+        """Test that polling resumes when the stream stops."""
+        self.assertTrue(self.manager.connect_wifi(self.simulator.host, self.simulator.port))
+        self.assertTrue(wait_for(lambda: self.manager.streaming))
+        polls = self.simulator.commands.count("?")
+
+        self.simulator.reset()
+
+        self.assertTrue(wait_for(lambda: self.manager.stream_stalls >= 1))
+        self.assertTrue(wait_for(lambda: self.simulator.commands.count("?") > polls))
+
+
+if __name__ == "__main__":
+    unittest.main()